@@ -7,8 +7,11 @@
 snapshots = Snapshot()
 
 snapshots["test_instance_yaml 1"] = [
+    "backfills",
     "code_servers",
     "compute_logs",
+    "event_log_batching",
+    "execution_plan_cache",
     "local_artifact_storage",
     "retention",
     "run_coordinator",
@@ -17,6 +20,7 @@
     "run_retries",
     "schedules",
     "sensors",
+    "snapshots",
     "storage",
     "telemetry",
 ]
@@ -91,7 +91,7 @@ def get_run_group(graphene_info, run_id):
     root_run_id, run_group = result
     run_group_run_ids = [run.run_id for run in run_group]
     records_by_id = {
-        record.pipeline_run.run_id: record
+        record.run_id: record
         for record in instance.get_run_records(RunsFilter(run_ids=run_group_run_ids))
     }
     return GrapheneRunGroup(
@@ -258,9 +258,9 @@ def get_assets_latest_info(graphene_info, step_keys_by_asset: Mapping[AssetKey,
     if run_ids:
         run_records = instance.get_run_records(RunsFilter(run_ids=run_ids))
         for run_record in run_records:
-            if run_record.pipeline_run.status in PENDING_STATUSES:
+            if run_record.status in PENDING_STATUSES:
                 in_progress_records.append(run_record)
-            run_records_by_run_id[run_record.pipeline_run.run_id] = run_record
+            run_records_by_run_id[run_record.run_id] = run_record
 
     (
         in_progress_run_ids_by_asset,
@@ -332,14 +332,14 @@ def _get_in_progress_runs_for_assets(
                             for step_stat in step_stats
                         ]
                     ):
-                        in_progress_run_ids_by_asset[asset].add(record.pipeline_run.run_id)
+                        in_progress_run_ids_by_asset[asset].add(record.run_id)
                     # else if step_stats exist and none are in progress, the step has completed
                 else:  # if step stats is none, then the step has not started
-                    unstarted_run_ids_by_asset[asset].add(record.pipeline_run.run_id)
+                    unstarted_run_ids_by_asset[asset].add(record.run_id)
         else:
             # the run never began execution, all steps are unstarted
             for asset in selected_assets:
-                unstarted_run_ids_by_asset[asset].add(record.pipeline_run.run_id)
+                unstarted_run_ids_by_asset[asset].add(record.run_id)
 
     return in_progress_run_ids_by_asset, unstarted_run_ids_by_asset
 
@@ -360,7 +360,7 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
     run_groups = instance.get_run_groups(filters=filters, cursor=cursor, limit=limit)
     run_ids = {run.run_id for run_group in run_groups.values() for run in run_group.get("runs", [])}
     records_by_ids = {
-        record.pipeline_run.run_id: record
+        record.run_id: record
         for record in instance.get_run_records(RunsFilter(run_ids=list(run_ids)))
     }
 
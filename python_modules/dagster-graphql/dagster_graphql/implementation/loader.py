@@ -103,7 +103,7 @@ def _fetch(self, data_type: RepositoryDataType, limit: int) -> None:
                         )
                     )
             for record in records:
-                fetched[record.pipeline_run.pipeline_name].append(record)
+                fetched[record.pipeline_name].append(record)
 
         elif data_type == RepositoryDataType.SCHEDULE_RUNS:
             schedule_names = [
@@ -308,7 +308,7 @@ def get_run_record_by_run_id(self, run_id: str) -> Optional[RunRecord]:
     def _fetch(self) -> None:
         records = self._instance.get_run_records(RunsFilter(run_ids=list(self._run_ids)))
         for record in records:
-            self._records[record.pipeline_run.run_id] = record
+            self._records[record.run_id] = record
 
 
 class BatchMaterializationLoader:
@@ -233,12 +233,9 @@ def resolve_numRequested(self, graphene_info):
 
         partition_run_data = self._get_partition_run_data(graphene_info)
 
-        checkpoint = self._backfill_job.last_submitted_partition_name
         return max(
             len(partition_run_data),
-            self._backfill_job.partition_names.index(checkpoint) + 1
-            if checkpoint and checkpoint in self._backfill_job.partition_names
-            else 0,
+            self._backfill_job.get_num_submitted_partitions(),
         )
 
     def resolve_partitionSet(self, graphene_info):
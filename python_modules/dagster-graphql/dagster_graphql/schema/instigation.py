@@ -135,7 +135,7 @@ def resolve_runs(self, graphene_info):
             return []
 
         records_by_id = {
-            record.pipeline_run.run_id: record
+            record.run_id: record
             for record in instance.get_run_records(RunsFilter(run_ids=run_ids))
         }
 
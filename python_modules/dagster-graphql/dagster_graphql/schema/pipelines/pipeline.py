@@ -305,18 +305,20 @@ class Meta:
 
     def __init__(self, record: RunRecord):
         check.inst_param(record, "record", RunRecord)
-        pipeline_run = record.pipeline_run
         super().__init__(
-            runId=pipeline_run.run_id,
-            status=pipeline_run.status.value,
-            mode=pipeline_run.mode,
+            runId=record.run_id,
+            status=record.status.value,
         )
-        self._pipeline_run = pipeline_run
         self._run_record = record
         self._run_stats = None
 
+    @property
+    def _pipeline_run(self):
+        # the run body of the record is only deserialized once a field that needs it is resolved
+        return self._run_record.pipeline_run
+
     def resolve_id(self, _graphene_info):
-        return self._pipeline_run.run_id
+        return self._run_record.run_id
 
     def resolve_repositoryOrigin(self, _graphene_info):
         return (
@@ -331,10 +333,10 @@ def resolve_pipeline(self, graphene_info):
         return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run)
 
     def resolve_pipelineName(self, _graphene_info):
-        return self._pipeline_run.pipeline_name
+        return self._run_record.pipeline_name
 
     def resolve_jobName(self, _graphene_info):
-        return self._pipeline_run.pipeline_name
+        return self._run_record.pipeline_name
 
     def resolve_solidSelection(self, _graphene_info):
         return self._pipeline_run.solid_selection
@@ -393,6 +395,9 @@ def resolve_runConfigYaml(self, _graphene_info):
     def resolve_runConfig(self, _graphene_info):
         return self._pipeline_run.run_config
 
+    def resolve_mode(self, _graphene_info):
+        return self._pipeline_run.mode
+
     def resolve_tags(self, _graphene_info):
         return [
             GraphenePipelineTag(key=key, value=value)
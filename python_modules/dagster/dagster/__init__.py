@@ -176,8 +176,10 @@
 from dagster._core.definitions.executor_definition import (
     ExecutorDefinition as ExecutorDefinition,
     ExecutorRequirement as ExecutorRequirement,
+    asyncio_executor as asyncio_executor,
     executor as executor,
     in_process_executor as in_process_executor,
+    in_process_threaded_executor as in_process_threaded_executor,
     multi_or_in_process_executor as multi_or_in_process_executor,
     multiple_process_executor_requirements as multiple_process_executor_requirements,
     multiprocess_executor as multiprocess_executor,
@@ -485,6 +487,7 @@
     input_manager as input_manager,
 )
 from dagster._core.storage.io_manager import (
+    AsyncIOManager as AsyncIOManager,
     IOManager as IOManager,
     IOManagerDefinition as IOManagerDefinition,
     io_manager as io_manager,
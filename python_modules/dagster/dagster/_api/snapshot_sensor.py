@@ -1,11 +1,11 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Sequence, Tuple, Union
 
 import dagster._check as check
 from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
 from dagster._core.host_representation.handle import RepositoryHandle
-from dagster._grpc.types import SensorExecutionArgs
+from dagster._grpc.types import SensorBatchExecutionArgs, SensorEvaluationArgs, SensorExecutionArgs
 from dagster._serdes import deserialize_as
 
 if TYPE_CHECKING:
@@ -73,3 +73,33 @@ def sync_get_external_sensor_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_sensor_execution_data_batch_grpc(
+    api_client: "DagsterGrpcClient",
+    instance: "DagsterInstance",
+    repository_handle: RepositoryHandle,
+    sensor_evaluation_args: Sequence[SensorEvaluationArgs],
+) -> Iterator[Tuple[str, Union[SensorExecutionData, ExternalSensorExecutionErrorData]]]:
+    """Evaluates several sensors of a repository in a single call, yielding the name and execution
+    data of each sensor as soon as it has been evaluated. Unlike the single sensor call, errors
+    are yielded rather than raised, so that one failing sensor does not interrupt the others.
+    """
+    check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+    check.sequence_param(
+        sensor_evaluation_args, "sensor_evaluation_args", of_type=SensorEvaluationArgs
+    )
+
+    origin = repository_handle.get_external_origin()
+
+    for sensor_name, serialized_sensor_data in api_client.external_sensor_batch_execution(
+        sensor_batch_execution_args=SensorBatchExecutionArgs(
+            repository_origin=origin,
+            instance_ref=instance.get_ref(),
+            sensor_evaluation_args=sensor_evaluation_args,
+        )
+    ):
+        yield sensor_name, deserialize_as(
+            serialized_sensor_data,
+            (SensorExecutionData, ExternalSensorExecutionErrorData),
+        )
@@ -18,7 +18,7 @@
 from dagster._core.definitions.metadata import MetadataEntry
 from dagster._core.errors import DagsterExecutionInterruptedError
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import create_execution_plan_for_steps, execute_plan_iterator
 from dagster._core.execution.context_creation_pipeline import create_context_free_log_manager
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster._core.instance import DagsterInstance, InstanceRef
@@ -32,6 +32,7 @@
 from dagster._core.utils import coerce_valid_log_level
 from dagster._grpc import DagsterGrpcClient, DagsterGrpcServer
 from dagster._grpc.impl import core_execute_run
+from dagster._grpc.server import DEFAULT_SENSOR_EVALUATION_MAX_WORKERS
 from dagster._grpc.types import ExecuteRunArgs, ExecuteStepArgs, ResumeRunArgs
 from dagster._serdes import deserialize_as, serialize_dagster_namedtuple
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -424,13 +425,13 @@ def _execute_step_command_body(
             pipeline_run.solids_to_execute, pipeline_run.asset_selection
         )
 
-        execution_plan = create_execution_plan(
+        execution_plan = create_execution_plan_for_steps(
             recon_pipeline,
-            run_config=pipeline_run.run_config,
+            pipeline_run,
             step_keys_to_execute=args.step_keys_to_execute,
-            mode=pipeline_run.mode,
             known_state=args.known_state,
             repository_load_data=repository_load_data,
+            execution_plan_cache_max_size=instance.execution_plan_cache_max_size,
         )
 
         yield from execute_plan_iterator(
@@ -604,6 +605,14 @@ def _execute_step_command_body(
     help="[INTERNAL] Serialized InstanceRef to use for accessing the instance",
     envvar="DAGSTER_INSTANCE_REF",
 )
+@click.option(
+    "--sensor-evaluation-max-workers",
+    type=click.INT,
+    required=False,
+    default=DEFAULT_SENSOR_EVALUATION_MAX_WORKERS,
+    help="Maximum number of threads on which the sensors of a batched sensor evaluation request "
+    f"are evaluated. Default is {DEFAULT_SENSOR_EVALUATION_MAX_WORKERS}.",
+)
 def grpc_command(
     port=None,
     socket=None,
@@ -622,6 +631,7 @@ def grpc_command(
     location_name=None,
     instance_ref=None,
     inject_env_vars_from_instance=False,
+    sensor_evaluation_max_workers=DEFAULT_SENSOR_EVALUATION_MAX_WORKERS,
     **kwargs,
 ):
     from dagster._core.test_utils import mock_system_timezone
@@ -689,6 +699,7 @@ def grpc_command(
             inject_env_vars_from_instance=inject_env_vars_from_instance,
             instance_ref=deserialize_as(instance_ref, InstanceRef) if instance_ref else None,
             location_name=location_name,
+            sensor_evaluation_max_workers=sensor_evaluation_max_workers,
         )
 
         code_desc = " "
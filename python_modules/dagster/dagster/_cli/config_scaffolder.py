@@ -52,6 +52,8 @@ def scaffold_type(config_type: ConfigType, skip_non_required: bool = True):
         defaults = {"String": "", "Int": 0, "Bool": True}
 
         return defaults[config_type.given_name]  # type: ignore
+    elif config_type.kind == ConfigTypeKind.SCALAR_UNION:
+        return scaffold_type(config_type.scalar_type, skip_non_required)  # type: ignore
     elif config_type.kind == ConfigTypeKind.ARRAY:
         return []
     elif config_type.kind == ConfigTypeKind.MAP:
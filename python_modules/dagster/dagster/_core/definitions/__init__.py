@@ -26,9 +26,11 @@
 from .executor_definition import (
     ExecutorDefinition,
     ExecutorRequirement,
+    asyncio_executor,
     default_executors,
     executor,
     in_process_executor,
+    in_process_threaded_executor,
     multi_or_in_process_executor,
     multiple_process_executor_requirements,
     multiprocess_executor,
@@ -16,6 +16,7 @@
 from dagster._core.definitions.reconstruct import ReconstructablePipeline
 from dagster._core.errors import DagsterUnmetExecutorRequirementsError
 from dagster._core.execution.retries import RetryMode, get_retries_config
+from dagster._utils.tags import get_tag_concurrency_limits_config
 
 from .definition_config_schema import (
     IDefinitionConfigSchema,
@@ -23,8 +24,10 @@
 )
 
 if TYPE_CHECKING:
+    from dagster._core.executor.asyncio_executor import AsyncioExecutor
     from dagster._core.executor.base import Executor
     from dagster._core.executor.in_process import InProcessExecutor
+    from dagster._core.executor.in_process_threaded import InProcessThreadedExecutor
     from dagster._core.executor.init import InitExecutorContext
     from dagster._core.executor.multiprocess import MultiprocessExecutor
     from dagster._core.instance import DagsterInstance
@@ -313,6 +316,155 @@ def execute_in_process_executor(_) -> "InProcessExecutor":
     )
 
 
+def _core_in_process_threaded_executor_creation(
+    config: ExecutorConfig,
+) -> "InProcessThreadedExecutor":
+    from dagster._core.executor.in_process_threaded import InProcessThreadedExecutor
+
+    return InProcessThreadedExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
+    )
+
+
+IN_PROC_THREADED_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Int,
+            default_value=0,
+            description=(
+                "The number of threads that may execute steps concurrently. By default, this is "
+                "set to the default number of workers of a `concurrent.futures.ThreadPoolExecutor`."
+            ),
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(
+            "A set of limits that are applied to steps with particular tags. "
+            "If a value is set, the limit is applied to only that key-value pair. "
+            "If no value is set, the limit is applied across all values of that key. "
+            "If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit "
+            "will apply to the number of unique values for that key."
+        ),
+        "retries": get_retries_config(),
+    },
+    description="Execute steps concurrently on threads in a single process.",
+)
+
+
+@executor(
+    name="in_process_threaded",
+    config_schema=IN_PROC_THREADED_CONFIG,
+)
+def in_process_threaded_executor(init_context):
+    """The in-process threaded executor executes steps concurrently on a pool of threads within a
+    single process.
+
+    All steps share the resources that are initialized once for the run, and step outputs can be
+    passed between steps in memory. This suits jobs whose ops spend most of their time waiting on
+    I/O, e.g. queries against a warehouse or calls to an HTTP API, which would otherwise pay for
+    process startup on every step with the multiprocess executor. CPU-bound ops will not execute in
+    parallel, since threads share the Python interpreter. The ops and resources of the job must be
+    safe to use from multiple threads.
+
+    To select it, include the following top-level fragment in config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            in_process_threaded:
+              max_concurrent: 8
+              tag_concurrency_limits:
+                - key: database
+                  value: redshift
+                  limit: 2
+
+    The ``max_concurrent`` arg is optional and tells the execution engine how many steps may run
+    concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the default number
+    of workers of a :py:class:`python:concurrent.futures.ThreadPoolExecutor`. The optional
+    ``tag_concurrency_limits`` further limit the number of steps with particular op tags that may
+    run concurrently.
+
+    Since stdout and stderr are shared between threads, compute logs are captured for the whole
+    run rather than for each step.
+
+    Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
+    where the higher the number the higher the priority. 0 is the default and both positive
+    and negative numbers can be used.
+    """
+    return _core_in_process_threaded_executor_creation(init_context.executor_config)
+
+
+def _core_asyncio_executor_creation(config: ExecutorConfig) -> "AsyncioExecutor":
+    from dagster._core.executor.asyncio_executor import AsyncioExecutor
+
+    return AsyncioExecutor(
+        retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
+        max_concurrent=check.int_elem(config, "max_concurrent"),
+        tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
+    )
+
+
+ASYNCIO_CONFIG = Field(
+    {
+        "max_concurrent": Field(
+            Int,
+            default_value=0,
+            description=(
+                "The number of steps that may execute concurrently. By default, every step "
+                "that is ready to execute is started."
+            ),
+        ),
+        "tag_concurrency_limits": get_tag_concurrency_limits_config(
+            "A set of limits that are applied to steps with particular tags. "
+            "If a value is set, the limit is applied to only that key-value pair. "
+            "If no value is set, the limit is applied across all values of that key. "
+            "If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit "
+            "will apply to the number of unique values for that key."
+        ),
+        "retries": get_retries_config(),
+    },
+    description="Execute async steps concurrently on a single event loop in a single process.",
+)
+
+
+@executor(
+    name="asyncio",
+    config_schema=ASYNCIO_CONFIG,
+)
+def asyncio_executor(init_context):
+    """The asyncio executor executes steps within a single process, running the coroutines of all
+    executing steps concurrently on a single event loop.
+
+    This suits jobs made up of many async ops that spend most of their time awaiting I/O, e.g. calls
+    to an HTTP API, where the run then takes about as long as its slowest chain of calls rather than
+    the sum of them. Async op bodies, as well as the ``load_input_async`` and
+    ``handle_output_async`` methods of an :py:class:`AsyncIOManager`, are run on the shared loop, so
+    they may share async clients that are bound to it. Each step executes as a task on the loop,
+    rather than on a thread of its own. The bodies of synchronous ops are run on the default
+    executor of the loop, a thread pool, so they also execute concurrently, while the methods of
+    synchronous IO managers are run on the loop itself and should not block for long.
+
+    To select it, include the following top-level fragment in config:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            asyncio:
+              max_concurrent: 100
+
+    The ``max_concurrent`` arg is optional and limits the number of steps that may execute
+    concurrently. By default, or if you set ``max_concurrent`` to be 0, every step that is ready to
+    execute is started. The optional ``tag_concurrency_limits`` further limit the number of steps
+    with particular op tags that may run concurrently.
+
+    Since stdout and stderr are shared between steps, compute logs are captured for the whole
+    run rather than for each step.
+    """
+    return _core_asyncio_executor_creation(init_context.executor_config)
+
+
 def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "MultiprocessExecutor":
     from dagster._core.executor.multiprocess import MultiprocessExecutor
 
@@ -323,11 +475,17 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    # the worker pool is enabled by the presence of its config
+    use_worker_pool = config.get("worker_pool") is not None
+    worker_pool_cfg = check.opt_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.int_elem(config, "max_concurrent"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=use_worker_pool,
+        max_tasks_per_worker=check.opt_int_elem(worker_pool_cfg, "max_tasks_per_worker"),
     )
 
 
@@ -379,6 +537,24 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_tasks_per_worker": Field(
+                    Int,
+                    default_value=0,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced by a "
+                        "new one. By default, or if set to 0, workers are never replaced."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes, rather than starting a "
+                "new process for each step. Each worker loads the job once and then executes "
+                "steps one at a time. A worker that dies fails the step that it was executing."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -408,6 +584,32 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    For jobs with many short steps, the cost of starting a process for each step can dominate. The
+    optional ``worker_pool`` config instead executes steps in long-lived worker processes, each of
+    which loads the job once. ``max_tasks_per_worker`` replaces a worker after it has executed that
+    many steps:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_tasks_per_worker: 100
+
+    Resources defined with ``reusable=True`` are initialized by the first step that a worker
+    executes and reused by the steps that it executes after it, instead of being initialized for
+    each step, and are torn down when the worker shuts down. This suits expensive resources like
+    connection pools and Spark sessions. A reusable resource is only reused if every resource
+    that it depends on is reusable as well.
+
+    Linear chains of lightweight ops can be fused by tagging them with ``dagster/fusible: "true"``.
+    Two fusible ops are fused when the downstream op depends on no other op, the upstream op has no
+    other downstream ops, and every output of the upstream op that the downstream op depends on is
+    required. Each chain of fused ops is executed in a single process, with their events reported
+    as usual. Their outputs are still handled by IO managers, so that retries and re-execution work
+    as usual, but each fused op receives its inputs in memory rather than loading them.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -91,6 +91,10 @@ class ResourceDefinition(AnonymousConfigurableDefinition, RequiresResources):
         version (Optional[str]): (Experimental) The version of the resource's definition fn. Two
             wrapped resource functions should only have the same version if they produce the same
             resource definition when provided with the same inputs.
+        reusable (bool): Whether the resource may be initialized once per long-lived worker
+            process and reused by every step that the worker executes, rather than initialized
+            for each step. Only resources that depend solely on other reusable resources are
+            reused. Defaults to False.
     """
 
     def __init__(
@@ -100,6 +104,7 @@ def __init__(
         description: Optional[str] = None,
         required_resource_keys: Optional[AbstractSet[str]] = None,
         version: Optional[str] = None,
+        reusable: bool = False,
     ):
         self._resource_fn = check.callable_param(resource_fn, "resource_fn")
         self._config_schema = convert_user_facing_definition_config_schema(config_schema)
@@ -110,6 +115,7 @@ def __init__(
         self._version = check.opt_str_param(version, "version")
         if version:
             experimental_arg_warning("version", "ResourceDefinition.__init__")
+        self._reusable = check.bool_param(reusable, "reusable")
 
     @property
     def resource_fn(self) -> ResourceFunction:
@@ -134,6 +140,11 @@ def version(self) -> Optional[str]:
     def required_resource_keys(self) -> AbstractSet[str]:
         return self._required_resource_keys
 
+    @public  # type: ignore
+    @property
+    def reusable(self) -> bool:
+        return self._reusable
+
     @public
     @staticmethod
     def none_resource(description: Optional[str] = None) -> "ResourceDefinition":
@@ -200,6 +211,7 @@ def copy_for_configured(
             resource_fn=self.resource_fn,
             required_resource_keys=self.required_resource_keys,
             version=self.version,
+            reusable=self.reusable,
         )
 
     def __call__(self, *args, **kwargs):
@@ -260,10 +272,12 @@ def __init__(
         description: Optional[str] = None,
         required_resource_keys: Optional[AbstractSet[str]] = None,
         version: Optional[str] = None,
+        reusable: bool = False,
     ):
         self.config_schema = config_schema  # checked by underlying definition
         self.description = check.opt_str_param(description, "description")
         self.version = check.opt_str_param(version, "version")
+        self.reusable = check.bool_param(reusable, "reusable")
         self.required_resource_keys = check.opt_set_param(
             required_resource_keys, "required_resource_keys"
         )
@@ -297,6 +311,7 @@ def __call__(self, resource_fn: ResourceFunction) -> ResourceDefinition:
             description=self.description or format_docstring_for_description(resource_fn),
             version=self.version,
             required_resource_keys=self.required_resource_keys,
+            reusable=self.reusable,
         )
 
         update_wrapper(resource_def, wrapped=resource_fn)
@@ -315,6 +330,7 @@ def resource(
     description: Optional[str] = ...,
     required_resource_keys: Optional[AbstractSet[str]] = ...,
     version: Optional[str] = ...,
+    reusable: bool = ...,
 ) -> Callable[[ResourceFunction], "ResourceDefinition"]:
     ...
 
@@ -324,6 +340,7 @@ def resource(
     description: Optional[str] = None,
     required_resource_keys: Optional[AbstractSet[str]] = None,
     version: Optional[str] = None,
+    reusable: bool = False,
 ) -> Union[Callable[[ResourceFunction], "ResourceDefinition"], "ResourceDefinition"]:
     """Define a resource.
 
@@ -344,6 +361,10 @@ def resource(
             resource functions should only have the same version if they produce the same resource
             definition when provided with the same inputs.
         required_resource_keys (Optional[Set[str]]): Keys for the resources required by this resource.
+        reusable (bool): Whether the resource may be initialized once per long-lived worker
+            process, such as the workers of the multiprocess executor's ``worker_pool``, and reused
+            by every step that the worker executes. The resource is torn down when the worker
+            shuts down. Defaults to False.
     """
 
     # This case is for when decorator is used bare, without arguments.
@@ -357,6 +378,7 @@ def _wrap(resource_fn: ResourceFunction) -> "ResourceDefinition":
             description=description,
             required_resource_keys=required_resource_keys,
             version=version,
+            reusable=reusable,
         )(resource_fn)
 
     return _wrap
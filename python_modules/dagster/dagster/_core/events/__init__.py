@@ -1071,6 +1071,7 @@ def resource_init_success(
         log_manager: DagsterLogManager,
         resource_instances: Mapping[str, Any],
         resource_init_times: Mapping[str, str],
+        reused_resource_keys: AbstractSet[str] = frozenset(),
     ) -> "DagsterEvent":
 
         metadata_entries = []
@@ -1084,6 +1085,9 @@ def resource_init_success(
                     MetadataEntry(f"{key}:init_time", value=resource_init_times[key]),
                 ]
             )
+            if key in reused_resource_keys:
+                # initialized by an earlier step executed in the same worker process
+                metadata_entries.append(MetadataEntry(f"{key}:reused", value=True))
 
         return DagsterEvent.from_resource(
             DagsterEventType.RESOURCE_INIT_SUCCESS,
@@ -28,6 +28,11 @@
 from dagster._core.execution.plan.execute_plan import inner_plan_execution_iterator
 from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.plan_cache import (
+    DEFAULT_EXECUTION_PLAN_CACHE_SIZE,
+    get_execution_plan_cache,
+    get_execution_plan_cache_key,
+)
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance, InstanceRef
@@ -1021,6 +1026,78 @@ def _get_execution_plan_from_run(
     )
 
 
+def create_execution_plan_for_steps(
+    pipeline: IPipeline,
+    pipeline_run: PipelineRun,
+    step_keys_to_execute: Optional[Sequence[str]],
+    known_state: Optional[KnownExecutionState] = None,
+    repository_load_data: Optional[RepositoryLoadData] = None,
+    execution_plan_cache_max_size: int = DEFAULT_EXECUTION_PLAN_CACHE_SIZE,
+) -> ExecutionPlan:
+    """Creates the plan for executing some of the steps of a run, e.g. in a step worker.
+
+    The plan for the whole run is cached in memory, so that a process that executes several steps
+    of the same run only plans the job once, and derives the plan for each step from it. The size
+    of the cache is set by the `execution_plan_cache` settings of the instance that first plans a
+    run in the process.
+    """
+    pipeline = _check_pipeline(pipeline)
+    check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+    check.opt_nullable_sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    known_state = check.opt_inst_param(
+        known_state, "known_state", KnownExecutionState, default=KnownExecutionState()
+    )
+    check.int_param(execution_plan_cache_max_size, "execution_plan_cache_max_size")
+
+    if isinstance(pipeline, ReconstructablePipeline) and repository_load_data is not None:
+        pipeline = pipeline.with_repository_load_data(repository_load_data)
+
+    pipeline_def = pipeline.get_definition()
+    cache_key = (
+        get_execution_plan_cache_key(
+            pipeline_run.pipeline_snapshot_id,
+            pipeline_run.run_config,
+            pipeline_run.mode,
+            None,
+            solid_selection=sorted(pipeline.solids_to_execute)
+            if pipeline.solids_to_execute
+            else None,
+            asset_selection=pipeline.asset_selection,
+        )
+        if pipeline_run.pipeline_snapshot_id and not pipeline_def.is_using_memoization({})
+        else None
+    )
+    if not cache_key:
+        return create_execution_plan(
+            pipeline,
+            run_config=pipeline_run.run_config,
+            mode=pipeline_run.mode,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+            repository_load_data=repository_load_data,
+        )
+
+    cache = get_execution_plan_cache(execution_plan_cache_max_size)
+    run_plan = cache.get(cache_key)
+    if run_plan is None:
+        run_plan = create_execution_plan(
+            pipeline,
+            run_config=pipeline_run.run_config,
+            mode=pipeline_run.mode,
+            repository_load_data=repository_load_data,
+        )
+        cache.set(cache_key, run_plan)
+
+    # equivalent to planning the job with the known state and then subsetting it, as
+    # ExecutionPlan.build does
+    execution_plan = run_plan.with_known_state(known_state)
+    if step_keys_to_execute is None:
+        return execution_plan
+    return execution_plan.build_subset_plan(
+        step_keys_to_execute, pipeline_def, None, mode=pipeline_run.mode
+    )
+
+
 def create_execution_plan(
     pipeline: Union[IPipeline, PipelineDefinition],
     run_config: Optional[Mapping[str, object]] = None,
@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
-from typing import Iterable, Mapping, NamedTuple, Optional, Sequence
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Sequence
 
 import dagster._check as check
 from dagster._core.definitions import AssetKey
@@ -60,6 +61,7 @@ class PartitionBackfill(
             ("last_submitted_partition_name", Optional[str]),
             ("error", Optional[SerializableErrorInfo]),
             ("asset_selection", Optional[Sequence[AssetKey]]),
+            ("num_submitted_partitions", Optional[int]),
         ],
     ),
 ):
@@ -76,6 +78,7 @@ def __new__(
         last_submitted_partition_name: Optional[str] = None,
         error: Optional[SerializableErrorInfo] = None,
         asset_selection: Optional[Sequence[AssetKey]] = None,
+        num_submitted_partitions: Optional[int] = None,
     ):
         check.invariant(
             not (asset_selection and reexecution_steps),
@@ -96,12 +99,26 @@ def __new__(
             check.opt_str_param(last_submitted_partition_name, "last_submitted_partition_name"),
             check.opt_inst_param(error, "error", SerializableErrorInfo),
             check.opt_list_param(asset_selection, "asset_selection", of_type=AssetKey),
+            check.opt_int_param(num_submitted_partitions, "num_submitted_partitions"),
         )
 
     @property
     def selector_id(self):
         return self.partition_set_origin.get_selector_id()
 
+    def get_num_submitted_partitions(self) -> int:
+        """The number of leading partition names whose runs have been submitted. Partitions are
+        submitted in order, so this is the index of the next partition name to submit.
+        """
+        if self.num_submitted_partitions is not None:
+            return self.num_submitted_partitions
+
+        # backfills checkpointed before the number of submitted partitions was stored
+        checkpoint = self.last_submitted_partition_name
+        if checkpoint and checkpoint in self.partition_names:
+            return self.partition_names.index(checkpoint) + 1
+        return 0
+
     def with_status(self, status):
         check.inst_param(status, "status", BulkActionStatus)
         return PartitionBackfill(
@@ -116,10 +133,12 @@ def with_status(self, status):
             self.last_submitted_partition_name,
             self.error,
             self.asset_selection,
+            self.num_submitted_partitions,
         )
 
-    def with_partition_checkpoint(self, last_submitted_partition_name):
+    def with_partition_checkpoint(self, last_submitted_partition_name, num_submitted_partitions):
         check.str_param(last_submitted_partition_name, "last_submitted_partition_name")
+        check.int_param(num_submitted_partitions, "num_submitted_partitions")
         return PartitionBackfill(
             self.backfill_id,
             self.partition_set_origin,
@@ -132,6 +151,7 @@ def with_partition_checkpoint(self, last_submitted_partition_name):
             last_submitted_partition_name,
             self.error,
             self.asset_selection,
+            num_submitted_partitions,
         )
 
     def with_error(self, error):
@@ -148,6 +168,7 @@ def with_error(self, error):
             self.last_submitted_partition_name,
             error,
             self.asset_selection,
+            self.num_submitted_partitions,
         )
 
 
@@ -157,8 +178,13 @@ def submit_backfill_runs(
     repo_location: RepositoryLocation,
     backfill_job: PartitionBackfill,
     partition_names: Optional[Sequence[str]] = None,
+    threadpool_executor: Optional[ThreadPoolExecutor] = None,
 ) -> Iterable[Optional[str]]:
-    """Returns the run IDs of the submitted runs"""
+    """Returns the run IDs of the submitted runs
+
+    When a threadpool executor is provided, the runs of the partitions are created and submitted
+    concurrently on it, and their run IDs are returned as the runs are submitted.
+    """
 
     repository_origin = backfill_job.partition_set_origin.external_repository_origin
     repo_name = repository_origin.repository_name
@@ -195,7 +221,63 @@ def submit_backfill_runs(
         external_pipeline = external_repo.get_full_external_job(
             external_partition_set.pipeline_name
         )
-    for partition_data in result.partition_data:
+
+    if backfill_job.from_failure:
+        # re-executions of the failed runs are created one at a time, since each one is built
+        # from the last run of its partition
+        yield from _create_and_submit_reexecuted_runs(
+            instance,
+            workspace,
+            repo_location,
+            external_pipeline,
+            external_partition_set,
+            backfill_job,
+            result.partition_data,
+            threadpool_executor,
+        )
+        return
+
+    def _get_create_run_args(partition_data: ExternalPartitionExecutionParamData):
+        _log_backfill_run_created(instance, repo_location, external_pipeline)
+        return _get_backfill_create_run_args(
+            instance,
+            repo_location,
+            external_pipeline,
+            external_partition_set,
+            backfill_job,
+            partition_data,
+        )
+
+    # fetching the execution plans is the slow part of creating the runs, so it is spread across
+    # the threadpool, while the runs themselves are stored and submitted in bulk
+    if threadpool_executor:
+        create_run_args = list(threadpool_executor.map(_get_create_run_args, result.partition_data))
+    else:
+        create_run_args = [
+            _get_create_run_args(partition_data) for partition_data in result.partition_data
+        ]
+
+    if not create_run_args:
+        return
+
+    pipeline_runs = instance.create_runs_bulk(create_run_args)
+    for pipeline_run in instance.submit_runs_bulk(
+        [pipeline_run.run_id for pipeline_run in pipeline_runs], workspace
+    ):
+        yield pipeline_run.run_id
+
+
+def _create_and_submit_reexecuted_runs(
+    instance: DagsterInstance,
+    workspace: IWorkspace,
+    repo_location: RepositoryLocation,
+    external_pipeline: ExternalPipeline,
+    external_partition_set: ExternalPartitionSet,
+    backfill_job: PartitionBackfill,
+    partition_data_list: Sequence[ExternalPartitionExecutionParamData],
+    threadpool_executor: Optional[ThreadPoolExecutor],
+) -> Iterable[Optional[str]]:
+    def _create_and_submit_run(partition_data: ExternalPartitionExecutionParamData):
         pipeline_run = create_backfill_run(
             instance,
             repo_location,
@@ -204,12 +286,27 @@ def submit_backfill_runs(
             backfill_job,
             partition_data,
         )
-        if pipeline_run:
+        if not pipeline_run:
             # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
             # and the partition has had a successful run since the time the backfill was
             # scheduled
-            instance.submit_run(pipeline_run.run_id, workspace)
-            yield pipeline_run.run_id
+            return None
+        instance.submit_run(pipeline_run.run_id, workspace)
+        return pipeline_run.run_id
+
+    if threadpool_executor:
+        futures = [
+            threadpool_executor.submit(_create_and_submit_run, partition_data)
+            for partition_data in partition_data_list
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+        return
+
+    for partition_data in partition_data_list:
+        run_id = _create_and_submit_run(partition_data)
+        if run_id:
+            yield run_id
         yield None
 
 
@@ -221,6 +318,40 @@ def create_backfill_run(
     backfill_job: PartitionBackfill,
     partition_data: ExternalPartitionExecutionParamData,
 ) -> Optional[PipelineRun]:
+    _log_backfill_run_created(instance, repo_location, external_pipeline)
+
+    if backfill_job.from_failure:
+        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+        if not last_run or last_run.status != PipelineRunStatus.FAILURE:
+            return None
+        return instance.create_reexecuted_run(
+            last_run,
+            repo_location,
+            external_pipeline,
+            ReexecutionStrategy.FROM_FAILURE,
+            extra_tags=_get_backfill_run_tags(external_pipeline, backfill_job, partition_data),
+            run_config=partition_data.run_config,
+            mode=external_partition_set.mode,
+            use_parent_run_tags=False,  # don't inherit tags from the previous run
+        )
+
+    return instance.create_run(
+        **_get_backfill_create_run_args(
+            instance,
+            repo_location,
+            external_pipeline,
+            external_partition_set,
+            backfill_job,
+            partition_data,
+        )
+    )
+
+
+def _log_backfill_run_created(
+    instance: DagsterInstance,
+    repo_location: RepositoryLocation,
+    external_pipeline: ExternalPipeline,
+) -> None:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     log_action(
@@ -233,40 +364,38 @@ def create_backfill_run(
         },
     )
 
-    tags = merge_dicts(
+
+def _get_backfill_run_tags(
+    external_pipeline: ExternalPipeline,
+    backfill_job: PartitionBackfill,
+    partition_data: ExternalPartitionExecutionParamData,
+) -> Mapping[str, str]:
+    return merge_dicts(
         external_pipeline.tags,
         partition_data.tags,
         PipelineRun.tags_for_backfill_id(backfill_job.backfill_id),
         backfill_job.tags,
     )
 
-    solids_to_execute = None
-    solid_selection = None
-    if not backfill_job.from_failure and not backfill_job.reexecution_steps:
-        step_keys_to_execute = None
-        parent_run_id = None
-        root_run_id = None
-        known_state = None
-        if external_partition_set.solid_selection:
-            solids_to_execute = frozenset(external_partition_set.solid_selection)
-            solid_selection = external_partition_set.solid_selection
-
-    elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
-        if not last_run or last_run.status != PipelineRunStatus.FAILURE:
-            return None
-        return instance.create_reexecuted_run(
-            last_run,
-            repo_location,
-            external_pipeline,
-            ReexecutionStrategy.FROM_FAILURE,
-            extra_tags=tags,
-            run_config=partition_data.run_config,
-            mode=external_partition_set.mode,
-            use_parent_run_tags=False,  # don't inherit tags from the previous run
-        )
 
-    elif backfill_job.reexecution_steps:
+def _get_backfill_create_run_args(
+    instance: DagsterInstance,
+    repo_location: RepositoryLocation,
+    external_pipeline: ExternalPipeline,
+    external_partition_set: ExternalPartitionSet,
+    backfill_job: PartitionBackfill,
+    partition_data: ExternalPartitionExecutionParamData,
+) -> Mapping[str, Any]:
+    """Returns the arguments to DagsterInstance.create_run for the run of the partition, for
+    backfills that do not re-execute from failure."""
+    check.invariant(not backfill_job.from_failure)
+
+    tags = _get_backfill_run_tags(external_pipeline, backfill_job, partition_data)
+    step_keys_to_execute = None
+    parent_run_id = None
+    root_run_id = None
+    known_state = None
+    if backfill_job.reexecution_steps:
         last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
@@ -280,12 +409,12 @@ def create_backfill_run(
                 instance,
                 last_run,
             ).update_for_step_selection(step_keys_to_execute)
-        else:
-            known_state = None
 
-        if external_partition_set.solid_selection:
-            solids_to_execute = frozenset(external_partition_set.solid_selection)
-            solid_selection = external_partition_set.solid_selection
+    solids_to_execute = None
+    solid_selection = None
+    if external_partition_set.solid_selection:
+        solids_to_execute = frozenset(external_partition_set.solid_selection)
+        solid_selection = external_partition_set.solid_selection
 
     external_execution_plan = repo_location.get_external_execution_plan(
         external_pipeline,
@@ -296,7 +425,7 @@ def create_backfill_run(
         instance=instance,
     )
 
-    return instance.create_run(
+    return dict(
         pipeline_snapshot=external_pipeline.pipeline_snapshot,
         execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
         parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
@@ -67,6 +67,7 @@
     from dagster._core.definitions.job_definition import JobDefinition
     from dagster._core.definitions.resource_definition import Resources
     from dagster._core.event_api import EventLogRecord
+    from dagster._core.execution.plan.fusion import FusedStepOutputs
     from dagster._core.execution.plan.plan import ExecutionPlan
     from dagster._core.execution.plan.state import KnownExecutionState
     from dagster._core.instance import DagsterInstance
@@ -181,6 +182,7 @@ class ExecutionData(NamedTuple):
     resolved_run_config: ResolvedRunConfig
     pipeline_def: PipelineDefinition
     mode_def: ModeDefinition
+    fused_step_outputs: "FusedStepOutputs"
 
 
 class IStepContext(IPlanContext):
@@ -782,6 +784,10 @@ def step_exception(self) -> Optional[BaseException]:
     def step_output_capture(self) -> Optional[Dict[StepOutputHandle, Any]]:
         return self._step_output_capture
 
+    @property
+    def fused_step_outputs(self) -> "FusedStepOutputs":
+        return self._execution_data.fused_step_outputs
+
     @property
     def previous_attempt_count(self) -> int:
         return self.get_known_state().get_retry_state().get_attempt_count(self._step.key)
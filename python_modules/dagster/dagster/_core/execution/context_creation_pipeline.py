@@ -29,6 +29,7 @@
 from dagster._core.errors import DagsterError, DagsterUserCodeExecutionError
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.memoization import validate_reexecution_memoization
+from dagster._core.execution.plan.fusion import FusedStepOutputs
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.resources_init import (
     get_required_resource_keys_to_init,
@@ -169,6 +170,7 @@ def create_execution_data(
         mode_def=context_creation_data.pipeline_def.get_mode_definition(
             context_creation_data.resolved_run_config.mode
         ),
+        fused_step_outputs=FusedStepOutputs(context_creation_data.execution_plan),
     )
 
 
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Any, AsyncGenerator, Awaitable, Generator, Iterator, Optional
+
+import dagster._check as check
+from dagster._core.errors import DagsterInvariantViolationError
+
+_step_event_loop = threading.local()
+
+
+@contextmanager
+def use_step_event_loop(loop: asyncio.AbstractEventLoop) -> Iterator[None]:
+    """Within this context, the current thread runs the given event loop, on which steps are
+    executed as tasks. Rather than blocking on the coroutines of a step, e.g. async op bodies or the
+    methods of an AsyncIOManager, step execution yields them up as StepAwaits for the task that
+    drives the step to await.
+
+    This is how the asyncio executor runs every executing step concurrently on a single event loop.
+    """
+    check.inst_param(loop, "loop", asyncio.AbstractEventLoop)
+    previous = getattr(_step_event_loop, "loop", None)
+    _step_event_loop.loop = loop
+    try:
+        yield
+    finally:
+        _step_event_loop.loop = previous
+
+
+def get_step_event_loop() -> Optional[asyncio.AbstractEventLoop]:
+    return getattr(_step_event_loop, "loop", None)
+
+
+class StepAwait:
+    """Yielded up through the event sequence of a step that is executing as a task on the step
+    event loop, to suspend the step until the awaitable completes. The task driving the step awaits
+    it with `resolve` before resuming the step, which then reads the outcome with `result`.
+    """
+
+    def __init__(self, awaitable: Awaitable):
+        self._awaitable = awaitable
+        self._result: Any = None
+        self._exception: Optional[Exception] = None
+
+    async def resolve(self) -> None:
+        try:
+            self._result = await self._awaitable
+        except Exception as e:  # pylint: disable=broad-except
+            # raised within the step when it is resumed
+            self._exception = e
+
+    def result(self) -> Any:
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+def await_in_step(awaitable: Awaitable) -> Generator[StepAwait, None, Any]:
+    """Awaits the awaitable from within the event sequence of a step, as
+    `value = yield from await_in_step(awaitable)`. Every generator between here and the executor
+    must pass the yielded StepAwaits through. Outside of the step event loop, the awaitable is run
+    to completion on the current thread instead.
+    """
+    if get_step_event_loop() is None:
+        return run_coroutine(awaitable)
+
+    step_await = StepAwait(awaitable)
+    yield step_await
+    return step_await.result()
+
+
+def run_coroutine(awaitable: Awaitable) -> Any:
+    """Runs the awaitable to completion and returns its result, blocking the current thread."""
+    if get_step_event_loop() is not None:
+        raise DagsterInvariantViolationError(
+            "Cannot block on a coroutine on the event loop that the asyncio executor runs steps "
+            "on. Await it from an async op or an AsyncIOManager instead."
+        )
+
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        # threads other than the main thread have no event loop by default
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(awaitable)
+
+
+def gen_from_async_gen(async_gen: AsyncGenerator) -> Iterator:
+    while True:
+        try:
+            item = yield from await_in_step(async_gen.__anext__())
+        except StopAsyncIteration:
+            return
+        yield item
+
+
+_DONE = object()
+
+
+def _next_or_done(iterator: Iterator) -> Any:
+    # StopIteration can't be raised through a future
+    return next(iterator, _DONE)
+
+
+def gen_off_step_event_loop(iterator: Iterator) -> Iterator:
+    """Iterates an iterator of synchronous user code from within the event sequence of a step. On
+    the step event loop, each item is computed on the loop's default executor, so that blocking
+    user code does not hold up the other executing steps.
+    """
+    loop = get_step_event_loop()
+    if loop is None:
+        yield from iterator
+        return
+
+    iterator = iter(iterator)
+    while True:
+        item = yield from await_in_step(loop.run_in_executor(None, _next_or_done, iterator))
+        if item is _DONE:
+            return
+        yield item
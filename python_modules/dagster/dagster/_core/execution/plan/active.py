@@ -1,5 +1,20 @@
+import heapq
+import itertools
 import time
-from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, cast
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 import dagster._check as check
 from dagster._core.errors import (
@@ -13,6 +28,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._utils.interrupts import pop_captured_interrupt
+from dagster._utils.tags import TagConcurrencyLimitsCounter
 
 from .outputs import StepOutputData, StepOutputHandle
 from .plan import ExecutionPlan
@@ -31,6 +47,7 @@ def __init__(
         execution_plan: ExecutionPlan,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]] = None,
     ):
         self._plan: ExecutionPlan = check.inst_param(
             execution_plan, "execution_plan", ExecutionPlan
@@ -46,13 +63,31 @@ def __init__(
             or _default_sort_key
         )
 
+        self._tag_concurrency_limits = check.opt_sequence_param(
+            tag_concurrency_limits, "tag_concurrency_limits", of_type=Mapping
+        )
+
         self._context_guard: bool = False  # Prevent accidental direct use
 
         # We decide what steps to skip based on what outputs are yielded by upstream steps
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # Rather than scanning all of _pending on every _update, track for each pending step how
+        # many of its upstream steps have yet to complete, indexed by upstream step. Completing a
+        # step then only touches its direct downstream steps, and _update only examines the steps
+        # that were queued up here as a result.
+        self._downstream: Dict[str, Set[str]] = defaultdict(set)
+        self._unmet_upstream_count: Dict[str, int] = {}
+        self._ready: Set[str] = set()
+        self._blocked: Set[str] = set()
+        self._resolved_upstream: Set[str] = set()
+        # steps are moved out of _pending in the order they were added, as a tie-breaker for
+        # sort_key_fn
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -63,13 +98,19 @@ def __init__(
         )
         self._new_dynamic_mappings: bool = False
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls, _executable is a heap
+        # ordered by sort_key_fn and then by the order in which steps became executable
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_counter = itertools.count()
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
         self._waiting_to_retry: Dict[str, float] = {}
 
+        # pending steps claimed to be executed along with an in flight step that they are fused
+        # with, see claim_fused_steps
+        self._fused: Set[str] = set()
+
         # then are considered _in_flight when vended via get_steps_to_*
         self._in_flight: Set[str] = set()
 
@@ -84,6 +125,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -100,7 +144,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [key for _, _, key in self._executable]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -141,6 +188,56 @@ def __exit__(self, exc_type, exc_value, traceback):
                     )
                 )
 
+    def _add_pending(self, step_key: str, requirements: Set[str]) -> None:
+        if step_key in self._pending:
+            for upstream_key in self._pending[step_key]:
+                self._downstream[upstream_key].discard(step_key)
+            self._ready.discard(step_key)
+            self._blocked.discard(step_key)
+
+        self._pending[step_key] = requirements
+        if step_key not in self._pending_order:
+            self._pending_order[step_key] = next(self._pending_counter)
+
+        unmet_count = 0
+        for upstream_key in requirements:
+            if upstream_key in self._failed or upstream_key in self._abandoned:
+                self._blocked.add(step_key)
+            elif upstream_key not in self._success and upstream_key not in self._skipped:
+                self._downstream[upstream_key].add(step_key)
+                unmet_count += 1
+
+        self._unmet_upstream_count[step_key] = unmet_count
+        if unmet_count == 0:
+            self._ready.add(step_key)
+
+    def _resolve_upstream(self, step_key: str, succeeded: bool) -> None:
+        """Propagate the terminal state of a step to the pending steps that depend on it."""
+        if step_key in self._resolved_upstream:
+            return
+        self._resolved_upstream.add(step_key)
+
+        for downstream_key in self._downstream.pop(step_key, ()):
+            if downstream_key not in self._pending:
+                # already skipped or abandoned due to another upstream step
+                continue
+            if not succeeded:
+                self._blocked.add(downstream_key)
+            else:
+                self._unmet_upstream_count[downstream_key] -= 1
+                if self._unmet_upstream_count[downstream_key] == 0:
+                    if downstream_key in self._fused:
+                        self._start_fused_step(downstream_key)
+                    else:
+                        self._ready.add(downstream_key)
+
+    def _start_fused_step(self, step_key: str) -> None:
+        # the step is already being executed, by whatever is executing the step it is fused with
+        self._fused.remove(step_key)
+        self._remove_pending(step_key)
+        self._in_flight.add(step_key)
+        self._prep_for_dynamic_outputs(self.get_step_by_key(step_key))
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed
@@ -149,60 +246,63 @@ def _update(self) -> None:
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
-            # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
-
-            # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
-                step = self.get_step_by_key(step_key)
+        # If any upstream deps failed - this is not executable
+        for step_key in self._in_pending_order(self._blocked):
+            new_steps_to_abandon.append(step_key)
+
+        # If all the upstream steps of a step are complete or skipped
+        for step_key in self._in_pending_order(self._ready):
+            if step_key in self._blocked:
+                continue
+
+            requirements = self._pending[step_key]
+            step = self.get_step_by_key(step_key)
+
+            # The base case is downstream step won't skip
+            should_skip = False
+
+            # If there is at least one of the step's inputs, none of whose upstream steps has
+            # yielded an output, we should skip that step.
+            for step_input in step.step_inputs:
+                missing_source_handles = [
+                    source_handle
+                    for source_handle in step_input.get_step_output_handle_dependencies()
+                    if source_handle.step_key in requirements
+                    and source_handle not in self._step_outputs
+                ]
+                if missing_source_handles:
+                    if len(missing_source_handles) == len(
+                        step_input.get_step_output_handle_dependencies()
+                    ):
+                        should_skip = True
+                        break
+
+            if should_skip:
+                new_steps_to_skip.append(step_key)
+            else:
+                new_steps_to_execute.append(step_key)
 
-                # The base case is downstream step won't skip
-                should_skip = False
-
-                # If there is at least one of the step's inputs, none of whose upstream steps has
-                # yielded an output, we should skip that step.
-                for step_input in step.step_inputs:
-                    missing_source_handles = [
-                        source_handle
-                        for source_handle in step_input.get_step_output_handle_dependencies()
-                        if source_handle.step_key in requirements
-                        and source_handle not in self._step_outputs
-                    ]
-                    if missing_source_handles:
-                        if len(missing_source_handles) == len(
-                            step_input.get_step_output_handle_dependencies()
-                        ):
-                            should_skip = True
-                            break
-
-                if should_skip:
-                    new_steps_to_skip.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
+        self._blocked.clear()
+        self._ready.clear()
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            self._add_executable(key)
+            self._remove_pending(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
+            self._remove_pending(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -211,9 +311,24 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
+    def _in_pending_order(self, step_keys: Set[str]) -> Sequence[str]:
+        return sorted(
+            (step_key for step_key in step_keys if step_key in self._pending),
+            key=self._pending_order.__getitem__,
+        )
+
+    def _add_executable(self, step_key: str) -> None:
+        sort_key = self._sort_key_fn(self.get_step_by_key(step_key))
+        heapq.heappush(self._executable, (sort_key, next(self._executable_counter), step_key))
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._unmet_upstream_count[step_key]
+        del self._pending_order[step_key]
+
     def sleep_til_ready(self) -> None:
         now = time.time()
         sleep_amt = min([ready_at - now for ready_at in self._waiting_to_retry.values()])
@@ -247,21 +362,66 @@ def get_steps_to_execute(self, limit: Optional[int] = None) -> Sequence[Executio
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
+        tag_concurrency_limits_counter = None
+        if self._tag_concurrency_limits:
+            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+                self._tag_concurrency_limits
+            )
+            for in_flight_key in self._in_flight:
+                tag_concurrency_limits_counter.update_counters_with_launched_item(
+                    self.get_step_by_key(in_flight_key)
+                )
 
-        if limit is not None:
-            steps = steps[:limit]
+        steps = []
+        blocked = []
+        while self._executable and (limit is None or len(steps) < limit):
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+            if tag_concurrency_limits_counter:
+                if tag_concurrency_limits_counter.is_blocked(step):
+                    # held back until enough of the in flight steps with the same tags complete
+                    blocked.append(entry)
+                    continue
+                tag_concurrency_limits_counter.update_counters_with_launched_item(step)
 
-        for step in steps:
+            steps.append(step)
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         return steps
 
+    def claim_fused_steps(self, step_keys: Sequence[str]) -> Sequence[str]:
+        """Claims steps that follow an in flight step in its chain of fused steps, so that they are
+        executed along with it rather than vended by get_steps_to_execute. A claimed step is
+        considered in flight as soon as the step that it depends on succeeds.
+
+        Returns the keys of the claimed steps, the longest prefix of the given steps that are
+        still pending and unclaimed.
+        """
+        check.sequence_param(step_keys, "step_keys", of_type=str)
+
+        claimed = []
+        for step_key in step_keys:
+            if step_key not in self._pending or step_key in self._fused:
+                break
+            self._fused.add(step_key)
+            claimed.append(step_key)
+        return claimed
+
+    def release_fused_steps(self, step_keys: Sequence[str]) -> None:
+        """Releases claimed steps that did not start, e.g. because the step that they depend on
+        failed or is up for retry, back to being executed on their own."""
+        check.sequence_param(step_keys, "step_keys", of_type=str)
+
+        for step_key in step_keys:
+            self._fused.discard(step_key)
+
+    def is_in_flight(self, step_key: str) -> bool:
+        return step_key in self._in_flight
+
     def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
@@ -339,20 +499,24 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
 
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
+        self._resolve_upstream(step_key, succeeded=False)
         self._mark_complete(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
+        self._resolve_upstream(step_key, succeeded=True)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
+        self._resolve_upstream(step_key, succeeded=True)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
+        self._resolve_upstream(step_key, succeeded=False)
         self._mark_complete(step_key)
 
     def mark_interrupted(self) -> None:
@@ -373,11 +537,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._resolve_upstream(step_key, succeeded=False)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -1,6 +1,5 @@
-import asyncio
 import inspect
-from typing import Any, AsyncGenerator, Callable, Iterator, List, Mapping, Sequence, Set, Union
+from typing import Any, Callable, Iterator, List, Mapping, Sequence, Set, Union
 
 import dagster._check as check
 from dagster._core.definitions import (
@@ -18,6 +17,11 @@
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.context.compute import SolidExecutionContext
 from dagster._core.execution.context.system import StepExecutionContext
+from dagster._core.execution.event_loop import (
+    StepAwait,
+    gen_from_async_gen,
+    gen_off_step_event_loop,
+)
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._utils import iterate_with_context
 
@@ -102,15 +106,6 @@ def _validate_event(event: Any, step_context: StepExecutionContext) -> SolidOutp
     return event
 
 
-def gen_from_async_gen(async_gen: AsyncGenerator) -> Iterator:
-    loop = asyncio.get_event_loop()
-    while True:
-        try:
-            yield loop.run_until_complete(async_gen.__anext__())
-        except StopAsyncIteration:
-            return
-
-
 def _yield_compute_results(
     step_context: StepExecutionContext, inputs: Mapping[str, Any], compute_fn: Callable
 ) -> Iterator[SolidOutputUnion]:
@@ -136,6 +131,8 @@ def _yield_compute_results(
 
     if inspect.isasyncgen(user_event_generator):
         user_event_generator = gen_from_async_gen(user_event_generator)
+    else:
+        user_event_generator = gen_off_step_event_loop(user_event_generator)
 
     op_label = step_context.describe_op()
 
@@ -150,6 +147,9 @@ def _yield_compute_results(
         ),
         user_event_generator,
     ):
+        if isinstance(event, StepAwait):
+            yield event
+            continue
         if context.has_events():
             yield from context.consume_events()
         yield _validate_event(event, step_context)
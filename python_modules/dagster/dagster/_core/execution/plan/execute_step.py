@@ -59,12 +59,13 @@
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.context.output import OutputContext
 from dagster._core.execution.context.system import StepExecutionContext, TypeCheckContext
+from dagster._core.execution.event_loop import StepAwait, await_in_step
 from dagster._core.execution.plan.compute import execute_core_compute
 from dagster._core.execution.plan.inputs import StepInputData
 from dagster._core.execution.plan.objects import StepSuccessData, TypeCheckData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.resolve_versions import resolve_step_output_versions
-from dagster._core.storage.io_manager import IOManager
+from dagster._core.storage.io_manager import AsyncIOManager, IOManager
 from dagster._core.storage.tags import MEMOIZED_RUN_TAG
 from dagster._core.types.dagster_type import DagsterType
 from dagster._utils import ensure_gen, iterate_with_context
@@ -351,7 +352,7 @@ def core_dagster_event_sequence_for_step(
         for event_or_input_value in ensure_gen(
             step_input.source.load_input_object(step_context, input_def)
         ):
-            if isinstance(event_or_input_value, DagsterEvent):
+            if isinstance(event_or_input_value, (DagsterEvent, StepAwait)):
                 yield event_or_input_value
             else:
                 check.invariant(step_input.name not in inputs)
@@ -389,7 +390,7 @@ def core_dagster_event_sequence_for_step(
         for user_event in check.generator(
             _step_output_error_checked_user_event_sequence(step_context, user_event_sequence)
         ):
-            if isinstance(user_event, DagsterEvent):
+            if isinstance(user_event, (DagsterEvent, StepAwait)):
                 yield user_event
             elif isinstance(user_event, (Output, DynamicOutput)):
                 for evt in _type_check_and_store_output(step_context, user_event, input_lineage):
@@ -437,6 +438,8 @@ def _type_check_and_store_output(
     # capture output at the step level for threading the computed output values to hook context
     if step_context.step_output_capture is not None:
         step_context.step_output_capture[step_output_handle] = output.value
+    # hold on to outputs that are passed in memory to a fused downstream step
+    step_context.fused_step_outputs.capture(step_output_handle, output.value)
 
     version = (
         resolve_step_output_versions(
@@ -623,7 +626,17 @@ def _store_output(
     # catch errors should they be raised before a return value. We can do this by wrapping
     # handle_output in a generator so that errors will be caught within iterate_with_context.
 
-    if not inspect.isgeneratorfunction(output_manager.handle_output):
+    if isinstance(output_manager, AsyncIOManager):
+
+        def _gen_fn():
+            yield from await_in_step(
+                output_manager.handle_output_async(output_context, output.value)
+            )
+            for event in output_context.consume_events():
+                yield event
+
+        handle_output_gen = _gen_fn()
+    elif not inspect.isgeneratorfunction(output_manager.handle_output):
 
         def _gen_fn():
             gen_output = output_manager.handle_output(output_context, output.value)
@@ -649,6 +662,10 @@ def _gen_fn():
         ),
         handle_output_gen,
     ):
+        if isinstance(elt, StepAwait):
+            yield elt
+            continue
+
         for event in output_context.consume_events():
             yield event
 
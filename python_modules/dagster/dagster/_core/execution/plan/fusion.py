@@ -0,0 +1,105 @@
+from collections import defaultdict
+from typing import Any, Dict, Mapping, Sequence, Set
+
+import dagster._check as check
+from dagster._core.storage.tags import FUSIBLE_TAG
+
+from .outputs import StepOutputHandle
+from .plan import ExecutionPlan
+from .step import ExecutionStep, IExecutionStep
+
+
+def is_fusible_step(step: IExecutionStep) -> bool:
+    """Whether the step opted in to being fused with its neighbors via the dagster/fusible tag.
+
+    Steps with dynamic outputs are never fused, since the steps downstream of them are only
+    resolved once they complete.
+    """
+    return (
+        isinstance(step, ExecutionStep)
+        and str(step.tags.get(FUSIBLE_TAG, "")).lower() == "true"
+        and not any(step_output.is_dynamic for step_output in step.step_outputs)
+    )
+
+
+def get_fused_successors(execution_plan: ExecutionPlan) -> Mapping[str, str]:
+    """Maps the key of each step to execute that is fused with the step that follows it to the key
+    of that step. Following the mapping from a step yields the rest of its chain of fused steps.
+
+    A step is fused with its upstream step when both are fusible and to be executed, the upstream
+    step is the only step that it depends on, it is the only step that depends on the upstream
+    step, and every output of the upstream step that it depends on is required. The last condition
+    ensures that, once the upstream step succeeds, the downstream step is never skipped.
+    """
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+    fusible_steps = {
+        step.key: step
+        for step in execution_plan.get_steps_to_execute_in_topo_order()
+        if is_fusible_step(step)
+    }
+    if len(fusible_steps) < 2:
+        return {}
+
+    all_step_deps = execution_plan.get_all_step_deps()
+    downstream_keys: Dict[str, Set[str]] = defaultdict(set)
+    for step_key, deps in all_step_deps.items():
+        for upstream_key in deps:
+            downstream_keys[upstream_key].add(step_key)
+
+    fused_successors = {}
+    for step_key, step in fusible_steps.items():
+        deps = all_step_deps[step_key]
+        if len(deps) != 1:
+            continue
+
+        upstream_key = next(iter(deps))
+        upstream_step = fusible_steps.get(upstream_key)
+        if upstream_step is None or downstream_keys[upstream_key] != {step_key}:
+            continue
+
+        if all(
+            upstream_step.step_output_named(step_output_handle.output_name).is_required
+            for step_input in step.step_inputs
+            for step_output_handle in step_input.get_step_output_handle_dependencies()
+        ):
+            fused_successors[upstream_key] = step_key
+
+    return fused_successors
+
+
+def get_fused_step_keys(fused_successors: Mapping[str, str], step_key: str) -> Sequence[str]:
+    """Returns the keys of the steps that follow the given step in its chain of fused steps."""
+    fused_step_keys = []
+    while step_key in fused_successors:
+        step_key = fused_successors[step_key]
+        fused_step_keys.append(step_key)
+    return fused_step_keys
+
+
+class FusedStepOutputs:
+    """Passes the outputs of fused steps to the steps that follow them in memory, when both are
+    executed as part of the same plan execution.
+
+    Outputs are still handled by their IO managers, so that they remain available to retries and
+    re-executions, but the downstream step receives the value directly rather than loading it.
+    Each value is only held until it is first received.
+    """
+
+    def __init__(self, execution_plan: ExecutionPlan):
+        self._fused_successors = get_fused_successors(execution_plan)
+        self._values: Dict[StepOutputHandle, Any] = {}
+
+    def capture(self, step_output_handle: StepOutputHandle, value: Any) -> None:
+        if step_output_handle.step_key in self._fused_successors:
+            self._values[step_output_handle] = value
+
+    def has_value(self, step_key: str, step_output_handle: StepOutputHandle) -> bool:
+        """Whether the given step can receive the output in memory."""
+        return (
+            self._fused_successors.get(step_output_handle.step_key) == step_key
+            and step_output_handle in self._values
+        )
+
+    def pop_value(self, step_output_handle: StepOutputHandle) -> Any:
+        return self._values.pop(step_output_handle)
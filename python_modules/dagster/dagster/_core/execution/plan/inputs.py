@@ -27,7 +27,8 @@
     DagsterTypeLoadingError,
     user_code_error_boundary,
 )
-from dagster._core.storage.io_manager import IOManager
+from dagster._core.execution.event_loop import StepAwait, await_in_step
+from dagster._core.storage.io_manager import AsyncIOManager, IOManager
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._serdes import whitelist_for_serdes
 from dagster._utils import ensure_gen
@@ -474,6 +475,16 @@ def load_input_object(
 
         source_handle = self.step_output_handle
 
+        if input_def.input_manager_key is None and step_context.fused_step_outputs.has_value(
+            step_context.step.key, source_handle
+        ):
+            step_context.log.debug(
+                f'Received input "{input_def.name}" in memory from fused step '
+                f'"{source_handle.step_key}".'
+            )
+            yield step_context.fused_step_outputs.pop_value(source_handle)
+            return
+
         if input_def.input_manager_key is not None:
             manager_key = input_def.input_manager_key
             input_manager = getattr(step_context.resources, manager_key)
@@ -819,7 +830,7 @@ def load_input_object(
             for event_or_input_value in ensure_gen(
                 inner_source.load_input_object(step_context, input_def)
             ):
-                if isinstance(event_or_input_value, DagsterEvent):
+                if isinstance(event_or_input_value, (DagsterEvent, StepAwait)):
                     yield event_or_input_value
                 else:
                     values.append(event_or_input_value)
@@ -864,7 +875,10 @@ def _load_input_with_input_manager(input_manager: "InputManager", context: "Inpu
         step_key=step_context.step.key,
         input_name=context.name,
     ):
-        value = input_manager.load_input(context)
+        if isinstance(input_manager, AsyncIOManager):
+            value = yield from await_in_step(input_manager.load_input_async(context))
+        else:
+            value = input_manager.load_input(context)
     # close user code boundary before returning value
     for event in context.consume_events():
         yield event
@@ -1,6 +1,7 @@
 from collections import OrderedDict, defaultdict
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
     FrozenSet,
@@ -44,7 +45,7 @@
 )
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance, InstanceRef
-from dagster._core.storage.mem_io_manager import mem_io_manager
+from dagster._core.storage.mem_io_manager import is_mem_io_manager
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.utils import toposort
 
@@ -242,7 +243,7 @@ def build(self) -> "ExecutionPlan":
                 step_dict_by_key,
                 step_handles_to_execute,
                 pipeline_def,
-                self.resolved_run_config,
+                self.resolved_run_config.mode,
                 executable_map,
             ),
             executor_name=executor_name,
@@ -779,14 +780,47 @@ def resolve(
 
         return {key: deps for key, deps in after.items() if key not in previous}
 
+    def with_known_state(self, known_state: KnownExecutionState) -> "ExecutionPlan":
+        """Returns a copy of this plan with the given known state, resolving any dynamic steps that
+        it makes executable. This plan is left unmodified, so that it may be shared."""
+        check.inst_param(known_state, "known_state", KnownExecutionState)
+
+        step_dict = dict(self.step_dict)
+        step_dict_by_key = dict(self.step_dict_by_key)
+        executable_map, resolvable_map = _compute_step_maps(
+            step_dict,
+            step_dict_by_key,
+            list(self.step_handles_to_execute),
+            known_state,
+        )
+
+        return ExecutionPlan(
+            step_dict,
+            executable_map,
+            resolvable_map,
+            self.step_handles_to_execute,
+            known_state,
+            self.artifacts_persisted,
+            step_dict_by_key,
+            executor_name=self.executor_name,
+            repository_load_data=self.repository_load_data,
+        )
+
     def build_subset_plan(
         self,
         step_keys_to_execute: Sequence[str],
         pipeline_def: PipelineDefinition,
-        resolved_run_config: ResolvedRunConfig,
+        resolved_run_config: Optional[ResolvedRunConfig],
         step_output_versions=None,
+        mode: Optional[str] = None,
     ) -> "ExecutionPlan":
+        """The resolved run config is only used for its mode, which may instead be passed directly,
+        e.g. to subset a cached plan without resolving the run config again."""
         check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.opt_inst_param(resolved_run_config, "resolved_run_config", ResolvedRunConfig)
+        mode = (
+            resolved_run_config.mode if resolved_run_config else check.opt_str_param(mode, "mode")
+        )
         step_output_versions = check.opt_dict_param(
             step_output_versions, "step_output_versions", key_type=StepOutputHandle, value_type=str
         )
@@ -860,7 +894,7 @@ def build_subset_plan(
                 self.step_dict_by_key,
                 step_handles_to_execute,
                 pipeline_def,
-                resolved_run_config,
+                mode,
                 executable_map,
             ),
             executor_name=self.executor_name,
@@ -975,6 +1009,7 @@ def start(
         self,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]] = None,
     ) -> "ActiveExecution":
         from .active import ActiveExecution
 
@@ -982,6 +1017,7 @@ def start(
             self,
             retry_mode,
             sort_key_fn,
+            tag_concurrency_limits,
         )
 
     def step_handle_for_single_step_plans(
@@ -1221,15 +1257,13 @@ def can_isolate_steps(pipeline_def: PipelineDefinition, mode_def: ModeDefinition
     If true, this indicates that it's OK to execute steps in their own processes, because their
     outputs will be available to other processes.
     """
-    # pylint: disable=comparison-with-callable
-
     output_defs = [
         output_def
         for solid_def in pipeline_def.all_node_defs
         for output_def in solid_def.output_defs
     ]
     for output_def in output_defs:
-        if mode_def.resource_defs[output_def.io_manager_key] == mem_io_manager:
+        if is_mem_io_manager(mode_def.resource_defs[output_def.io_manager_key]):
             return False
 
     return True
@@ -1330,7 +1364,7 @@ def _compute_artifacts_persisted(
     step_dict_by_key,
     step_handles_to_execute,
     pipeline_def,
-    resolved_run_config,
+    mode,
     executable_map,
 ):
     """
@@ -1340,7 +1374,7 @@ def _compute_artifacts_persisted(
     """
     # pylint: disable=comparison-with-callable
 
-    mode_def = pipeline_def.get_mode_definition(resolved_run_config.mode)
+    mode_def = pipeline_def.get_mode_definition(mode)
 
     if len(step_dict) == 0:
         return False
@@ -1364,7 +1398,7 @@ def _compute_artifacts_persisted(
                     # no IO manager is configured
                     not manager_def
                     # IO manager is non persistent
-                    or manager_def == mem_io_manager
+                    or is_mem_io_manager(manager_def)
                 ):
                     return False
     return True
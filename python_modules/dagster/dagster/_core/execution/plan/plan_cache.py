@@ -0,0 +1,149 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, AbstractSet, Any, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._core.definitions.events import AssetKey
+from dagster._serdes.utils import hash_str
+
+if TYPE_CHECKING:
+    from dagster._core.execution.plan.plan import ExecutionPlan
+
+# the number of execution plans that are kept in memory by each process, unless it is set in the
+# `execution_plan_cache` instance settings
+DEFAULT_EXECUTION_PLAN_CACHE_SIZE = 16
+
+
+def get_execution_plan_cache_max_size(instance_settings: Optional[Mapping[str, Any]]) -> int:
+    plan_cache_settings = (instance_settings or {}).get("execution_plan_cache") or {}
+    return plan_cache_settings.get("max_size", DEFAULT_EXECUTION_PLAN_CACHE_SIZE)
+
+
+class ExecutionPlanCacheKey(
+    NamedTuple(
+        "_ExecutionPlanCacheKey",
+        [
+            ("pipeline_snapshot_id", str),
+            ("run_config_hash", str),
+            ("step_keys_to_execute", Optional[Tuple[str, ...]]),
+        ],
+    )
+):
+    """Identifies the execution plan that is built for a job with a particular run config and step
+    selection, from an initially unknown execution state."""
+
+    def __new__(
+        cls,
+        pipeline_snapshot_id: str,
+        run_config_hash: str,
+        step_keys_to_execute: Optional[Tuple[str, ...]],
+    ):
+        return super(ExecutionPlanCacheKey, cls).__new__(
+            cls,
+            pipeline_snapshot_id=check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id"),
+            run_config_hash=check.str_param(run_config_hash, "run_config_hash"),
+            step_keys_to_execute=step_keys_to_execute,
+        )
+
+
+def get_execution_plan_cache_key(
+    pipeline_snapshot_id: str,
+    run_config: Mapping[str, object],
+    mode: Optional[str],
+    step_keys_to_execute: Optional[Sequence[str]],
+    solid_selection: Optional[Sequence[str]] = None,
+    asset_selection: Optional[AbstractSet[AssetKey]] = None,
+) -> Optional[ExecutionPlanCacheKey]:
+    """Returns None if the run config can't be hashed, in which case the plan should not be cached.
+
+    The snapshot id of a subset job already identifies the subset, but the selection is hashed
+    along with the run config too, so that a plan is never reused for a different subset.
+    """
+    check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
+    check.mapping_param(run_config, "run_config")
+    check.opt_str_param(mode, "mode")
+    check.opt_nullable_sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    check.opt_nullable_sequence_param(solid_selection, "solid_selection", of_type=str)
+    check.opt_nullable_set_param(asset_selection, "asset_selection", of_type=AssetKey)
+
+    try:
+        run_config_json = json.dumps(
+            {
+                "mode": mode,
+                "run_config": run_config,
+                "solid_selection": sorted(solid_selection) if solid_selection else None,
+                "asset_selection": sorted(key.to_user_string() for key in asset_selection)
+                if asset_selection
+                else None,
+            },
+            sort_keys=True,
+        )
+    except (TypeError, ValueError):
+        return None
+
+    return ExecutionPlanCacheKey(
+        pipeline_snapshot_id,
+        hash_str(run_config_json),
+        tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
+    )
+
+
+class ExecutionPlanCache:
+    """A thread-safe, in-process LRU cache of execution plans.
+
+    Cached plans are shared, so they must not be modified: ActiveExecution resolves dynamic steps
+    in the plan that it is executing, so callers should execute a copy derived with
+    ExecutionPlan.with_known_state instead.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = check.int_param(max_size, "max_size")
+        self._plans: "OrderedDict[ExecutionPlanCacheKey, ExecutionPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, key: ExecutionPlanCacheKey) -> Optional["ExecutionPlan"]:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+            return plan
+
+    def set(self, key: ExecutionPlanCacheKey, plan: "ExecutionPlan") -> None:
+        if self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self._max_size:
+                self._plans.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+
+_execution_plan_cache: Optional[ExecutionPlanCache] = None
+_execution_plan_cache_lock = threading.Lock()
+
+
+def get_execution_plan_cache(
+    max_size: int = DEFAULT_EXECUTION_PLAN_CACHE_SIZE,
+) -> ExecutionPlanCache:
+    """Returns the cache that is shared by the whole process.
+
+    The cache is sized once, by the first caller in the process. Code servers and step workers can
+    plan for several instances, and resizing the shared cache for each of them would evict the
+    plans cached for the others.
+    """
+    global _execution_plan_cache  # pylint: disable=global-statement
+
+    with _execution_plan_cache_lock:
+        if _execution_plan_cache is None:
+            _execution_plan_cache = ExecutionPlanCache(max_size=max_size)
+        return _execution_plan_cache
@@ -0,0 +1,140 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Set
+
+import dagster._check as check
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.stats import StepEventStatus
+from dagster._core.storage.pipeline_run import FINISHED_STATUSES, RunsFilter
+from dagster._core.storage.tags import PRIORITY_TAG, STEP_PRIORITIZATION_TAG
+
+from .handle import StepHandle
+from .plan import ExecutionPlan
+from .step import ExecutionStep
+
+if TYPE_CHECKING:
+    from dagster._core.execution.context.system import PlanOrchestrationContext
+    from dagster._core.instance import DagsterInstance
+
+CRITICAL_PATH_PRIORITIZATION = "critical_path"
+
+# the number of previous runs of a job whose step durations are used to weight the critical path
+DEFAULT_STEP_DURATION_HISTORY_RUNS = 5
+
+
+def get_step_sort_key_fn(
+    plan_context: "PlanOrchestrationContext", execution_plan: ExecutionPlan
+) -> Optional[Callable[[ExecutionStep], float]]:
+    """Returns the sort key fn to start the execution plan with, based on the step prioritization
+    tag of the run. Returns None for the default, priority tag only, ordering."""
+    prioritization = plan_context.pipeline_run.tags.get(STEP_PRIORITIZATION_TAG)
+    if prioritization is None:
+        return None
+
+    if prioritization != CRITICAL_PATH_PRIORITIZATION:
+        raise DagsterInvariantViolationError(
+            f'Unexpected value "{prioritization}" for tag {STEP_PRIORITIZATION_TAG}, expected '
+            f'"{CRITICAL_PATH_PRIORITIZATION}".'
+        )
+
+    step_durations = get_historical_step_durations(
+        plan_context.instance, plan_context.pipeline_name
+    )
+    return critical_path_sort_key_fn(execution_plan, step_durations)
+
+
+def get_historical_step_durations(
+    instance: "DagsterInstance",
+    pipeline_name: str,
+    limit: int = DEFAULT_STEP_DURATION_HISTORY_RUNS,
+) -> Mapping[str, float]:
+    """Averages the durations of successful steps over the most recent finished runs of the given
+    job, keyed by the string form of the step's node handle so that every mapped instance of a
+    dynamic step contributes to the same entry."""
+    runs = instance.get_runs(
+        filters=RunsFilter(job_name=pipeline_name, statuses=FINISHED_STATUSES),
+        limit=limit,
+    )
+
+    durations: Dict[str, List[float]] = defaultdict(list)
+    for run in runs:
+        for step_stats in instance.get_run_step_stats(run.run_id):
+            if (
+                step_stats.status != StepEventStatus.SUCCESS
+                or step_stats.start_time is None
+                or step_stats.end_time is None
+            ):
+                continue
+            handle = StepHandle.parse_from_key(step_stats.step_key)
+            durations[str(handle.solid_handle)].append(step_stats.end_time - step_stats.start_time)
+
+    return {node: sum(values) / len(values) for node, values in durations.items()}
+
+
+def get_remaining_path_weights(
+    execution_plan: ExecutionPlan,
+    step_durations: Optional[Mapping[str, float]] = None,
+) -> Mapping[str, float]:
+    """For each node in the execution plan, computes the weight of the longest path from the start
+    of the node's step to the end of the plan.
+
+    Nodes are weighted by their historical duration in step_durations. Nodes with no history are
+    weighted by the mean of the known durations, so with no history at all the weight of a node is
+    the depth of the deepest chain of steps downstream of it, counting itself.
+    """
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    step_durations = check.opt_mapping_param(step_durations, "step_durations", key_type=str)
+
+    # dynamic steps are weighted by node rather than by step key, since the keys of mapped steps
+    # are not known until their upstream output is resolved
+    downstream: Dict[str, Set[str]] = defaultdict(set)
+    nodes: Set[str] = set()
+    for step in execution_plan.step_dict.values():
+        node = str(step.solid_handle)
+        nodes.add(node)
+        if isinstance(step, ExecutionStep):
+            dep_keys = step.get_execution_dependency_keys()
+        else:
+            dep_keys = step.get_all_dependency_keys()  # type: ignore
+        for dep_key in dep_keys:
+            downstream[str(StepHandle.parse_from_key(dep_key).solid_handle)].add(node)
+
+    known = [step_durations[node] for node in nodes if node in step_durations]
+    default_weight = sum(known) / len(known) if known else 1.0
+
+    weights: Dict[str, float] = {}
+    for node in nodes:
+        if node in weights:
+            continue
+        # iterative post-order walk, to avoid recursion limits on long chains
+        stack = [(node, False)]
+        while stack:
+            current, children_done = stack.pop()
+            if current in weights:
+                continue
+            if children_done:
+                weights[current] = step_durations.get(current, default_weight) + max(
+                    (weights[child] for child in downstream[current]), default=0.0
+                )
+                continue
+            stack.append((current, True))
+            stack.extend((child, False) for child in downstream[current] if child not in weights)
+
+    return weights
+
+
+def critical_path_sort_key_fn(
+    execution_plan: ExecutionPlan,
+    step_durations: Optional[Mapping[str, float]] = None,
+) -> Callable[[ExecutionStep], float]:
+    """Builds a sort key fn for ActiveExecution that starts the executable steps with the longest
+    remaining path through the plan first. The priority tag still takes precedence, the remaining
+    path weight only orders steps of equal priority."""
+    weights = get_remaining_path_weights(execution_plan, step_durations)
+    # normalize the weights into [0, 1) so that they never outrank a difference in priority
+    scale = max(weights.values(), default=0.0) + 1.0
+
+    def _sort_key(step: ExecutionStep) -> float:
+        priority = int(step.tags.get(PRIORITY_TAG, 0))
+        return -priority - weights.get(str(step.solid_handle), 0.0) / scale
+
+    return _sort_key
@@ -1,6 +1,7 @@
 import inspect
+import logging
 from collections import deque
-from contextlib import ContextDecorator
+from contextlib import ContextDecorator, contextmanager
 from typing import (
     AbstractSet,
     Any,
@@ -8,9 +9,11 @@
     Deque,
     Dict,
     Generator,
+    Iterator,
     Mapping,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -48,6 +51,79 @@
 from .context.init import InitResourceContext
 
 
+class ReusableResourceCache:
+    """Holds the reusable resources initialized by the steps that a long-lived worker process
+    executes, so that later steps executed by the same worker can reuse them.
+
+    A resource is only reused for the definition and config that it was initialized with. Each
+    resource is torn down when the cache is, rather than after the step that initialized it.
+    """
+
+    def __init__(self):
+        self._resources: Dict[str, Tuple[ResourceDefinition, Any, "InitializedResource"]] = {}
+        self._managers: Deque[EventGenerationManager] = deque()
+
+    def get(
+        self, resource_name: str, resource_def: ResourceDefinition, resource_config: Any
+    ) -> Optional["InitializedResource"]:
+        if resource_name not in self._resources:
+            return None
+
+        cached_def, cached_config, initialized_resource = self._resources[resource_name]
+        if cached_def is not resource_def or cached_config != resource_config:
+            return None
+        return initialized_resource
+
+    def add(
+        self,
+        resource_name: str,
+        resource_def: ResourceDefinition,
+        resource_config: Any,
+        initialized_resource: "InitializedResource",
+        manager: EventGenerationManager,
+    ) -> bool:
+        """Holds on to a newly initialized resource. Returns False, leaving the resource to be torn
+        down by the caller, if a different resource is already held under the same name."""
+        if resource_name in self._resources:
+            return False
+
+        self._resources[resource_name] = (resource_def, resource_config, initialized_resource)
+        self._managers.append(manager)
+        return True
+
+    def teardown(self) -> None:
+        # in the reverse order of initialization, since resources may depend on earlier ones
+        while self._managers:
+            manager = self._managers.pop()
+            try:
+                for _event in manager.generate_teardown_events():
+                    pass
+            except DagsterUserCodeExecutionError:
+                logging.exception("Error tearing down reusable resource.")
+        self._resources = {}
+
+
+_reusable_resource_cache: Optional[ReusableResourceCache] = None
+
+
+@contextmanager
+def reusable_resource_scope() -> Iterator[ReusableResourceCache]:
+    """Within this scope, resources marked as reusable are initialized once for the current process
+    and reused by every subsequent resource initialization, then torn down on exit. Entered by
+    long-lived worker processes for their whole lifetime.
+    """
+    global _reusable_resource_cache  # pylint: disable=global-statement
+    check.invariant(_reusable_resource_cache is None, "Already within a reusable resource scope")
+
+    cache = ReusableResourceCache()
+    _reusable_resource_cache = cache
+    try:
+        yield cache
+    finally:
+        _reusable_resource_cache = None
+        cache.teardown()
+
+
 def resource_initialization_manager(
     resource_defs: Mapping[str, ResourceDefinition],
     resource_configs: Mapping[str, ResourceConfig],
@@ -146,6 +222,10 @@ def _core_resource_initialization_event_generator(
     resource_keys_to_init = check.opt_set_param(resource_keys_to_init, "resource_keys_to_init")
     resource_instances: Dict[str, "InitializedResource"] = {}
     resource_init_times = {}
+    reusable_resource_cache = _reusable_resource_cache
+    # resources held by the reusable resource cache, which reusable resources may depend on
+    cached_resource_keys: Set[str] = set()
+    reused_resource_keys: Set[str] = set()
     try:
         if emit_persistent_events and resource_keys_to_init:
             yield DagsterEvent.resource_init_start(
@@ -163,13 +243,31 @@ def _core_resource_initialization_event_generator(
                 if not resource_name in resource_keys_to_init:
                     continue
 
+                resource_config = resource_configs[resource_name].config
+                is_reusable = (
+                    reusable_resource_cache is not None
+                    and resource_def.reusable
+                    and resource_def.required_resource_keys.issubset(cached_resource_keys)
+                )
+                if is_reusable:
+                    with time_execution_scope() as timer_result:
+                        cached_resource = cast(ReusableResourceCache, reusable_resource_cache).get(
+                            resource_name, resource_def, resource_config
+                        )
+                    if cached_resource is not None:
+                        resource_instances[resource_name] = cached_resource.resource
+                        resource_init_times[resource_name] = format_duration(timer_result.millis)
+                        cached_resource_keys.add(resource_name)
+                        reused_resource_keys.add(resource_name)
+                        continue
+
                 resource_fn = cast(Callable[[InitResourceContext], Any], resource_def.resource_fn)
                 resources = ScopedResourcesBuilder(resource_instances).build(
                     resource_def.required_resource_keys
                 )
                 resource_context = InitResourceContext(
                     resource_def=resource_def,
-                    resource_config=resource_configs[resource_name].config,
+                    resource_config=resource_config,
                     dagster_run=pipeline_run,
                     # Add tags with information about the resource
                     log_manager=resource_log_manager.with_tags(
@@ -189,7 +287,13 @@ def _core_resource_initialization_event_generator(
                 resource_instances[resource_name] = initialized_resource.resource
                 resource_init_times[resource_name] = initialized_resource.duration
                 contains_generator = contains_generator or initialized_resource.is_generator
-                resource_managers.append(manager)
+                if is_reusable and cast(ReusableResourceCache, reusable_resource_cache).add(
+                    resource_name, resource_def, resource_config, initialized_resource, manager
+                ):
+                    # torn down along with the cache rather than after this initialization
+                    cached_resource_keys.add(resource_name)
+                else:
+                    resource_managers.append(manager)
 
         if emit_persistent_events and resource_keys_to_init:
             yield DagsterEvent.resource_init_success(
@@ -198,6 +302,7 @@ def _core_resource_initialization_event_generator(
                 resource_log_manager,
                 resource_instances,
                 resource_init_times,
+                reused_resource_keys,
             )
 
         delta_res_keys = resource_keys_to_init - set(resource_instances.keys())
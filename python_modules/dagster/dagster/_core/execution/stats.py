@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -88,8 +88,38 @@ class StepEventStatus(Enum):
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
+    by_step_key, attempt_events, markers = _aggregate_step_events(records)
+    return _build_run_step_stats_snapshots(run_id, by_step_key, attempt_events, markers)
+
+
+def build_run_step_stats_from_step_rows(
+    run_id: str,
+    step_rows: Mapping[str, Mapping[str, Any]],
+    records: Iterable[EventLogEntry],
+) -> Sequence["RunStepKeyStatsSnapshot"]:
+    """Builds step stats from pre-aggregated per-step values (start_time, end_time, status,
+    attempts), as maintained by event log storages that index step stats at write time.
+
+    Only the events that cannot be summarized in a single row (materializations, expectation
+    results, retries and markers) need to be passed in as `records`.
+    """
+    detail_by_step_key, attempt_events, markers = _aggregate_step_events(records)
+
+    by_step_key: Dict[str, Dict[str, Any]] = {}
+    for step_key, step_row in step_rows.items():
+        step_stats = {
+            key: value
+            for key, value in detail_by_step_key.get(step_key, {}).items()
+            if key in ("materialization_events", "expectation_results")
+        }
+        step_stats.update({key: value for key, value in step_row.items() if value is not None})
+        by_step_key[step_key] = step_stats
+
+    return _build_run_step_stats_snapshots(run_id, by_step_key, attempt_events, markers)
+
+
+def _aggregate_step_events(records: Iterable[EventLogEntry]):
     by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
     attempt_events = defaultdict(list)
     markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
     for event in records:
@@ -145,8 +175,18 @@ def build_run_step_stats_from_events(
                 else:
                     markers[step_key][key]["end"] = event.timestamp
 
+    return by_step_key, attempt_events, markers
+
+
+def _build_run_step_stats_snapshots(
+    run_id: str,
+    by_step_key: Dict[str, Dict[str, Any]],
+    attempt_events: Mapping[str, Sequence[EventLogEntry]],
+    markers: Mapping[str, Mapping[str, Any]],
+) -> Sequence["RunStepKeyStatsSnapshot"]:
+    attempts = defaultdict(list)
     for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
+        events = attempt_events.get(step_key, [])
         step_attempts = []
         attempt_start = step_stats.get("start_time")
 
@@ -174,7 +214,7 @@ def build_run_step_stats_from_events(
             attempts_list=attempts[step_key],
             markers=[
                 RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
+                for marker in markers.get(step_key, {}).values()
             ],
             **value,
         )
@@ -0,0 +1,101 @@
+import asyncio
+import queue
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from typing import Any, List, Mapping, Optional, Sequence, Union
+
+import dagster._check as check
+from dagster._core.events import DagsterEvent
+from dagster._core.execution.context.system import PlanOrchestrationContext, StepExecutionContext
+from dagster._core.execution.event_loop import StepAwait, use_step_event_loop
+from dagster._core.execution.plan.execute_plan import dagster_event_sequence_for_step
+from dagster._core.execution.retries import RetryMode
+
+from .in_process_threaded import InProcessThreadedExecutor, StepThreads, _StepThreadDone
+
+
+class EventLoopStepTasks(StepThreads):
+    """Executes every step as a task on a single event loop, which runs on a thread of its own.
+
+    Step execution yields the coroutines that it would otherwise block on, i.e. async op bodies and
+    the methods of AsyncIOManagers, up to the task as StepAwaits, so that a step waiting on one does
+    not hold up the others. The bodies of synchronous ops are run on the default executor of the
+    loop, a thread pool.
+    """
+
+    def __init__(self, thread_name_prefix: str):
+        check.str_param(thread_name_prefix, "thread_name_prefix")
+        self._loop = asyncio.new_event_loop()
+        self._thread_pool = ThreadPoolExecutor(thread_name_prefix=thread_name_prefix)
+        self._loop.set_default_executor(self._thread_pool)
+        self._loop_thread = threading.Thread(
+            target=self._run_loop,
+            name=f"{thread_name_prefix}-event-loop",
+            daemon=True,
+        )
+        self._loop_thread.start()
+        self._event_queue: "queue.Queue[Any]" = queue.Queue()
+        self._step_futures: List[Future] = []
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        with use_step_event_loop(self._loop):
+            self._loop.run_forever()
+
+    async def _execute_step(self, step_context: StepExecutionContext) -> None:
+        exc_info = None
+        try:
+            for item in check.generator(dagster_event_sequence_for_step(step_context)):
+                if isinstance(item, StepAwait):
+                    await item.resolve()
+                else:
+                    self._event_queue.put(item)
+        except BaseException:  # pylint: disable=broad-except
+            # re-raised by the orchestrating thread, as if the step had executed there
+            exc_info = sys.exc_info()
+        finally:
+            self._event_queue.put(_StepThreadDone(step_context.step.key, exc_info))
+
+    def start_step(self, step_context: StepExecutionContext) -> None:
+        self._step_futures.append(
+            asyncio.run_coroutine_threadsafe(self._execute_step(step_context), self._loop)
+        )
+
+    def get_event(self, timeout: float) -> Union[DagsterEvent, _StepThreadDone]:
+        return self._event_queue.get(timeout=timeout)
+
+    def wait_for_steps(self) -> None:
+        wait_for_futures(self._step_futures)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._thread_pool.shutdown(wait=True)
+
+
+class AsyncioExecutor(InProcessThreadedExecutor):
+    """Executes steps within the run process as tasks on a single event loop."""
+
+    def __init__(
+        self,
+        retries: RetryMode,
+        max_concurrent: Optional[int] = None,
+        tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]] = None,
+    ):
+        super().__init__(
+            retries=retries,
+            max_concurrent=max_concurrent,
+            tag_concurrency_limits=tag_concurrency_limits,
+        )
+        # steps are tasks rather than threads, so by default every step that is ready is started
+        max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
+        self._max_concurrent = max_concurrent if max_concurrent else None
+
+    def create_step_threads(self, plan_context: PlanOrchestrationContext) -> StepThreads:
+        return EventLoopStepTasks(thread_name_prefix=f"dagster-{plan_context.run_id[:8]}")
+
+    def describe_execution(self) -> str:
+        if self._max_concurrent:
+            return f"on a single event loop, executing up to {self._max_concurrent} steps at a time"
+        return "on a single event loop"
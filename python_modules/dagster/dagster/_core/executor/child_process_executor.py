@@ -5,10 +5,12 @@
 import queue
 import sys
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from contextlib import nullcontext
+from typing import Callable, ContextManager, List, NamedTuple, Optional, Set
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -165,3 +167,162 @@ def execute_child_process_command(multiprocessing_ctx, command):
         process.join()
     finally:
         event_queue.close()
+
+
+def _execute_commands_in_worker_process(task_queue, event_queue, term_event, worker_scope_fn):
+    """Executes ChildProcessCommands from the task queue one at a time until it receives None,
+    within the scope returned by worker_scope_fn, if provided."""
+    start_termination_thread(term_event)
+
+    with worker_scope_fn() if worker_scope_fn else nullcontext():
+        while True:
+            command = task_queue.get()
+            if command is None:
+                return
+            _execute_command_in_child_process(event_queue, command)
+
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+"""How long to wait for an idle worker process to exit before terminating it."""
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes the ChildProcessCommands sent to it, one at a time.
+
+    Setting the term_event interrupts the command that the worker is currently executing. The
+    term_event is created along with the process since multiprocessing synchronization primitives
+    can not be sent over a queue.
+
+    If provided, worker_scope_fn is called in the worker process to return a context manager that
+    the worker stays within for its whole lifetime, e.g. to hold on to state shared by the commands
+    that it executes. It must be picklable.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx,
+        worker_scope_fn: Optional[Callable[[], ContextManager]] = None,
+    ):
+        self.task_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        self.term_event = multiprocessing_ctx.Event()
+        self.process = multiprocessing_ctx.Process(
+            target=_execute_commands_in_worker_process,
+            args=(self.task_queue, self.event_queue, self.term_event, worker_scope_fn),
+        )
+        self.process.start()
+        self.commands_executed = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def shutdown(self, timeout: float = WORKER_SHUTDOWN_TIMEOUT) -> None:
+        if self.process.is_alive():
+            self.task_queue.put(None)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+
+        self.task_queue.close()
+        self.event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of ChildProcessWorkers, for running many commands without paying the cost of starting
+    a new process for each one.
+
+    The pool does not bound the number of workers, a new worker is started whenever one is acquired
+    and none are idle. A worker is retired instead of being returned to the pool if its command
+    did not finish cleanly, if it was interrupted, or once it has executed max_tasks_per_worker
+    commands.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx,
+        max_tasks_per_worker: Optional[int] = None,
+        worker_scope_fn: Optional[Callable[[], ContextManager]] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        self._worker_scope_fn = check.opt_callable_param(worker_scope_fn, "worker_scope_fn")
+        self._idle: List[ChildProcessWorker] = []
+        self._workers: Set[ChildProcessWorker] = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def acquire(self) -> ChildProcessWorker:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.process.is_alive():
+                return worker
+            self._retire(worker)
+
+        worker = ChildProcessWorker(self._multiprocessing_ctx, self._worker_scope_fn)
+        self._workers.add(worker)
+        return worker
+
+    def execute_command(self, worker: ChildProcessWorker, command: ChildProcessCommand):
+        """Execute a ChildProcessCommand in an acquired worker, releasing the worker back to the pool
+        once the command completes.
+
+        Yields the same objects as execute_child_process_command, and likewise raises a
+        ChildProcessCrashException if the worker process dies before the command completes.
+        """
+        check.inst_param(worker, "worker", ChildProcessWorker)
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        reusable = False
+        try:
+            worker.task_queue.put(command)
+            worker.commands_executed += 1
+
+            completed_properly = False
+            while not completed_properly:
+                event = _poll_for_event(worker.process, worker.event_queue)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                yield event
+
+                if isinstance(event, ChildProcessDoneEvent):
+                    completed_properly = True
+                    reusable = True
+                elif isinstance(event, ChildProcessSystemErrorEvent):
+                    completed_properly = True
+
+            if not completed_properly:
+                raise ChildProcessCrashException(exit_code=worker.process.exitcode)
+        finally:
+            self._release(worker, reusable)
+
+    def _release(self, worker: ChildProcessWorker, reusable: bool) -> None:
+        if (
+            reusable
+            and not worker.term_event.is_set()
+            and (
+                not self._max_tasks_per_worker
+                or worker.commands_executed < self._max_tasks_per_worker
+            )
+        ):
+            self._idle.append(worker)
+        else:
+            self._retire(worker)
+
+    def _retire(self, worker: ChildProcessWorker) -> None:
+        self._workers.discard(worker)
+        worker.shutdown()
+
+    def shutdown(self) -> None:
+        for worker in list(self._workers):
+            self._retire(worker)
+        self._idle = []
@@ -0,0 +1,293 @@
+import os
+import queue
+import sys
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Union, cast
+
+import dagster._check as check
+from dagster._core.events import DagsterEvent, EngineEventData
+from dagster._core.execution.api import ExecuteRunWithPlanIterable
+from dagster._core.execution.compute_logs import create_compute_log_file_key
+from dagster._core.execution.context.system import (
+    PlanExecutionContext,
+    PlanOrchestrationContext,
+    StepExecutionContext,
+)
+from dagster._core.execution.context_creation_pipeline import PlanExecutionContextManager
+from dagster._core.execution.plan.execute_plan import _trigger_hook, dagster_event_sequence_for_step
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.prioritization import get_step_sort_key_fn
+from dagster._core.execution.retries import RetryMode
+from dagster._core.storage.captured_log_manager import CapturedLogManager
+from dagster._utils.timing import format_duration, time_execution_scope
+
+from .base import Executor
+
+DEFAULT_MAX_CONCURRENT = min(32, (os.cpu_count() or 1) + 4)
+
+# how long the orchestrating thread waits for events from steps before checking for interrupts
+# and steps that are up for retry
+THREAD_EVENT_POLL_INTERVAL = 0.1
+
+
+class _StepThreadDone:
+    """Put on the event queue by a thread when it has finished executing a step"""
+
+    def __init__(self, step_key: str, exc_info=None):
+        self.step_key = step_key
+        self.exc_info = exc_info
+
+
+def _execute_step_in_thread(
+    step_context: StepExecutionContext, put_event: Callable[[Any], None]
+) -> None:
+    exc_info = None
+    try:
+        for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
+            put_event(step_event)
+    except BaseException:  # pylint: disable=broad-except
+        # re-raised by the orchestrating thread, as if the step had executed there
+        exc_info = sys.exc_info()
+    finally:
+        put_event(_StepThreadDone(step_context.step.key, exc_info))
+
+
+class StepThreads(ABC):
+    """Executes steps on threads other than the orchestrating thread, and hands the events that
+    they yield back to it. Used as a context manager, exiting waits for every started step."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.wait_for_steps()
+
+    @abstractmethod
+    def start_step(self, step_context: StepExecutionContext) -> None:
+        pass
+
+    @abstractmethod
+    def get_event(self, timeout: float) -> Union[DagsterEvent, _StepThreadDone]:
+        """Returns the next event yielded by any executing step, raising queue.Empty if there is
+        none within the timeout."""
+
+    @abstractmethod
+    def wait_for_steps(self) -> None:
+        pass
+
+
+class ThreadPoolStepThreads(StepThreads):
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._event_queue: "queue.Queue[Any]" = queue.Queue()
+
+    def start_step(self, step_context: StepExecutionContext) -> None:
+        self._thread_pool.submit(_execute_step_in_thread, step_context, self._event_queue.put)
+
+    def get_event(self, timeout: float) -> Union[DagsterEvent, _StepThreadDone]:
+        return self._event_queue.get(timeout=timeout)
+
+    def wait_for_steps(self) -> None:
+        self._thread_pool.shutdown(wait=True)
+
+
+class InProcessThreadedExecutor(Executor):
+    """Executes steps in a pool of threads within the run process, sharing a single set of
+    resources between them."""
+
+    def __init__(
+        self,
+        retries: RetryMode,
+        max_concurrent: Optional[int] = None,
+        tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]] = None,
+    ):
+        self._retries = check.inst_param(retries, "retries", RetryMode)
+        max_concurrent = check.opt_int_param(max_concurrent, "max_concurrent")
+        self._max_concurrent = max_concurrent if max_concurrent else DEFAULT_MAX_CONCURRENT
+        self._tag_concurrency_limits = check.opt_sequence_param(
+            tag_concurrency_limits, "tag_concurrency_limits"
+        )
+
+    @property
+    def retries(self):
+        return self._retries
+
+    def create_step_threads(self, plan_context: PlanOrchestrationContext) -> StepThreads:
+        return ThreadPoolStepThreads(
+            max_workers=self._max_concurrent,
+            thread_name_prefix=f"dagster-{plan_context.run_id[:8]}",
+        )
+
+    def describe_execution(self) -> str:
+        return f"using up to {self._max_concurrent} threads"
+
+    def execute(self, plan_context, execution_plan):
+        check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        step_keys_to_execute = execution_plan.step_keys_to_execute
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Executing steps in process (pid: {pid}) {description}".format(
+                pid=os.getpid(), description=self.describe_execution()
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+        def _iterator(pipeline_context, execution_plan):
+            return threaded_plan_execution_iterator(
+                pipeline_context,
+                execution_plan,
+                step_threads=self.create_step_threads(plan_context),
+                max_concurrent=self._max_concurrent,
+                tag_concurrency_limits=self._tag_concurrency_limits,
+                sort_key_fn=get_step_sort_key_fn(plan_context, execution_plan),
+            )
+
+        with time_execution_scope() as timer_result:
+            yield from iter(
+                ExecuteRunWithPlanIterable(
+                    execution_plan=plan_context.execution_plan,
+                    iterator=_iterator,
+                    execution_context_manager=PlanExecutionContextManager(
+                        pipeline=plan_context.pipeline,
+                        retry_mode=plan_context.retry_mode,
+                        execution_plan=plan_context.execution_plan,
+                        run_config=plan_context.run_config,
+                        pipeline_run=plan_context.pipeline_run,
+                        instance=plan_context.instance,
+                        raise_on_error=plan_context.raise_on_error,
+                        output_capture=plan_context.output_capture,
+                    ),
+                )
+            )
+
+        yield DagsterEvent.engine_event(
+            plan_context,
+            "Finished steps in process (pid: {pid}) in {duration_ms}".format(
+                pid=os.getpid(), duration_ms=format_duration(timer_result.millis)
+            ),
+            event_specific_data=EngineEventData.in_process(os.getpid(), step_keys_to_execute),
+        )
+
+
+def threaded_plan_execution_iterator(
+    pipeline_context: PlanExecutionContext,
+    execution_plan: ExecutionPlan,
+    step_threads: StepThreads,
+    max_concurrent: Optional[int] = None,
+    tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]] = None,
+    sort_key_fn=None,
+) -> Iterator[DagsterEvent]:
+    """The threaded counterpart of inner_plan_execution_iterator. Steps are executed on the given
+    step threads, while this iterator, on the calling thread, owns the ActiveExecution: it starts
+    steps, relays the events that they yield, and runs hooks once each step has completed.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", PlanExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.inst_param(step_threads, "step_threads", StepThreads)
+    check.opt_int_param(max_concurrent, "max_concurrent")
+
+    compute_log_manager = pipeline_context.instance.compute_log_manager
+    step_keys = [step.key for step in execution_plan.get_steps_to_execute_in_topo_order()]
+
+    with ExitStack() as plan_stack:
+        active_execution = plan_stack.enter_context(
+            execution_plan.start(
+                retry_mode=pipeline_context.retry_mode,
+                sort_key_fn=sort_key_fn,
+                tag_concurrency_limits=tag_concurrency_limits,
+            )
+        )
+
+        # stdout and stderr are shared by every thread, so logs can only be captured for the
+        # whole process rather than for individual steps
+        if isinstance(compute_log_manager, CapturedLogManager):
+            file_key = create_compute_log_file_key()
+            log_key = compute_log_manager.build_log_key_for_run(pipeline_context.run_id, file_key)
+            log_context = plan_stack.enter_context(compute_log_manager.capture_logs(log_key))
+            yield DagsterEvent.capture_logs(pipeline_context, step_keys, log_key, log_context)
+
+        # entered last, so that on exit any steps still running finish before the plan is closed out
+        plan_stack.enter_context(step_threads)
+
+        step_contexts: Dict[str, StepExecutionContext] = {}
+        step_event_lists: Dict[str, List[DagsterEvent]] = {}
+        stopping = False
+
+        while (not stopping and not active_execution.is_complete) or step_contexts:
+            if active_execution.check_for_interrupts():
+                yield DagsterEvent.engine_event(
+                    pipeline_context,
+                    "Execution interrupted, waiting for {} step threads to finish: {}".format(
+                        len(step_contexts), ", ".join(step_contexts.keys())
+                    ),
+                    EngineEventData.interrupted(list(step_contexts.keys())),
+                )
+                stopping = True
+                active_execution.mark_interrupted()
+
+            if not stopping:
+                for step in active_execution.get_steps_to_execute(
+                    limit=max_concurrent - len(step_contexts) if max_concurrent else None
+                ):
+                    step_context = cast(
+                        StepExecutionContext,
+                        pipeline_context.for_step(step, active_execution.get_known_state()),
+                    )
+                    missing_resources = [
+                        resource_key
+                        for resource_key in step_context.required_resource_keys
+                        if not hasattr(step_context.resources, resource_key)
+                    ]
+                    check.invariant(
+                        len(missing_resources) == 0,
+                        (
+                            "Expected step context for solid {solid_name} to have all required "
+                            "resources, but missing {missing_resources}."
+                        ).format(
+                            solid_name=step_context.solid.name,
+                            missing_resources=missing_resources,
+                        ),
+                    )
+                    step_contexts[step.key] = step_context
+                    step_event_lists[step.key] = []
+                    step_threads.start_step(step_context)
+
+            try:
+                item = step_threads.get_event(timeout=THREAD_EVENT_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            if isinstance(item, _StepThreadDone):
+                step_context = step_contexts.pop(item.step_key)
+                step_event_list = step_event_lists.pop(item.step_key)
+                if item.exc_info:
+                    raise item.exc_info[1].with_traceback(item.exc_info[2])
+
+                # a step that is up for retry only becomes executable again once its thread is
+                # done, so that the retry is never running alongside the previous attempt
+                for event in step_event_list:
+                    if event.is_step_up_for_retry:
+                        active_execution.handle_event(event)
+
+                active_execution.verify_complete(pipeline_context, item.step_key)
+
+                # process skips from failures or uncovered inputs
+                for event in active_execution.plan_events_iterator(pipeline_context):
+                    step_event_list.append(event)
+                    yield event
+
+                # pass a list of step events to hooks
+                for hook_event in _trigger_hook(step_context, step_event_list):
+                    yield hook_event
+            else:
+                step_event_lists[item.step_key].append(item)
+                yield item
+                if not item.is_step_up_for_retry:
+                    active_execution.handle_event(item)
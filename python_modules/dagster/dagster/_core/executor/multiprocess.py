@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import sys
+from contextlib import nullcontext
 from typing import Optional, Sequence
 
 from dagster import MetadataEntry
@@ -11,11 +12,14 @@
     DagsterUnmetExecutorRequirementsError,
 )
 from dagster._core.events import DagsterEvent, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import create_execution_plan_for_steps, execute_plan_iterator
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.context_creation_pipeline import create_context_free_log_manager
+from dagster._core.execution.plan.fusion import get_fused_step_keys, get_fused_successors
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.prioritization import get_step_sort_key_fn
+from dagster._core.execution.resources_init import reusable_resource_scope
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
 from dagster._core.instance import DagsterInstance
@@ -28,6 +32,7 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -46,10 +51,12 @@ def __init__(
         retry_mode,
         known_state,
         repository_load_data,
+        fused_step_keys=None,
     ):
         self.run_config = run_config
         self.pipeline_run = pipeline_run
         self.step_key = step_key
+        self.fused_step_keys = fused_step_keys or []
         self.instance_ref = instance_ref
         self.term_event = term_event
         self.recon_pipeline = recon_pipeline
@@ -60,14 +67,16 @@ def __init__(
     def execute(self):
         pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
-                step_keys_to_execute=[self.step_key],
+            # workers in a pool watch their own termination event for their whole lifetime
+            if self.term_event is not None:
+                start_termination_thread(self.term_event)
+            execution_plan = create_execution_plan_for_steps(
+                pipeline,
+                self.pipeline_run,
+                step_keys_to_execute=[self.step_key, *self.fused_step_keys],
                 known_state=self.known_state,
                 repository_load_data=self.repository_load_data,
+                execution_plan_cache_max_size=instance.execution_plan_cache_max_size,
             )
 
             log_manager = create_context_free_log_manager(instance, self.pipeline_run)
@@ -75,7 +84,9 @@ def execute(self):
             yield DagsterEvent.step_worker_started(
                 log_manager,
                 self.pipeline_run.pipeline_name,
-                message='Executing step "{}" in subprocess.'.format(self.step_key),
+                message='Executing step "{}"{} in subprocess.'.format(
+                    self.step_key, _describe_fused_steps(self.fused_step_keys)
+                ),
                 metadata_entries=[
                     MetadataEntry("pid", value=str(os.getpid())),
                 ],
@@ -99,6 +110,8 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_tasks_per_worker: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -116,6 +129,10 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
 
     @property
     def retries(self):
@@ -126,6 +143,8 @@ def execute(self, plan_context, execution_plan):
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
         pipeline = plan_context.reconstructable_pipeline
+        # chains of steps tagged as fusible are each executed in a single process
+        fused_successors = get_fused_successors(execution_plan)
 
         multiproc_ctx = multiprocessing.get_context(self._start_method)
         if self._start_method == "forkserver":
@@ -163,11 +182,23 @@ def execute(self, plan_context, execution_plan):
         # It would be good to implement a reference tracking algorithm here so we could
         # garbage collect results that are no longer needed by any steps
         # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
-            with execution_plan.start(retry_mode=self.retries) as active_execution:
+        with time_execution_scope() as timer_result, (
+            # resources marked as reusable are initialized once per worker
+            ChildProcessWorkerPool(
+                multiproc_ctx, self._max_tasks_per_worker, worker_scope_fn=reusable_resource_scope
+            )
+            if self._use_worker_pool
+            else nullcontext()
+        ) as worker_pool:
+            with execution_plan.start(
+                retry_mode=self.retries,
+                sort_key_fn=get_step_sort_key_fn(plan_context, execution_plan),
+            ) as active_execution:
                 active_iters = {}
                 errors = {}
                 term_events = {}
+                # the steps that are executed along with each step in active_iters
+                fused_step_keys = {}
                 stopping = False
 
                 while (not stopping and not active_execution.is_complete) or active_iters:
@@ -194,18 +225,38 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                pipeline,
-                                step_context,
-                                step,
-                                errors,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
+                            fused_step_keys[step.key] = active_execution.claim_fused_steps(
+                                get_fused_step_keys(fused_successors, step.key)
                             )
+                            if worker_pool is not None:
+                                worker = worker_pool.acquire()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker(
+                                    worker_pool,
+                                    worker,
+                                    pipeline,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    fused_step_keys[step.key],
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    pipeline,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    fused_step_keys[step.key],
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -222,21 +273,29 @@ def execute(self, plan_context, execution_plan):
                             serializable_error = serializable_error_info_from_exc_info(
                                 sys.exc_info()
                             )
+                            # the crashed step is the first one still in flight, the steps fused
+                            # with it only start once the steps before them succeed
+                            crashed_step_key = next(
+                                (
+                                    step_key
+                                    for step_key in [key, *fused_step_keys[key]]
+                                    if active_execution.is_in_flight(step_key)
+                                ),
+                                key,
+                            )
                             step_context = plan_context.for_step(
-                                active_execution.get_step_by_key(key)
+                                active_execution.get_step_by_key(crashed_step_key)
                             )
                             yield DagsterEvent.engine_event(
                                 step_context,
                                 (
                                     "Multiprocess executor: child process for step {step_key} "
                                     "unexpectedly exited with code {exit_code}"
-                                ).format(step_key=key, exit_code=crash.exit_code),
+                                ).format(step_key=crashed_step_key, exit_code=crash.exit_code),
                                 EngineEventData.engine_error(serializable_error),
                             )
                             step_failure_event = DagsterEvent.step_failure_event(
-                                step_context=plan_context.for_step(
-                                    active_execution.get_step_by_key(key)
-                                ),
+                                step_context=step_context,
                                 step_failure_data=StepFailureData(
                                     error=serializable_error, user_failure_data=None
                                 ),
@@ -252,6 +311,9 @@ def execute(self, plan_context, execution_plan):
                         del active_iters[key]
                         del term_events[key]
                         active_execution.verify_complete(plan_context, key)
+                        active_execution.release_fused_steps(fused_step_keys[key])
+                        for fused_step_key in fused_step_keys.pop(key):
+                            active_execution.verify_complete(plan_context, fused_step_key)
 
                     # process skipped and abandoned steps
                     yield from active_execution.plan_events_iterator(plan_context)
@@ -308,6 +370,7 @@ def execute_step_out_of_process(
     retries,
     known_state,
     repository_load_data,
+    fused_step_keys=None,
 ):
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -319,15 +382,58 @@ def execute_step_out_of_process(
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
+        fused_step_keys=fused_step_keys,
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        'Launching subprocess for "{}"{}.'.format(step.key, _describe_fused_steps(fused_step_keys)),
+        metadata_entries=[],
+    )
+
+    yield from _handle_child_process_events(
+        execute_child_process_command(multiproc_ctx, command), errors
+    )
+
+
+def execute_step_in_worker(
+    worker_pool,
+    worker,
+    pipeline,
+    step_context,
+    step,
+    errors,
+    retries,
+    known_state,
+    repository_load_data,
+    fused_step_keys=None,
+):
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        pipeline_run=step_context.pipeline_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        term_event=None,
+        recon_pipeline=pipeline,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+        fused_step_keys=fused_step_keys,
     )
 
     yield DagsterEvent.step_worker_starting(
         step_context,
-        'Launching subprocess for "{}".'.format(step.key),
+        'Sending "{}"{} to worker process (pid: {}).'.format(
+            step.key, _describe_fused_steps(fused_step_keys), worker.pid
+        ),
         metadata_entries=[],
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    yield from _handle_child_process_events(worker_pool.execute_command(worker, command), errors)
+
+
+def _handle_child_process_events(child_process_events, errors):
+    for ret in child_process_events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -335,3 +441,9 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed("Unexpected return value from child process {}".format(type(ret)))
+
+
+def _describe_fused_steps(fused_step_keys):
+    if not fused_step_keys:
+        return ""
+    return " and fused steps {}".format(", ".join(f'"{key}"' for key in fused_step_keys))
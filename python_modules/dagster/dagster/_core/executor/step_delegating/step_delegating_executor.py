@@ -1,7 +1,8 @@
 import os
 import sys
-import time
-from typing import Dict, Optional, Sequence, cast
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, cast
 
 import pendulum
 
@@ -10,6 +11,7 @@
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.prioritization import get_step_sort_key_fn
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
@@ -27,7 +29,12 @@ class StepDelegatingExecutor(Executor):
     """This executor tails the event log for events from the steps that it spins up. It also
     sometimes creates its own events - when it does, that event is automatically written to the
     event log. But we wait until we later tail it from the event log database before yielding it,
-    to avoid yielding the same event multiple times to callsites."""
+    to avoid yielding the same event multiple times to callsites.
+
+    Rather than sleeping between reads of the event log, the executor watches the event log of the
+    run and wakes up as soon as new events are stored. sleep_seconds only bounds how long it waits
+    when no events arrive, i.e. how often it checks for interrupts and step health.
+    """
 
     def __init__(
         self,
@@ -62,12 +69,34 @@ def retries(self):
         return self._retries
 
     def _pop_events(self, instance, run_id) -> Sequence[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+        connection = instance.get_records_for_run(
+            run_id, self._event_cursor, of_type=set(DagsterEventType)
+        )
+        self._event_cursor = connection.cursor
+        dagster_events = [record.event_log_entry.dagster_event for record in connection.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    @contextmanager
+    def _watch_for_events(self, instance, run_id) -> Iterator[threading.Event]:
+        """Yields a threading.Event that is set whenever new events are stored for the run."""
+        events_available = threading.Event()
+
+        def _on_event(_event, _cursor):
+            events_available.set()
+
+        try:
+            instance.watch_event_logs(run_id, self._event_cursor, _on_event)
+        except NotImplementedError:
+            # fall back to polling the event log every sleep_seconds
+            yield events_available
+            return
+
+        try:
+            yield events_available
+        finally:
+            instance.end_watch_event_logs(run_id, _on_event)
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -91,7 +120,8 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        # storage id cursor of the last event read from the event log
+        self._event_cursor: Optional[str] = None  # pylint: disable=attribute-defined-outside-init
 
         DagsterEvent.engine_event(
             plan_context,
@@ -99,7 +129,12 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
-        with execution_plan.start(retry_mode=self.retries) as active_execution:
+        with execution_plan.start(
+            retry_mode=self.retries,
+            sort_key_fn=get_step_sort_key_fn(plan_context, execution_plan),
+        ) as active_execution, self._watch_for_events(
+            plan_context.instance, plan_context.run_id
+        ) as events_available:
             running_steps: Dict[str, ExecutionStep] = {}
 
             if plan_context.resume_from_failure:
@@ -204,6 +239,8 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                     return
 
+                # cleared before reading, so that events stored from here on wake up the next wait
+                events_available.clear()
                 for dagster_event in self._pop_events(
                     plan_context.instance,
                     plan_context.run_id,
@@ -289,4 +326,5 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         )
                     )
 
-                time.sleep(self._sleep_seconds)
+                if not active_execution.is_complete:
+                    events_available.wait(self._sleep_seconds)
@@ -3,7 +3,18 @@
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dagster._check as check
 from dagster._api.get_server_id import sync_get_server_id
@@ -19,7 +30,10 @@
 from dagster._api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
 from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
-from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
+from dagster._api.snapshot_sensor import (
+    sync_get_external_sensor_execution_data_batch_grpc,
+    sync_get_external_sensor_execution_data_grpc,
+)
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.reconstruct import ReconstructablePipeline
 from dagster._core.definitions.repository_definition import RepositoryDefinition
@@ -57,7 +71,7 @@
     get_partition_set_execution_param_data,
     get_partition_tags,
 )
-from dagster._grpc.types import GetCurrentImageResult
+from dagster._grpc.types import GetCurrentImageResult, SensorEvaluationArgs
 from dagster._serdes import deserialize_as
 from dagster._seven.compat.pendulum import PendulumDateTime
 from dagster._utils import merge_dicts
@@ -204,6 +218,16 @@ def get_external_sensor_execution_data(
     ) -> "SensorExecutionData":
         pass
 
+    @abstractmethod
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        sensor_evaluation_args: Sequence[SensorEvaluationArgs],
+    ) -> Iterator[Tuple[str, Union["SensorExecutionData", ExternalSensorExecutionErrorData]]]:
+        """Evaluates several sensors of a repository, yielding the name and execution data of each
+        sensor as it is evaluated. Errors are yielded rather than raised."""
+
     @abstractmethod
     def get_external_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -494,6 +518,24 @@ def get_external_sensor_execution_data(
 
         return result
 
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        sensor_evaluation_args: Sequence[SensorEvaluationArgs],
+    ) -> Iterator[Tuple[str, Union["SensorExecutionData", ExternalSensorExecutionErrorData]]]:
+        repo_def = self._get_repo_def(repository_handle.repository_name)
+        instance_ref = instance.get_ref()
+        for args in sensor_evaluation_args:
+            yield args.sensor_name, get_external_sensor_execution(
+                repo_def,
+                instance_ref,
+                args.sensor_name,
+                args.last_completion_time,
+                args.last_run_key,
+                args.cursor,
+            )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
@@ -826,6 +868,16 @@ def get_external_sensor_execution_data(
             cursor,
         )
 
+    def get_external_sensor_execution_data_batch(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        sensor_evaluation_args: Sequence[SensorEvaluationArgs],
+    ) -> Iterator[Tuple[str, Union["SensorExecutionData", ExternalSensorExecutionErrorData]]]:
+        return sync_get_external_sensor_execution_data_batch_grpc(
+            self.client, instance, repository_handle, sensor_evaluation_args
+        )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
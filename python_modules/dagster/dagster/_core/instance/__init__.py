@@ -13,6 +13,7 @@
 from tempfile import TemporaryDirectory
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -46,6 +47,7 @@
     DagsterRunConflict,
     DagsterUndefinedLogicalVersionError,
 )
+from dagster._core.execution.plan.plan_cache import get_execution_plan_cache_max_size
 from dagster._core.storage.pipeline_run import (
     IN_PROGRESS_RUN_STATUSES,
     DagsterRun,
@@ -75,6 +77,12 @@
     is_dagster_home_set,
 )
 from .ref import InstanceRef
+from .snapshot_cache import (
+    DEFAULT_SNAPSHOT_CACHE_MAX_BYTES,
+    EXECUTION_PLAN_SNAPSHOT_KIND,
+    PIPELINE_SNAPSHOT_KIND,
+    SnapshotCache,
+)
 
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
 # airflow ingestion logic (see: dagster_pipeline_factory.py). 'airflow_execution_date' stores the
@@ -113,6 +121,7 @@
     from dagster._core.storage.compute_log_manager import ComputeLogManager
     from dagster._core.storage.event_log import EventLogStorage
     from dagster._core.storage.event_log.base import AssetRecord, EventLogRecord, EventRecordsFilter
+    from dagster._core.storage.event_log.buffer import EventLogBuffer
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
     from dagster._core.storage.schedules import ScheduleStorage
@@ -344,6 +353,10 @@ def __init__(
 
         self._settings = check.opt_mapping_param(settings, "settings")
 
+        # snapshots are immutable and keyed by a hash of their contents, so they are safe to cache
+        # for the lifetime of the instance
+        self._snapshot_cache = SnapshotCache(self.snapshot_cache_max_bytes)
+
         self._secrets_loader = check.opt_inst_param(secrets_loader, "secrets_loader", SecretsLoader)
 
         if self._secrets_loader:
@@ -353,6 +366,24 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_log_buffer: Optional["EventLogBuffer"] = None
+        if self.event_log_batching_enabled:
+            from dagster._core.storage.event_log.buffer import (
+                DEFAULT_MAX_BATCH_INTERVAL_SECONDS,
+                DEFAULT_MAX_BATCH_SIZE,
+                EventLogBuffer,
+            )
+
+            self._event_log_buffer = EventLogBuffer(
+                self._event_storage,
+                max_batch_size=self.event_log_batching_settings.get(
+                    "max_batch_size", DEFAULT_MAX_BATCH_SIZE
+                ),
+                max_batch_interval_seconds=self.event_log_batching_settings.get(
+                    "max_batch_interval_seconds", DEFAULT_MAX_BATCH_INTERVAL_SECONDS
+                ),
+            )
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         if run_monitoring_enabled and not self.run_launcher.supports_check_run_worker_health:
             run_monitoring_enabled = False
@@ -716,6 +747,36 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries")
 
+    # event log batching
+
+    @property
+    def event_log_batching_settings(self) -> Mapping:
+        return self.get_settings("event_log_batching")
+
+    @property
+    def event_log_batching_enabled(self) -> bool:
+        return self.event_log_batching_settings.get("enabled", False)
+
+    # snapshots
+
+    @property
+    def snapshot_settings(self) -> Mapping:
+        return self.get_settings("snapshots")
+
+    @property
+    def snapshot_cache_max_bytes(self) -> int:
+        return self.snapshot_settings.get("cache_max_bytes", DEFAULT_SNAPSHOT_CACHE_MAX_BYTES)
+
+    @property
+    def binary_snapshot_encoding_enabled(self) -> bool:
+        return self.snapshot_settings.get("binary_encoding", False)
+
+    # execution plan cache
+
+    @property
+    def execution_plan_cache_max_size(self) -> int:
+        return get_execution_plan_cache_max_size(self._settings)
+
     # python logs
 
     @property
@@ -769,6 +830,8 @@ def reindex(self, print_fn=lambda _: None):
         print_fn("Done.")
 
     def dispose(self):
+        if self._event_log_buffer:
+            self._event_log_buffer.dispose()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
@@ -785,7 +848,9 @@ def get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
 
     @traced
     def get_pipeline_snapshot(self, snapshot_id: str) -> "PipelineSnapshot":
-        return self._run_storage.get_pipeline_snapshot(snapshot_id)
+        return self._snapshot_cache.get_or_load(
+            PIPELINE_SNAPSHOT_KIND, snapshot_id, self._run_storage.get_pipeline_snapshot
+        )
 
     @traced
     def has_pipeline_snapshot(self, snapshot_id: str) -> bool:
@@ -799,9 +864,9 @@ def has_snapshot(self, snapshot_id: str) -> bool:
     def get_historical_pipeline(self, snapshot_id: str) -> "HistoricalPipeline":
         from dagster._core.host_representation import HistoricalPipeline
 
-        snapshot = self._run_storage.get_pipeline_snapshot(snapshot_id)
+        snapshot = self.get_pipeline_snapshot(snapshot_id)
         parent_snapshot = (
-            self._run_storage.get_pipeline_snapshot(snapshot.lineage_snapshot.parent_snapshot_id)
+            self.get_pipeline_snapshot(snapshot.lineage_snapshot.parent_snapshot_id)
             if snapshot.lineage_snapshot
             else None
         )
@@ -813,7 +878,9 @@ def has_historical_pipeline(self, snapshot_id: str) -> bool:
 
     @traced
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
-        return self._run_storage.get_execution_plan_snapshot(snapshot_id)
+        return self._snapshot_cache.get_or_load(
+            EXECUTION_PLAN_SNAPSHOT_KIND, snapshot_id, self._run_storage.get_execution_plan_snapshot
+        )
 
     @traced
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
@@ -827,6 +894,18 @@ def get_run_step_stats(self, run_id, step_keys=None) -> Sequence["RunStepKeyStat
     def get_run_tags(self) -> Sequence[Tuple[str, Set[str]]]:
         return self._run_storage.get_run_tags()
 
+    @traced
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._run_storage.get_run_tag_counts(tag_keys, filters)
+
+    @traced
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[PipelineRun]:
+        return self._run_storage.get_queued_runs(cursor, limit)
+
     @traced
     def get_run_group(self, run_id: str) -> Optional[Tuple[str, Iterable[PipelineRun]]]:
         return self._run_storage.get_run_group(run_id)
@@ -945,6 +1024,7 @@ def _construct_run_with_snapshots(
         solid_selection=None,
         external_pipeline_origin=None,
         pipeline_code_origin=None,
+        persisted_snapshot_ids=None,
     ) -> DagsterRun:
 
         # https://github.com/dagster-io/dagster/issues/2403
@@ -959,19 +1039,28 @@ def _construct_run_with_snapshots(
             "that do not successfully compile execution plans in the scheduled case.",
         )
 
-        pipeline_snapshot_id = (
-            self._ensure_persisted_pipeline_snapshot(pipeline_snapshot, parent_pipeline_snapshot)
-            if pipeline_snapshot
-            else None
-        )
+        # maps snapshot objects, by id(), to the ids they were persisted with, so that runs created
+        # together only hash and persist each snapshot they share once
+        if persisted_snapshot_ids is None:
+            persisted_snapshot_ids = {}
 
-        execution_plan_snapshot_id = (
-            self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
-            )
-            if execution_plan_snapshot and pipeline_snapshot_id
-            else None
-        )
+        pipeline_snapshot_id = None
+        if pipeline_snapshot:
+            pipeline_snapshot_id = persisted_snapshot_ids.get(id(pipeline_snapshot))
+            if not pipeline_snapshot_id:
+                pipeline_snapshot_id = self._ensure_persisted_pipeline_snapshot(
+                    pipeline_snapshot, parent_pipeline_snapshot
+                )
+                persisted_snapshot_ids[id(pipeline_snapshot)] = pipeline_snapshot_id
+
+        execution_plan_snapshot_id = None
+        if execution_plan_snapshot and pipeline_snapshot_id:
+            execution_plan_snapshot_id = persisted_snapshot_ids.get(id(execution_plan_snapshot))
+            if not execution_plan_snapshot_id:
+                execution_plan_snapshot_id = self._ensure_persisted_execution_plan_snapshot(
+                    execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+                )
+                persisted_snapshot_ids[id(execution_plan_snapshot)] = execution_plan_snapshot_id
 
         return DagsterRun(
             pipeline_name=pipeline_name,
@@ -1063,6 +1152,15 @@ def _ensure_persisted_execution_plan_snapshot(
         return execution_plan_snapshot_id
 
     def _log_asset_materialization_planned_events(self, pipeline_run, execution_plan_snapshot):
+        for event, run_id in self._get_asset_materialization_planned_events(
+            pipeline_run, execution_plan_snapshot
+        ):
+            # Logs and stores asset_materialization_planned event
+            self.report_dagster_event(event, run_id, logging.DEBUG)
+
+    def _get_asset_materialization_planned_events(
+        self, pipeline_run, execution_plan_snapshot
+    ) -> Sequence[Tuple["DagsterEvent", str]]:
         from dagster._core.events import (
             AssetMaterializationPlannedData,
             DagsterEvent,
@@ -1071,19 +1169,20 @@ def _log_asset_materialization_planned_events(self, pipeline_run, execution_plan
 
         pipeline_name = pipeline_run.pipeline_name
 
+        events = []
         for step in execution_plan_snapshot.steps:
             if step.key in execution_plan_snapshot.step_keys_to_execute:
                 for output in step.outputs:
                     asset_key = output.properties.asset_key
                     if asset_key:
-                        # Logs and stores asset_materialization_planned event
                         event = DagsterEvent(
                             event_type_value=DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
                             pipeline_name=pipeline_name,
                             message=f"{pipeline_name} intends to materialize asset {asset_key.to_string()}",
                             event_specific_data=AssetMaterializationPlannedData(asset_key),
                         )
-                        self.report_dagster_event(event, pipeline_run.run_id, logging.DEBUG)
+                        events.append((event, pipeline_run.run_id))
+        return events
 
     def create_run(
         self,
@@ -1133,6 +1232,48 @@ def create_run(
 
         return pipeline_run
 
+    def create_runs_bulk(
+        self, create_run_args: Sequence[Mapping[str, Any]]
+    ) -> Sequence[PipelineRun]:
+        """Creates a batch of runs, e.g. the runs of a chunk of backfill partitions.
+
+        Each pipeline and execution plan snapshot shared by the runs is persisted once, the runs
+        and their tags are added to run storage in a single transaction, and the asset
+        materialization planned events of all runs are stored as one batch.
+
+        Args:
+            create_run_args (Sequence[Mapping[str, Any]]): The keyword arguments to
+                ``DagsterInstance.create_run`` of each run to create.
+
+        Returns:
+            Sequence[PipelineRun]: The created runs, in the order of their arguments.
+        """
+        check.sequence_param(create_run_args, "create_run_args", of_type=Mapping)
+
+        persisted_snapshot_ids: Dict[int, str] = {}
+        pipeline_runs = [
+            self._construct_run_with_snapshots(
+                **run_args, persisted_snapshot_ids=persisted_snapshot_ids
+            )
+            for run_args in create_run_args
+        ]
+
+        pipeline_runs = self._run_storage.add_runs(pipeline_runs)
+
+        planned_events = []
+        for pipeline_run, run_args in zip(pipeline_runs, create_run_args):
+            execution_plan_snapshot = run_args.get("execution_plan_snapshot")
+            if execution_plan_snapshot:
+                planned_events.extend(
+                    self._get_asset_materialization_planned_events(
+                        pipeline_run, execution_plan_snapshot
+                    )
+                )
+        if planned_events:
+            self.report_dagster_events(planned_events, logging.DEBUG)
+
+        return pipeline_runs
+
     def create_reexecuted_run(
         self,
         parent_run: DagsterRun,
@@ -1374,6 +1515,7 @@ def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartiti
     def wipe(self):
         self._run_storage.wipe()
         self._event_storage.wipe()
+        self._snapshot_cache.clear()
 
     @public
     @traced
@@ -1390,6 +1532,7 @@ def logs_after(
         of_type: Optional["DagsterEventType"] = None,
         limit: Optional[int] = None,
     ):
+        self.flush_event_log_buffer(run_id)
         return self._event_storage.get_logs_for_run(
             run_id,
             cursor=cursor,
@@ -1401,6 +1544,7 @@ def logs_after(
     def all_logs(
         self, run_id, of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None
     ):
+        self.flush_event_log_buffer(run_id)
         return self._event_storage.get_logs_for_run(run_id, of_type=of_type)
 
     @traced
@@ -1411,6 +1555,7 @@ def get_records_for_run(
         of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
         limit: Optional[int] = None,
     ):
+        self.flush_event_log_buffer(run_id)
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
 
     def watch_event_logs(self, run_id, cursor, cb):
@@ -1552,10 +1697,19 @@ def get_handlers(self):
     def store_event(self, event):
         self._event_storage.store_event(event)
 
+    def flush_event_log_buffer(self, run_id: Optional[str] = None):
+        """Write out any events held back by event log batching, for the given run or for all
+        runs. A no-op unless `event_log_batching` is enabled in the instance settings."""
+        if self._event_log_buffer:
+            self._event_log_buffer.flush(run_id)
+
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        if self._event_log_buffer:
+            self._event_log_buffer.store_event(event)
+        else:
+            self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.dagster_event.is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
@@ -1563,6 +1717,28 @@ def handle_new_event(self, event):
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events: Sequence["EventLogEntry"]):
+        """Stores a batch of events as one write to the event log, and applies the updates of its
+        pipeline events to run storage as one batch.
+        """
+        if self._event_log_buffer:
+            for event in events:
+                self._event_log_buffer.store_event(event)
+        else:
+            self._event_storage.store_event_batch(events)
+
+        run_events = [
+            (event.run_id, event.dagster_event)
+            for event in events
+            if event.is_dagster_event and event.dagster_event.is_pipeline_event
+        ]
+        if run_events:
+            self._run_storage.handle_run_events(run_events)
+
+        for event in events:
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
@@ -1642,6 +1818,32 @@ def report_dagster_event(
         )
         self.handle_new_event(event_record)
 
+    def report_dagster_events(
+        self,
+        dagster_events: Sequence[Tuple["DagsterEvent", str]],
+        log_level: Union[str, int] = logging.INFO,
+    ):
+        """
+        Takes a batch of DagsterEvents, each with the id of its PipelineRun, and stores them in
+        persistent storage together
+        """
+        from dagster._core.events.log import EventLogEntry
+
+        event_records = [
+            EventLogEntry(
+                user_message="",
+                level=log_level,
+                pipeline_name=dagster_event.pipeline_name,
+                run_id=run_id,
+                error_info=None,
+                timestamp=time.time(),
+                step_key=dagster_event.step_key,
+                dagster_event=dagster_event,
+            )
+            for dagster_event, run_id in dagster_events
+        ]
+        self.handle_new_events(event_records)
+
     def report_run_canceling(self, run, message=None):
 
         from dagster._core.events import DagsterEvent, DagsterEventType
@@ -1771,6 +1973,70 @@ def submit_run(self, run_id, workspace: "IWorkspace") -> PipelineRun:
 
         return submitted_run
 
+    def submit_runs_bulk(
+        self, run_ids: Sequence[str], workspace: "IWorkspace"
+    ) -> Sequence[PipelineRun]:
+        """Submit a batch of pipeline runs to the coordinator.
+
+        Like ``DagsterInstance.submit_run()``, but loads the runs with a single query and hands
+        them to ``RunCoordinator.submit_runs()`` together, so that coordinators can submit them in
+        bulk, e.g. enqueueing all of them in one transaction. If submission fails, the runs that
+        were not submitted are marked as failed.
+
+        Args:
+            run_ids (Sequence[str]): The ids of the runs.
+
+        Returns:
+            Sequence[PipelineRun]: The submitted runs, in the order of their ids.
+        """
+        from dagster._core.host_representation import ExternalPipelineOrigin
+        from dagster._core.origin import PipelinePythonOrigin
+        from dagster._core.run_coordinator import SubmitRunContext
+
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return []
+
+        runs_by_id = {run.run_id: run for run in self.get_runs(RunsFilter(run_ids=list(run_ids)))}
+        runs = []
+        for run_id in run_ids:
+            run = runs_by_id.get(run_id)
+            if run is None:
+                raise DagsterInvariantViolationError(
+                    f"Could not load run {run_id} that was passed to submit_runs_bulk"
+                )
+
+            check.inst(
+                run.external_pipeline_origin,
+                ExternalPipelineOrigin,
+                "External pipeline origin must be set for submitted runs",
+            )
+            check.inst(
+                run.pipeline_code_origin,
+                PipelinePythonOrigin,
+                "Python origin must be set for submitted runs",
+            )
+            runs.append(run)
+
+        try:
+            return self._run_coordinator.submit_runs(
+                [SubmitRunContext(run, workspace=workspace) for run in runs]
+            )
+        except:
+            from dagster._core.events import EngineEventData
+
+            error = serializable_error_info_from_exc_info(sys.exc_info())
+            for run in self.get_runs(RunsFilter(run_ids=list(run_ids))):
+                if run.status != PipelineRunStatus.NOT_STARTED:
+                    continue
+                self.report_engine_event(
+                    error.message,
+                    run,
+                    EngineEventData.engine_error(error),
+                )
+                self.report_run_failed(run)
+            raise
+
     # Run launcher
 
     def launch_run(self, run_id: str, workspace: "IWorkspace"):
@@ -1990,6 +2256,12 @@ def all_instigator_state(
             repository_origin_id, repository_selector_id, instigator_type
         )
 
+    @traced
+    def get_running_instigator_selector_ids(self, instigator_type=None) -> AbstractSet[str]:
+        if not self._schedule_storage:
+            check.failed("Schedule storage not available")
+        return self._schedule_storage.get_running_instigator_selector_ids(instigator_type)
+
     @traced
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["InstigatorState"]:
         if not self._schedule_storage:
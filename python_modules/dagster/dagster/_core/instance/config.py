@@ -235,6 +235,17 @@ def schedules_daemon_config():
     )
 
 
+def backfills_daemon_config():
+    return Field(
+        {
+            "use_threads": Field(Bool, is_required=False, default_value=False),
+            "num_workers": Field(int, is_required=False),
+            "max_runs_per_minute": Field(int, is_required=False),
+        },
+        is_required=False,
+    )
+
+
 def secrets_loader_config_schema():
     return Field(
         Selector(
@@ -282,8 +293,28 @@ def dagster_instance_config_schema():
         "code_servers": Field(
             {"local_startup_timeout": Field(int, is_required=False)}, is_required=False
         ),
+        "event_log_batching": Field(
+            {
+                "enabled": Field(Bool, is_required=False, default_value=False),
+                "max_batch_size": Field(int, is_required=False),
+                "max_batch_interval_seconds": Field(float, is_required=False),
+            },
+            is_required=False,
+        ),
+        "snapshots": Field(
+            {
+                "cache_max_bytes": Field(int, is_required=False),
+                "binary_encoding": Field(Bool, is_required=False, default_value=False),
+            },
+            is_required=False,
+        ),
+        "execution_plan_cache": Field(
+            {"max_size": Field(int, is_required=False)},
+            is_required=False,
+        ),
         "secrets": secrets_loader_config_schema(),
         "retention": retention_config_schema(),
         "sensors": sensors_daemon_config(),
         "schedules": schedules_daemon_config(),
+        "backfills": backfills_daemon_config(),
     }
@@ -396,9 +396,13 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             "run_monitoring",
             "run_retries",
             "code_servers",
+            "event_log_batching",
+            "snapshots",
+            "execution_plan_cache",
             "retention",
             "sensors",
             "schedules",
+            "backfills",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
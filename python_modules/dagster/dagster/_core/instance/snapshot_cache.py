@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+import dagster._check as check
+from dagster._utils import approximate_size
+
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+PIPELINE_SNAPSHOT_KIND = "pipeline"
+EXECUTION_PLAN_SNAPSHOT_KIND = "execution_plan"
+
+
+def snapshot_cache_key(snapshot_kind: str, snapshot_id: str) -> str:
+    check.str_param(snapshot_kind, "snapshot_kind")
+    check.str_param(snapshot_id, "snapshot_id")
+    return f"{snapshot_kind}:{snapshot_id}"
+
+
+class SnapshotCache:
+    """An in-process LRU cache of deserialized snapshots, keyed by snapshot kind and id.
+
+    Snapshot ids are hashes of the snapshot contents, so a cached snapshot can never go stale. The
+    kind is part of the key, so that a pipeline snapshot and an execution plan snapshot can never be
+    returned for each other. The cache is bounded by the approximate in-memory size of the cached
+    snapshots rather than by their count, since snapshots range from a few kilobytes to many
+    megabytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = check.int_param(max_bytes, "max_bytes")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._size_bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, snapshot_id: str) -> bool:
+        return snapshot_id in self._entries
+
+    def get(self, snapshot_id: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(snapshot_id)
+            return entry[0]
+
+    def put(self, snapshot_id: str, snapshot: Any) -> None:
+        check.str_param(snapshot_id, "snapshot_id")
+        check.not_none_param(snapshot, "snapshot")
+
+        # sized outside of the lock, this walks the entire snapshot
+        size = approximate_size(snapshot)
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            existing = self._entries.pop(snapshot_id, None)
+            if existing is not None:
+                self._size_bytes -= existing[1]
+
+            self._entries[snapshot_id] = (snapshot, size)
+            self._size_bytes += size
+
+            while self._size_bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+    def get_or_load(
+        self, snapshot_kind: str, snapshot_id: str, load_fn: Callable[[str], Any]
+    ) -> Any:
+        """Returns the cached snapshot of the given kind and id, or loads and caches it with load_fn.
+        Results of None are not cached."""
+        key = snapshot_cache_key(snapshot_kind, snapshot_id)
+        snapshot = self.get(key)
+        if snapshot is None:
+            snapshot = load_fn(snapshot_id)
+            if snapshot is not None:
+                self.put(key, snapshot)
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
@@ -1,5 +1,6 @@
 import datetime
 import logging
+import threading
 from typing import TYPE_CHECKING, Any, Mapping, NamedTuple, Optional, Sequence, Union
 
 import dagster._check as check
@@ -192,7 +193,9 @@ def __init__(
         self._logging_metadata = logging_metadata
         self._loggers = loggers
         self._handlers = handlers
-        self._should_capture = True
+        # whether log messages are being captured is tracked per thread, so that steps executing
+        # concurrently in threads do not drop each other's messages
+        self._capture_state = threading.local()
         super().__init__()
 
     @property
@@ -246,7 +249,7 @@ def filter(self, record: logging.LogRecord) -> bool:
         multiple times, as the DagsterLogHandler will be invoked at each level of the hierarchy as
         the message is propagated. This filter prevents this from happening.
         """
-        return self._should_capture and not isinstance(
+        return getattr(self._capture_state, "should_capture", True) and not isinstance(
             getattr(record, DAGSTER_META_KEY, None), dict
         )
 
@@ -257,7 +260,7 @@ def emit(self, record: logging.LogRecord):
             # to prevent the potential for infinite loops in which a handler produces log messages
             # which are then captured and then handled by that same handler (etc.), do not capture
             # any log messages while one is currently being emitted
-            self._should_capture = False
+            self._capture_state.should_capture = False
             dagster_record = self._convert_record(record)
             # built-in handlers
             for handler in self._handlers:
@@ -272,7 +275,7 @@ def emit(self, record: logging.LogRecord):
                     extra=self._extract_extra(record),
                 )
         finally:
-            self._should_capture = True
+            self._capture_state.should_capture = True
 
 
 class DagsterLogManager(logging.Logger):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, Sequence
 
 from dagster._core.instance import MayHaveInstanceWeakref
 from dagster._core.storage.pipeline_run import PipelineRun
@@ -42,6 +42,19 @@ def submit_run(self, context: SubmitRunContext) -> PipelineRun:
             PipelineRun: The queued run
         """
 
+    def submit_runs(self, contexts: Sequence[SubmitRunContext]) -> Sequence[PipelineRun]:
+        """
+        Submit a batch of runs to the run coordinator for execution. Run coordinators that can
+        submit multiple runs at once should override this method.
+
+        Args:
+            contexts (Sequence[SubmitRunContext]): information about the submission of each run.
+
+        Returns:
+            Sequence[PipelineRun]: The queued runs, in the order of their contexts
+        """
+        return [self.submit_run(context) for context in contexts]
+
     @abstractmethod
     def cancel_run(self, run_id):
         """
@@ -1,12 +1,12 @@
 import logging
 from typing import Any, Mapping, NamedTuple, Optional, Sequence
 
-from dagster import DagsterEvent, DagsterEventType, IntSource, String
+from dagster import DagsterEvent, DagsterEventType, IntSource
 from dagster import _check as check
-from dagster._builtins import Bool
-from dagster._config import Array, Field, Noneable, ScalarUnion, Shape
-from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster._config import Field
+from dagster._core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
+from dagster._utils.tags import get_tag_concurrency_limits_config
 
 from .base import RunCoordinator, SubmitRunContext
 
@@ -78,30 +78,12 @@ def config_type(cls):
                 "Defaults to 10. Set to -1 to disable the limit. Set to 0 to stop any runs from launching. "
                 "Any other negative values are disallowed.",
             ),
-            "tag_concurrency_limits": Field(
-                config=Noneable(
-                    Array(
-                        Shape(
-                            {
-                                "key": String,
-                                "value": Field(
-                                    ScalarUnion(
-                                        scalar_type=String,
-                                        non_scalar_schema=Shape({"applyLimitPerUniqueValue": Bool}),
-                                    ),
-                                    is_required=False,
-                                ),
-                                "limit": Field(int),
-                            }
-                        )
-                    )
-                ),
-                is_required=False,
-                description="A set of limits that are applied to runs with particular tags. "
+            "tag_concurrency_limits": get_tag_concurrency_limits_config(
+                "A set of limits that are applied to runs with particular tags. "
                 "If a value is set, the limit is applied to only that key-value pair. "
                 "If no value is set, the limit is applied across all values of that key. "
                 "If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit "
-                "will apply to the number of unique values for that key.",
+                "will apply to the number of unique values for that key."
             ),
             "dequeue_interval_seconds": Field(
                 config=IntSource,
@@ -141,6 +123,36 @@ def submit_run(self, context: SubmitRunContext) -> PipelineRun:
             check.failed(f"Failed to reload run {pipeline_run.run_id}")
         return run
 
+    def submit_runs(self, contexts: Sequence[SubmitRunContext]) -> Sequence[PipelineRun]:
+        """Enqueues the runs by storing all of their enqueued events as one batch."""
+        enqueued_events = []
+        for context in contexts:
+            pipeline_run = context.pipeline_run
+            if pipeline_run.status == PipelineRunStatus.NOT_STARTED:
+                enqueued_event = DagsterEvent(
+                    event_type_value=DagsterEventType.PIPELINE_ENQUEUED.value,
+                    pipeline_name=pipeline_run.pipeline_name,
+                )
+                enqueued_events.append((enqueued_event, pipeline_run.run_id))
+            else:
+                # the run was already submitted, this is a no-op
+                self._logger.warning(
+                    f"submit_run called for run {pipeline_run.run_id} with status "
+                    f"{pipeline_run.status.value}, skipping enqueue."
+                )
+
+        if enqueued_events:
+            self._instance.report_dagster_events(enqueued_events)
+
+        run_ids = [context.pipeline_run.run_id for context in contexts]
+        runs_by_id = {
+            run.run_id: run for run in self._instance.get_runs(RunsFilter(run_ids=run_ids))
+        }
+        for run_id in run_ids:
+            if run_id not in runs_by_id:
+                check.failed(f"Failed to reload run {run_id}")
+        return [runs_by_id[run_id] for run_id in run_ids]
+
     def cancel_run(self, run_id):
         run = self._instance.get_run_by_id(run_id)
         if not run:
@@ -44,7 +44,6 @@
     DefaultNamedTupleSerializer,
     create_snapshot_id,
     deserialize_value,
-    unpack_inner_value,
     whitelist_for_serdes,
 )
 
@@ -74,19 +73,11 @@ def skip_when_empty(cls) -> Set[str]:
         return {"metadata"}  # Maintain stable snapshot ID for back-compat purposes
 
     @classmethod
-    def value_from_storage_dict(
+    def value_from_unpacked(
         cls,
-        storage_dict,
+        unpacked_dict,
         klass,
-        args_for_class,
-        whitelist_map,
-        descent_path,
     ):
-        # unpack all stored fields
-        unpacked_dict = {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
-            for key, value in storage_dict.items()
-        }
         # called by the serdes layer, delegates to helper method with expanded kwargs
         return _pipeline_snapshot_from_storage(**unpacked_dict)
 
@@ -0,0 +1,68 @@
+"""add run stats tables
+
+Revision ID: 6ed5a8f0b0a7
+Revises: 958a9495162d
+Create Date: 2022-11-08 14:21:37.408913
+
+"""
+import sqlalchemy as db
+from alembic import op
+
+from dagster._core.storage.migration.utils import has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "6ed5a8f0b0a7"
+down_revision = "958a9495162d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), unique=True, nullable=False),
+            db.Column("steps_succeeded", db.Integer),
+            db.Column("steps_failed", db.Integer),
+            db.Column("materializations", db.Integer),
+            db.Column("expectations", db.Integer),
+            db.Column("enqueued_time", db.Float),
+            db.Column("launch_time", db.Float),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+        )
+
+    if not has_table("run_step_stats"):
+        op.create_table(
+            "run_step_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("status", db.String(63)),
+            db.Column("start_time", db.Float),
+            db.Column("end_time", db.Float),
+            db.Column("attempts", db.Integer),
+            db.Column("materializations", db.Integer),
+            db.Column("expectations", db.Integer),
+        )
+
+    if not has_index("run_step_stats", "idx_run_step_stats"):
+        op.create_index(
+            "idx_run_step_stats",
+            "run_step_stats",
+            ["run_id", "step_key"],
+            unique=True,
+            mysql_length={"step_key": 255},
+        )
+
+
+def downgrade():
+    if has_index("run_step_stats", "idx_run_step_stats"):
+        op.drop_index("idx_run_step_stats")
+
+    if has_table("run_step_stats"):
+        op.drop_table("run_step_stats")
+
+    if has_table("run_stats"):
+        op.drop_table("run_stats")
@@ -0,0 +1,46 @@
+"""add run priority column
+
+Revision ID: 1ad8f0e8b6c2
+Revises: 6ed5a8f0b0a7
+Create Date: 2022-11-15 10:12:48.220481
+
+"""
+import sqlalchemy as db
+from alembic import op
+
+from dagster._core.storage.migration.utils import has_column, has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "1ad8f0e8b6c2"
+down_revision = "6ed5a8f0b0a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_column("runs", "priority"):
+        # the server default backfills existing runs, so that no run sorts ahead of the queue
+        op.add_column("runs", db.Column("priority", db.Integer, nullable=True, server_default="0"))
+
+    if not has_index("runs", "idx_run_priority"):
+        op.create_index(
+            "idx_run_priority",
+            "runs",
+            ["status", "priority", "id"],
+            unique=False,
+            mysql_length={"status": 32},
+        )
+
+
+def downgrade():
+    if not has_table("runs"):
+        return
+
+    with op.batch_alter_table("runs") as batch_op:
+        if has_index("runs", "idx_run_priority"):
+            batch_op.drop_index("idx_run_priority")
+        if has_column("runs", "priority"):
+            batch_op.drop_column("priority")
@@ -1,7 +1,19 @@
 import base64
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Set, Union
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import dagster._check as check
 from dagster._core.assets import AssetDetails
@@ -18,6 +30,8 @@
 from dagster._core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster._seven import json
 
+DEFAULT_EVENT_LOG_STREAM_BATCH_SIZE = 1000
+
 
 class EventLogConnection(NamedTuple):
     records: List[EventLogRecord]
@@ -186,6 +200,16 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]):
+        """Store a batch of events, preserving their order. Storages that can write multiple events
+        in a single round trip should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
@@ -248,6 +272,29 @@ def get_logs_for_all_runs_by_log_id(
         """Get event records across all runs. Only supported for non sharded sql storage"""
         raise NotImplementedError()
 
+    def iter_logs_for_all_runs_by_log_id(
+        self,
+        after_cursor: int = -1,
+        dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        batch_size: int = DEFAULT_EVENT_LOG_STREAM_BATCH_SIZE,
+    ) -> Iterator[Tuple[int, EventLogEntry]]:
+        """Stream (storage_id, event) pairs across all runs in ascending storage id order, holding at
+        most batch_size events in memory at a time. An interrupted stream can be resumed by passing
+        the last yielded storage id as after_cursor. Only supported for non sharded sql storage"""
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        cursor = after_cursor
+        while True:
+            events_by_log_id = self.get_logs_for_all_runs_by_log_id(
+                after_cursor=cursor, dagster_event_type=dagster_event_type, limit=batch_size
+            )
+            if not events_by_log_id:
+                return
+            for storage_id, event in sorted(events_by_log_id.items()):
+                yield storage_id, event
+            cursor = max(events_by_log_id.keys())
+
     def get_maximum_record_id(self) -> Optional[int]:
         """Get the current greatest record id in the event log. Only supported for non sharded sql storage"""
         raise NotImplementedError()
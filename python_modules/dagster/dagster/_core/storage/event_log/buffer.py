@@ -0,0 +1,124 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import dagster._check as check
+from dagster._core.events import PIPELINE_EVENTS, DagsterEventType
+from dagster._core.events.log import EventLogEntry
+
+from .base import EventLogStorage
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_INTERVAL_SECONDS = 1.0
+
+# Events that mark a step boundary. Other processes (e.g. step-delegating executors, run monitoring)
+# make scheduling decisions off of these, so they are never held in the buffer.
+FLUSH_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}.union(PIPELINE_EVENTS)
+
+
+class EventLogBuffer:
+    """Buffers events per run and writes them to the event log storage in batches.
+
+    A run's buffered events are flushed when the buffer reaches `max_batch_size` events, when the
+    oldest buffered event is older than `max_batch_interval_seconds`, or when a step boundary or
+    run event arrives. Flushing on step boundaries preserves the ordering of step events relative
+    to the log lines emitted within each step.
+
+    The interval is enforced by a timer, so that events logged by a step that then runs for a long
+    time without logging are still written within `max_batch_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_interval_seconds: float = DEFAULT_MAX_BATCH_INTERVAL_SECONDS,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        self._max_batch_interval_seconds = check.numeric_param(
+            max_batch_interval_seconds, "max_batch_interval_seconds"
+        )
+        self._buffers: Dict[str, List[EventLogEntry]] = OrderedDict()
+        self._buffer_start_times: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._disposed = False
+
+    def store_event(self, event: EventLogEntry):
+        check.inst_param(event, "event", EventLogEntry)
+        run_id = event.run_id
+
+        with self._lock:
+            if run_id not in self._buffers:
+                self._buffers[run_id] = []
+                self._buffer_start_times[run_id] = time.time()
+            self._buffers[run_id].append(event)
+            self._arm_flush_timer(self._max_batch_interval_seconds)
+
+            if (
+                (event.is_dagster_event and event.dagster_event_type in FLUSH_EVENT_TYPES)
+                or len(self._buffers[run_id]) >= self._max_batch_size
+                or time.time() - self._buffer_start_times[run_id]
+                >= self._max_batch_interval_seconds
+            ):
+                self.flush(run_id)
+
+    def flush(self, run_id: Optional[str] = None):
+        """Write out the buffered events for the given run, or for all runs if no run is given."""
+        check.opt_str_param(run_id, "run_id")
+
+        with self._lock:
+            run_ids = [run_id] if run_id is not None else list(self._buffers.keys())
+            for flush_run_id in run_ids:
+                events = self._buffers.pop(flush_run_id, None)
+                self._buffer_start_times.pop(flush_run_id, None)
+                if events:
+                    self._event_log_storage.store_event_batch(events)
+
+    def has_buffered_events(self, run_id: str) -> bool:
+        with self._lock:
+            return bool(self._buffers.get(run_id))
+
+    def dispose(self):
+        """Write out all buffered events and stop the flush timer."""
+        with self._lock:
+            self.flush()
+            self._disposed = True
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+    def _arm_flush_timer(self, delay: float):
+        # called with the lock held. a single timer is armed for the oldest buffered event
+        if self._flush_timer is not None or self._disposed:
+            return
+
+        self._flush_timer = threading.Timer(delay, self._flush_expired_buffers)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _flush_expired_buffers(self):
+        with self._lock:
+            self._flush_timer = None
+            try:
+                now = time.time()
+                for run_id, start_time in list(self._buffer_start_times.items()):
+                    if now - start_time >= self._max_batch_interval_seconds:
+                        self.flush(run_id)
+            finally:
+                if self._buffer_start_times:
+                    oldest_start_time = min(self._buffer_start_times.values())
+                    self._arm_flush_timer(
+                        max(0, oldest_start_time + self._max_batch_interval_seconds - time.time())
+                    )
@@ -1,4 +1,5 @@
 import logging
+import threading
 from collections import defaultdict
 from contextlib import contextmanager
 from typing import Callable
@@ -23,6 +24,9 @@ class InMemoryEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     def __init__(self, inst_data=None, preload=None):
         self._inst_data = inst_data
+        # the connection is shared by every thread that logs events, e.g. the steps of the in
+        # process threaded executor, so its use is serialized
+        self._lock = threading.RLock()
         self._conn = self._create_connection()
         self._handlers = defaultdict(set)
         self._storage_id = 0  # mirror the storage id, to mimic watching cursors
@@ -36,7 +40,11 @@ def __init__(self, inst_data=None, preload=None):
                     self.store_event(event)
 
     def _create_connection(self):
-        engine = create_engine(create_in_memory_conn_string("event_log"), poolclass=NullPool)
+        engine = create_engine(
+            create_in_memory_conn_string("event_log"),
+            poolclass=NullPool,
+            connect_args={"check_same_thread": False},
+        )
         conn = engine.connect()
         conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA foreign_keys=ON;")
@@ -47,11 +55,13 @@ def _create_connection(self):
 
     @contextmanager
     def run_connection(self, run_id=None):
-        yield self._conn
+        with self._lock:
+            yield self._conn
 
     @contextmanager
     def index_connection(self):
-        yield self._conn
+        with self._lock:
+            yield self._conn
 
     @property
     def inst_data(self):
@@ -69,7 +79,17 @@ def upgrade(self):
         pass
 
     def store_event(self, event):
-        super(InMemoryEventLogStorage, self).store_event(event)
+        with self._lock:
+            super(InMemoryEventLogStorage, self).store_event(event)
+            self._notify_handlers(event)
+
+    def store_event_batch(self, events):
+        with self._lock:
+            super(InMemoryEventLogStorage, self).store_event_batch(events)
+            for event in events:
+                self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
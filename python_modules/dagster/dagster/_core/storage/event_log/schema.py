@@ -69,6 +69,38 @@
     db.Column("event_timestamp", db.types.TIMESTAMP),
 )
 
+# Run and step stats, maintained incrementally as events are stored so that run stats can be read
+# without aggregating over the event log. Reads are guarded by the `run_stats_tables` secondary index
+# check, which is set once the stats of historical runs have been backfilled.
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), unique=True, nullable=False),
+    db.Column("steps_succeeded", db.Integer, default=0),
+    db.Column("steps_failed", db.Integer, default=0),
+    db.Column("materializations", db.Integer, default=0),
+    db.Column("expectations", db.Integer, default=0),
+    db.Column("enqueued_time", db.Float),
+    db.Column("launch_time", db.Float),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+)
+
+RunStepStatsTable = db.Table(
+    "run_step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.Float),
+    db.Column("end_time", db.Float),
+    db.Column("attempts", db.Integer),
+    db.Column("materializations", db.Integer, default=0),
+    db.Column("expectations", db.Integer, default=0),
+)
+
 db.Index(
     "idx_step_key",
     SqlEventLogStorageTable.c.step_key,
@@ -119,3 +151,10 @@
     ),
     mysql_length={"asset_key": 64, "dagster_event_type": 64, "partition": 64},
 )
+db.Index(
+    "idx_run_step_stats",
+    RunStepStatsTable.c.run_id,
+    RunStepStatsTable.c.step_key,
+    unique=True,
+    mysql_length={"step_key": 255},
+)
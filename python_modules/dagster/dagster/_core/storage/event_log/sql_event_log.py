@@ -1,8 +1,23 @@
 import logging
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Union, cast
+from itertools import groupby
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pendulum
 import sqlalchemy as db
@@ -19,7 +34,11 @@
 from dagster._core.event_api import RunShardedEventsCursor
 from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    StepEventStatus,
+    build_run_step_stats_from_events,
+    build_run_step_stats_from_step_rows,
+)
 from dagster._serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
@@ -30,6 +49,7 @@
 
 from ..pipeline_run import PipelineRunStatsSnapshot
 from .base import (
+    DEFAULT_EVENT_LOG_STREAM_BATCH_SIZE,
     AssetEntry,
     AssetRecord,
     EventLogConnection,
@@ -38,10 +58,17 @@
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLES,
+)
 from .schema import (
     AssetEventTagsTable,
     AssetKeyTable,
+    RunStatsTable,
+    RunStepStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
@@ -49,6 +76,124 @@
 
 MIN_ASSET_ROWS = 25
 
+# events that are summarized in the run stats table
+RUN_STATS_EVENT_TYPES = {
+    DagsterEventType.PIPELINE_ENQUEUED,
+    DagsterEventType.PIPELINE_STARTING,
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.PIPELINE_CANCELED,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+# events that are summarized in the step stats table
+STEP_STATS_TABLE_EVENT_TYPES = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+}
+
+# events that contribute to step stats. Retry and marker timings are derived from sequences of
+# events, so those are always read from the event log
+STEP_STATS_EVENT_TYPES = STEP_STATS_TABLE_EVENT_TYPES.union(
+    {DagsterEventType.STEP_UP_FOR_RETRY}
+).union(MARKER_EVENTS)
+
+
+def _is_asset_index_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.dagster_event.asset_key
+    )
+
+
+def _is_stats_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and (
+            event.dagster_event_type in RUN_STATS_EVENT_TYPES
+            or event.dagster_event_type in STEP_STATS_TABLE_EVENT_TYPES
+        )
+    )
+
+
+def _get_stats_row_updates(events: Iterable[EventLogEntry]):
+    """Folds the events of a single run into the updates to apply to its run stats row and step
+    stats rows. Each update is a tuple of (column values to set, column values to increment).
+    """
+    run_values: Dict[str, Any] = {}
+    run_increments: Dict[str, int] = defaultdict(int)
+    step_updates: Dict[str, Any] = OrderedDict()
+
+    for event in events:
+        if not event.is_dagster_event:
+            continue
+
+        event_type = event.dagster_event_type
+        if event_type == DagsterEventType.PIPELINE_ENQUEUED:
+            run_values["enqueued_time"] = event.timestamp
+        elif event_type == DagsterEventType.PIPELINE_STARTING:
+            run_values["launch_time"] = event.timestamp
+        elif event_type == DagsterEventType.PIPELINE_START:
+            run_values["start_time"] = event.timestamp
+        elif event_type in (
+            DagsterEventType.PIPELINE_SUCCESS,
+            DagsterEventType.PIPELINE_FAILURE,
+            DagsterEventType.PIPELINE_CANCELED,
+        ):
+            run_values["end_time"] = event.timestamp
+        elif event_type == DagsterEventType.STEP_SUCCESS:
+            run_increments["steps_succeeded"] += 1
+        elif event_type == DagsterEventType.STEP_FAILURE:
+            run_increments["steps_failed"] += 1
+        elif event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            run_increments["materializations"] += 1
+        elif event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            run_increments["expectations"] += 1
+
+        step_key = event.dagster_event.step_key
+        if not step_key or event_type not in STEP_STATS_TABLE_EVENT_TYPES:
+            continue
+
+        if step_key not in step_updates:
+            step_updates[step_key] = ({}, defaultdict(int))
+        step_values, step_increments = step_updates[step_key]
+
+        if event_type == DagsterEventType.STEP_START:
+            step_values["start_time"] = event.timestamp
+            step_values["attempts"] = 1
+            step_increments.pop("attempts", None)
+        elif event_type == DagsterEventType.STEP_RESTARTED:
+            if "attempts" in step_values:
+                step_values["attempts"] += 1
+            else:
+                step_increments["attempts"] += 1
+        elif event_type == DagsterEventType.STEP_SUCCESS:
+            step_values["end_time"] = event.timestamp
+            step_values["status"] = StepEventStatus.SUCCESS.value
+        elif event_type == DagsterEventType.STEP_FAILURE:
+            step_values["end_time"] = event.timestamp
+            step_values["status"] = StepEventStatus.FAILURE.value
+        elif event_type == DagsterEventType.STEP_SKIPPED:
+            step_values["end_time"] = event.timestamp
+            step_values["status"] = StepEventStatus.SKIPPED.value
+        elif event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            step_increments["materializations"] += 1
+        elif event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            step_increments["expectations"] += 1
+
+    run_update = (run_values, run_increments) if run_values or run_increments else None
+    return run_update, step_updates
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -88,6 +233,14 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
+
+    def _get_event_insert_values(self, event: EventLogEntry) -> Dict[str, Any]:
+        # column values for a single event log row, shared between the single-event insert
+        # statement and the multi-row inserts issued by `store_event_batch`
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -101,8 +254,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -119,11 +271,28 @@ def has_asset_key_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
             return "last_materialization_timestamp" in column_names
 
+    def _asset_key_index_cols_enabled(self) -> bool:
+        """Whether asset index rows should populate the `last_materialization_timestamp` column."""
+        return self.has_asset_key_index_cols()
+
+    @contextmanager
+    def _write_transaction(self, conn):
+        """Wraps the writes made on `conn` in a single transaction. Storages whose engines
+        autocommit every statement override this to opt the connection out of autocommit.
+        """
+        with conn.begin():
+            yield conn
+
     def store_asset_event(self, event: EventLogEntry):
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
             return
 
+        has_asset_key_index_cols = self._asset_key_index_cols_enabled()
+        with self.index_connection() as conn:
+            self._store_asset_event(conn, event, has_asset_key_index_cols)
+
+    def _store_asset_event(self, conn, event: EventLogEntry, has_asset_key_index_cols: bool):
         # We switched to storing the entire event record of the last materialization instead of just
         # the AssetMaterialization object, so that we have access to metadata like timestamp,
         # pipeline, run_id, etc.
@@ -136,7 +305,7 @@ def store_asset_event(self, event: EventLogEntry):
         #
         # https://github.com/dagster-io/dagster/issues/3945
 
-        values = self._get_asset_entry_values(event, self.has_asset_key_index_cols())
+        values = self._get_asset_entry_values(event, has_asset_key_index_cols)
         insert_statement = AssetKeyTable.insert().values(
             asset_key=event.dagster_event.asset_key.to_string(), **values
         )
@@ -148,11 +317,10 @@ def store_asset_event(self, event: EventLogEntry):
             )
         )
 
-        with self.index_connection() as conn:
-            try:
-                conn.execute(insert_statement)
-            except db.exc.IntegrityError:
-                conn.execute(update_statement)
+        try:
+            conn.execute(insert_statement)
+        except db.exc.IntegrityError:
+            conn.execute(update_statement)
 
     def _get_asset_entry_values(self, event, has_asset_key_index_cols):
         # The AssetKeyTable contains a `last_materialization_timestamp` column that is exclusively
@@ -214,6 +382,10 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
 
+        with self.index_connection() as conn:
+            self._store_asset_event_tags(conn, event, event_id)
+
+    def _store_asset_event_tags(self, conn, event: EventLogEntry, event_id: int) -> None:
         if (
             event.dagster_event
             and event.dagster_event.asset_key
@@ -234,22 +406,34 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
             asset_key_str = event.dagster_event.asset_key.to_string()
 
             tags = event.dagster_event.step_materialization_data.materialization.tags
-            with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
-                )
+            conn.execute(
+                AssetEventTagsTable.insert(),
+                [
+                    dict(
+                        event_id=event_id,
+                        asset_key=asset_key_str,
+                        key=key,
+                        value=value,
+                        # Postgres requires a datetime that is in UTC but has no timezone info
+                        # set in order to be stored correctly
+                        event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+                    )
+                    for key, value in tags.items()
+                ],
+            )
+
+    def _store_asset_index_rows(
+        self, conn, event: EventLogEntry, event_id: Optional[int], has_asset_key_index_cols: bool
+    ) -> None:
+        """Writes the asset key and asset event tag rows for a stored asset event on `conn`, so that
+        a batch can write them in the same transaction as the event rows.
+        """
+        self._store_asset_event(conn, event, has_asset_key_index_cols)
+
+        if event_id is None:
+            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+
+        self._store_asset_event_tags(conn, event, event_id)
 
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
@@ -263,9 +447,13 @@ def store_event(self, event):
 
         event_id = None
 
-        with self.run_connection(run_id) as conn:
-            result = conn.execute(insert_event_statement)
-            event_id = result.inserted_primary_key[0]
+        with self.run_connection(run_id) as run_conn:
+            with self._write_transaction(run_conn) as conn:
+                result = conn.execute(insert_event_statement)
+                event_id = result.inserted_primary_key[0]
+
+                if self._should_write_run_stats(conn, [event]):
+                    self._write_run_stats(conn, run_id, [event])
 
         if (
             event.is_dagster_event
@@ -281,6 +469,156 @@ def store_event(self, event):
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]):
+        """Store a batch of events in a single transaction per run, using a single multi-row insert
+        per contiguous run of non-asset events. Asset events are inserted individually so that their
+        storage ids are available for writing their asset index rows in the same transaction, which
+        also updates the run's stats rows.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in order.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        has_asset_key_index_cols = self._asset_key_index_cols_enabled()
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+            with self.run_connection(run_id) as run_conn:
+                with self._write_transaction(run_conn) as conn:
+                    for is_asset_chunk, chunk in groupby(run_events, key=_is_asset_index_event):
+                        if is_asset_chunk:
+                            for event in chunk:
+                                result = conn.execute(self.prepare_insert_event(event))
+                                self._store_asset_index_rows(
+                                    conn,
+                                    event,
+                                    result.inserted_primary_key[0],
+                                    has_asset_key_index_cols,
+                                )
+                        else:
+                            conn.execute(
+                                SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                                [self._get_event_insert_values(event) for event in chunk],
+                            )
+
+                    if self._should_write_run_stats(conn, run_events):
+                        self._write_run_stats(conn, run_id, run_events)
+
+    def _should_write_run_stats(self, conn, events: Sequence[EventLogEntry]) -> bool:
+        # the stats rows are written whenever the tables exist, so that they are already complete
+        # for new events once the data migration backfills historical runs; only reads are gated on
+        # the migration
+        return any(_is_stats_event(event) for event in events) and self._has_run_stats_tables(conn)
+
+    def _has_run_stats_tables(self, conn) -> bool:
+        """Whether the database that `conn` is connected to has the run and step stats tables.
+        Storages may override this to cache the check, but only once the tables are found, since
+        they are created by a schema migration that may run while the storage is in use.
+        """
+        return RunStatsTable.name in db.inspect(conn).get_table_names()
+
+    def _write_run_stats(self, conn, run_id: str, events: Sequence[EventLogEntry]):
+        """Update the run and step stats rows of a run with newly stored events, on the connection
+        (and so in the transaction) that the events were written with.
+
+        Args:
+            conn: The connection to the run's event log.
+            run_id (str): The id of the run that the events belong to.
+            events (Sequence[EventLogEntry]): The newly stored events, in order.
+        """
+        run_update, step_updates = _get_stats_row_updates(events)
+        if run_update:
+            self._upsert_stats_row(conn, RunStatsTable, {"run_id": run_id}, *run_update)
+        for step_key, step_update in step_updates.items():
+            self._upsert_stats_row(
+                conn, RunStepStatsTable, {"run_id": run_id, "step_key": step_key}, *step_update
+            )
+
+    def _upsert_stats_row(self, conn, table, key_values, values, increments):
+        """Sets `values` and adds `increments` to the stats row identified by `key_values`, inserting
+        the row if it does not exist yet.
+        """
+        where_clause = db.and_(*[table.c[column] == value for column, value in key_values.items()])
+        update_statement = (
+            table.update()  # pylint: disable=no-value-for-parameter
+            .where(where_clause)
+            .values(
+                **values,
+                **{
+                    column: db.func.coalesce(table.c[column], 0) + increment
+                    for column, increment in increments.items()
+                },
+            )
+        )
+        if conn.execute(update_statement).rowcount:
+            return
+
+        try:
+            conn.execute(
+                table.insert().values(  # pylint: disable=no-value-for-parameter
+                    **key_values, **values, **increments
+                )
+            )
+        except db.exc.IntegrityError:
+            # the row was inserted concurrently, apply the update to it instead
+            conn.execute(update_statement)
+
+    def rebuild_run_stats(self, run_id: str):
+        """Utility method for migration scripts to rebuild the stats rows of a run from its
+        stored events."""
+        check.str_param(run_id, "run_id")
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        event_type.value
+                        for event_type in RUN_STATS_EVENT_TYPES.union(STEP_STATS_TABLE_EVENT_TYPES)
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.run_connection(run_id) as run_conn:
+            if SqlEventLogStorageTable.name not in db.inspect(run_conn).get_table_names():
+                # not an event log database, e.g. a run storage database that shares its directory
+                # with run-sharded event log databases
+                return
+
+            # the stats tables may not exist yet if the data migration is run against a storage whose
+            # schema has not been upgraded (e.g. run shards that predate the index shard)
+            SqlEventLogStorageMetadata.create_all(
+                run_conn, tables=[RunStatsTable, RunStepStatsTable], checkfirst=True
+            )
+
+            with self._write_transaction(run_conn) as conn:
+                # events may be stored for the run while its stats are rebuilt. Deleting the rows
+                # before reading the events means that every such event is either read here, or
+                # applied to the rebuilt rows once this transaction commits
+                self._delete_run_stats(conn, run_id)
+                events = [
+                    deserialize_as(json_str, EventLogEntry)
+                    for (json_str,) in conn.execute(query).fetchall()
+                ]
+                self._write_run_stats(conn, run_id, events)
+
+    def _delete_run_stats(self, conn, run_id: str):
+        conn.execute(
+            RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                RunStatsTable.c.run_id == run_id
+            )
+        )
+        conn.execute(
+            RunStepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                RunStepStatsTable.c.run_id == run_id
+            )
+        )
+
     def get_records_for_run(
         self,
         run_id,
@@ -373,6 +711,9 @@ def get_records_for_run(
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
 
+        if self.has_secondary_index(RUN_STATS_TABLES):
+            return self._get_stats_for_run_from_stats_table(run_id)
+
         query = (
             db.select(
                 [
@@ -427,10 +768,55 @@ def get_stats_for_run(self, run_id):
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_stats_for_run_from_stats_table(self, run_id):
+        query = db.select(
+            [
+                RunStatsTable.c.steps_succeeded,
+                RunStatsTable.c.steps_failed,
+                RunStatsTable.c.materializations,
+                RunStatsTable.c.expectations,
+                RunStatsTable.c.enqueued_time,
+                RunStatsTable.c.launch_time,
+                RunStatsTable.c.start_time,
+                RunStatsTable.c.end_time,
+            ]
+        ).where(RunStatsTable.c.run_id == run_id)
+
+        with self.run_connection(run_id) as conn:
+            row = conn.execute(query).fetchone()
+
+        if not row:
+            return PipelineRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=0,
+                steps_failed=0,
+                materializations=0,
+                expectations=0,
+                enqueued_time=None,
+                launch_time=None,
+                start_time=None,
+                end_time=None,
+            )
+
+        return PipelineRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=row.steps_succeeded or 0,
+            steps_failed=row.steps_failed or 0,
+            materializations=row.materializations or 0,
+            expectations=row.expectations or 0,
+            enqueued_time=row.enqueued_time,
+            launch_time=row.launch_time,
+            start_time=row.start_time,
+            end_time=row.end_time,
+        )
+
     def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_secondary_index(RUN_STATS_TABLES):
+            return self._get_step_stats_for_run_from_stats_table(run_id, step_keys)
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -449,18 +835,7 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
             .where(SqlEventLogStorageTable.c.step_key != None)
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
+                    [event_type.value for event_type in STEP_STATS_EVENT_TYPES]
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
@@ -484,6 +859,89 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+    def _get_step_stats_for_run_from_stats_table(self, run_id, step_keys=None):
+        step_query = (
+            db.select(
+                [
+                    RunStepStatsTable.c.step_key,
+                    RunStepStatsTable.c.status,
+                    RunStepStatsTable.c.start_time,
+                    RunStepStatsTable.c.end_time,
+                    RunStepStatsTable.c.attempts,
+                    RunStepStatsTable.c.materializations,
+                    RunStepStatsTable.c.expectations,
+                ]
+            )
+            .where(RunStepStatsTable.c.run_id == run_id)
+            .order_by(RunStepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            step_query = step_query.where(RunStepStatsTable.c.step_key.in_(step_keys))
+
+        with self.run_connection(run_id) as conn:
+            step_rows = conn.execute(step_query).fetchall()
+
+        if not step_rows:
+            return []
+
+        # the remaining stats are derived from sequences of events (marker and attempt timings) or
+        # need the full event objects (materializations, expectation results), so only those event
+        # types are fetched from the event log
+        detail_event_types = {
+            DagsterEventType.STEP_UP_FOR_RETRY,
+            DagsterEventType.STEP_RESTARTED,
+        }.union(MARKER_EVENTS)
+        if any(row.materializations for row in step_rows):
+            detail_event_types.add(DagsterEventType.ASSET_MATERIALIZATION)
+        if any(row.expectations for row in step_rows):
+            detail_event_types.add(DagsterEventType.STEP_EXPECTATION_RESULT)
+
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in detail_event_types]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if step_keys:
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        try:
+            records = [
+                check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                )
+                for (json_str,) in results
+            ]
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return build_run_step_stats_from_step_rows(
+            run_id,
+            OrderedDict(
+                (
+                    row.step_key,
+                    {
+                        "status": StepEventStatus(row.status) if row.status else None,
+                        "start_time": row.start_time,
+                        "end_time": row.end_time,
+                        "attempts": row.attempts,
+                    },
+                )
+                for row in step_rows
+            ),
+            records,
+        )
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -516,6 +974,9 @@ def wipe(self):
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if self._has_run_stats_tables(conn):
+                conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+                conn.execute(RunStepStatsTable.delete())  # pylint: disable=no-value-for-parameter
 
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
@@ -524,6 +985,8 @@ def wipe(self):
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+            if self._has_run_stats_tables(conn):
+                self._delete_run_stats(conn, run_id)
 
     def delete_events_for_run(self, conn, run_id):
         check.str_param(run_id, "run_id")
@@ -802,12 +1265,11 @@ def get_event_records(
     def supports_event_consumer_queries(self):
         return True
 
-    def get_logs_for_all_runs_by_log_id(
+    def _all_runs_events_query(
         self,
-        after_cursor: int = -1,
-        dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
-        limit: Optional[int] = None,
-    ) -> Mapping[int, EventLogEntry]:
+        after_cursor: int,
+        dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+    ):
         check.int_param(after_cursor, "after_cursor")
         check.invariant(
             after_cursor >= -1,
@@ -834,6 +1296,16 @@ def get_logs_for_all_runs_by_log_id(
                 )
             )
 
+        return query
+
+    def get_logs_for_all_runs_by_log_id(
+        self,
+        after_cursor: int = -1,
+        dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+    ) -> Mapping[int, EventLogEntry]:
+        query = self._all_runs_events_query(after_cursor, dagster_event_type)
+
         if limit:
             query = query.limit(limit)
 
@@ -852,6 +1324,38 @@ def get_logs_for_all_runs_by_log_id(
 
         return events
 
+    def iter_logs_for_all_runs_by_log_id(
+        self,
+        after_cursor: int = -1,
+        dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        batch_size: int = DEFAULT_EVENT_LOG_STREAM_BATCH_SIZE,
+    ) -> Iterator[Tuple[int, EventLogEntry]]:
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        # keyset pagination, each batch is fetched on its own short-lived connection so that the
+        # consumer can take as long as it needs between batches without holding the database open
+        cursor = after_cursor
+        while True:
+            query = self._all_runs_events_query(cursor, dagster_event_type).limit(batch_size)
+            with self.index_connection() as conn:
+                rows = conn.execute(query).fetchall()
+
+            yield from self._iter_event_log_rows(rows)
+
+            if len(rows) < batch_size:
+                return
+            cursor = rows[-1][0]
+
+    def _iter_event_log_rows(self, rows) -> Iterator[Tuple[int, EventLogEntry]]:
+        for record_id, json_str in rows:
+            try:
+                event = deserialize_as(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, check.CheckError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+                continue
+            yield record_id, event
+
     def get_maximum_record_id(self) -> Optional[int]:
         with self.index_connection() as conn:
             result = conn.execute(db.select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
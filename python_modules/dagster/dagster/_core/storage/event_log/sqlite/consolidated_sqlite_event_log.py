@@ -1,16 +1,15 @@
 import logging
 import os
-from collections import defaultdict
 from contextlib import contextmanager
 
+import sqlalchemy as db
 from sqlalchemy.pool import NullPool
-from watchdog.events import PatternMatchingEventHandler
-from watchdog.observers import Observer
 
 import dagster._check as check
+import dagster._seven as seven
 from dagster._config import StringSource
-from dagster._core.storage.event_log.base import EventLogCursor
-from dagster._core.storage.pipeline_run import PipelineRunStatus
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogRecord
 from dagster._core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -19,11 +18,13 @@
     stamp_alembic_rev,
 )
 from dagster._core.storage.sqlite import create_db_conn_string
-from dagster._serdes import ConfigurableClass, ConfigurableClassData
+from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_as
+from dagster._serdes.errors import DeserializationError
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata
+from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from ..sql_event_log import SqlEventLogStorage
+from .event_watcher import SqliteEventWatcher, resolve_watch_cursor
 
 SQLITE_EVENT_LOG_FILENAME = "event_log"
 
@@ -53,9 +54,15 @@ def __init__(self, base_dir, inst_data=None):
         self._base_dir = check.str_param(base_dir, "base_dir")
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
         self._secondary_index_cache = {}
+        # only cached once found, since the tables may be added by a migration while in use
+        self._run_stats_tables_exist = False
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._watchers = defaultdict(dict)
-        self._obs = None
+        self._event_watcher = SqliteEventWatcher(
+            self._base_dir,
+            patterns=[self.get_db_path()],
+            fetch_records=self._fetch_watched_records,
+            run_ids_for_path=self._watched_run_ids_for_path,
+        )
 
         if not os.path.exists(self.get_db_path()):
             self._init_db()
@@ -128,69 +135,40 @@ def enable_secondary_index(self, name):
         if name in self._secondary_index_cache:
             del self._secondary_index_cache[name]
 
+    def _has_run_stats_tables(self, conn):
+        if not self._run_stats_tables_exist:
+            self._run_stats_tables_exist = super(
+                ConsolidatedSqliteEventLogStorage, self
+            )._has_run_stats_tables(conn)
+        return self._run_stats_tables_exist
+
     def watch(self, run_id, cursor, callback):
-        if not self._obs:
-            self._obs = Observer()
-            self._obs.start()
-            self._obs.schedule(
-                ConsolidatedSqliteEventLogStorageWatchdog(self), self._base_dir, True
-            )
-
-        self._watchers[run_id][callback] = cursor
-
-    def on_modified(self):
-        keys = [
-            (run_id, callback)
-            for run_id, callback_dict in self._watchers.items()
-            for callback, _ in callback_dict.items()
-        ]
-        for run_id, callback in keys:
-            cursor = self._watchers[run_id][callback]
-
-            # fetch events
-            connection = self.get_records_for_run(run_id, cursor)
-
-            # update cursor
-            if connection.cursor:
-                self._watchers[run_id][callback] = connection.cursor
-
-            for record in connection.records:
-                status = None
-                try:
-                    status = callback(
-                        record.event_log_entry,
-                        str(EventLogCursor.from_storage_id(record.storage_id)),
-                    )
-                except Exception:
-                    logging.exception("Exception in callback for event watch on run %s.", run_id)
-
-                if (
-                    status == PipelineRunStatus.SUCCESS
-                    or status == PipelineRunStatus.FAILURE
-                    or status == PipelineRunStatus.CANCELED
-                ):
-                    self.end_watch(run_id, callback)
+        self._event_watcher.watch_run(run_id, resolve_watch_cursor(self, run_id, cursor), callback)
 
     def end_watch(self, run_id, handler):
-        if run_id in self._watchers and handler in self._watchers[run_id]:
-            del self._watchers[run_id][handler]
-
-    def dispose(self):
-        if self._obs:
-            self._obs.stop()
-            self._obs.join(timeout=15)
+        self._event_watcher.unwatch_run(run_id, handler)
+
+    def _fetch_watched_records(self, after_storage_ids):
+        # storage ids are global in the consolidated db, so a single query serves every watched run
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id.in_(list(after_storage_ids.keys())))
+            .where(SqlEventLogStorageTable.c.id > min(after_storage_ids.values()))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        with self._connect() as conn:
+            results = conn.execute(query).fetchall()
 
+        for record_id, json_str in results:
+            try:
+                yield EventLogRecord(
+                    storage_id=record_id, event_log_entry=deserialize_as(json_str, EventLogEntry)
+                )
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
 
-class ConsolidatedSqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, **kwargs):
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", ConsolidatedSqliteEventLogStorage
-        )
-        self._log_path = event_log_storage.get_db_path()
-        super(ConsolidatedSqliteEventLogStorageWatchdog, self).__init__(
-            patterns=[self._log_path], **kwargs
-        )
+    def _watched_run_ids_for_path(self, _path, watched_run_ids):
+        return watched_run_ids
 
-    def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._event_log_storage.on_modified()
+    def dispose(self):
+        self._event_watcher.close()
@@ -0,0 +1,155 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Mapping, MutableMapping, Optional, Sequence
+
+from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
+
+import dagster._check as check
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord
+from dagster._core.storage.pipeline_run import PipelineRunStatus
+
+WatchCallback = Callable[[EventLogEntry, str], Optional[PipelineRunStatus]]
+
+# Fetches the records stored after the given storage id for each of the given run ids
+FetchRecordsFn = Callable[[Mapping[str, int]], Iterable[EventLogRecord]]
+
+# Maps a modified file path to the run ids whose events may have changed, given the watched run ids
+RunIdsForPathFn = Callable[[str, Sequence[str]], Sequence[str]]
+
+
+class SqliteEventWatcher:
+    """Event log watcher shared by every subscription on a SQLite event log storage.
+
+    A single filesystem observer watches the storage directory. When a database file is modified,
+    the new records for the affected runs are fetched once, starting from the lowest storage id
+    that any subscriber of those runs has seen, and fanned out to every callback whose cursor is
+    behind each record. The work done per modification therefore scales with the number of new
+    events, not with the number of subscribers.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _cursors
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        patterns: Sequence[str],
+        fetch_records: FetchRecordsFn,
+        run_ids_for_path: RunIdsForPathFn,
+    ):
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        self._patterns = check.sequence_param(patterns, "patterns", of_type=str)
+        self._fetch_records = check.callable_param(fetch_records, "fetch_records")
+        self._run_ids_for_path = check.callable_param(run_ids_for_path, "run_ids_for_path")
+
+        self._lock = threading.Lock()
+        # run_id -> callback -> storage id of the last record delivered to the callback
+        self._cursors: MutableMapping[str, Dict[WatchCallback, int]] = defaultdict(dict)
+        self._obs = None
+
+    def watch_run(self, run_id: str, storage_id: int, callback: WatchCallback):
+        check.str_param(run_id, "run_id")
+        check.int_param(storage_id, "storage_id")
+        check.callable_param(callback, "callback")
+
+        with self._lock:
+            if not self._obs:
+                self._obs = Observer()
+                self._obs.start()
+                self._obs.schedule(
+                    _SqliteEventWatcherHandler(self, patterns=self._patterns), self._base_dir, True
+                )
+            self._cursors[run_id][callback] = storage_id
+
+    def unwatch_run(self, run_id: str, callback: WatchCallback):
+        check.str_param(run_id, "run_id")
+        check.callable_param(callback, "callback")
+
+        with self._lock:
+            if run_id in self._cursors and callback in self._cursors[run_id]:
+                del self._cursors[run_id][callback]
+                if not self._cursors[run_id]:
+                    del self._cursors[run_id]
+
+    def close(self):
+        if self._obs:
+            self._obs.stop()
+            self._obs.join(timeout=15)
+            self._obs = None
+
+    def on_modified(self, path: str):
+        with self._lock:
+            watched_run_ids = list(self._cursors.keys())
+        if not watched_run_ids:
+            return
+
+        run_ids = self._run_ids_for_path(path, watched_run_ids)
+        if not run_ids:
+            return
+
+        with self._lock:
+            after_storage_ids = {
+                run_id: min(self._cursors[run_id].values())
+                for run_id in run_ids
+                if self._cursors.get(run_id)
+            }
+        if not after_storage_ids:
+            return
+
+        for record in self._fetch_records(after_storage_ids):
+            run_id = record.event_log_entry.run_id
+            with self._lock:
+                callbacks = [
+                    callback
+                    for callback, storage_id in self._cursors.get(run_id, {}).items()
+                    if storage_id < record.storage_id
+                ]
+                for callback in callbacks:
+                    self._cursors[run_id][callback] = record.storage_id
+
+            for callback in callbacks:
+                self._call_callback(run_id, callback, record)
+
+    def _call_callback(self, run_id: str, callback: WatchCallback, record: EventLogRecord):
+        status = None
+        try:
+            status = callback(
+                record.event_log_entry, str(EventLogCursor.from_storage_id(record.storage_id))
+            )
+        except Exception:
+            logging.exception("Exception in callback for event watch on run %s.", run_id)
+
+        if (
+            status == PipelineRunStatus.SUCCESS
+            or status == PipelineRunStatus.FAILURE
+            or status == PipelineRunStatus.CANCELED
+        ):
+            self.unwatch_run(run_id, callback)
+
+
+class _SqliteEventWatcherHandler(PatternMatchingEventHandler):
+    def __init__(self, watcher: SqliteEventWatcher, **kwargs):
+        self._watcher = check.inst_param(watcher, "watcher", SqliteEventWatcher)
+        super(_SqliteEventWatcherHandler, self).__init__(**kwargs)
+
+    def on_modified(self, event):
+        self._watcher.on_modified(event.src_path)
+
+
+def resolve_watch_cursor(event_log_storage, run_id: str, cursor: Optional[str]) -> int:
+    """Converts the cursor passed to `watch` into the storage id of the last record that the
+    subscriber has already seen."""
+    if not cursor:
+        return -1
+
+    cursor_obj = EventLogCursor.parse(cursor)
+    if cursor_obj.is_id_cursor():
+        return cursor_obj.storage_id()
+
+    if cursor_obj.offset() == 0:
+        return -1
+    records = event_log_storage.get_records_for_run(run_id, limit=cursor_obj.offset()).records
+    return records[-1].storage_id if records else -1
@@ -4,15 +4,13 @@
 import sqlite3
 import threading
 import time
-from collections import defaultdict
 from contextlib import contextmanager
+from itertools import groupby
 from typing import Iterable, Optional
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
 from tqdm import tqdm
-from watchdog.events import PatternMatchingEventHandler
-from watchdog.observers import Observer
 
 import dagster._check as check
 import dagster._seven as seven
@@ -21,7 +19,7 @@
 from dagster._core.events import ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
-from dagster._core.storage.pipeline_run import PipelineRunStatus, RunsFilter
+from dagster._core.storage.pipeline_run import RunsFilter
 from dagster._core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -39,6 +37,7 @@
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from .event_watcher import SqliteEventWatcher, resolve_watch_cursor
 
 INDEX_SHARD_NAME = "index"
 
@@ -74,9 +73,12 @@ def __init__(self, base_dir, inst_data=None):
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
 
-        self._obs = None
-
-        self._watchers = defaultdict(dict)
+        self._event_watcher = SqliteEventWatcher(
+            self._base_dir,
+            patterns=[os.path.join(self._base_dir, "*.db")],
+            fetch_records=self._fetch_watched_records,
+            run_ids_for_path=self._watched_run_ids_for_path,
+        )
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
         # Used to ensure that each run ID attempts to initialize its DB the first time it connects,
@@ -86,6 +88,12 @@ def __init__(self, base_dir, inst_data=None):
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
+        self._secondary_index_cache = {}
+
+        # shards that are known to have the run stats tables. Shards created before the tables were
+        # added only get them once the run stats data migration has been run
+        self._run_stats_table_shards = set()
+
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
@@ -124,6 +132,26 @@ def config_type(cls):
     def from_config_value(inst_data, config_value):
         return SqliteEventLogStorage(inst_data=inst_data, **config_value)
 
+    def has_secondary_index(self, name):
+        if name not in self._secondary_index_cache:
+            self._secondary_index_cache[name] = super(
+                SqliteEventLogStorage, self
+            ).has_secondary_index(name)
+        return self._secondary_index_cache[name]
+
+    def enable_secondary_index(self, name):
+        super(SqliteEventLogStorage, self).enable_secondary_index(name)
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
+
+    def _has_run_stats_tables(self, conn):
+        shard = conn.engine.url.database
+        if shard not in self._run_stats_table_shards:
+            if not super(SqliteEventLogStorage, self)._has_run_stats_tables(conn):
+                return False
+            self._run_stats_table_shards.add(shard)
+        return True
+
     def get_all_run_ids(self):
         all_filenames = glob.glob(os.path.join(self._base_dir, "*.db"))
         return [
@@ -167,6 +195,9 @@ def _initdb(self, engine):
                     "table asset_keys already exists" in err_msg
                     or "table secondary_indexes already exists" in err_msg
                     or "table event_logs already exists" in err_msg
+                    or "table asset_event_tags already exists" in err_msg
+                    or "table run_stats already exists" in err_msg
+                    or "table run_step_stats already exists" in err_msg
                     or "database is locked" in err_msg
                     or "table alembic_version already exists" in err_msg
                     or "UNIQUE constraint failed: alembic_version.version_num" in err_msg
@@ -224,7 +255,11 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            with conn.begin():
+                conn.execute(insert_event_statement)
+
+                if self._should_write_run_stats(conn, [event]):
+                    self._write_run_stats(conn, run_id, [event])
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             check.invariant(
@@ -248,6 +283,54 @@ def store_event(self, event):
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_event_batch(self, events):
+        """
+        Overridden method to write each run's events to its shard in a single multi-row insert,
+        then mirror any asset events, along with their asset index rows, into the cross-run index
+        shard in a single transaction.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events)
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [self._get_event_insert_values(event) for event in run_events],
+                    )
+
+                    if self._should_write_run_stats(conn, run_events):
+                        self._write_run_stats(conn, run_id, run_events)
+
+            asset_events = [
+                event
+                for event in run_events
+                if event.is_dagster_event and event.dagster_event.asset_key
+            ]
+            if not asset_events:
+                continue
+
+            check.invariant(
+                all(event.dagster_event_type in ASSET_EVENTS for event in asset_events),
+                "Can only store asset materializations, materialization_planned, and observations in index database",
+            )
+
+            # mirror the asset events in the cross-run index database, writing their asset index
+            # rows in the same transaction. The column check opens its own connection, which can't
+            # be nested inside the index shard's connection.
+            has_asset_key_index_cols = self._asset_key_index_cols_enabled()
+            with self.index_connection() as conn:
+                with conn.begin():
+                    for event in asset_events:
+                        result = conn.execute(self.prepare_insert_event(event))
+                        self._store_asset_index_rows(
+                            conn, event, result.inserted_primary_key[0], has_asset_key_index_cols
+                        )
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -317,7 +400,7 @@ def get_event_records(
 
         event_records = []
         for run_record in run_records:
-            run_id = run_record.pipeline_run.run_id
+            run_id = run_record.run_id
             with self.run_connection(run_id) as conn:
                 results = conn.execute(query).fetchall()
 
@@ -349,6 +432,8 @@ def supports_event_consumer_queries(self):
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
+            if self._has_run_stats_tables(conn):
+                self._delete_run_stats(conn, run_id)
 
         # delete the mirrored event in the cross-run index database
         with self.index_connection() as conn:
@@ -364,6 +449,8 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
+        self._run_stats_table_shards = set()
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
@@ -384,26 +471,24 @@ def wipe_asset(self, asset_key):
         self._delete_mirrored_events_for_asset_key(asset_key)
 
     def watch(self, run_id, cursor, callback):
-        if not self._obs:
-            self._obs = Observer()
-            self._obs.start()
-
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, True),
-        )
+        self._event_watcher.watch_run(run_id, resolve_watch_cursor(self, run_id, cursor), callback)
 
     def end_watch(self, run_id, handler):
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)
-            del self._watchers[run_id][handler]
+        self._event_watcher.unwatch_run(run_id, handler)
+
+    def _fetch_watched_records(self, after_storage_ids):
+        # storage ids are only unique within a run shard, so each modified run is queried separately
+        for run_id, storage_id in after_storage_ids.items():
+            yield from self.get_records_for_run(
+                run_id, str(EventLogCursor.from_storage_id(storage_id))
+            ).records
+
+    def _watched_run_ids_for_path(self, path, watched_run_ids):
+        run_id = os.path.splitext(os.path.basename(path))[0]
+        return [run_id] if run_id in watched_run_ids else []
 
     def dispose(self):
-        if self._obs:
-            self._obs.stop()
-            self._obs.join(timeout=15)
+        self._event_watcher.close()
 
     def alembic_version(self):
         alembic_config = get_alembic_config(__file__)
@@ -413,39 +498,3 @@ def alembic_version(self):
     @property
     def is_run_sharded(self):
         return True
-
-
-class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, run_id, callback, cursor, **kwargs):
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", SqliteEventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._cb = check.callable_param(callback, "callback")
-        self._log_path = event_log_storage.path_for_shard(run_id)
-        self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
-
-    def _process_log(self):
-        connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
-        if connection.cursor:
-            self._cursor = connection.cursor
-        for record in connection.records:
-            status = None
-            try:
-                status = self._cb(
-                    record.event_log_entry, str(EventLogCursor.from_storage_id(record.storage_id))
-                )
-            except Exception:
-                logging.exception("Exception in callback for event watch on run %s.", self._run_id)
-
-            if (
-                status == PipelineRunStatus.SUCCESS
-                or status == PipelineRunStatus.FAILURE
-                or status == PipelineRunStatus.CANCELED
-            ):
-                self._event_log_storage.end_watch(self._run_id, self._cb)
-
-    def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
@@ -15,6 +15,7 @@
 )
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.resource_definition import ResourceDefinition
+from dagster._core.execution.event_loop import run_coroutine
 from dagster._core.storage.input_manager import InputManager
 from dagster._core.storage.output_manager import IOutputManagerDefinition, OutputManager
 from dagster._core.storage.root_input_manager import IInputManagerDefinition
@@ -188,6 +189,47 @@ def get_input_asset_partitions(self, context: "InputContext") -> Set[str]:
         return self.get_output_asset_partitions(upstream_output_context)
 
 
+class AsyncIOManager(IOManager):
+    """
+    Base class for user-provided IO managers that store and load objects with coroutines, e.g.
+    using an async client for a cloud object store.
+
+    Users should implement ``handle_output_async`` and ``load_input_async``. When executing with
+    the :py:func:`asyncio_executor`, these are run on the event loop that is shared by every
+    executing step, concurrently with the async ops of the run. Otherwise, they are run to
+    completion on an event loop of their own, like ``async def`` ops.
+    """
+
+    @public  # type: ignore
+    @abstractmethod
+    async def load_input_async(self, context: "InputContext") -> Any:
+        """User-defined coroutine that loads an input to an op.
+
+        Args:
+            context (InputContext): The input context, which describes the input that's being loaded
+                and the upstream output that's being loaded from.
+
+        Returns:
+            Any: The data object.
+        """
+
+    @public  # type: ignore
+    @abstractmethod
+    async def handle_output_async(self, context: "OutputContext", obj: Any) -> None:
+        """User-defined coroutine that stores an output of an op.
+
+        Args:
+            context (OutputContext): The context of the step output that produces this object.
+            obj (Any): The object, returned by the op, to be stored.
+        """
+
+    def load_input(self, context: "InputContext") -> Any:
+        return run_coroutine(self.load_input_async(context))
+
+    def handle_output(self, context: "OutputContext", obj: Any) -> None:
+        run_coroutine(self.handle_output_async(context, obj))
+
+
 @overload
 def io_manager(config_schema: IOManagerFunction) -> IOManagerDefinition:
     ...
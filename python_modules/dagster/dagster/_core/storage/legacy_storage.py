@@ -147,9 +147,15 @@ def from_config_value(inst_data, config_value):
     def add_run(self, pipeline_run: "PipelineRun") -> "PipelineRun":
         return self._storage.run_storage.add_run(pipeline_run)
 
+    def add_runs(self, pipeline_runs: Sequence["PipelineRun"]) -> Sequence["PipelineRun"]:
+        return self._storage.run_storage.add_runs(pipeline_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent"):
         return self._storage.run_storage.handle_run_event(run_id, event)
 
+    def handle_run_events(self, run_events: Sequence[Tuple[str, "DagsterEvent"]]):
+        return self._storage.run_storage.handle_run_events(run_events)
+
     def get_runs(
         self,
         filters: Optional["RunsFilter"] = None,
@@ -192,6 +198,16 @@ def get_run_records(
     def get_run_tags(self) -> Sequence[Tuple[str, Set[str]]]:
         return self._storage.run_storage.get_run_tags()
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional["RunsFilter"] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._storage.run_storage.get_run_tag_counts(tag_keys, filters)
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence["PipelineRun"]:
+        return self._storage.run_storage.get_queued_runs(cursor, limit)
+
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
         return self._storage.run_storage.add_run_tags(run_id, new_tags)
 
@@ -330,6 +346,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry"):
         return self._storage.event_storage.store_event(event)
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]):
+        return self._storage.event_storage.store_event_batch(events)
+
     def delete_events(self, run_id: str):
         return self._storage.event_storage.delete_events(run_id)
 
@@ -1,21 +1,298 @@
-from dagster._core.storage.io_manager import IOManager, io_manager
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Set, Tuple
+
+import dagster._check as check
+from dagster._config import Field, IntSource, StringSource
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.storage.io_manager import IOManager, IOManagerDefinition, io_manager
+from dagster._utils import PICKLE_PROTOCOL, approximate_size
+
+if TYPE_CHECKING:
+    from dagster._core.execution.context.input import InputContext
+    from dagster._core.execution.context.output import OutputContext
+    from dagster._core.execution.plan.outputs import StepOutputHandle
+    from dagster._core.execution.plan.plan import ExecutionPlan
+
+# (step key, input name) of a step input that loads an output
+_Consumer = Tuple[str, str]
+
+
+class _ConsumerIndex:
+    """Maps each step output to the inputs of the steps to execute that load it.
+
+    Built from the execution plan, and rebuilt whenever the plan grows as its dynamic steps are
+    resolved. Outputs of steps that unresolved steps depend on are marked as having unknown
+    consumers.
+    """
+
+    def __init__(self, execution_plan: "ExecutionPlan"):
+        from dagster._core.execution.plan.step import ExecutionStep
+
+        self.num_steps = len(execution_plan.step_dict)
+        self.consumers: Dict["StepOutputHandle", Set[_Consumer]] = {}
+        self.unknown_consumer_step_keys: Set[str] = set()
+
+        step_keys_to_execute = set(execution_plan.step_keys_to_execute)
+        for step in execution_plan.step_dict.values():
+            if not isinstance(step, ExecutionStep):
+                self.unknown_consumer_step_keys.update(step.get_all_dependency_keys())
+                continue
+            if step.key not in step_keys_to_execute:
+                continue
+            for step_input in step.step_inputs:
+                for handle in step_input.get_step_output_handle_dependencies():
+                    self.consumers.setdefault(handle, set()).add((step.key, step_input.name))
+
+    def get_consumers(self, step_output_handle: "StepOutputHandle") -> Optional[Set[_Consumer]]:
+        if step_output_handle.step_key in self.unknown_consumer_step_keys:
+            return None
+        return set(self.consumers.get(step_output_handle, ()))
 
 
 class InMemoryIOManager(IOManager):
-    def __init__(self):
-        self.values = {}
+    """IO manager that stores and retrieves values in memory.
+
+    Args:
+        max_bytes (Optional[int]): The approximate number of bytes that the stored values may take
+            up in memory, counting the items of lists, tuples, sets and dicts. Once exceeded, the
+            least recently stored values are pickled to files in ``spill_dir`` until the values in
+            memory fit the budget.
+        spill_dir (Optional[str]): The directory that values are spilled to. A temporary
+            directory is created when not provided.
+        release_consumed_outputs (bool): Whether to drop each value once every step of the
+            execution plan that loads it has loaded it. Values whose downstream steps are not yet
+            resolved, and values stored outside of a run, are kept until the manager is cleaned
+            up.
+    """
 
-    def handle_output(self, context, obj):
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        release_consumed_outputs: bool = False,
+    ):
+        self._max_bytes = check.opt_int_param(max_bytes, "max_bytes")
+        self._spill_dir = check.opt_str_param(spill_dir, "spill_dir")
+        self._release_consumed_outputs = check.bool_param(
+            release_consumed_outputs, "release_consumed_outputs"
+        )
+
+        self.values: Dict[Tuple[str, ...], Any] = {}
+
+        # LOCKING INFO:
+        #   INVARIANTS: _lock protects every attribute below, along with values, since steps may
+        #   be executed concurrently in threads
+        self._lock = threading.RLock()
+        # keys of the values in memory, least recently stored first, mapped to their size
+        self._sizes: Dict[Tuple[str, ...], int] = OrderedDict()
+        self._num_bytes = 0
+        self._spilled_paths: Dict[Tuple[str, ...], str] = {}
+        self._num_spilled = 0
+        self._temp_spill_dir: Optional[str] = None
+        self._pending_consumers: Dict[Tuple[str, ...], Set[_Consumer]] = {}
+        self._released: Set[Tuple[str, ...]] = set()
+        self._consumer_index: Optional[_ConsumerIndex] = None
+
+    @property
+    def num_bytes(self) -> int:
+        """The number of bytes that the values in memory take up."""
+        return self._num_bytes
+
+    def is_spilled(self, keys: Tuple[str, ...]) -> bool:
+        return keys in self._spilled_paths
+
+    def handle_output(self, context: "OutputContext", obj: Any):
         keys = tuple(context.get_identifier())
-        self.values[keys] = obj
+        with self._lock:
+            self._discard(keys)
+            self._released.discard(keys)
 
-    def load_input(self, context):
+            self.values[keys] = obj
+            if self._max_bytes is not None:
+                self._sizes[keys] = approximate_size(obj)
+                self._num_bytes += self._sizes[keys]
+
+            if self._release_consumed_outputs:
+                consumers = self._get_consumers(context)
+                if consumers is not None:
+                    self._pending_consumers[keys] = consumers
+                    if not consumers:
+                        # nothing in the plan loads the value
+                        self._release(keys)
+
+            self._spill_to_budget()
+
+    def load_input(self, context: "InputContext"):
         keys = tuple(context.get_identifier())
-        return self.values[keys]
+        with self._lock:
+            if keys in self._released:
+                raise DagsterInvariantViolationError(
+                    f'Value for input "{context.name}" was released from memory after every step '
+                    "that loads it had loaded it. Set release_consumed_outputs to False to keep "
+                    "values in memory for steps that are retried or loaded more than once."
+                )
+
+            if keys in self._spilled_paths:
+                with open(self._spilled_paths[keys], "rb") as f:
+                    obj = pickle.load(f)
+            else:
+                obj = self.values[keys]
+
+            consumers = self._pending_consumers.get(keys)
+            if consumers is not None and context.has_input_name:
+                consumers.discard((context.step_context.step.key, context.name))
+                if not consumers:
+                    self._release(keys)
+
+            return obj
+
+    def cleanup(self) -> None:
+        """Drops every stored value and removes any spilled files."""
+        with self._lock:
+            for keys in list(self.values.keys()) + list(self._spilled_paths.keys()):
+                self._discard(keys)
+            self._pending_consumers.clear()
+            self._released.clear()
+            if self._temp_spill_dir:
+                shutil.rmtree(self._temp_spill_dir, ignore_errors=True)
+                self._temp_spill_dir = None
+
+    def _get_consumers(self, context: "OutputContext") -> Optional[Set[_Consumer]]:
+        from dagster._core.execution.plan.outputs import StepOutputHandle
+
+        try:
+            execution_plan = context.step_context.execution_plan
+        except DagsterInvariantViolationError:
+            # not executing as part of a run, so there is no plan to count consumers from
+            return None
+
+        if self._consumer_index is None or self._consumer_index.num_steps != len(
+            execution_plan.step_dict
+        ):
+            self._consumer_index = _ConsumerIndex(execution_plan)
+
+        return self._consumer_index.get_consumers(
+            StepOutputHandle(context.step_key, context.name, context.mapping_key)
+        )
+
+    def _release(self, keys: Tuple[str, ...]) -> None:
+        self._discard(keys)
+        self._released.add(keys)
+
+    def _discard(self, keys: Tuple[str, ...]) -> None:
+        self.values.pop(keys, None)
+        self._num_bytes -= self._sizes.pop(keys, 0)
+        self._pending_consumers.pop(keys, None)
+        spilled_path = self._spilled_paths.pop(keys, None)
+        if spilled_path and os.path.exists(spilled_path):
+            os.remove(spilled_path)
+
+    def _spill_to_budget(self) -> None:
+        if self._max_bytes is None:
+            return
+
+        while self._num_bytes > self._max_bytes and self._sizes:
+            keys, size = next(iter(self._sizes.items()))
+            path = os.path.join(self._get_spill_dir(), f"{self._num_spilled}.pickle")
+            self._num_spilled += 1
+            with open(path, "wb") as f:
+                pickle.dump(self.values[keys], f, PICKLE_PROTOCOL)
+
+            del self.values[keys]
+            del self._sizes[keys]
+            self._num_bytes -= size
+            self._spilled_paths[keys] = path
+
+    def _get_spill_dir(self) -> str:
+        if self._temp_spill_dir is None:
+            if self._spill_dir:
+                os.makedirs(self._spill_dir, exist_ok=True)
+            self._temp_spill_dir = tempfile.mkdtemp(dir=self._spill_dir)
+        return self._temp_spill_dir
+
+
+@io_manager(
+    config_schema={
+        "max_bytes": Field(
+            IntSource,
+            is_required=False,
+            description=(
+                "The number of bytes that the values stored in memory may take up. Once exceeded, "
+                "the least recently stored values are pickled to the spill directory."
+            ),
+        ),
+        "spill_dir": Field(
+            StringSource,
+            is_required=False,
+            description=(
+                "The directory in which to create a temporary directory for spilled values. "
+                "Defaults to the system temporary directory."
+            ),
+        ),
+        "release_consumed_outputs": Field(
+            bool,
+            default_value=False,
+            description=(
+                "Whether to drop each value once every step in the run that loads it has loaded "
+                "it. Steps that are retried can then no longer load their inputs."
+            ),
+        ),
+    },
+    description="Built-in IO manager that stores and retrieves values in memory.",
+)
+def mem_io_manager(init_context):
+    """Built-in IO manager that stores and retrieves values in memory.
+
+    By default, every value is kept in memory until the run completes. To bound the memory that a
+    run with large outputs takes up:
+
+    * ``max_bytes`` caps the approximate number of bytes that the values in memory may take up,
+      counting the items of lists, tuples, sets and dicts along with the containers themselves.
+      Once exceeded, the least recently stored values are pickled to a temporary directory under
+      ``spill_dir``, and loaded from there.
+    * ``release_consumed_outputs`` drops each value as soon as every step in the execution plan
+      that loads it has loaded it. Values consumed by dynamic steps that are not yet resolved are
+      kept. Steps that are retried after loading a released value fail to load it again.
+
+    Spilled files are removed once the run completes.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import job, mem_io_manager
 
+        @job(
+            resource_defs={
+                "io_manager": mem_io_manager.configured(
+                    {"max_bytes": 2 * 1024**3, "release_consumed_outputs": True}
+                )
+            }
+        )
+        def my_job():
+            ...
+    """
+    config: Mapping[str, Any] = init_context.resource_config or {}
+    manager = InMemoryIOManager(
+        max_bytes=config.get("max_bytes"),
+        spill_dir=config.get("spill_dir"),
+        release_consumed_outputs=config.get("release_consumed_outputs", False),
+    )
+    try:
+        yield manager
+    finally:
+        manager.cleanup()
 
-@io_manager(description="Built-in IO manager that stores and retrieves values in memory.")
-def mem_io_manager(_):
-    """Built-in IO manager that stores and retrieves values in memory."""
 
-    return InMemoryIOManager()
+def is_mem_io_manager(resource_def: object) -> bool:
+    """Whether the resource definition is the mem_io_manager, or a configured version of it."""
+    # pylint: disable=comparison-with-callable
+    return resource_def == mem_io_manager or (
+        isinstance(resource_def, IOManagerDefinition)
+        and resource_def.resource_fn == mem_io_manager.resource_fn
+    )
@@ -26,6 +26,7 @@
     DefaultNamedTupleSerializer,
     EnumSerializer,
     WhitelistMap,
+    deserialize_as,
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
     replace_storage_keys,
@@ -692,27 +693,32 @@ class TagBucket(NamedTuple):
     bucket_limit: Optional[int]
 
 
-class RunRecord(
-    NamedTuple(
-        "_RunRecord",
-        [
-            ("storage_id", int),
-            ("pipeline_run", PipelineRun),
-            ("create_timestamp", datetime),
-            ("update_timestamp", datetime),
-            ("start_time", Optional[float]),
-            ("end_time", Optional[float]),
-        ],
-    )
-):
+class RunRecord:
     """Internal representation of a run record, as stored in a
     :py:class:`~dagster._core.storage.runs.RunStorage`.
 
+    Records read from SQL storage hold the serialized run body and only deserialize it into a
+    :py:class:`PipelineRun` when ``pipeline_run`` is first accessed, so that callers which only need
+    the run id, job name, status or timestamps of a record do not pay for parsing it.
+
     Users should not invoke this class directly.
     """
 
-    def __new__(
-        cls,
+    __slots__ = [
+        "storage_id",
+        "run_id",
+        "_pipeline_name",
+        "status",
+        "create_timestamp",
+        "update_timestamp",
+        "start_time",
+        "end_time",
+        "_pipeline_run",
+        "_run_body",
+    ]
+
+    def __init__(
+        self,
         storage_id,
         pipeline_run,
         create_timestamp,
@@ -720,15 +726,106 @@ def __new__(
         start_time=None,
         end_time=None,
     ):
-        return super(RunRecord, cls).__new__(
-            cls,
-            storage_id=check.int_param(storage_id, "storage_id"),
-            pipeline_run=check.inst_param(pipeline_run, "pipeline_run", PipelineRun),
-            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
-            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
-            # start_time and end_time fields will be populated once the run has started and ended, respectively, but will be None beforehand.
-            start_time=check.opt_float_param(start_time, "start_time"),
-            end_time=check.opt_float_param(end_time, "end_time"),
+        pipeline_run = check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        self._set_fields(
+            storage_id=storage_id,
+            run_id=pipeline_run.run_id,
+            pipeline_name=pipeline_run.pipeline_name,
+            status=pipeline_run.status,
+            create_timestamp=create_timestamp,
+            update_timestamp=update_timestamp,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        self._pipeline_run = pipeline_run
+        self._run_body = None
+
+    @classmethod
+    def from_run_body(
+        cls,
+        storage_id: int,
+        run_id: str,
+        pipeline_name: Optional[str],
+        status: "DagsterRunStatus",
+        run_body: str,
+        create_timestamp: datetime,
+        update_timestamp: datetime,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> "RunRecord":
+        """Build a record whose run is deserialized from the given serialized run body on first
+        access. The given status takes precedence over the status in the run body."""
+        record = cls.__new__(cls)
+        record._set_fields(  # pylint: disable=protected-access
+            storage_id=storage_id,
+            run_id=run_id,
+            pipeline_name=pipeline_name,
+            status=status,
+            create_timestamp=create_timestamp,
+            update_timestamp=update_timestamp,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        record._pipeline_run = None  # pylint: disable=protected-access
+        record._run_body = check.str_param(run_body, "run_body")  # pylint: disable=protected-access
+        return record
+
+    def _set_fields(
+        self,
+        storage_id,
+        run_id,
+        pipeline_name,
+        status,
+        create_timestamp,
+        update_timestamp,
+        start_time,
+        end_time,
+    ):
+        self.storage_id = check.int_param(storage_id, "storage_id")
+        self.run_id = check.str_param(run_id, "run_id")
+        # the pipeline_name column of runs stored by old versions of dagster may be NULL
+        self._pipeline_name = check.opt_str_param(pipeline_name, "pipeline_name")
+        self.status = check.inst_param(status, "status", DagsterRunStatus)
+        self.create_timestamp = check.inst_param(create_timestamp, "create_timestamp", datetime)
+        self.update_timestamp = check.inst_param(update_timestamp, "update_timestamp", datetime)
+        # start_time and end_time fields will be populated once the run has started and ended, respectively, but will be None beforehand.
+        self.start_time = check.opt_float_param(start_time, "start_time")
+        self.end_time = check.opt_float_param(end_time, "end_time")
+
+    @property
+    def pipeline_name(self) -> str:
+        if self._pipeline_name is None:
+            self._pipeline_name = self.pipeline_run.pipeline_name
+        return self._pipeline_name
+
+    @property
+    def pipeline_run(self) -> PipelineRun:
+        if self._pipeline_run is None:
+            run = deserialize_as(self._run_body, PipelineRun)
+            # NOTE: the status column is more trustworthy than the status in the run body, since
+            # concurrent writes can cause the status in the body to be overriden with an old value.
+            self._pipeline_run = run.with_status(self.status)
+            self._run_body = None
+        return self._pipeline_run
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, RunRecord)
+            and self.storage_id == other.storage_id
+            and self.pipeline_run == other.pipeline_run
+            and self.create_timestamp == other.create_timestamp
+            and self.update_timestamp == other.update_timestamp
+            and self.start_time == other.start_time
+            and self.end_time == other.end_time
+        )
+
+    def __hash__(self):
+        return hash((self.storage_id, self.run_id))
+
+    def __repr__(self):
+        return (
+            f"RunRecord(storage_id={self.storage_id}, run_id={self.run_id!r}, "
+            f"pipeline_name={self.pipeline_name!r}, status={self.status})"
         )
 
 
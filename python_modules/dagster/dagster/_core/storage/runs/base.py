@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, Mapping, Optional, Sequence, Set, Tuple, Union
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.instance import MayHaveInstanceWeakref
 from dagster._core.snap import ExecutionPlanSnapshot, PipelineSnapshot
 from dagster._core.storage.pipeline_run import (
+    DagsterRunStatus,
     JobBucket,
     PipelineRun,
     RunPartitionData,
@@ -13,6 +15,7 @@
     RunsFilter,
     TagBucket,
 )
+from dagster._core.storage.tags import PRIORITY_TAG, parse_run_priority
 from dagster._daemon.types import DaemonHeartbeat
 
 
@@ -39,6 +42,18 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             pipeline_run (PipelineRun): The run to add.
         """
 
+    def add_runs(self, pipeline_runs: Sequence[PipelineRun]) -> Sequence[PipelineRun]:
+        """Add a batch of runs to storage. Storages that can write multiple runs in a single
+        transaction should override this method.
+
+        If a run already exists with the same ID, raise DagsterRunAlreadyExists
+        If a run's snapshot ID does not exist raise DagsterSnapshotDoesNotExist
+
+        Args:
+            pipeline_runs (Sequence[PipelineRun]): The runs to add.
+        """
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         """Update run storage in accordance to a pipeline run related DagsterEvent
@@ -48,6 +63,17 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
             event (DagsterEvent)
         """
 
+    def handle_run_events(self, run_events: Sequence[Tuple[str, DagsterEvent]]):
+        """Update run storage in accordance to a batch of pipeline run related DagsterEvents, in
+        order. Storages that can apply multiple updates in a single transaction should override
+        this method.
+
+        Args:
+            run_events (Sequence[Tuple[str, DagsterEvent]]): The run id and event of each update.
+        """
+        for run_id, event in run_events:
+            self.handle_run_event(run_id, event)
+
     @abstractmethod
     def get_runs(
         self,
@@ -179,6 +205,58 @@ def get_run_tags(self) -> Sequence[Tuple[str, Set[str]]]:
             List[Tuple[str, Set[str]]]
         """
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        """Count the runs matching the given filter that are tagged with each of the given tag keys.
+
+        Args:
+            tag_keys (Sequence[str]): The tag keys to count.
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+
+        Returns:
+            Dict[Tuple[str, str], int]: The number of matching runs for each (key, value) pair.
+        """
+        counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for run in self.get_runs(filters=filters):
+            for key, value in run.tags.items():
+                if key in tag_keys:
+                    counts[(key, value)] += 1
+        return dict(counts)
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[PipelineRun]:
+        """Return queued runs in the order that they should be dequeued: highest priority first,
+        and oldest first among runs with the same priority.
+
+        Args:
+            cursor (Optional[str]): Run id of the last run of the previous page. Only runs that
+                would be dequeued after this run are returned.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[PipelineRun]
+        """
+
+        def _dequeue_order(record: RunRecord) -> Tuple[int, int]:
+            priority = parse_run_priority(record.pipeline_run.tags.get(PRIORITY_TAG))
+            return (-priority, record.storage_id)
+
+        records = sorted(
+            self.get_run_records(filters=RunsFilter(statuses=[DagsterRunStatus.QUEUED])),
+            key=_dequeue_order,
+        )
+        if cursor:
+            # the cursor run may have been dequeued since the previous page was fetched
+            cursor_records = self.get_run_records(filters=RunsFilter(run_ids=[cursor]))
+            if cursor_records:
+                cursor_order = _dequeue_order(cursor_records[0])
+                records = [record for record in records if _dequeue_order(record) > cursor_order]
+        if limit:
+            records = records[:limit]
+        return [record.pipeline_run for record in records]
+
     @abstractmethod
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
         """Add additional tags for a pipeline run.
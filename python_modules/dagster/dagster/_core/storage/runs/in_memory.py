@@ -1,3 +1,4 @@
+import threading
 from contextlib import contextmanager
 
 import sqlalchemy as db
@@ -18,6 +19,9 @@ class InMemoryRunStorage(SqlRunStorage):
     """
 
     def __init__(self, preload=None):
+        # the connection may be used from multiple threads, e.g. by the steps of the in process
+        # threaded executor, so its use is serialized
+        self._lock = threading.RLock()
         self._conn = self._create_connection()
 
         self.migrate()
@@ -34,7 +38,11 @@ def __init__(self, preload=None):
                 self.add_run(payload.pipeline_run)
 
     def _create_connection(self):
-        engine = create_engine(create_in_memory_conn_string("runs"), poolclass=NullPool)
+        engine = create_engine(
+            create_in_memory_conn_string("runs"),
+            poolclass=NullPool,
+            connect_args={"check_same_thread": False},
+        )
         conn = engine.connect()
         conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA foreign_keys=ON;")
@@ -48,7 +56,8 @@ def _create_connection(self):
 
     @contextmanager
     def connect(self):
-        yield self._conn
+        with self._lock:
+            yield self._conn
 
     def upgrade(self):
         pass
@@ -11,18 +11,26 @@
 from ..pipeline_run import PipelineRun, PipelineRunStatus
 from ..runs.base import RunStorage
 from ..runs.schema import BulkActionsTable, RunTagsTable, RunsTable
-from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
+from ..tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    PRIORITY_TAG,
+    REPOSITORY_LABEL_TAG,
+    parse_run_priority,
+)
 
 RUN_PARTITIONS = "run_partitions"
 RUN_START_END = "run_start_end_overwritten"  # was run_start_end, but renamed to overwrite bad timestamps written
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+RUN_PRIORITY = "run_priority"
 
 # for `dagster instance migrate`, paired with schema changes
 REQUIRED_DATA_MIGRATIONS = {
     RUN_PARTITIONS: lambda: migrate_run_partition,
     RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags,
     BULK_ACTION_TYPES: lambda: migrate_bulk_actions,
+    RUN_PRIORITY: lambda: migrate_run_priority,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS = {
@@ -111,7 +119,7 @@ def migrate_run_start_end(storage, print_fn=None):
         print_fn("Querying run and event log storage.")
 
     for run_record in chunked_run_records_iterator(storage, print_fn):
-        if run_record.pipeline_run.status in UNSTARTED_RUN_STATUSES:
+        if run_record.status in UNSTARTED_RUN_STATUSES:
             continue
 
         # commented out here to ensure that previously written timestamps that may not have
@@ -119,7 +127,7 @@ def migrate_run_start_end(storage, print_fn=None):
         # if run_record.start_time:
         #     continue
 
-        add_run_stats(storage, run_record.pipeline_run.run_id)
+        add_run_stats(storage, run_record.run_id)
 
 
 def add_run_stats(run_storage: RunStorage, run_id: str) -> None:
@@ -253,3 +261,53 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn=None):
                     .where(BulkActionsTable.c.id == storage_id)
                 )
                 cursor = storage_id
+
+
+def migrate_run_priority(run_storage: RunStorage, print_fn=None):
+    """
+    Utility method to populate the priority column of existing runs from their priority tags.
+    """
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    base_query = (
+        db.select([RunTagsTable.c.run_id, RunTagsTable.c.value, RunTagsTable.c.id])
+        .where(RunTagsTable.c.key == PRIORITY_TAG)
+        .order_by(db.asc(RunTagsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunTagsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for run_id, priority_tag_value, tag_id in rows:
+                conn.execute(
+                    RunsTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(RunsTable.c.run_id == run_id)
+                    .values(priority=parse_run_priority(priority_tag_value))
+                )
+                cursor = tag_id
+
+    # every other run has the default priority
+    with run_storage.connect() as conn:
+        conn.execute(
+            RunsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(RunsTable.c.priority.is_(None))
+            .values(priority=0)
+        )
@@ -38,6 +38,9 @@
     # columns in favor of DateTime / Timestamp columns.
     db.Column("start_time", db.Float),
     db.Column("end_time", db.Float),
+    # Added priority (11/2022), the dequeue priority of the run parsed from its dagster/priority tag,
+    # so that the run queue can be ordered and paginated in the database.
+    db.Column("priority", db.Integer, server_default="0"),
 )
 
 # Secondary Index migration table, used to track data migrations, both for event_logs and runs.
@@ -110,6 +113,13 @@
 db.Index("idx_bulk_actions_action_type", BulkActionsTable.c.action_type, mysql_length=32)
 db.Index("idx_bulk_actions_selector_id", BulkActionsTable.c.selector_id, mysql_length=64)
 db.Index("idx_run_status", RunsTable.c.status, mysql_length=32)
+db.Index(
+    "idx_run_priority",
+    RunsTable.c.status,
+    RunsTable.c.priority,
+    RunsTable.c.id,
+    mysql_length={"status": 32},
+)
 db.Index(
     "idx_run_range",
     RunsTable.c.status,
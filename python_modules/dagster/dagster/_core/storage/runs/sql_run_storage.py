@@ -3,12 +3,14 @@
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import pendulum
 import sqlalchemy as db
+from sqlalchemy.ext.compiler import compiles
 
 import dagster._check as check
 from dagster._core.errors import (
@@ -28,17 +30,25 @@
     create_pipeline_snapshot_id,
 )
 from dagster._core.storage.tags import (
+    MAX_RUN_PRIORITY,
+    MIN_RUN_PRIORITY,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    parse_run_priority,
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
+    deserialize_value_from_bytes,
+    is_binary_serialized,
     serialize_dagster_namedtuple,
+    serialize_value_to_bytes,
 )
+from dagster._serdes.errors import DeserializationError
 from dagster._seven import JSONDecodeError
 from dagster._utils import merge_dicts, utc_datetime_from_timestamp
 
@@ -52,7 +62,12 @@
     TagBucket,
 )
 from .base import RunStorage
-from .migration import OPTIONAL_DATA_MIGRATIONS, REQUIRED_DATA_MIGRATIONS, RUN_PARTITIONS
+from .migration import (
+    OPTIONAL_DATA_MIGRATIONS,
+    REQUIRED_DATA_MIGRATIONS,
+    RUN_PARTITIONS,
+    RUN_PRIORITY,
+)
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
@@ -65,6 +80,63 @@
 )
 
 
+class run_priority_from_tag(db.sql.expression.FunctionElement):  # pylint: disable=abstract-method
+    """The dequeue priority of a run given the value of its priority tag, as parsed by
+    parse_run_priority. Runs without a priority tag have priority 0."""
+
+    name = "run_priority_from_tag"
+    type = db.types.Integer()
+    inherit_cache = True
+
+
+def _cast_run_priority(tag_value, is_integer, wide_type):
+    # the expressions are built rather than formatted so that a tag value that is a bound parameter
+    # gets bound once per reference. Integers are first cast to a type that holds values outside the
+    # range of the priority column, and clamped to that range as parse_run_priority does, since
+    # casting them directly to an integer raises on postgres and overflows on mysql.
+    wide_value = db.cast(tag_value, wide_type)
+    clamped = db.case(
+        [
+            (wide_value < MIN_RUN_PRIORITY, MIN_RUN_PRIORITY),
+            (wide_value > MAX_RUN_PRIORITY, MAX_RUN_PRIORITY),
+        ],
+        else_=wide_value,
+    )
+    return db.case([(is_integer, db.cast(clamped, db.Integer))], else_=0)
+
+
+@compiles(run_priority_from_tag)
+def compiles_run_priority_from_tag_default(element, compiler, **kw):
+    # sqlite casts any value with a numeric prefix (e.g. "1.5" or "2abc"), and has no regex operator
+    # to match the format parse_run_priority accepts. Instead, strip the surrounding whitespace and
+    # the sign, and only cast the values that are left with nothing but digits. Casting to an integer
+    # saturates at the 64-bit range, which is wide enough to clamp from.
+    (tag_value,) = element.clauses
+    trimmed = db.func.trim(tag_value, db.literal_column("' ' || CHAR(9, 10, 11, 12, 13)"))
+    unsigned = db.case(
+        [(db.func.substr(trimmed, 1, 1).in_(["+", "-"]), db.func.substr(trimmed, 2))],
+        else_=trimmed,
+    )
+    is_integer = db.and_(unsigned != "", db.not_(unsigned.op("GLOB")("*[^0-9]*")))
+    return compiler.process(_cast_run_priority(trimmed, is_integer, db.Integer), **kw)
+
+
+@compiles(run_priority_from_tag, "mysql")
+def compiles_run_priority_from_tag_mysql(element, compiler, **kw):
+    # mysql casts any value with a numeric prefix, so only cast the values that are integers
+    (tag_value,) = element.clauses
+    is_integer = tag_value.op("REGEXP")("^[[:space:]]*[-+]?[0-9]+[[:space:]]*$")
+    return compiler.process(_cast_run_priority(tag_value, is_integer, db.Numeric(65, 0)), **kw)
+
+
+@compiles(run_priority_from_tag, "postgresql")
+def compiles_run_priority_from_tag_postgresql(element, compiler, **kw):
+    # postgres raises on casting values that are not integers, so only cast those that are
+    (tag_value,) = element.clauses
+    is_integer = tag_value.op("~")("^[[:space:]]*[-+]?[0-9]+[[:space:]]*$")
+    return compiler.process(_cast_run_priority(tag_value, is_integer, db.Numeric), **kw)
+
+
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
@@ -111,18 +183,8 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
                 )
             )
 
-        has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
-        partition = pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
-        partition_set = pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None
-
         runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=pipeline_run.run_id,
-            pipeline_name=pipeline_run.pipeline_name,
-            status=pipeline_run.status.value,
-            run_body=serialize_dagster_namedtuple(pipeline_run),
-            snapshot_id=pipeline_run.pipeline_snapshot_id,
-            partition=partition,
-            partition_set=partition_set,
+            **self._get_run_insert_values(pipeline_run)
         )
         with self.connect() as conn:
             try:
@@ -142,6 +204,82 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
 
         return pipeline_run
 
+    def add_runs(self, pipeline_runs: Sequence[PipelineRun]) -> Sequence[PipelineRun]:
+        """Adds the runs with a single multi-row insert of the runs and of their tags, within one
+        transaction. Either every run is added, or none is.
+        """
+        check.sequence_param(pipeline_runs, "pipeline_runs", of_type=PipelineRun)
+
+        if not pipeline_runs:
+            return []
+
+        snapshot_ids = {
+            pipeline_run.pipeline_snapshot_id
+            for pipeline_run in pipeline_runs
+            if pipeline_run.pipeline_snapshot_id
+        }
+        for snapshot_id in snapshot_ids:
+            if not self.has_pipeline_snapshot(snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    "Snapshot {ss_id} does not exist in run storage".format(ss_id=snapshot_id)
+                )
+
+        tags_to_insert = [
+            dict(run_id=pipeline_run.run_id, key=k, value=v)
+            for pipeline_run in pipeline_runs
+            for k, v in pipeline_run.tags_for_storage().items()
+        ]
+        with self.connect() as run_conn:
+            with self._write_transaction(run_conn) as conn:
+                try:
+                    conn.execute(
+                        RunsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [
+                            self._get_run_insert_values(pipeline_run)
+                            for pipeline_run in pipeline_runs
+                        ],
+                    )
+                except db.exc.IntegrityError as exc:
+                    raise DagsterRunAlreadyExists from exc
+
+                if tags_to_insert:
+                    conn.execute(
+                        RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        tags_to_insert,
+                    )
+
+        return pipeline_runs
+
+    @contextmanager
+    def _write_transaction(self, conn):
+        """Wraps the writes made on `conn` in a single transaction. Storages whose engines
+        autocommit every statement override this to opt the connection out of autocommit.
+        """
+        with conn.begin():
+            yield conn
+
+    def _get_run_insert_values(self, pipeline_run: PipelineRun) -> Mapping[str, object]:
+        has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
+        partition = pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
+        partition_set = pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None
+
+        kwargs = {}
+        if self.has_run_priority_col():
+            kwargs["priority"] = parse_run_priority(
+                pipeline_run.tags.get(PRIORITY_TAG) if has_tags else None
+            )
+
+        return dict(
+            run_id=pipeline_run.run_id,
+            pipeline_name=pipeline_run.pipeline_name,
+            status=pipeline_run.status.value,
+            run_body=serialize_dagster_namedtuple(pipeline_run),
+            snapshot_id=pipeline_run.pipeline_snapshot_id,
+            partition=partition,
+            partition_set=partition_set,
+            **kwargs,
+        )
+
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
@@ -154,6 +292,53 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
             # TODO log?
             return
 
+        with self.connect() as conn:
+            conn.execute(
+                RunsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(RunsTable.c.run_id == run_id)
+                .values(**self._get_run_event_update_values(run, event))
+            )
+
+    def handle_run_events(self, run_events: Sequence[Tuple[str, DagsterEvent]]):
+        """Fetches the runs of the events with a single query, and applies their updates within one
+        transaction.
+        """
+        check.sequence_param(run_events, "run_events", of_type=tuple)
+
+        run_events = [
+            (run_id, event)
+            for run_id, event in run_events
+            if event.event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+        ]
+        if not run_events:
+            return
+
+        runs_by_id = {
+            run.run_id: run
+            for run in self.get_runs(
+                filters=RunsFilter(run_ids=list({run_id for run_id, _ in run_events}))
+            )
+        }
+        with self.connect() as run_conn:
+            with self._write_transaction(run_conn) as conn:
+                for run_id, event in run_events:
+                    run = runs_by_id.get(run_id)
+                    if not run:
+                        continue
+
+                    values = self._get_run_event_update_values(run, event)
+                    conn.execute(
+                        RunsTable.update()  # pylint: disable=no-value-for-parameter
+                        .where(RunsTable.c.run_id == run_id)
+                        .values(**values)
+                    )
+                    runs_by_id[run_id] = run.with_status(
+                        EVENT_TYPE_TO_PIPELINE_RUN_STATUS[event.event_type]
+                    )
+
+    def _get_run_event_update_values(
+        self, run: PipelineRun, event: DagsterEvent
+    ) -> Mapping[str, object]:
         new_pipeline_status = EVENT_TYPE_TO_PIPELINE_RUN_STATUS[event.event_type]
 
         run_stats_cols_in_index = self.has_run_stats_index_cols()
@@ -174,18 +359,12 @@ def handle_run_event(self, run_id: str, event: DagsterEvent):
         }:
             kwargs["end_time"] = now.timestamp()
 
-        with self.connect() as conn:
-
-            conn.execute(
-                RunsTable.update()  # pylint: disable=no-value-for-parameter
-                .where(RunsTable.c.run_id == run_id)
-                .values(
-                    run_body=serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
-                    status=new_pipeline_status.value,
-                    update_timestamp=now,
-                    **kwargs,
-                )
-            )
+        return dict(
+            run_body=serialize_dagster_namedtuple(run.with_status(new_pipeline_status)),
+            status=new_pipeline_status.value,
+            update_timestamp=now,
+            **kwargs,
+        )
 
     def _row_to_run(self, row) -> PipelineRun:
         run = deserialize_as(row["run_body"], PipelineRun)
@@ -421,7 +600,15 @@ def get_run_records(
         filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
         check.opt_int_param(limit, "limit")
 
-        columns = ["id", "run_body", "status", "create_timestamp", "update_timestamp"]
+        columns = [
+            "id",
+            "run_id",
+            "pipeline_name",
+            "run_body",
+            "status",
+            "create_timestamp",
+            "update_timestamp",
+        ]
 
         if self.has_run_stats_index_cols():
             columns += ["start_time", "end_time"]
@@ -437,10 +624,14 @@ def get_run_records(
         )
 
         rows = self.fetchall(query)
+        # the run body is only deserialized when the pipeline_run of a record is accessed
         return [
-            RunRecord(
+            RunRecord.from_run_body(
                 storage_id=check.int_param(row["id"], "id"),
-                pipeline_run=self._row_to_run(row),
+                run_id=row["run_id"],
+                pipeline_name=row["pipeline_name"],
+                status=DagsterRunStatus(row["status"]),
+                run_body=row["run_body"],
                 create_timestamp=check.inst(row["create_timestamp"], datetime),
                 update_timestamp=check.inst(row["update_timestamp"], datetime),
                 start_time=check.opt_inst(row["start_time"], float)
@@ -461,6 +652,81 @@ def get_run_tags(self) -> Sequence[Tuple[str, Set[str]]]:
             result[r[0]].add(r[1])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+
+        if not tag_keys:
+            return {}
+
+        runs_query = self._add_filters_to_query(
+            db.select([RunsTable.c.run_id]).select_from(RunsTable), filters
+        )
+        query = (
+            db.select([RunTagsTable.c.key, RunTagsTable.c.value, db.func.count()])
+            .where(
+                db.and_(
+                    RunTagsTable.c.key.in_(tag_keys),
+                    RunTagsTable.c.run_id.in_(runs_query),
+                )
+            )
+            .group_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
+        rows = self.fetchall(query)
+        return {(key, value): count for key, value, count in rows}
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[PipelineRun]:
+        check.opt_str_param(cursor, "cursor")
+        check.opt_int_param(limit, "limit")
+
+        if self.has_built_index(RUN_PRIORITY):
+            runs_table = RunsTable
+            priority = RunsTable.c.priority
+        else:
+            # until the priority column is populated, parse the priority of each run from its tag
+            priority_tags = RunTagsTable.alias("priority_tags")
+            runs_table = RunsTable.outerjoin(
+                priority_tags,
+                db.and_(
+                    RunsTable.c.run_id == priority_tags.c.run_id,
+                    priority_tags.c.key == PRIORITY_TAG,
+                ),
+            )
+            priority = run_priority_from_tag(priority_tags.c.value)
+
+        # dequeued by priority, then in fifo order
+        query = (
+            db.select([RunsTable.c.run_body, RunsTable.c.status])
+            .select_from(runs_table)
+            .where(RunsTable.c.status == DagsterRunStatus.QUEUED.value)
+        )
+
+        if cursor:
+            # the cursor run may have been dequeued since the previous page was fetched
+            cursor_row = self.fetchone(
+                db.select([priority, RunsTable.c.id])
+                .select_from(runs_table)
+                .where(RunsTable.c.run_id == cursor)
+            )
+            if cursor_row:
+                cursor_priority, cursor_id = cursor_row
+                query = query.where(
+                    db.or_(
+                        priority < cursor_priority,
+                        db.and_(priority == cursor_priority, RunsTable.c.id > cursor_id),
+                    )
+                )
+
+        query = query.order_by(db.desc(priority), db.asc(RunsTable.c.id))
+        if limit:
+            query = query.limit(limit)
+
+        return self._rows_to_runs(self.fetchall(query))
+
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
         check.str_param(run_id, "run_id")
         check.mapping_param(new_tags, "new_tags", key_type=str, value_type=str)
@@ -476,6 +742,10 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
         partition = all_tags.get(PARTITION_NAME_TAG)
         partition_set = all_tags.get(PARTITION_SET_TAG)
 
+        kwargs = {}
+        if PRIORITY_TAG in new_tags and self.has_run_priority_col():
+            kwargs["priority"] = parse_run_priority(new_tags[PRIORITY_TAG])
+
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()  # pylint: disable=no-value-for-parameter
@@ -487,6 +757,7 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
                     partition=partition,
                     partition_set=partition_set,
                     update_timestamp=pendulum.now("UTC"),
+                    **kwargs,
                 )
             )
 
@@ -755,6 +1026,11 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)
 
+    @property
+    def _binary_snapshot_encoding(self) -> bool:
+        # set in the `snapshots` instance settings, storages used without an instance write json
+        return bool(self._instance and self._instance.binary_snapshot_encoding_enabled)
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
@@ -765,12 +1041,17 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
                     snapshot_id=snapshot_id,
                     snapshot_body=zlib.compress(
-                        serialize_dagster_namedtuple(snapshot_obj).encode("utf-8")
+                        _serialize_snapshot(snapshot_obj, self._binary_snapshot_encoding)
                     ),
                     snapshot_type=snapshot_type.value,
                 )
             )
-            conn.execute(snapshot_insert)
+            try:
+                conn.execute(snapshot_insert)
+            except db.exc.IntegrityError:
+                # snapshot ids are hashes of their contents, so the snapshot was already added,
+                # e.g. by a run for the same pipeline that was created concurrently
+                pass
             return snapshot_id
 
     def get_run_storage_id(self) -> str:
@@ -928,6 +1209,11 @@ def has_run_stats_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
             return "start_time" in column_names and "end_time" in column_names
 
+    def has_run_priority_col(self):
+        with self.connect() as conn:
+            column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
+            return "priority" in column_names
+
     def has_bulk_actions_selector_cols(self):
         with self.connect() as conn:
             column_names = [
@@ -1095,6 +1381,15 @@ def replace_job_origin(self, run: PipelineRun, job_origin: ExternalPipelineOrigi
 GET_PIPELINE_SNAPSHOT_QUERY_ID = "get-pipeline-snapshot"
 
 
+def _serialize_snapshot(snapshot_obj, binary_encoding: bool) -> bytes:
+    # Snapshots are stored as json unless the binary encoding is opted into. Every process reading
+    # from the storage needs to be on a version of dagster that can read the binary encoding before
+    # it is turned on.
+    if binary_encoding:
+        return serialize_value_to_bytes(snapshot_obj)
+    return serialize_dagster_namedtuple(snapshot_obj).encode("utf-8")
+
+
 def defensively_unpack_pipeline_snapshot_query(logger, row):
     # no checking here because sqlalchemy returns a special
     # row proxy and don't want to instance check on an internal
@@ -1113,6 +1408,14 @@ def _warn(msg):
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
 
+    # snapshots written by older versions of dagster are json, newer ones use the binary encoding
+    if is_binary_serialized(uncompressed_bytes):
+        try:
+            return deserialize_value_from_bytes(uncompressed_bytes)
+        except (ValueError, DeserializationError):
+            _warn("Could not parse binary encoded snapshot in snapshot table.")
+            return None
+
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
@@ -52,6 +52,7 @@ def __init__(self, conn_string, inst_data=None):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._run_priority_col_cache = None
         super().__init__()
 
     @property
@@ -108,11 +109,18 @@ def _alembic_upgrade(self, rev="head"):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn, rev=rev)
+        self._run_priority_col_cache = None
 
     def _alembic_downgrade(self, rev="head"):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_downgrade(alembic_config, conn, rev=rev)
+        self._run_priority_col_cache = None
+
+    def has_run_priority_col(self):
+        if self._run_priority_col_cache is None:
+            self._run_priority_col_cache = super().has_run_priority_col()
+        return self._run_priority_col_cache
 
     @property
     def supports_bucket_queries(self):
@@ -1,5 +1,5 @@
 import abc
-from typing import Callable, Iterable, Mapping, Optional, Sequence
+from typing import AbstractSet, Callable, Iterable, Mapping, Optional, Sequence
 
 from dagster._core.definitions.run_request import InstigatorType
 from dagster._core.instance import MayHaveInstanceWeakref
@@ -33,6 +33,20 @@ def all_instigator_state(
             instigator_type (Optional[InstigatorType]): The InstigatorType to scope results to
         """
 
+    def get_running_instigator_selector_ids(
+        self, instigator_type: Optional[InstigatorType] = None
+    ) -> AbstractSet[str]:
+        """Return the selector ids of the running InstigationStates present in storage
+
+        Args:
+            instigator_type (Optional[InstigatorType]): The InstigatorType to scope results to
+        """
+        return {
+            state.selector_id
+            for state in self.all_instigator_state(instigator_type=instigator_type)
+            if state.is_running
+        }
+
     @abc.abstractmethod
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[InstigatorState]:
         """Return the instigator state for the given id
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from collections import defaultdict
 from datetime import datetime
-from typing import Callable, Iterable, Mapping, Optional, Sequence, cast
+from typing import AbstractSet, Callable, Iterable, Mapping, Optional, Sequence, cast
 
 import pendulum
 import sqlalchemy as db
@@ -11,6 +11,7 @@
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.scheduler.instigation import (
     InstigatorState,
+    InstigatorStatus,
     InstigatorTick,
     TickData,
     TickStatus,
@@ -69,6 +70,25 @@ def all_instigator_state(
         rows = self.execute(query)
         return self._deserialize_rows(rows)
 
+    def get_running_instigator_selector_ids(
+        self, instigator_type: Optional[InstigatorType] = None
+    ) -> AbstractSet[str]:
+        check.opt_inst_param(instigator_type, "instigator_type", InstigatorType)
+
+        if not (self.has_instigators_table() and self.has_built_index(SCHEDULE_JOBS_SELECTOR_ID)):
+            return super().get_running_instigator_selector_ids(instigator_type)
+
+        # only reads the selector ids, without deserializing the stored states
+        query = (
+            db.select([InstigatorsTable.c.selector_id])
+            .select_from(InstigatorsTable)
+            .where(InstigatorsTable.c.status != InstigatorStatus.STOPPED.value)
+        )
+        if instigator_type:
+            query = query.where(InstigatorsTable.c.instigator_type == instigator_type.value)
+
+        return {row[0] for row in self.execute(query)}
+
     def get_instigator_state(self, origin_id, selector_id):
         check.str_param(origin_id, "origin_id")
         check.str_param(selector_id, "selector_id")
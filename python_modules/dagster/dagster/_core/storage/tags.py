@@ -1,3 +1,4 @@
+import re
 from enum import Enum
 
 import dagster._check as check
@@ -51,13 +52,22 @@
 
 PRIORITY_TAG = "{prefix}priority".format(prefix=SYSTEM_TAG_PREFIX)
 
+FUSIBLE_TAG = "{prefix}fusible".format(prefix=SYSTEM_TAG_PREFIX)
+
 DOCKER_IMAGE_TAG = "{prefix}image".format(prefix=SYSTEM_TAG_PREFIX)
 
 MAX_RETRIES_TAG = "{prefix}max_retries".format(prefix=SYSTEM_TAG_PREFIX)
 RETRY_NUMBER_TAG = "{prefix}retry_number".format(prefix=SYSTEM_TAG_PREFIX)
 RETRY_STRATEGY_TAG = "{prefix}retry_strategy".format(prefix=SYSTEM_TAG_PREFIX)
 
-USER_EDITABLE_SYSTEM_TAGS = [PRIORITY_TAG, MAX_RETRIES_TAG, RETRY_STRATEGY_TAG]
+STEP_PRIORITIZATION_TAG = "{prefix}step_prioritization".format(prefix=SYSTEM_TAG_PREFIX)
+
+USER_EDITABLE_SYSTEM_TAGS = [
+    PRIORITY_TAG,
+    MAX_RETRIES_TAG,
+    RETRY_STRATEGY_TAG,
+    STEP_PRIORITIZATION_TAG,
+]
 
 
 class TagType(Enum):
@@ -90,3 +100,25 @@ def check_reserved_tags(tags):
                 not tag.startswith(SYSTEM_TAG_PREFIX),
                 desc="Attempted to set tag with reserved system prefix: {tag}".format(tag=tag),
             )
+
+
+# the priority tag values that parse as a priority: a base-10 integer with an optional sign and
+# surrounding whitespace. Run storages that order runs by their priority tag in SQL match tag values
+# against the same format.
+_RUN_PRIORITY_RE = re.compile(r"\s*[-+]?[0-9]+\s*", re.ASCII)
+
+# priorities are stored in a 32-bit integer column, so priority tag values outside its range are
+# clamped to it
+MIN_RUN_PRIORITY = -(2**31)
+MAX_RUN_PRIORITY = 2**31 - 1
+
+
+def parse_run_priority(priority_tag_value):
+    """Returns the dequeue priority of a run given the value of its priority tag. Runs without a
+    priority tag, or with a value that is not an integer, have priority 0. Priorities outside of
+    [MIN_RUN_PRIORITY, MAX_RUN_PRIORITY] are clamped to that range."""
+    check.opt_str_param(priority_tag_value, "priority_tag_value")
+
+    if not priority_tag_value or not _RUN_PRIORITY_RE.fullmatch(priority_tag_value):
+        return 0
+    return min(max(int(priority_tag_value), MIN_RUN_PRIORITY), MAX_RUN_PRIORITY)
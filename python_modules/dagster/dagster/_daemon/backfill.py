@@ -2,7 +2,10 @@
 import os
 import sys
 import time
-from typing import Iterable, Optional, Sequence, Tuple, cast
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Deque, Dict, Iterable, Optional, Sequence, Tuple, cast
 
 from dagster._core.errors import DagsterBackfillFailedError
 from dagster._core.execution.backfill import (
@@ -12,13 +15,13 @@
 )
 from dagster._core.host_representation.repository_location import RepositoryLocation
 from dagster._core.instance import DagsterInstance
-from dagster._core.storage.pipeline_run import PipelineRun, RunsFilter
+from dagster._core.storage.pipeline_run import DagsterRunStatus, PipelineRun, RunsFilter
 from dagster._core.storage.tags import PARTITION_NAME_TAG
-from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
-# out of abundance of caution, sleep at checkpoints in case we are pinning CPU by submitting lots
-# of jobs all at once
+# out of abundance of caution, sleep between rounds of chunks in case we are pinning CPU by
+# submitting lots of jobs all at once
 CHECKPOINT_INTERVAL = 1
 CHECKPOINT_COUNT = 25
 
@@ -36,11 +39,40 @@ def _check_for_debug_crash(debug_crash_flags, key):
     raise Exception("Process didn't terminate after sending crash signal")
 
 
+class _BackfillRateLimiter:
+    """Tracks the runs that a backfill submitted in the last minute, to limit the rate at which
+    each backfill adds runs to the run queue.
+    """
+
+    def __init__(self, max_runs_per_minute: Optional[int]):
+        self._max_runs_per_minute = max_runs_per_minute
+        self._submit_times: Deque[float] = deque()
+
+    def get_num_runs_allowed(self, now: float) -> Optional[int]:
+        """The number of runs the backfill may submit now, or None if it is not rate limited."""
+        if self._max_runs_per_minute is None:
+            return None
+
+        while self._submit_times and self._submit_times[0] <= now - 60:
+            self._submit_times.popleft()
+        return max(0, self._max_runs_per_minute - len(self._submit_times))
+
+    def record_run(self, now: float) -> None:
+        if self._max_runs_per_minute is not None:
+            self._submit_times.append(now)
+
+
 def execute_backfill_iteration(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
     debug_crash_flags=None,
 ) -> Iterable[Optional[SerializableErrorInfo]]:
+    """Submits the runs of every requested backfill.
+
+    Backfills are interleaved round-robin: each round submits at most one chunk of partitions per
+    backfill, so that a large backfill does not hold up the backfills requested after it. Backfills
+    requested while the daemon is submitting runs join the next round.
+    """
     instance = workspace_process_context.instance
     backfill_jobs = instance.get_backfills(status=BulkActionStatus.REQUESTED)
 
@@ -49,75 +81,127 @@ def execute_backfill_iteration(
         yield None
         return
 
+    settings = instance.get_settings("backfills")
     workspace = workspace_process_context.create_request_context()
+    rate_limiters: Dict[str, _BackfillRateLimiter] = {}
 
-    for backfill_job in backfill_jobs:
-        backfill_id = backfill_job.backfill_id
+    with ExitStack() as stack:
+        if settings.get("use_threads"):
+            threadpool_executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=settings.get("num_workers"),
+                    thread_name_prefix="backfill_daemon_worker",
+                )
+            )
+        else:
+            threadpool_executor = None
 
-        # refetch, in case the backfill was updated in the meantime
-        backfill_job = cast(PartitionBackfill, instance.get_backfill(backfill_id))
+        while backfill_jobs:
+            for backfill_job in backfill_jobs:
+                backfill_id = backfill_job.backfill_id
 
-        if not backfill_job.last_submitted_partition_name:
-            logger.info(f"Starting backfill for {backfill_id}")
-        else:
-            logger.info(
-                f"Resuming backfill for {backfill_id} from {backfill_job.last_submitted_partition_name}"
-            )
+                # refetch, in case the backfill was updated while submitting the previous chunks
+                backfill_job = cast(PartitionBackfill, instance.get_backfill(backfill_id))
+                if backfill_job.status != BulkActionStatus.REQUESTED:
+                    continue
 
-        origin = (
-            backfill_job.partition_set_origin.external_repository_origin.repository_location_origin
-        )
+                if backfill_id not in rate_limiters:
+                    if not backfill_job.get_num_submitted_partitions():
+                        logger.info(f"Starting backfill for {backfill_id}")
+                    else:
+                        logger.info(
+                            f"Resuming backfill for {backfill_id} from {backfill_job.last_submitted_partition_name}"
+                        )
+                    rate_limiters[backfill_id] = _BackfillRateLimiter(
+                        settings.get("max_runs_per_minute")
+                    )
 
-        try:
-            repo_location = workspace.get_repository_location(origin.location_name)
+                yield from _execute_backfill_chunk(
+                    instance,
+                    workspace,
+                    logger,
+                    backfill_job,
+                    rate_limiters[backfill_id],
+                    threadpool_executor,
+                    debug_crash_flags,
+                )
 
-            _check_repo_has_partition_set(repo_location, backfill_job)
+            backfill_jobs = instance.get_backfills(status=BulkActionStatus.REQUESTED)
+            if backfill_jobs:
+                yield None
+                time.sleep(CHECKPOINT_INTERVAL)
 
-            has_more = True
-            while has_more:
-                if backfill_job.status != BulkActionStatus.REQUESTED:
-                    break
 
-                chunk, checkpoint, has_more = _get_partitions_chunk(
-                    instance, logger, backfill_job, CHECKPOINT_COUNT
-                )
-                _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
-
-                if chunk:
-                    for _run_id in submit_backfill_runs(
-                        instance, workspace, repo_location, backfill_job, chunk
-                    ):
-                        yield None
-                        # before submitting, refetch the backfill job to check for status changes
-                        backfill_job = cast(
-                            PartitionBackfill, instance.get_backfill(backfill_job.backfill_id)
-                        )
-                        if backfill_job.status != BulkActionStatus.REQUESTED:
-                            return
+def _execute_backfill_chunk(
+    instance: DagsterInstance,
+    workspace: BaseWorkspaceRequestContext,
+    logger: logging.Logger,
+    backfill_job: PartitionBackfill,
+    rate_limiter: _BackfillRateLimiter,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    debug_crash_flags,
+) -> Iterable[Optional[SerializableErrorInfo]]:
+    backfill_id = backfill_job.backfill_id
+    origin = backfill_job.partition_set_origin.external_repository_origin.repository_location_origin
 
-                _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
+    try:
+        repo_location = workspace.get_repository_location(origin.location_name)
 
-                if has_more:
-                    # refetch, in case the backfill was updated in the meantime
-                    backfill_job = cast(
-                        PartitionBackfill, instance.get_backfill(backfill_job.backfill_id)
-                    )
-                    instance.update_backfill(backfill_job.with_partition_checkpoint(checkpoint))
-                    yield None
-                    time.sleep(CHECKPOINT_INTERVAL)
-                else:
-                    logger.info(
-                        f"Backfill completed for {backfill_id} for {len(backfill_job.partition_names)} partitions"
-                    )
-                    instance.update_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
-                    yield None
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        _check_repo_has_partition_set(repo_location, backfill_job)
+
+        chunk_size = CHECKPOINT_COUNT
+        num_runs_allowed = rate_limiter.get_num_runs_allowed(time.time())
+        if num_runs_allowed is not None:
+            if not num_runs_allowed:
+                logger.debug(f"Backfill {backfill_id} is rate limited, skipping this round")
+                return
+            chunk_size = min(chunk_size, num_runs_allowed)
+
+        chunk, unsubmitted_run_ids, num_submitted, has_more = _get_partitions_chunk(
+            instance, logger, backfill_job, chunk_size
+        )
+        _check_for_debug_crash(debug_crash_flags, "BEFORE_SUBMIT")
+
+        if unsubmitted_run_ids:
+            for _run in instance.submit_runs_bulk(unsubmitted_run_ids, workspace):
+                rate_limiter.record_run(time.time())
+            yield None
+
+        if chunk:
+            for run_id in submit_backfill_runs(
+                instance, workspace, repo_location, backfill_job, chunk, threadpool_executor
+            ):
+                if run_id:
+                    rate_limiter.record_run(time.time())
+                yield None
+
+        _check_for_debug_crash(debug_crash_flags, "AFTER_SUBMIT")
+
+        # refetch, in case the backfill was updated (e.g. canceled) while the chunk was submitted
+        backfill_job = cast(PartitionBackfill, instance.get_backfill(backfill_id))
+        if backfill_job.status != BulkActionStatus.REQUESTED:
+            return
+
+        if has_more:
             instance.update_backfill(
-                backfill_job.with_status(BulkActionStatus.FAILED).with_error(error_info)
+                backfill_job.with_partition_checkpoint(
+                    backfill_job.partition_names[num_submitted - 1], num_submitted
+                )
+            )
+            yield None
+        else:
+            logger.info(
+                f"Backfill completed for {backfill_id} for {len(backfill_job.partition_names)} partitions"
             )
-            logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
-            yield error_info
+            instance.update_backfill(backfill_job.with_status(BulkActionStatus.COMPLETED))
+            yield None
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        instance.update_backfill(
+            backfill_job.with_status(BulkActionStatus.FAILED).with_error(error_info)
+        )
+        logger.error(f"Backfill failed for {backfill_id}: {error_info.to_string()}")
+        yield error_info
 
 
 def _check_repo_has_partition_set(
@@ -143,38 +227,51 @@ def _get_partitions_chunk(
     logger: logging.Logger,
     backfill_job: PartitionBackfill,
     chunk_size: int,
-) -> Tuple[Sequence[str], str, bool]:
+) -> Tuple[Sequence[str], Sequence[str], int, bool]:
+    """Returns the partitions of the next chunk of the backfill that have no run yet, the ids of
+    the runs of the chunk that were created but never submitted, the number of partitions that
+    will have been submitted once the chunk is, and whether there are partitions after the chunk.
+    """
     partition_names = backfill_job.partition_names
-    checkpoint = backfill_job.last_submitted_partition_name
-
-    if (
-        backfill_job.last_submitted_partition_name
-        and backfill_job.last_submitted_partition_name in partition_names
-    ):
-        index = partition_names.index(backfill_job.last_submitted_partition_name)
-        partition_names = partition_names[index + 1 :]
-
-    # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        RunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_job.backfill_id))
-    )
-    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
-    initial_checkpoint = (
-        partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
+    num_submitted = backfill_job.get_num_submitted_partitions()
+    partitions_chunk = partition_names[num_submitted : num_submitted + chunk_size]
+    next_num_submitted = num_submitted + len(partitions_chunk)
+    has_more = next_num_submitted < len(partition_names)
+
+    if not partitions_chunk:
+        return [], [], next_num_submitted, has_more
+
+    # for idempotence, fetch the partitions in the chunk that already have a run for the backfill
+    chunk_tags = {
+        **PipelineRun.tags_for_backfill_id(backfill_job.backfill_id),
+        PARTITION_NAME_TAG: list(partitions_chunk),
+    }
+    partition_counts = instance.get_run_tag_counts(
+        [PARTITION_NAME_TAG], RunsFilter(tags=chunk_tags)
     )
-    partition_names = partition_names[initial_checkpoint:]
-    has_more = chunk_size < len(partition_names)
-    partitions_chunk = partition_names[:chunk_size]
-    next_checkpoint = partitions_chunk[-1]
+    completed_partitions = {partition_name for _, partition_name in partition_counts}
 
-    to_skip = set(partitions_chunk).intersection(completed_partitions)
-    if to_skip:
+    unsubmitted_run_ids: Sequence[str] = []
+    if completed_partitions:
         logger.info(
-            f"Found {len(to_skip)} existing runs for backfill {backfill_job.backfill_id}, skipping"
+            f"Found {len(completed_partitions)} existing runs for backfill {backfill_job.backfill_id}, skipping"
         )
+        # if the daemon crashed between creating a run and submitting it, submit it now
+        unsubmitted_run_ids = [
+            run.run_id
+            for run in instance.get_runs(
+                RunsFilter(tags=chunk_tags, statuses=[DagsterRunStatus.NOT_STARTED])
+            )
+        ]
+        if unsubmitted_run_ids:
+            logger.info(
+                f"Submitting {len(unsubmitted_run_ids)} existing runs for backfill "
+                f"{backfill_job.backfill_id} that were created but not submitted"
+            )
+
     to_submit = [
         partition_name
         for partition_name in partitions_chunk
         if partition_name not in completed_partitions
     ]
-    return to_submit, next_checkpoint, has_more
+    return to_submit, unsubmitted_run_ids, next_num_submitted, has_more
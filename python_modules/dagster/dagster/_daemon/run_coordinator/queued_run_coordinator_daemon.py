@@ -1,6 +1,5 @@
 import sys
-from collections import defaultdict
-from typing import Dict, Tuple
+from typing import Iterator, Mapping, Tuple
 
 from dagster import DagsterEvent, DagsterEventType
 from dagster import _check as check
@@ -12,82 +11,13 @@
     PipelineRunStatus,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.daemon import IntervalDaemon
 from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.tags import TagConcurrencyLimitsCounter
 
-
-class _TagConcurrencyLimitsCounter:
-    """
-    Helper object that keeps track of when the tag concurrency limits are met
-    """
-
-    def __init__(self, tag_concurrency_limits, in_progress_runs):
-        check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
-        check.list_param(in_progress_runs, "in_progress_runs", of_type=PipelineRun)
-
-        self._key_limits: Dict[str, int] = {}
-        self._key_value_limits: Dict[Tuple[str, str], int] = {}
-        self._unique_value_limits: Dict[str, int] = {}
-
-        for tag_limit in tag_concurrency_limits:
-            key = tag_limit["key"]
-            value = tag_limit.get("value")
-            limit = tag_limit["limit"]
-
-            if isinstance(value, str):
-                self._key_value_limits[(key, value)] = limit
-            elif not value or not value["applyLimitPerUniqueValue"]:
-                self._key_limits[key] = limit
-            else:
-                self._unique_value_limits[key] = limit
-
-        self._key_counts: Dict[str, int] = defaultdict(lambda: 0)
-        self._key_value_counts: Dict[Tuple[str, str], int] = defaultdict(lambda: 0)
-        self._unique_value_counts: Dict[Tuple[str, str], int] = defaultdict(lambda: 0)
-
-        # initialize counters based on current in progress runs
-        for run in in_progress_runs:
-            self.update_counters_with_launched_run(run)
-
-    def is_run_blocked(self, run):
-        """
-        True if there are in progress runs which are blocking this run based on tag limits
-        """
-        for key, value in run.tags.items():
-            if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
-                return True
-
-            tag_tuple = (key, value)
-            if (
-                tag_tuple in self._key_value_limits
-                and self._key_value_counts[tag_tuple] >= self._key_value_limits[tag_tuple]
-            ):
-                return True
-
-            if (
-                key in self._unique_value_limits
-                and self._unique_value_counts[tag_tuple] >= self._unique_value_limits[key]
-            ):
-                return True
-
-        return False
-
-    def update_counters_with_launched_run(self, run):
-        """
-        Add a new in progress run to the counters
-        """
-        for key, value in run.tags.items():
-            if key in self._key_limits:
-                self._key_counts[key] += 1
-
-            tag_tuple = (key, value)
-            if tag_tuple in self._key_value_limits:
-                self._key_value_counts[tag_tuple] += 1
-
-            if key in self._unique_value_limits:
-                self._unique_value_counts[tag_tuple] += 1
+# Maximum number of queued runs loaded from the run storage at a time
+MAX_QUEUED_RUNS_PAGE_SIZE = 100
 
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
@@ -96,6 +26,12 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     store and launches them.
     """
 
+    def __init__(self, interval_seconds, max_queued_runs_page_size=MAX_QUEUED_RUNS_PAGE_SIZE):
+        self._max_queued_runs_page_size = check.int_param(
+            max_queued_runs_page_size, "max_queued_runs_page_size"
+        )
+        super().__init__(interval_seconds)
+
     @classmethod
     def daemon_type(cls):
         return "QUEUED_RUN_COORDINATOR"
@@ -113,42 +49,43 @@ def run_iteration(
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
-
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         if max_concurrent_runs_enabled:
-            max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+            num_in_progress_runs = instance.get_runs_count(
+                filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+            )
+            max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
 
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len(in_progress_runs), max_concurrent_runs
+                        num_in_progress_runs, max_concurrent_runs
                     )
                 )
                 return
 
-        queued_runs = self._get_queued_runs(instance)
-
-        if not queued_runs:
-            self._logger.debug("Poll returned no queued runs.")
-        else:
-            self._logger.info("Retrieved %d queued runs, checking limits.", len(queued_runs))
-
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
-
         # launch until blocked by limit rules
+        num_checked_runs = 0
         num_dequeued_runs = 0
-        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            tag_concurrency_limits,
+            self._get_in_progress_tag_counts(instance, tag_concurrency_limits),
         )
 
-        for run in sorted_runs:
-            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
-                break
-
-            if tag_concurrency_limits_counter.is_run_blocked(run):
+        # queued runs are fetched in pages in the order they should be dequeued, so that runs that
+        # won't be launched in this iteration are not loaded
+        for run in self._iterate_queued_runs(
+            instance,
+            page_size=(
+                min(max_runs_to_launch, self._max_queued_runs_page_size)
+                if max_concurrent_runs_enabled
+                else self._max_queued_runs_page_size
+            ),
+        ):
+            num_checked_runs += 1
+
+            if tag_concurrency_limits_counter.is_blocked(run):
                 continue
 
             error_info = None
@@ -171,36 +108,49 @@ def run_iteration(
                 error_info = error_info._replace(message=f"{message}: {error_info.message}")
 
             else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
+                tag_concurrency_limits_counter.update_counters_with_launched_item(run)
                 num_dequeued_runs += 1
 
             yield error_info
 
-        if num_dequeued_runs > 0:
-            self._logger.info("Launched %d runs.", num_dequeued_runs)
+            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
+                break
+
+        if not num_checked_runs:
+            self._logger.debug("Poll returned no queued runs.")
+        elif num_dequeued_runs > 0:
+            self._logger.info(
+                "Checked limits for %d queued runs, launched %d runs.",
+                num_checked_runs,
+                num_dequeued_runs,
+            )
 
-    def _get_queued_runs(self, instance):
-        queued_runs_filter = RunsFilter(statuses=[PipelineRunStatus.QUEUED])
+    def _iterate_queued_runs(
+        self, instance: DagsterInstance, page_size: int
+    ) -> Iterator[PipelineRun]:
+        cursor = None
+        while True:
+            runs = instance.get_queued_runs(cursor=cursor, limit=page_size)
+            yield from runs
 
-        # Reversed for fifo ordering
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+            if len(runs) < page_size:
+                return
 
-    def _get_in_progress_runs(self, instance):
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+            cursor = runs[-1].run_id
+            # runs blocked by tag concurrency limits are skipped over, so fetch larger pages as
+            # the queue is traversed to bound the number of queries
+            page_size = min(page_size * 2, self._max_queued_runs_page_size)
 
-    def _priority_sort(self, runs):
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+    def _get_in_progress_tag_counts(
+        self, instance: DagsterInstance, tag_concurrency_limits
+    ) -> Mapping[Tuple[str, str], int]:
+        if not tag_concurrency_limits:
+            return {}
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return instance.get_run_tag_counts(
+            tag_keys=list({tag_limit["key"] for tag_limit in tag_concurrency_limits}),
+            filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES),
+        )
 
     def _dequeue_run(
         self,
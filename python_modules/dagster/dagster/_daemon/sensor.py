@@ -1,4 +1,5 @@
 import datetime
+import heapq
 import logging
 import os
 import sys
@@ -7,7 +8,20 @@
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Dict, Generator, List, Mapping, NamedTuple, Optional, Sequence, Union
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pendulum
 
@@ -16,10 +30,13 @@
 from dagster._core.definitions.run_request import InstigatorType, RunRequest
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorExecutionData
 from dagster._core.definitions.utils import validate_tags
-from dagster._core.errors import DagsterError
+from dagster._core.errors import DagsterError, DagsterUserCodeProcessError
 from dagster._core.host_representation import PipelineSelector
 from dagster._core.host_representation.external import ExternalPipeline, ExternalSensor
-from dagster._core.host_representation.external_data import ExternalTargetData
+from dagster._core.host_representation.external_data import (
+    ExternalSensorExecutionErrorData,
+    ExternalTargetData,
+)
 from dagster._core.host_representation.repository_location import RepositoryLocation
 from dagster._core.instance import DagsterInstance
 from dagster._core.scheduler.instigation import (
@@ -34,11 +51,18 @@
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.workspace import WorkspaceLocationEntry
+from dagster._grpc.client import is_unimplemented_rpc_error
+from dagster._grpc.types import SensorEvaluationArgs
 from dagster._utils import merge_dicts
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 MIN_INTERVAL_LOOP_TIME = 5
 
+# how often the sensor daemon rebuilds its queue of sensors from the stored sensor states, even if
+# neither the workspace nor the set of running sensors changed since
+SENSOR_STATE_REFRESH_INTERVAL = 30
+
 FINISHED_TICK_STATES = [TickStatus.SKIPPED, TickStatus.SUCCESS, TickStatus.FAILURE]
 
 TDaemonGenerator = Generator[Union[None, SerializableErrorInfo], None, None]
@@ -206,6 +230,89 @@ def _check_for_debug_crash(debug_crash_flags, key):
 VERBOSE_LOGS_INTERVAL = 60
 
 
+class SensorTickQueue:
+    """Keeps the running sensors of the workspace in a min-heap, keyed by the time at which each
+    sensor is next eligible to be evaluated, so that each iteration of the sensor daemon only visits
+    the sensors that are due.
+
+    The heap is rebuilt from the workspace and the stored sensor states whenever a code location
+    is reloaded or a sensor is started or stopped, and otherwise every ``refresh_interval`` seconds.
+    """
+
+    def __init__(self, refresh_interval: float = SENSOR_STATE_REFRESH_INTERVAL):
+        self._refresh_interval = check.numeric_param(refresh_interval, "refresh_interval")
+        self._heap: List[Tuple[float, str]] = []
+        self._sensors: Dict[str, ExternalSensor] = {}
+        # the time each sensor is scheduled for, used to ignore heap entries that were superseded
+        self._next_tick_timestamps: Dict[str, float] = {}
+        self._workspace_key: Optional[FrozenSet[Tuple[str, float]]] = None
+        self._running_selector_ids: Optional[AbstractSet[str]] = None
+        self._last_refresh_timestamp: Optional[float] = None
+
+    @property
+    def sensors(self) -> Mapping[str, ExternalSensor]:
+        return self._sensors
+
+    def needs_refresh(
+        self,
+        workspace_key: FrozenSet[Tuple[str, float]],
+        running_selector_ids: AbstractSet[str],
+        now: float,
+    ) -> bool:
+        return (
+            self._last_refresh_timestamp is None
+            or workspace_key != self._workspace_key
+            or running_selector_ids != self._running_selector_ids
+            or now - self._last_refresh_timestamp >= self._refresh_interval
+        )
+
+    def refresh(
+        self,
+        workspace_key: FrozenSet[Tuple[str, float]],
+        running_selector_ids: AbstractSet[str],
+        sensors: Mapping[str, ExternalSensor],
+        sensor_states: Mapping[str, InstigatorState],
+        now: float,
+    ) -> None:
+        self._workspace_key = workspace_key
+        self._running_selector_ids = running_selector_ids
+        self._last_refresh_timestamp = now
+        self._sensors = dict(sensors)
+        self._next_tick_timestamps = {
+            selector_id: _get_next_tick_timestamp(
+                sensor_states.get(selector_id), external_sensor, now
+            )
+            for selector_id, external_sensor in self._sensors.items()
+        }
+        self._heap = [
+            (timestamp, selector_id)
+            for selector_id, timestamp in self._next_tick_timestamps.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def schedule(self, selector_id: str, timestamp: float) -> None:
+        if selector_id not in self._sensors:
+            return
+        self._next_tick_timestamps[selector_id] = timestamp
+        heapq.heappush(self._heap, (timestamp, selector_id))
+
+    def remove(self, selector_id: str) -> None:
+        self._sensors.pop(selector_id, None)
+        self._next_tick_timestamps.pop(selector_id, None)
+
+    def pop_due(self, now: float) -> Sequence[ExternalSensor]:
+        """Removes and returns the sensors that are due at the given time. Each of them needs to
+        be scheduled again to be returned by a later call."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            timestamp, selector_id = heapq.heappop(self._heap)
+            if self._next_tick_timestamps.get(selector_id) != timestamp:
+                continue
+            del self._next_tick_timestamps[selector_id]
+            due.append(self._sensors[selector_id])
+        return due
+
+
 def execute_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -220,6 +327,7 @@ def execute_sensor_iteration_loop(
 
     sensor_state_lock = threading.Lock()
     sensor_tick_futures: Dict[str, Future] = {}
+    sensor_tick_queue = SensorTickQueue()
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("sensors")
         if settings.get("use_threads"):
@@ -250,6 +358,7 @@ def execute_sensor_iteration_loop(
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
+                sensor_tick_queue=sensor_tick_queue,
             )
             end_time = pendulum.now("UTC").timestamp()
 
@@ -270,6 +379,7 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags=None,
+    sensor_tick_queue: Optional[SensorTickQueue] = None,
 ):
 
     instance = workspace_process_context.instance
@@ -277,20 +387,270 @@ def execute_sensor_iteration(
     if not sensor_state_lock:
         sensor_state_lock = threading.Lock()
 
+    if not sensor_tick_queue:
+        sensor_tick_queue = SensorTickQueue()
+
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
         for location_entry in workspace_process_context.create_request_context()
         .get_workspace_snapshot()
         .values()
     }
+    workspace_key = frozenset(
+        (location_name, location_entry.update_timestamp)
+        for location_name, location_entry in workspace_snapshot.items()
+    )
 
-    all_sensor_states = {
-        sensor_state.selector_id: sensor_state
-        for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
-    }
+    # cheaper to fetch than the sensor states, so that sensors started from dagit are picked up on
+    # the next iteration
+    running_selector_ids = instance.get_running_instigator_selector_ids(InstigatorType.SENSOR)
+
+    now = pendulum.now("UTC").timestamp()
+    # the verbose checks need every sensor state, so the queue is refreshed along with them
+    if log_verbose_checks or sensor_tick_queue.needs_refresh(
+        workspace_key, running_selector_ids, now
+    ):
+        all_sensor_states = {
+            sensor_state.selector_id: sensor_state
+            for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
+        }
+        sensor_tick_queue.refresh(
+            workspace_key,
+            running_selector_ids,
+            _get_running_sensors(workspace_snapshot, all_sensor_states, logger, log_verbose_checks),
+            all_sensor_states,
+            now,
+        )
+
+    if not sensor_tick_queue.sensors:
+        if log_verbose_checks:
+            logger.info("Not checking for any runs since no sensors have been started.")
+        yield
+        return
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
 
+    def _tick_sensor(
+        external_sensor: ExternalSensor,
+        sensor_state: InstigatorState,
+        sensor_runtime_data: Optional[
+            Union[SensorExecutionData, ExternalSensorExecutionErrorData]
+        ] = None,
+    ):
+        sensor_debug_crash_flags = (
+            debug_crash_flags.get(external_sensor.name) if debug_crash_flags else None
+        )
+        if threadpool_executor:
+            future = threadpool_executor.submit(
+                _process_tick,
+                workspace_process_context,
+                logger,
+                external_sensor,
+                sensor_state,
+                sensor_state_lock,
+                sensor_debug_crash_flags,
+                tick_retention_settings,
+                sensor_runtime_data,
+            )
+            check.not_none(sensor_tick_futures)[external_sensor.selector_id] = future
+            yield
+        else:
+            # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
+            # heartbeat
+            yield from _process_tick_generator(
+                workspace_process_context,
+                logger,
+                external_sensor,
+                sensor_state,
+                sensor_state_lock,
+                sensor_debug_crash_flags,
+                tick_retention_settings,
+                sensor_runtime_data,
+            )
+
+    # due sensors, grouped by the repository that they are evaluated in
+    sensors_by_repository: Dict[
+        Tuple[str, str], List[Tuple[ExternalSensor, InstigatorState]]
+    ] = defaultdict(list)
+
+    for external_sensor in sensor_tick_queue.pop_due(now):
+        selector_id = external_sensor.selector_id
+        sensor_state = instance.get_instigator_state(
+            external_sensor.get_external_origin_id(), selector_id
+        )
+        if not external_sensor.get_current_instigator_state(sensor_state).is_running:
+            # the sensor was stopped since the queue was last refreshed
+            sensor_tick_queue.remove(selector_id)
+            continue
+
+        if not sensor_state:
+            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
+            sensor_state = InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.AUTOMATICALLY_RUNNING,
+                SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
+            )
+            instance.add_instigator_state(sensor_state)
+        elif _is_under_min_interval(sensor_state, external_sensor):
+            sensor_tick_queue.schedule(
+                selector_id, _get_next_tick_timestamp(sensor_state, external_sensor, now)
+            )
+            continue
+
+        if threadpool_executor:
+            if sensor_tick_futures is None:
+                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+
+            # only allow one tick per sensor to be in flight
+            if selector_id in sensor_tick_futures and not sensor_tick_futures[selector_id].done():
+                sensor_tick_queue.schedule(selector_id, now)
+                continue
+
+        sensor_tick_queue.schedule(selector_id, now + (external_sensor.min_interval_seconds or 0))
+        repository_handle = external_sensor.handle.repository_handle
+        sensors_by_repository[
+            (repository_handle.location_name, repository_handle.repository_name)
+        ].append((external_sensor, sensor_state))
+
+    for (location_name, repository_name), repository_sensors in sensors_by_repository.items():
+        if len(repository_sensors) == 1:
+            yield from _tick_sensor(*repository_sensors[0])
+            continue
+
+        if threadpool_executor:
+            # evaluate the sensors of the repository in a single call to its location, on the
+            # threadpool like every other evaluation, so that a slow sensor holds up neither the
+            # other repositories nor the daemon's heartbeat
+            future = threadpool_executor.submit(
+                _process_sensor_batch,
+                workspace_process_context,
+                logger,
+                location_name,
+                repository_name,
+                repository_sensors,
+                sensor_state_lock,
+                debug_crash_flags,
+                tick_retention_settings,
+            )
+            for external_sensor, _ in repository_sensors:
+                check.not_none(sensor_tick_futures)[external_sensor.selector_id] = future
+            yield
+        else:
+            # drain the stream before processing the ticks, so that it is not held open while runs
+            # are launched
+            evaluated_sensors = []
+            for evaluated_sensor in _evaluate_sensor_batch(
+                workspace_process_context,
+                logger,
+                location_name,
+                repository_name,
+                repository_sensors,
+            ):
+                evaluated_sensors.append(evaluated_sensor)
+                yield
+
+            for external_sensor, sensor_state, sensor_runtime_data in evaluated_sensors:
+                yield from _tick_sensor(external_sensor, sensor_state, sensor_runtime_data)
+
+
+def _evaluate_sensor_batch(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    location_name: str,
+    repository_name: str,
+    repository_sensors: Sequence[Tuple[ExternalSensor, InstigatorState]],
+) -> Iterator[
+    Tuple[
+        ExternalSensor,
+        InstigatorState,
+        Optional[Union[SensorExecutionData, ExternalSensorExecutionErrorData]],
+    ]
+]:
+    """Evaluates the sensors of a repository in a single call to its location, yielding each sensor
+    along with its evaluation as soon as it is returned.
+
+    If the location does not support batched evaluation, the sensors are yielded without an
+    evaluation, to be evaluated one at a time. If the call fails otherwise, the sensors that were
+    not evaluated yet are yielded with the error, rather than evaluated again while the location
+    may still be evaluating them.
+    """
+    instance = workspace_process_context.instance
+    pending_sensors = {
+        external_sensor.name: (external_sensor, sensor_state)
+        for external_sensor, sensor_state in repository_sensors
+    }
+    pending_sensor_runtime_data: Optional[ExternalSensorExecutionErrorData] = None
+    try:
+        repo_location = workspace_process_context.create_request_context().get_repository_location(
+            location_name
+        )
+        sensor_evaluations = repo_location.get_external_sensor_execution_data_batch(
+            instance,
+            repository_sensors[0][0].handle.repository_handle,
+            [
+                _get_sensor_evaluation_args(external_sensor.name, sensor_state)
+                for external_sensor, sensor_state in repository_sensors
+            ],
+        )
+        for sensor_name, sensor_runtime_data in sensor_evaluations:
+            if sensor_name not in pending_sensors:
+                continue
+
+            external_sensor, sensor_state = pending_sensors.pop(sensor_name)
+            yield external_sensor, sensor_state, sensor_runtime_data
+    except Exception as e:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        if is_unimplemented_rpc_error(e):
+            logger.debug(
+                f"Could not evaluate the sensors of repository {repository_name} in a single "
+                f"batch, evaluating them one at a time: {error_info.to_string()}"
+            )
+        else:
+            pending_sensor_runtime_data = ExternalSensorExecutionErrorData(error_info)
+
+    for external_sensor, sensor_state in pending_sensors.values():
+        yield external_sensor, sensor_state, pending_sensor_runtime_data
+
+
+def _process_sensor_batch(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    location_name: str,
+    repository_name: str,
+    repository_sensors: Sequence[Tuple[ExternalSensor, InstigatorState]],
+    sensor_state_lock: threading.Lock,
+    debug_crash_flags,
+    tick_retention_settings,
+):
+    # evaluate the sensors of a repository from within a thread, then process their ticks. The
+    # stream is drained first, so that launching runs does not count against its deadline. The
+    # ticks are processed here rather than submitted to the threadpool, so that the batch stays the
+    # one tick in flight of each of its sensors, and never waits on a threadpool that it occupies.
+    evaluated_sensors = list(
+        _evaluate_sensor_batch(
+            workspace_process_context, logger, location_name, repository_name, repository_sensors
+        )
+    )
+    for external_sensor, sensor_state, sensor_runtime_data in evaluated_sensors:
+        _process_tick(
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            sensor_state_lock,
+            debug_crash_flags.get(external_sensor.name) if debug_crash_flags else None,
+            tick_retention_settings,
+            sensor_runtime_data,
+        )
+
+
+def _get_running_sensors(
+    workspace_snapshot: Mapping[str, WorkspaceLocationEntry],
+    all_sensor_states: Mapping[str, InstigatorState],
+    logger: logging.Logger,
+    log_verbose_checks: bool,
+) -> Mapping[str, ExternalSensor]:
     sensors: Dict[str, ExternalSensor] = {}
     for location_entry in workspace_snapshot.values():
         repo_location = location_entry.repository_location
@@ -346,64 +706,7 @@ def execute_sensor_iteration(
                     "Status tab.",
                 )
 
-    if not sensors:
-        if log_verbose_checks:
-            logger.info("Not checking for any runs since no sensors have been started.")
-        yield
-        return
-
-    for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        sensor_state = all_sensor_states.get(external_sensor.selector_id)
-        if not sensor_state:
-            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
-            sensor_state = InstigatorState(
-                external_sensor.get_external_origin(),
-                InstigatorType.SENSOR,
-                InstigatorStatus.AUTOMATICALLY_RUNNING,
-                SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
-            )
-            instance.add_instigator_state(sensor_state)
-        elif _is_under_min_interval(sensor_state, external_sensor):
-            continue
-
-        if threadpool_executor:
-            if sensor_tick_futures is None:
-                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
-
-            # only allow one tick per sensor to be in flight
-            if (
-                external_sensor.selector_id in sensor_tick_futures
-                and not sensor_tick_futures[external_sensor.selector_id].done()
-            ):
-                continue
-
-            future = threadpool_executor.submit(
-                _process_tick,
-                workspace_process_context,
-                logger,
-                external_sensor,
-                sensor_state,
-                sensor_state_lock,
-                sensor_debug_crash_flags,
-                tick_retention_settings,
-            )
-            sensor_tick_futures[external_sensor.selector_id] = future
-            yield
-
-        else:
-            # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
-            # heartbeat
-            yield from _process_tick_generator(
-                workspace_process_context,
-                logger,
-                external_sensor,
-                sensor_state,
-                sensor_state_lock,
-                sensor_debug_crash_flags,
-                tick_retention_settings,
-            )
+    return sensors
 
 
 def _process_tick(
@@ -414,6 +717,9 @@ def _process_tick(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    sensor_runtime_data: Optional[
+        Union[SensorExecutionData, ExternalSensorExecutionErrorData]
+    ] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -426,6 +732,7 @@ def _process_tick(
             sensor_state_lock,
             sensor_debug_crash_flags,
             tick_retention_settings,
+            sensor_runtime_data,
         )
     )
 
@@ -438,6 +745,9 @@ def _process_tick_generator(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags,
     tick_retention_settings,
+    sensor_runtime_data: Optional[
+        Union[SensorExecutionData, ExternalSensorExecutionErrorData]
+    ] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -481,6 +791,7 @@ def _process_tick_generator(
                 external_sensor,
                 sensor_state,
                 sensor_debug_crash_flags,
+                sensor_runtime_data,
             )
 
     except Exception:
@@ -500,6 +811,18 @@ def _sensor_instigator_data(state: InstigatorState) -> Optional[SensorInstigator
         check.failed(f"Expected SensorInstigatorData, got {instigator_data}")
 
 
+def _get_sensor_evaluation_args(
+    sensor_name: str, sensor_state: InstigatorState
+) -> SensorEvaluationArgs:
+    instigator_data = _sensor_instigator_data(sensor_state)
+    return SensorEvaluationArgs(
+        sensor_name=sensor_name,
+        last_completion_time=instigator_data.last_tick_timestamp if instigator_data else None,
+        last_run_key=instigator_data.last_run_key if instigator_data else None,
+        cursor=instigator_data.cursor if instigator_data else None,
+    )
+
+
 def _mark_sensor_state_for_tick(
     instance: DagsterInstance,
     external_sensor: ExternalSensor,
@@ -528,6 +851,9 @@ def _evaluate_sensor(
     external_sensor: ExternalSensor,
     state: InstigatorState,
     sensor_debug_crash_flags=None,
+    sensor_runtime_data: Optional[
+        Union[SensorExecutionData, ExternalSensorExecutionErrorData]
+    ] = None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
@@ -538,16 +864,19 @@ def _evaluate_sensor(
         sensor_origin.external_repository_origin.repository_location_origin.location_name
     )
 
-    instigator_data = _sensor_instigator_data(state)
-
-    sensor_runtime_data = repo_location.get_external_sensor_execution_data(
-        instance,
-        repository_handle,
-        external_sensor.name,
-        instigator_data.last_tick_timestamp if instigator_data else None,
-        instigator_data.last_run_key if instigator_data else None,
-        instigator_data.cursor if instigator_data else None,
-    )
+    if sensor_runtime_data is None:
+        instigator_data = _sensor_instigator_data(state)
+        sensor_runtime_data = repo_location.get_external_sensor_execution_data(
+            instance,
+            repository_handle,
+            external_sensor.name,
+            instigator_data.last_tick_timestamp if instigator_data else None,
+            instigator_data.last_run_key if instigator_data else None,
+            instigator_data.cursor if instigator_data else None,
+        )
+    elif isinstance(sensor_runtime_data, ExternalSensorExecutionErrorData):
+        # evaluated in a batch along with the other sensors of the repository
+        raise DagsterUserCodeProcessError.from_error_info(sensor_runtime_data.error)
 
     yield
 
@@ -684,6 +1013,24 @@ def _evaluate_sensor(
     yield
 
 
+def _get_next_tick_timestamp(
+    state: Optional[InstigatorState], external_sensor: ExternalSensor, now: float
+) -> float:
+    """Returns the earliest time at which the sensor may be evaluated, per its minimum interval."""
+    instigator_data = _sensor_instigator_data(state) if state else None
+    if not instigator_data or not external_sensor.min_interval_seconds:
+        return now
+
+    last_tick_timestamp = max(
+        instigator_data.last_tick_timestamp or 0,
+        instigator_data.last_tick_start_timestamp or 0,
+    )
+    if not last_tick_timestamp:
+        return now
+
+    return max(now, last_tick_timestamp + external_sensor.min_interval_seconds)
+
+
 def _is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
     instigator_data = _sensor_instigator_data(state)
     if not instigator_data:
@@ -107,6 +107,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalSensorExecutionRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingChunkEvent.FromString,
         )
+        self.ExternalSensorBatchExecution = channel.unary_stream(
+            "/api.DagsterApi/ExternalSensorBatchExecution",
+            request_serializer=api__pb2.ExternalSensorBatchExecutionRequest.SerializeToString,
+            response_deserializer=api__pb2.ExternalSensorBatchExecutionEvent.FromString,
+        )
         self.ShutdownServer = channel.unary_unary(
             "/api.DagsterApi/ShutdownServer",
             request_serializer=api__pb2.Empty.SerializeToString,
@@ -239,6 +244,12 @@ def ExternalSensorExecution(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ExternalSensorBatchExecution(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ShutdownServer(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -357,6 +368,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalSensorExecutionRequest.FromString,
             response_serializer=api__pb2.StreamingChunkEvent.SerializeToString,
         ),
+        "ExternalSensorBatchExecution": grpc.unary_stream_rpc_method_handler(
+            servicer.ExternalSensorBatchExecution,
+            request_deserializer=api__pb2.ExternalSensorBatchExecutionRequest.FromString,
+            response_serializer=api__pb2.ExternalSensorBatchExecutionEvent.SerializeToString,
+        ),
         "ShutdownServer": grpc.unary_unary_rpc_method_handler(
             servicer.ShutdownServer,
             request_deserializer=api__pb2.Empty.FromString,
@@ -884,6 +900,35 @@ def ExternalSensorExecution(
             metadata,
         )
 
+    @staticmethod
+    def ExternalSensorBatchExecution(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/ExternalSensorBatchExecution",
+            api__pb2.ExternalSensorBatchExecutionRequest.SerializeToString,
+            api__pb2.ExternalSensorBatchExecutionEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ShutdownServer(
         request,
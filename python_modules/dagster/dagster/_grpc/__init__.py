@@ -32,6 +32,8 @@
     PartitionSetExecutionParamArgs,
     PipelineSubsetSnapshotArgs,
     ResumeRunArgs,
+    SensorBatchExecutionArgs,
+    SensorEvaluationArgs,
     SensorExecutionArgs,
     ShutdownServerResult,
     StartRunResult,
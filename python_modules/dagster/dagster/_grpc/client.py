@@ -3,7 +3,7 @@
 import sys
 import warnings
 from contextlib import contextmanager
-from typing import Iterator, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 import grpc
 from grpc_health.v1 import health_pb2
@@ -31,6 +31,7 @@
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
     PipelineSubsetSnapshotArgs,
+    SensorBatchExecutionArgs,
     SensorExecutionArgs,
 )
 from .utils import default_grpc_timeout, max_rx_bytes, max_send_bytes
@@ -52,6 +53,15 @@ def client_heartbeat_thread(client, shutdown_event):
             continue
 
 
+def is_unimplemented_rpc_error(error: Exception) -> bool:
+    """Whether a call failed because the server does not implement the called method, e.g. since
+    it runs an older version of dagster."""
+    cause = error.__cause__ if isinstance(error, DagsterUserCodeUnreachableError) else error
+    if not isinstance(cause, grpc.RpcError) or not hasattr(cause, "code"):
+        return False
+    return cause.code() == grpc.StatusCode.UNIMPLEMENTED
+
+
 class DagsterGrpcClient:
     def __init__(
         self,
@@ -379,6 +389,35 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    def external_sensor_batch_execution(
+        self, sensor_batch_execution_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ) -> Iterator[Tuple[str, str]]:
+        """Yields the name and serialized execution data of each sensor in the batch, in the order
+        in which the server finishes evaluating them.
+
+        The timeout applies per sensor. The whole stream shares a single deadline, so it is scaled
+        by the number of sensors in the batch, which the server may evaluate one after another.
+        """
+        check.inst_param(
+            sensor_batch_execution_args,
+            "sensor_batch_execution_args",
+            SensorBatchExecutionArgs,
+        )
+
+        chunks_by_sensor_name: Dict[str, List[str]] = {}
+        for chunk in self._streaming_query(
+            "ExternalSensorBatchExecution",
+            api_pb2.ExternalSensorBatchExecutionRequest,
+            timeout=timeout * max(len(sensor_batch_execution_args.sensor_evaluation_args), 1),
+            serialized_external_sensor_batch_execution_args=serialize_dagster_namedtuple(
+                sensor_batch_execution_args
+            ),
+        ):
+            chunks = chunks_by_sensor_name.setdefault(chunk.sensor_name, [])
+            chunks.append(chunk.serialized_chunk)
+            if chunk.is_last_chunk:
+                yield chunk.sensor_name, "".join(chunks_by_sensor_name.pop(chunk.sensor_name))
+
     def external_notebook_data(self, notebook_path: str):
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
@@ -23,6 +23,11 @@
 )
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_run_iterator
+from dagster._core.execution.plan.plan_cache import (
+    get_execution_plan_cache,
+    get_execution_plan_cache_key,
+    get_execution_plan_cache_max_size,
+)
 from dagster._core.host_representation import external_pipeline_data_from_def
 from dagster._core.host_representation.external_data import (
     ExternalPartitionConfigData,
@@ -409,8 +414,28 @@ def get_external_execution_plan_snapshot(
             asset_selection=args.asset_selection,
         )
 
-        return snapshot_from_execution_plan(
-            create_execution_plan(
+        # the same job is typically launched over and over with the same config, so reuse plans
+        # that don't depend on the state of a previous run or on memoized outputs
+        cache = get_execution_plan_cache(
+            get_execution_plan_cache_max_size(
+                args.instance_ref.settings if args.instance_ref else None
+            )
+        )
+        cache_key = (
+            get_execution_plan_cache_key(
+                args.pipeline_snapshot_id,
+                args.run_config,
+                args.mode,
+                args.step_keys_to_execute,
+                solid_selection=args.solid_selection,
+                asset_selection=args.asset_selection,
+            )
+            if args.known_state is None and not job_def.is_using_memoization({})
+            else None
+        )
+        execution_plan = cache.get(cache_key) if cache_key else None
+        if execution_plan is None:
+            execution_plan = create_execution_plan(
                 job_def,
                 run_config=args.run_config,
                 mode=args.mode,
@@ -418,9 +443,11 @@ def get_external_execution_plan_snapshot(
                 known_state=args.known_state,
                 instance_ref=args.instance_ref,
                 repository_load_data=repo_def.repository_load_data,
-            ),
-            args.pipeline_snapshot_id,
-        )
+            )
+            if cache_key:
+                cache.set(cache_key, execution_plan)
+
+        return snapshot_from_execution_plan(execution_plan, args.pipeline_snapshot_id)
     except:
         return ExecutionPlanSnapshotErrorData(
             error=serializable_error_info_from_exc_info(sys.exc_info())
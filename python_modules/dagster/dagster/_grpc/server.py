@@ -6,7 +6,7 @@
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from multiprocessing.synchronize import Event as MPEvent
 from threading import Event as ThreadingEventType
 from time import sleep
@@ -23,6 +23,7 @@
 from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.host_representation.external_data import (
     ExternalRepositoryErrorData,
+    ExternalSensorExecutionErrorData,
     external_pipeline_data_from_def,
     external_repository_data_from_def,
 )
@@ -66,6 +67,8 @@
     PartitionNamesArgs,
     PartitionSetExecutionParamArgs,
     PipelineSubsetSnapshotArgs,
+    SensorBatchExecutionArgs,
+    SensorEvaluationArgs,
     SensorExecutionArgs,
     ShutdownServerResult,
     StartRunResult,
@@ -78,6 +81,9 @@
 
 STREAMING_CHUNK_SIZE = 4000000
 
+# number of threads on which the sensors of a batched sensor evaluation request are evaluated
+DEFAULT_SENSOR_EVALUATION_MAX_WORKERS = 4
+
 
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
@@ -188,12 +194,18 @@ def __init__(
         inject_env_vars_from_instance: Optional[bool] = False,
         instance_ref: Optional[InstanceRef] = None,
         location_name: Optional[str] = None,
+        sensor_evaluation_max_workers: int = DEFAULT_SENSOR_EVALUATION_MAX_WORKERS,
     ):
         super(DagsterApiServer, self).__init__()
 
         check.bool_param(heartbeat, "heartbeat")
         check.int_param(heartbeat_timeout, "heartbeat_timeout")
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
+        check.int_param(sensor_evaluation_max_workers, "sensor_evaluation_max_workers")
+        check.invariant(
+            sensor_evaluation_max_workers > 0,
+            "sensor_evaluation_max_workers must be greater than 0",
+        )
 
         self._server_termination_event = check.inst_param(
             server_termination_event, "server_termination_event", ThreadingEventType
@@ -268,10 +280,16 @@ def __init__(
 
         self.__cleanup_thread.start()
 
+        self._sensor_evaluation_executor = ThreadPoolExecutor(
+            max_workers=sensor_evaluation_max_workers,
+            thread_name_prefix="grpc-server-sensor-evaluation",
+        )
+
     def cleanup(self):
         if self.__heartbeat_thread:
             self.__heartbeat_thread.join()
         self.__cleanup_thread.join()
+        self._sensor_evaluation_executor.shutdown(wait=False)
 
     def _heartbeat_thread(self, heartbeat_timeout):
         while True:
@@ -590,6 +608,50 @@ def ExternalSensorExecution(self, request, _context):
 
         yield from self._split_serialized_data_into_chunk_events(serialized_sensor_data)
 
+    def ExternalSensorBatchExecution(self, request, _context):
+        args = deserialize_as(
+            request.serialized_external_sensor_batch_execution_args,
+            SensorBatchExecutionArgs,
+        )
+        repo_def = self._get_repo_for_origin(args.repository_origin)
+
+        def _evaluate_sensor(sensor_evaluation_args: SensorEvaluationArgs):
+            try:
+                return get_external_sensor_execution(
+                    repo_def,
+                    args.instance_ref,
+                    sensor_evaluation_args.sensor_name,
+                    sensor_evaluation_args.last_completion_time,
+                    sensor_evaluation_args.last_run_key,
+                    sensor_evaluation_args.cursor,
+                )
+            except Exception:
+                return ExternalSensorExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
+        futures = {
+            self._sensor_evaluation_executor.submit(
+                _evaluate_sensor, sensor_evaluation_args
+            ): sensor_evaluation_args.sensor_name
+            for sensor_evaluation_args in args.sensor_evaluation_args
+        }
+
+        # stream back the result of each sensor as soon as it has been evaluated
+        for future in as_completed(futures):
+            serialized_sensor_data = serialize_dagster_namedtuple(future.result())
+            num_chunks = int(math.ceil(float(len(serialized_sensor_data)) / STREAMING_CHUNK_SIZE))
+            for i in range(num_chunks):
+                start_index = i * STREAMING_CHUNK_SIZE
+                end_index = min((i + 1) * STREAMING_CHUNK_SIZE, len(serialized_sensor_data))
+
+                yield api_pb2.ExternalSensorBatchExecutionEvent(
+                    sensor_name=futures[future],
+                    sequence_number=i,
+                    serialized_chunk=serialized_sensor_data[start_index:end_index],
+                    is_last_chunk=i == num_chunks - 1,
+                )
+
     def ShutdownServer(self, request, _context):
         try:
             self._shutdown_once_executions_finish_event.set()
@@ -825,6 +887,7 @@ def __init__(
         inject_env_vars_from_instance=False,
         instance_ref=None,
         location_name=None,
+        sensor_evaluation_max_workers=DEFAULT_SENSOR_EVALUATION_MAX_WORKERS,
     ):
         check.opt_str_param(host, "host")
         check.opt_int_param(port, "port")
@@ -883,6 +946,7 @@ def __init__(
                 inject_env_vars_from_instance=inject_env_vars_from_instance,
                 instance_ref=instance_ref,
                 location_name=location_name,
+                sensor_evaluation_max_workers=sensor_evaluation_max_workers,
             )
         except Exception:
             if self._ipc_output_file:
@@ -558,6 +558,67 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class SensorEvaluationArgs(
+    NamedTuple(
+        "_SensorEvaluationArgs",
+        [
+            ("sensor_name", str),
+            ("last_completion_time", Optional[float]),
+            ("last_run_key", Optional[str]),
+            ("cursor", Optional[str]),
+        ],
+    )
+):
+    def __new__(
+        cls,
+        sensor_name: str,
+        last_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+    ):
+        return super(SensorEvaluationArgs, cls).__new__(
+            cls,
+            sensor_name=check.str_param(sensor_name, "sensor_name"),
+            last_completion_time=check.opt_float_param(
+                last_completion_time, "last_completion_time"
+            ),
+            last_run_key=check.opt_str_param(last_run_key, "last_run_key"),
+            cursor=check.opt_str_param(cursor, "cursor"),
+        )
+
+
+@whitelist_for_serdes
+class SensorBatchExecutionArgs(
+    NamedTuple(
+        "_SensorBatchExecutionArgs",
+        [
+            ("repository_origin", ExternalRepositoryOrigin),
+            ("instance_ref", Optional[InstanceRef]),
+            ("sensor_evaluation_args", Sequence[SensorEvaluationArgs]),
+        ],
+    )
+):
+    """Arguments to evaluate several sensors of a repository with a single request."""
+
+    def __new__(
+        cls,
+        repository_origin: ExternalRepositoryOrigin,
+        instance_ref: Optional[InstanceRef],
+        sensor_evaluation_args: Sequence[SensorEvaluationArgs],
+    ):
+        return super(SensorBatchExecutionArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", ExternalRepositoryOrigin
+            ),
+            instance_ref=check.opt_inst_param(instance_ref, "instance_ref", InstanceRef),
+            sensor_evaluation_args=check.sequence_param(
+                sensor_evaluation_args, "sensor_evaluation_args", of_type=SensorEvaluationArgs
+            ),
+        )
+
+
 @whitelist_for_serdes
 class ExternalJobArgs(
     NamedTuple(
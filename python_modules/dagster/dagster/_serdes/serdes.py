@@ -18,6 +18,7 @@
 from enum import Enum
 from inspect import Parameter, signature
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -25,6 +26,7 @@
     Mapping,
     NamedTuple,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -39,6 +41,11 @@
 
 from .errors import DeserializationError, SerdesUsageError, SerializationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 ###################################################################################################
 # Whitelisting
 ###################################################################################################
@@ -49,11 +56,35 @@
 EnumEntry = Tuple[Type[Enum], Type["EnumSerializer"]]
 
 
+class TuplePackPlan(NamedTuple):
+    """Precomputed instructions for packing instances of a whitelisted namedtuple class."""
+
+    serializer: Type["NamedTupleSerializer"]
+    # False if the serializer overrides value_to_storage_dict and has to be called directly
+    uses_default_packing: bool
+    skip_when_empty: AbstractSet[str]
+    storage_name: str
+
+
+class TupleUnpackPlan(NamedTuple):
+    """Precomputed instructions for unpacking a stored dict with a given __class__ name."""
+
+    klass: Optional[Type[NamedTuple]]
+    serializer: Type["NamedTupleSerializer"]
+    args_for_class: Mapping[str, Parameter]
+    # False if the serializer overrides value_from_storage_dict and has to be called directly
+    uses_default_unpacking: bool
+
+
 class WhitelistMap(NamedTuple):
     tuples: Dict[str, TupleEntry]
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    # pack / unpack plans are derived from the registrations above, and are compiled once per
+    # class the first time it is (de)serialized. Any new registration invalidates them.
+    pack_plans: Dict[str, TuplePackPlan]
+    unpack_plans: Dict[str, Optional[TupleUnpackPlan]]
 
     def register_tuple(
         self,
@@ -71,6 +102,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self._clear_plans()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -85,6 +117,7 @@ def register_enum(
         serializer: Optional[Type["EnumSerializer"]],
     ):
         self.enums[name] = (enum, serializer or DefaultEnumSerializer)
+        self._clear_plans()
 
     def has_enum_entry(self, name: str) -> bool:
         return name in self.enums
@@ -94,6 +127,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self._clear_plans()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -103,6 +137,7 @@ def get_serialized_name(self, name: str) -> str:
 
     def register_deserialized_name(self, name: str, deserialized_name: str):
         self.deserialized_names[name] = deserialized_name
+        self._clear_plans()
 
     def has_deserialized_name(self, name: str) -> bool:
         return name in self.deserialized_names
@@ -110,9 +145,58 @@ def has_deserialized_name(self, name: str) -> bool:
     def get_deserialized_name(self, name: str) -> str:
         return self.deserialized_names[name]
 
+    def get_pack_plan(self, name: str) -> Optional[TuplePackPlan]:
+        """Returns the plan for packing instances of the namedtuple class with the given name, or
+        None if the class is not whitelisted."""
+        plan = self.pack_plans.get(name)
+        if plan is None and name in self.tuples:
+            _, serializer, _ = self.tuples[name]
+            plan = TuplePackPlan(
+                serializer=serializer,
+                uses_default_packing=_is_default_method(serializer, "value_to_storage_dict"),
+                skip_when_empty=(
+                    frozenset(serializer.skip_when_empty())
+                    if issubclass(serializer, DefaultNamedTupleSerializer)
+                    else frozenset()
+                ),
+                storage_name=self.serialized_names.get(name, name),
+            )
+            self.pack_plans[name] = plan
+        return plan
+
+    def get_unpack_plan(self, storage_name: str) -> Optional[TupleUnpackPlan]:
+        """Returns the plan for unpacking a dict stored with the given __class__ name, or None if
+        the name does not map to a whitelisted class."""
+        if storage_name in self.unpack_plans:
+            return self.unpack_plans[storage_name]
+
+        lookup_name = self.deserialized_names.get(storage_name, storage_name)
+        plan = None
+        if lookup_name in self.tuples:
+            klass, serializer, args_for_class = self.tuples[lookup_name]
+            plan = TupleUnpackPlan(
+                klass=klass,
+                serializer=serializer,
+                args_for_class=args_for_class,
+                uses_default_unpacking=_is_default_method(serializer, "value_from_storage_dict"),
+            )
+        self.unpack_plans[storage_name] = plan
+        return plan
+
+    def _clear_plans(self):
+        self.pack_plans.clear()
+        self.unpack_plans.clear()
+
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={},
+            enums={},
+            serialized_names={},
+            deserialized_names={},
+            pack_plans={},
+            unpack_plans={},
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -368,6 +452,60 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _pack_value(val, whitelist_map)
+    except SerializationError:
+        # The fast path does not keep track of where it is in the object tree. Pack again while
+        # tracking descent paths so that the raised error points at the offending value.
+        _pack_value_with_descent_paths(val, whitelist_map, descent_path)
+        raise
+
+
+_JSON_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _pack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    val_type = type(val)
+    if val_type in _JSON_SCALAR_TYPES:
+        return val
+    if isinstance(val, list):
+        return [_pack_value(item, whitelist_map) for item in val]
+    if isinstance(val, tuple):
+        plan = whitelist_map.get_pack_plan(val_type.__name__)
+        if plan is None:
+            raise SerializationError(f"Can only serialize whitelisted namedtuples, received {val}.")
+        if not plan.uses_default_packing:
+            return plan.serializer.value_to_storage_dict(cast(NamedTuple, val), whitelist_map, "")
+
+        skip_when_empty = plan.skip_when_empty
+        base_dict = {}
+        for key, inner_value in zip(val._fields, val):  # type: ignore
+            if skip_when_empty and key in skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
+                continue
+            base_dict[key] = _pack_value(inner_value, whitelist_map)
+        base_dict["__class__"] = plan.storage_name
+        return base_dict
+    if isinstance(val, Enum):
+        klass_name = val_type.__name__
+        if not whitelist_map.has_enum_entry(klass_name):
+            raise SerializationError(
+                f"Can only serialize whitelisted Enums, received {klass_name}."
+            )
+        _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+        return {"__enum__": enum_serializer.value_to_storage_str(val, whitelist_map, "")}
+    if isinstance(val, set):
+        return {"__set__": [_pack_value(item, whitelist_map) for item in sorted(val, key=str)]}
+    if isinstance(val, frozenset):
+        return {
+            "__frozenset__": [_pack_value(item, whitelist_map) for item in sorted(val, key=str)]
+        }
+    if isinstance(val, dict):
+        return {key: _pack_value(value, whitelist_map) for key, value in val.items()}
+
+    return val
+
+
+def _pack_value_with_descent_paths(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
             pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
@@ -462,15 +600,32 @@ def opt_deserialize_as(json_str: Optional[str], cls: Type[T]) -> Optional[T]:
     return deserialize_as(json_str, cls) if json_str else None
 
 
+# orjson silently loads integers that do not fit in 64 bits as floats, so documents that contain a
+# run of 19 or more digits are left to the standard library parser
+_DIGITS_TO_ZEROS = str.maketrans("123456789", "000000000")
+_LONG_DIGIT_RUN = "0" * 19
+
+
+def _loads(json_str: str) -> Any:
+    if orjson is not None and _LONG_DIGIT_RUN not in json_str.translate(_DIGITS_TO_ZEROS):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library parser (e.g. it rejects NaN and
+            # control characters in strings), so fall back for those
+            pass
+    return seven.json.loads(json_str)
+
+
 def _deserialize_json(json_str: str, whitelist_map: WhitelistMap):
-    value = seven.json.loads(json_str)
+    value = _loads(json_str)
     return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
 
 
 def deserialize_value(val: str, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
     """Deserialize a json encoded string in to its original value"""
     return unpack_inner_value(
-        seven.json.loads(check.str_param(val, "val")),
+        _loads(check.str_param(val, "val")),
         whitelist_map=whitelist_map,
         descent_path="",
     )
@@ -486,47 +641,95 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _unpack_value(val, whitelist_map)
+    except DeserializationError:
+        # The fast path does not keep track of where it is in the object tree. Unpack again while
+        # tracking descent paths so that the raised error points at the offending value. Neither
+        # path modifies the passed in object tree, so it can safely be walked a second time.
+        _unpack_value_with_descent_paths(val, whitelist_map, descent_path)
+        raise
+
+
+def _unpack_value(val: Any, whitelist_map: WhitelistMap) -> Any:
+    if type(val) in _JSON_SCALAR_TYPES:
+        return val
+    if isinstance(val, list):
+        return [_unpack_value(item, whitelist_map) for item in val]
+    if not isinstance(val, dict):
+        return val
+
+    klass_name = val.get("__class__")
+    if klass_name:
+        plan = whitelist_map.get_unpack_plan(klass_name)
+        if plan is None:
+            raise DeserializationError(_unknown_class_msg(klass_name, whitelist_map))
+
+        # Target class being set to none, likely by
+        if plan.klass is None:
+            return None
+
+        if not plan.uses_default_unpacking:
+            return plan.serializer.value_from_storage_dict(
+                _without_class_key(val),
+                plan.klass,
+                plan.args_for_class,
+                whitelist_map,
+                "",
+            )
+
+        args_for_class = plan.args_for_class
+        return plan.serializer.value_from_unpacked(  # type: ignore
+            {
+                key: _unpack_value(value, whitelist_map)
+                for key, value in val.items()
+                if key in args_for_class
+            },
+            plan.klass,
+        )
+    enum_str = val.get("__enum__")
+    if enum_str:
+        name, member = enum_str.split(".")
+        if not whitelist_map.has_enum_entry(name):
+            raise DeserializationError(_unknown_enum_msg(name))
+        enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+        return enum_serializer.value_from_storage_str(member, enum_class)
+    set_items = val.get("__set__")
+    if set_items is not None:
+        return set([_unpack_value(item, whitelist_map) for item in set_items])
+    frozenset_items = val.get("__frozenset__")
+    if frozenset_items is not None:
+        return frozenset([_unpack_value(item, whitelist_map) for item in frozenset_items])
+    return {key: _unpack_value(value, whitelist_map) for key, value in val.items()}
+
+
+def _unpack_value_with_descent_paths(
+    val: Any, whitelist_map: WhitelistMap, descent_path: str
+) -> Any:
     if isinstance(val, list):
         return [
             unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
-        klass_name = cast(str, val.pop("__class__"))
-        lookup_name = (
-            whitelist_map.get_deserialized_name(klass_name)
-            if whitelist_map.has_deserialized_name(klass_name)
-            else klass_name
-        )
-        if not whitelist_map.has_tuple_entry(lookup_name):
-            name_str = (
-                f'"{klass_name}"'
-                if klass_name == lookup_name
-                else f'"{klass_name}" (mapped to: "{lookup_name}")'
-            )
+        klass_name = cast(str, val["__class__"])
+        plan = whitelist_map.get_unpack_plan(klass_name)
+        if plan is None:
             raise DeserializationError(
-                f"Attempted to deserialize class {name_str} which is not in the whitelist. "
-                "This error can occur due to version skew, verify processes are running "
-                f"expected versions.{_path_msg(descent_path)}"
+                _unknown_class_msg(klass_name, whitelist_map) + _path_msg(descent_path)
             )
 
-        klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
-
         # Target class being set to none, likely by
-        if klass is None:
+        if plan.klass is None:
             return None
 
-        return serializer.value_from_storage_dict(
-            val, klass, args_for_class, whitelist_map, descent_path
+        return plan.serializer.value_from_storage_dict(
+            _without_class_key(val), plan.klass, plan.args_for_class, whitelist_map, descent_path
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
         if not whitelist_map.has_enum_entry(name):
-            raise DeserializationError(
-                f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
-                "This error can occur due to version skew, verify processes are running "
-                f"expected versions.{_path_msg(descent_path)}"
-            )
+            raise DeserializationError(_unknown_enum_msg(name) + _path_msg(descent_path))
         enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
         return enum_serializer.value_from_storage_str(member, enum_class)
     if isinstance(val, dict) and val.get("__set__") is not None:
@@ -546,6 +749,234 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
     return val
 
 
+def _without_class_key(storage_dict: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in storage_dict.items() if key != "__class__"}
+
+
+###################################################################################################
+# Binary encoding
+###################################################################################################
+
+# Binary encoded values start with a header byte identifying the encoding version. JSON documents
+# never start with one of these bytes, so readers can tell the two formats apart.
+MSGPACK_V1_HEADER = b"\x01"
+
+# In the msgpack encoding, class and field names are interned in a table that precedes the body.
+# A namedtuple is encoded as a map keyed by name table indexes, with its class name index stored
+# under the key _CLASS_KEY. Other maps always have string keys, so the two cannot be confused.
+_CLASS_KEY = -1
+_BIG_INT_EXT_TYPE = 1
+_MIN_MSGPACK_INT = -(2**63)
+_MAX_MSGPACK_INT = 2**64 - 1
+
+
+def serialize_value_to_bytes(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> bytes:
+    """Serialize a value to the versioned binary (msgpack) encoding. The result can be read back
+    with deserialize_value_from_bytes, and loads to the same value as the json encoding would."""
+    import msgpack
+
+    names: List[str] = []
+    name_ids: Dict[str, int] = {}
+    try:
+        body = _BinaryPacker(whitelist_map, names, name_ids).pack(val)
+    except SerializationError:
+        # report the error with a descent path
+        pack_inner_value(val, whitelist_map, _root(val))
+        raise
+    return MSGPACK_V1_HEADER + msgpack.packb(
+        [names, body], use_bin_type=True, default=_msgpack_default
+    )
+
+
+def is_binary_serialized(data: bytes) -> bool:
+    return data[:1] == MSGPACK_V1_HEADER
+
+
+def deserialize_value_from_bytes(data: bytes, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
+    """Deserialize a value from either the binary encoding or utf-8 encoded json."""
+    import msgpack
+
+    check.inst_param(data, "data", bytes)
+    if not is_binary_serialized(data):
+        return unpack_inner_value(_loads(data.decode("utf-8")), whitelist_map, "")
+
+    document = msgpack.unpackb(
+        data[1:], raw=False, strict_map_key=False, ext_hook=_msgpack_ext_hook
+    )
+    if not isinstance(document, list) or len(document) != 2:
+        raise DeserializationError("Binary encoded value is missing its name table.")
+    names, body = document
+    try:
+        return _unpack_binary_value(body, whitelist_map, names)
+    except DeserializationError:
+        # report the error with a descent path
+        unpack_inner_value(_restore_packed_value(body, names), whitelist_map, "")
+        raise
+
+
+def _msgpack_default(val: Any) -> Any:
+    import msgpack
+
+    if isinstance(val, int):
+        return msgpack.ExtType(_BIG_INT_EXT_TYPE, str(val).encode("ascii"))
+    raise TypeError(f"Object of type {type(val).__name__} is not msgpack serializable")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    import msgpack
+
+    if code == _BIG_INT_EXT_TYPE:
+        return int(data)
+    return msgpack.ExtType(code, data)
+
+
+def _json_key(key: Any) -> str:
+    # match the conversion json.dumps applies to non-string keys
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+class _BinaryPacker:
+    def __init__(self, whitelist_map: WhitelistMap, names: List[str], name_ids: Dict[str, int]):
+        self._whitelist_map = whitelist_map
+        self._names = names
+        self._name_ids = name_ids
+        # name table indexes of the fields of each namedtuple class seen so far
+        self._field_ids: Dict[type, Tuple[int, ...]] = {}
+
+    def _intern(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._name_ids[name] = name_id
+        return name_id
+
+    def pack(self, val: Any) -> Any:
+        val_type = type(val)
+        if val_type in _JSON_SCALAR_TYPES:
+            return val
+        if isinstance(val, list):
+            return [self.pack(item) for item in val]
+        if isinstance(val, tuple):
+            plan = self._whitelist_map.get_pack_plan(val_type.__name__)
+            if plan is None:
+                raise SerializationError(
+                    f"Can only serialize whitelisted namedtuples, received {val}."
+                )
+            if not plan.uses_default_packing:
+                return self.intern_packed(
+                    plan.serializer.value_to_storage_dict(
+                        cast(NamedTuple, val), self._whitelist_map, ""
+                    )
+                )
+
+            field_ids = self._field_ids.get(val_type)
+            if field_ids is None:
+                field_ids = tuple(self._intern(field) for field in val._fields)  # type: ignore
+                self._field_ids[val_type] = field_ids
+
+            skip_when_empty = plan.skip_when_empty
+            node = {_CLASS_KEY: self._intern(plan.storage_name)}
+            for field, field_id, inner_value in zip(val._fields, field_ids, val):  # type: ignore
+                if (
+                    skip_when_empty
+                    and field in skip_when_empty
+                    and inner_value in EMPTY_VALUES_TO_SKIP
+                ):
+                    continue
+                node[field_id] = self.pack(inner_value)
+            return node
+        if isinstance(val, (Enum, set, frozenset)):
+            return self.intern_packed(_pack_value(val, self._whitelist_map))
+        if isinstance(val, dict):
+            return {_json_key(key): self.pack(value) for key, value in val.items()}
+
+        return val
+
+    def intern_packed(self, val: Any) -> Any:
+        """Converts the json form of a packed value to the binary form."""
+        if isinstance(val, list):
+            return [self.intern_packed(item) for item in val]
+        if isinstance(val, dict):
+            if val.get("__class__"):
+                node = {_CLASS_KEY: self._intern(val["__class__"])}
+                for key, value in val.items():
+                    if key != "__class__":
+                        node[self._intern(key)] = self.intern_packed(value)
+                return node
+            return {_json_key(key): self.intern_packed(value) for key, value in val.items()}
+        return val
+
+
+def _unpack_binary_value(val: Any, whitelist_map: WhitelistMap, names: Sequence[str]) -> Any:
+    if type(val) in _JSON_SCALAR_TYPES:
+        return val
+    if isinstance(val, list):
+        return [_unpack_binary_value(item, whitelist_map, names) for item in val]
+    if not isinstance(val, dict):
+        return val
+
+    if _CLASS_KEY in val:
+        klass_name = names[val[_CLASS_KEY]]
+        plan = whitelist_map.get_unpack_plan(klass_name)
+        if plan is None:
+            raise DeserializationError(_unknown_class_msg(klass_name, whitelist_map))
+
+        if plan.klass is None:
+            return None
+
+        if not plan.uses_default_unpacking:
+            storage_dict = {
+                names[key]: _restore_packed_value(value, names)
+                for key, value in val.items()
+                if key != _CLASS_KEY
+            }
+            return plan.serializer.value_from_storage_dict(
+                storage_dict, plan.klass, plan.args_for_class, whitelist_map, ""
+            )
+
+        args_for_class = plan.args_for_class
+        unpacked_dict = {}
+        for key, value in val.items():
+            if key != _CLASS_KEY:
+                field = names[key]
+                if field in args_for_class:
+                    unpacked_dict[field] = _unpack_binary_value(value, whitelist_map, names)
+        return plan.serializer.value_from_unpacked(unpacked_dict, plan.klass)  # type: ignore
+    if "__enum__" in val or "__set__" in val or "__frozenset__" in val:
+        return _unpack_value(_restore_packed_value(val, names), whitelist_map)
+    return {key: _unpack_binary_value(value, whitelist_map, names) for key, value in val.items()}
+
+
+def _restore_packed_value(val: Any, names: Sequence[str]) -> Any:
+    """Converts the binary form of a packed value back to the json form."""
+    if isinstance(val, list):
+        return [_restore_packed_value(item, names) for item in val]
+    if isinstance(val, dict):
+        if _CLASS_KEY in val:
+            restored = {
+                names[key]: _restore_packed_value(value, names)
+                for key, value in val.items()
+                if key != _CLASS_KEY
+            }
+            restored["__class__"] = names[val[_CLASS_KEY]]
+            return restored
+        return {key: _restore_packed_value(value, names) for key, value in val.items()}
+    return val
+
+
 ###################################################################################################
 # Back compat
 ###################################################################################################
@@ -657,6 +1088,34 @@ def _with_header(msg):
                 raise SerdesUsageError(_with_header(error_msg))
 
 
+def _is_default_method(serializer: Type["NamedTupleSerializer"], method_name: str) -> bool:
+    method = getattr(serializer, method_name)
+    default_method = getattr(DefaultNamedTupleSerializer, method_name)
+    return getattr(method, "__func__", method) is getattr(default_method, "__func__", None)
+
+
+def _unknown_class_msg(klass_name: str, whitelist_map: WhitelistMap) -> str:
+    lookup_name = whitelist_map.deserialized_names.get(klass_name, klass_name)
+    name_str = (
+        f'"{klass_name}"'
+        if klass_name == lookup_name
+        else f'"{klass_name}" (mapped to: "{lookup_name}")'
+    )
+    return (
+        f"Attempted to deserialize class {name_str} which is not in the whitelist. "
+        "This error can occur due to version skew, verify processes are running "
+        "expected versions."
+    )
+
+
+def _unknown_enum_msg(name: str) -> str:
+    return (
+        f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
+        "This error can occur due to version skew, verify processes are running "
+        "expected versions."
+    )
+
+
 def _path_msg(descent_path: str) -> str:
     if not descent_path:
         return ""
@@ -533,6 +533,27 @@ def generate_teardown_events(self) -> Iterator["DagsterEvent"]:
             yield from self.generator
 
 
+def approximate_size(obj: Any) -> int:
+    """Approximates the memory used by a tree of namedtuples and builtin containers. Objects that
+    are shared within the tree are only counted once."""
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        item_id = id(item)
+        if item_id in seen:
+            continue
+        seen.add(item_id)
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
 def utc_datetime_from_timestamp(timestamp: float) -> datetime.datetime:
     tz = timezone.utc
     return datetime.datetime.fromtimestamp(timestamp, tz=tz)
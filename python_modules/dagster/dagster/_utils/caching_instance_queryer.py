@@ -45,7 +45,7 @@ def get_in_progress_run_time_and_planned_materializations(
         run_id = asset_record.asset_entry.last_run_id
 
         run_record = self._get_run_record_by_id(run_id=run_id)
-        if run_record is not None and run_record.pipeline_run.status in IN_PROGRESS_RUN_STATUSES:
+        if run_record is not None and run_record.status in IN_PROGRESS_RUN_STATUSES:
             data_time = (
                 datetime.datetime.fromtimestamp(run_record.start_time, tz=datetime.timezone.utc)
                 if run_record.start_time
@@ -0,0 +1,110 @@
+from collections import defaultdict
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._builtins import Bool, String
+from dagster._config import Array, Field, Noneable, ScalarUnion, Shape
+
+
+def get_tag_concurrency_limits_config(description: str) -> Field:
+    return Field(
+        config=Noneable(
+            Array(
+                Shape(
+                    {
+                        "key": String,
+                        "value": Field(
+                            ScalarUnion(
+                                scalar_type=String,
+                                non_scalar_schema=Shape({"applyLimitPerUniqueValue": Bool}),
+                            ),
+                            is_required=False,
+                        ),
+                        "limit": Field(int),
+                    }
+                )
+            )
+        ),
+        is_required=False,
+        description=description,
+    )
+
+
+class TagConcurrencyLimitsCounter:
+    """
+    Helper object that keeps track of when the tag concurrency limits are met, for any items with
+    tags, e.g. runs or execution steps
+    """
+
+    def __init__(
+        self,
+        tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]],
+        in_progress_tag_counts: Optional[Mapping[Tuple[str, str], int]] = None,
+    ):
+        check.opt_sequence_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=Mapping)
+        check.opt_mapping_param(in_progress_tag_counts, "in_progress_tag_counts", key_type=tuple)
+
+        self._key_limits: Dict[str, int] = {}
+        self._key_value_limits: Dict[Tuple[str, str], int] = {}
+        self._unique_value_limits: Dict[str, int] = {}
+
+        for tag_limit in tag_concurrency_limits or []:
+            key = tag_limit["key"]
+            value = tag_limit.get("value")
+            limit = tag_limit["limit"]
+
+            if isinstance(value, str):
+                self._key_value_limits[(key, value)] = limit
+            elif not value or not value["applyLimitPerUniqueValue"]:
+                self._key_limits[key] = limit
+            else:
+                self._unique_value_limits[key] = limit
+
+        self._key_counts: Dict[str, int] = defaultdict(lambda: 0)
+        self._key_value_counts: Dict[Tuple[str, str], int] = defaultdict(lambda: 0)
+        self._unique_value_counts: Dict[Tuple[str, str], int] = defaultdict(lambda: 0)
+
+        # initialize counters based on the tags of the current in progress items
+        for (key, value), count in (in_progress_tag_counts or {}).items():
+            self._update_counters(key, value, count)
+
+    def is_blocked(self, item) -> bool:
+        """
+        True if there are in progress items which are blocking this item based on tag limits
+        """
+        for key, value in item.tags.items():
+            if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
+                return True
+
+            tag_tuple = (key, value)
+            if (
+                tag_tuple in self._key_value_limits
+                and self._key_value_counts[tag_tuple] >= self._key_value_limits[tag_tuple]
+            ):
+                return True
+
+            if (
+                key in self._unique_value_limits
+                and self._unique_value_counts[tag_tuple] >= self._unique_value_limits[key]
+            ):
+                return True
+
+        return False
+
+    def update_counters_with_launched_item(self, item) -> None:
+        """
+        Add a new in progress item to the counters
+        """
+        for key, value in item.tags.items():
+            self._update_counters(key, value, 1)
+
+    def _update_counters(self, key, value, count):
+        if key in self._key_limits:
+            self._key_counts[key] += count
+
+        tag_tuple = (key, value)
+        if tag_tuple in self._key_value_limits:
+            self._key_value_counts[tag_tuple] += count
+
+        if key in self._unique_value_limits:
+            self._unique_value_counts[tag_tuple] += count
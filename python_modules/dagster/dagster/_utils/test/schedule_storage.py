@@ -400,6 +400,31 @@ def test_update_state(self, storage):
         assert state.instigator_name == "my_sensor"
         assert state.status == InstigatorStatus.STOPPED
 
+    def test_get_running_instigator_selector_ids(self, storage):
+        assert storage
+
+        running_state = self.build_sensor("my_sensor", InstigatorStatus.RUNNING)
+        stopped_state = self.build_sensor("my_sensor_2")
+        automatic_state = self.build_sensor("my_sensor_3", InstigatorStatus.AUTOMATICALLY_RUNNING)
+        schedule_state = self.build_schedule("my_schedule", "* * * * *", InstigatorStatus.RUNNING)
+
+        storage.add_instigator_state(running_state)
+        storage.add_instigator_state(stopped_state)
+        storage.add_instigator_state(automatic_state)
+        storage.add_instigator_state(schedule_state)
+
+        assert storage.get_running_instigator_selector_ids(InstigatorType.SENSOR) == {
+            running_state.selector_id,
+            automatic_state.selector_id,
+        }
+
+        storage.update_instigator_state(running_state.with_status(InstigatorStatus.STOPPED))
+        storage.update_instigator_state(stopped_state.with_status(InstigatorStatus.RUNNING))
+        assert storage.get_running_instigator_selector_ids(InstigatorType.SENSOR) == {
+            stopped_state.selector_id,
+            automatic_state.selector_id,
+        }
+
     def test_update_state_not_found(self, storage):
         assert storage
 
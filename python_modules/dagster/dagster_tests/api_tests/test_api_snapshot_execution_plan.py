@@ -4,9 +4,17 @@
 
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
 from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.execution.plan.plan_cache import (
+    get_execution_plan_cache,
+    get_execution_plan_cache_key,
+)
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.host_representation.handle import PipelineHandle
 from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+from dagster._grpc.impl import get_external_execution_plan_snapshot
+from dagster._grpc.types import ExecutionPlanSnapshotArgs
 
+from .api_tests_repo import bar_repo
 from .utils import get_bar_repo_repository_location
 
 
@@ -97,3 +105,58 @@ def test_execution_plan_with_subset_snapshot_api_grpc(instance):
             "do_input",
         ]
         assert len(execution_plan_snapshot.steps) == 1
+
+
+def test_execution_plan_snapshot_cache(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        pipeline_origin = PipelineHandle(
+            "foo", repository_location.get_repository("bar_repo").handle
+        ).get_external_origin()
+
+        def _get_snapshot(**kwargs):
+            return get_external_execution_plan_snapshot(
+                bar_repo,
+                "foo",
+                ExecutionPlanSnapshotArgs(
+                    pipeline_origin=pipeline_origin,
+                    solid_selection=kwargs.get("solid_selection"),
+                    run_config=kwargs.get("run_config", {}),
+                    mode="default",
+                    step_keys_to_execute=kwargs.get("step_keys_to_execute"),
+                    pipeline_snapshot_id="12345",
+                    known_state=kwargs.get("known_state"),
+                ),
+            )
+
+        def _is_cached(**kwargs):
+            return (
+                get_execution_plan_cache().get(
+                    get_execution_plan_cache_key(
+                        "12345",
+                        kwargs.get("run_config", {}),
+                        "default",
+                        kwargs.get("step_keys_to_execute"),
+                        solid_selection=kwargs.get("solid_selection"),
+                    )
+                )
+                is not None
+            )
+
+        get_execution_plan_cache().clear()
+
+        execution_plan_snapshot = _get_snapshot()
+        assert isinstance(execution_plan_snapshot, ExecutionPlanSnapshot)
+        assert _is_cached()
+        assert _get_snapshot() == execution_plan_snapshot
+
+        assert _get_snapshot(step_keys_to_execute=["do_something"]) != execution_plan_snapshot
+        assert _is_cached(step_keys_to_execute=["do_something"])
+
+        # plans that depend on the state of a previous run are not cached
+        _get_snapshot(step_keys_to_execute=["do_input"], known_state=KnownExecutionState())
+        assert not _is_cached(step_keys_to_execute=["do_input"])
+
+        subset_run_config = {"solids": {"do_input": {"inputs": {"x": {"value": "test"}}}}}
+        subset_snapshot = _get_snapshot(solid_selection=["do_input"], run_config=subset_run_config)
+        assert subset_snapshot.step_keys_to_execute == ["do_input"]
+        assert _is_cached(solid_selection=["do_input"], run_config=subset_run_config)
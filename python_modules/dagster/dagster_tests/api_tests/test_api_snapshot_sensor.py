@@ -3,8 +3,10 @@
 from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_ephemeral_grpc
 from dagster._core.definitions.sensor_definition import SensorExecutionData
 from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.host_representation.external_data import ExternalSensorExecutionErrorData
+from dagster._grpc.types import SensorEvaluationArgs
 
-from .utils import get_bar_repo_handle
+from .utils import get_bar_repo_handle, get_bar_repo_repository_location
 
 
 def test_external_sensor_grpc(instance):
@@ -33,3 +35,30 @@ def test_external_sensor_raises_dagster_error(instance):
             sync_get_external_sensor_execution_data_ephemeral_grpc(
                 instance, repository_handle, "sensor_raises_dagster_error", None, None, None
             )
+
+
+def test_external_sensor_batch_grpc(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        repository_handle = repository_location.get_repository("bar_repo").handle
+        results = dict(
+            repository_location.get_external_sensor_execution_data_batch(
+                instance,
+                repository_handle,
+                [
+                    SensorEvaluationArgs(sensor_name, None, None, None)
+                    for sensor_name in ["sensor_foo", "sensor_error", "sensor_raises_dagster_error"]
+                ],
+            )
+        )
+
+        assert set(results.keys()) == {"sensor_foo", "sensor_error", "sensor_raises_dagster_error"}
+
+        assert isinstance(results["sensor_foo"], SensorExecutionData)
+        assert len(results["sensor_foo"].run_requests) == 2
+        assert results["sensor_foo"].run_requests[0].run_config == {"foo": "FOO"}
+
+        assert isinstance(results["sensor_error"], ExternalSensorExecutionErrorData)
+        assert "womp womp" in results["sensor_error"].error.to_string()
+
+        assert isinstance(results["sensor_raises_dagster_error"], ExternalSensorExecutionErrorData)
+        assert "Dagster error" in results["sensor_raises_dagster_error"].error.to_string()
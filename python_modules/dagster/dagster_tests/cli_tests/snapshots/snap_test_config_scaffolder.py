@@ -4,6 +4,7 @@
 
 from snapshottest import Snapshot
 
+
 snapshots = Snapshot()
 
 snapshots['test_basic_solids_config 1'] = {
@@ -35,6 +36,9 @@
                     },
                     'spawn': {
                     }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
@@ -49,7 +53,11 @@
     },
     'resources': {
         'io_manager': {
-            'config': 'AnyType'
+            'config': {
+                'max_bytes': 0,
+                'release_consumed_outputs': True,
+                'spill_dir': ''
+            }
         }
     },
     'solids': {
@@ -93,6 +101,9 @@
                     },
                     'spawn': {
                     }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
@@ -107,7 +118,11 @@
     },
     'resources': {
         'io_manager': {
-            'config': 'AnyType'
+            'config': {
+                'max_bytes': 0,
+                'release_consumed_outputs': True,
+                'spill_dir': ''
+            }
         },
         'value': {
             'config': {
@@ -151,6 +166,9 @@
                     },
                     'spawn': {
                     }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
@@ -165,7 +183,11 @@
     },
     'resources': {
         'io_manager': {
-            'config': 'AnyType'
+            'config': {
+                'max_bytes': 0,
+                'release_consumed_outputs': True,
+                'spill_dir': ''
+            }
         },
         'value': {
             'config': {
@@ -1,12 +1,21 @@
 import pytest
 
-from dagster import job, op
+from dagster import Out, job, op
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.fusion import get_fused_step_keys, get_fused_successors
 from dagster._core.execution.plan.objects import StepSuccessData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.plan.prioritization import (
+    CRITICAL_PATH_PRIORITIZATION,
+    critical_path_sort_key_fn,
+    get_historical_step_durations,
+    get_remaining_path_weights,
+)
 from dagster._core.execution.retries import RetryMode
+from dagster._core.storage.tags import FUSIBLE_TAG, STEP_PRIORITIZATION_TAG
+from dagster._core.test_utils import instance_for_test
 
 
 def define_foo_job():
@@ -148,3 +157,381 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+def test_downstream_steps_resolved_by_upstream_completion():
+    @op
+    def start():
+        return 1
+
+    @op(tags={"dagster/priority": "-1"})
+    def low(x):
+        return x
+
+    @op(tags={"dagster/priority": "1"})
+    def high(x):
+        return x
+
+    @op
+    def fails(x):
+        return x
+
+    @op
+    def after_low_and_high(a, b):
+        return a + b
+
+    @op
+    def after_fails(a, b):
+        return a + b
+
+    @op
+    def after_after_fails(a):
+        return a
+
+    @job
+    def fan_job():
+        x = start()
+        a = low(x)
+        b = high(x)
+        after_low_and_high(a, b)
+        after_after_fails(after_fails(b, fails(x)))
+
+    def _succeed(active_execution, step_key):
+        active_execution.mark_step_produced_output(StepOutputHandle(step_key, "result"))
+        active_execution.mark_success(step_key)
+
+    with create_execution_plan(fan_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["start"]
+        _succeed(active_execution, "start")
+
+        # priority first, then the order of the plan
+        assert [step.key for step in active_execution.get_steps_to_execute(limit=2)] == [
+            "high",
+            "fails",
+        ]
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["low"]
+
+        _succeed(active_execution, "high")
+        active_execution.mark_failed("fails")
+        assert not active_execution.get_steps_to_execute()
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["after_fails"]
+        active_execution.mark_abandoned("after_fails")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == [
+            "after_after_fails"
+        ]
+        active_execution.mark_abandoned("after_after_fails")
+
+        _succeed(active_execution, "low")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "after_low_and_high"
+        ]
+        _succeed(active_execution, "after_low_and_high")
+        assert active_execution.is_complete
+
+
+def test_upstream_success_after_downstream_abandoned():
+    @op
+    def fails():
+        return 1
+
+    @op
+    def slow():
+        return 1
+
+    @op
+    def after_both(a, b):
+        return a + b
+
+    @job
+    def abandon_job():
+        after_both(fails(), slow())
+
+    with create_execution_plan(abandon_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "fails",
+            "slow",
+        ]
+        active_execution.mark_failed("fails")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["after_both"]
+        active_execution.mark_abandoned("after_both")
+
+        # the abandoned step is no longer waiting on the step that is still in flight
+        active_execution.mark_step_produced_output(StepOutputHandle("slow", "result"))
+        active_execution.mark_success("slow")
+        assert not active_execution.get_steps_to_execute()
+        assert active_execution.is_complete
+
+
+def _run_to_completion(active_execution, in_flight_step_keys):
+    step_keys = list(in_flight_step_keys)
+    while step_keys:
+        for step_key in step_keys:
+            active_execution.mark_step_produced_output(StepOutputHandle(step_key, "result"))
+            active_execution.mark_success(step_key)
+        step_keys = [step.key for step in active_execution.get_steps_to_execute()]
+    assert active_execution.is_complete
+
+
+def define_critical_path_job():
+    @op
+    def a_short():
+        return 1
+
+    @op
+    def b_short():
+        return 1
+
+    @op
+    def z_chain_1():
+        return 1
+
+    @op
+    def z_chain_2(x):
+        return x
+
+    @op
+    def z_chain_3(x):
+        return x
+
+    @job
+    def critical_path_job():
+        a_short()
+        b_short()
+        z_chain_3(z_chain_2(z_chain_1()))
+
+    return critical_path_job
+
+
+def test_critical_path_sort_key_fn():
+    critical_path_job = define_critical_path_job()
+    execution_plan = create_execution_plan(critical_path_job)
+
+    assert get_remaining_path_weights(execution_plan) == {
+        "a_short": 1.0,
+        "b_short": 1.0,
+        "z_chain_1": 3.0,
+        "z_chain_2": 2.0,
+        "z_chain_3": 1.0,
+    }
+
+    # without history, the longest chain of steps starts first
+    with execution_plan.start(
+        RetryMode.DISABLED, sort_key_fn=critical_path_sort_key_fn(execution_plan)
+    ) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute(limit=1)] == [
+            "z_chain_1"
+        ]
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "a_short",
+            "b_short",
+        ]
+        _run_to_completion(active_execution, ["z_chain_1", "a_short", "b_short"])
+
+    # with history, a single slow step outweighs a chain of fast ones
+    step_durations = {
+        "a_short": 0.5,
+        "b_short": 10.0,
+        "z_chain_1": 1.0,
+        "z_chain_2": 1.0,
+        "z_chain_3": 1.0,
+    }
+    sort_key_fn = critical_path_sort_key_fn(execution_plan, step_durations)
+    with execution_plan.start(RetryMode.DISABLED, sort_key_fn=sort_key_fn) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "b_short",
+            "z_chain_1",
+            "a_short",
+        ]
+        _run_to_completion(active_execution, ["b_short", "z_chain_1", "a_short"])
+
+
+def test_critical_path_respects_priority_tag():
+    @op(tags={"dagster/priority": "1"})
+    def prioritized():
+        return 1
+
+    @op
+    def chain_1():
+        return 1
+
+    @op
+    def chain_2(x):
+        return x
+
+    @job
+    def priority_job():
+        prioritized()
+        chain_2(chain_1())
+
+    execution_plan = create_execution_plan(priority_job)
+    sort_key_fn = critical_path_sort_key_fn(execution_plan)
+    with execution_plan.start(RetryMode.DISABLED, sort_key_fn=sort_key_fn) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "prioritized",
+            "chain_1",
+        ]
+        _run_to_completion(active_execution, ["prioritized", "chain_1"])
+
+
+def test_historical_step_durations():
+    critical_path_job = define_critical_path_job()
+    with instance_for_test() as instance:
+        assert get_historical_step_durations(instance, critical_path_job.name) == {}
+
+        result = critical_path_job.execute_in_process(
+            instance=instance, tags={STEP_PRIORITIZATION_TAG: CRITICAL_PATH_PRIORITIZATION}
+        )
+        assert result.success
+
+        step_durations = get_historical_step_durations(instance, critical_path_job.name)
+        assert set(step_durations.keys()) == {
+            "a_short",
+            "b_short",
+            "z_chain_1",
+            "z_chain_2",
+            "z_chain_3",
+        }
+        assert all(duration >= 0 for duration in step_durations.values())
+
+
+def test_tag_concurrency_limits():
+    @op(tags={"database": "warehouse"})
+    def query():
+        return 1
+
+    @op
+    def untagged():
+        return 1
+
+    @job
+    def tagged_job():
+        for i in range(3):
+            query.alias(f"query_{i}")()
+        untagged()
+
+    with create_execution_plan(tagged_job).start(
+        RetryMode.DISABLED,
+        tag_concurrency_limits=[{"key": "database", "value": "warehouse", "limit": 2}],
+    ) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "query_0",
+            "query_1",
+            "untagged",
+        ]
+        # held back until one of the in flight steps with the same tag completes
+        assert not active_execution.get_steps_to_execute()
+        active_execution.mark_step_produced_output(StepOutputHandle("query_0", "result"))
+        active_execution.mark_success("query_0")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["query_2"]
+        _run_to_completion(active_execution, ["query_1", "query_2", "untagged"])
+
+
+def define_fusible_job():
+    fusible = {FUSIBLE_TAG: "true"}
+
+    @op(tags=fusible)
+    def extract():
+        return 1
+
+    @op(tags=fusible)
+    def transform(x):
+        return x
+
+    @op(tags=fusible)
+    def load(x):
+        return x
+
+    @op(tags=fusible, out={"a": Out(), "b": Out(is_required=False)})
+    def split():
+        yield from []
+
+    @op(tags=fusible)
+    def after_optional(b):
+        return b
+
+    @op
+    def not_fusible(a):
+        return a
+
+    @op(tags=fusible)
+    def after_not_fusible(x):
+        return x
+
+    @job
+    def fusible_job():
+        load(transform(extract()))
+        a, b = split()
+        after_optional(b)
+        after_not_fusible(not_fusible(a))
+
+    return fusible_job
+
+
+def test_fused_successors():
+    execution_plan = create_execution_plan(define_fusible_job())
+    fused_successors = get_fused_successors(execution_plan)
+    assert fused_successors == {"extract": "transform", "transform": "load"}
+    assert get_fused_step_keys(fused_successors, "extract") == ["transform", "load"]
+    assert get_fused_step_keys(fused_successors, "transform") == ["load"]
+    assert get_fused_step_keys(fused_successors, "load") == []
+
+    subset_plan = execution_plan.build_subset_plan(
+        ["transform", "load"], define_fusible_job(), None, mode="default"
+    )
+    assert get_fused_successors(subset_plan) == {"transform": "load"}
+
+
+def test_claim_fused_steps():
+    with create_execution_plan(define_fusible_job()).start(RetryMode.ENABLED) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["extract", "split"]
+        assert active_execution.claim_fused_steps(["transform", "load"]) == ["transform", "load"]
+        # already claimed
+        assert active_execution.claim_fused_steps(["transform"]) == []
+
+        active_execution.mark_step_produced_output(StepOutputHandle("extract", "result"))
+        active_execution.mark_success("extract")
+        # claimed steps are in flight as soon as their upstream step succeeds, rather than vended
+        assert active_execution.is_in_flight("transform")
+        assert not active_execution.is_in_flight("load")
+        assert not active_execution.get_steps_to_execute()
+
+        # once released, steps that did not start are executed on their own
+        active_execution.mark_up_for_retry("transform")
+        active_execution.release_fused_steps(["transform", "load"])
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["transform"]
+        assert active_execution.claim_fused_steps(["load"]) == ["load"]
+        active_execution.mark_step_produced_output(StepOutputHandle("transform", "result"))
+        active_execution.mark_success("transform")
+        active_execution.mark_step_produced_output(StepOutputHandle("load", "result"))
+        active_execution.mark_success("load")
+        active_execution.release_fused_steps(["load"])
+
+        active_execution.mark_step_produced_output(StepOutputHandle("split", "a"))
+        active_execution.mark_success("split")
+        assert [step.key for step in active_execution.get_steps_to_skip()] == ["after_optional"]
+        active_execution.mark_skipped("after_optional")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["not_fusible"]
+        _run_to_completion(active_execution, ["not_fusible"])
+
+
+def test_release_fused_steps_after_failure():
+    with create_execution_plan(define_fusible_job()).start(RetryMode.DISABLED) as active_execution:
+        active_execution.get_steps_to_execute()
+        assert active_execution.claim_fused_steps(["transform", "load"]) == ["transform", "load"]
+        active_execution.mark_failed("extract")
+        active_execution.release_fused_steps(["transform", "load"])
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["transform"]
+        active_execution.mark_abandoned("transform")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["load"]
+        active_execution.mark_abandoned("load")
+        active_execution.mark_success("split")
+        assert [step.key for step in active_execution.get_steps_to_skip()] == [
+            "after_optional",
+            "not_fusible",
+        ]
+        active_execution.mark_skipped("after_optional")
+        active_execution.mark_skipped("not_fusible")
+        assert [step.key for step in active_execution.get_steps_to_skip()] == ["after_not_fusible"]
+        active_execution.mark_skipped("after_not_fusible")
+        assert active_execution.is_complete
@@ -1,4 +1,6 @@
 import re
+import time
+from unittest import mock
 
 import pytest
 import yaml
@@ -14,8 +16,13 @@
     DagsterInvariantViolationError,
 )
 from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.plan_cache import (
+    DEFAULT_EXECUTION_PLAN_CACHE_SIZE,
+    get_execution_plan_cache_max_size,
+)
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
+from dagster._core.instance.snapshot_cache import DEFAULT_SNAPSHOT_CACHE_MAX_BYTES
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster._core.secrets.env_file import EnvFileLoader
@@ -24,6 +31,7 @@
     create_pipeline_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster._core.storage.pipeline_run import PipelineRunStatus
 from dagster._core.test_utils import (
     TestSecretsLoader,
     create_run_for_test,
@@ -31,7 +39,7 @@
     instance_for_test,
 )
 from dagster._legacy import PipelineDefinition
-from dagster._serdes import ConfigurableClass
+from dagster._serdes import ConfigurableClass, serialize_value_to_bytes
 from dagster._serdes.config_class import ConfigurableClassData
 
 
@@ -162,6 +170,49 @@ def test_create_execution_plan_snapshot():
         assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
 
 
+def test_snapshots_cached_on_instance():
+    with instance_for_test() as instance:
+        snapshot = noop_job.get_pipeline_snapshot()
+        snapshot_id = create_pipeline_snapshot_id(snapshot)
+        instance.add_snapshot(snapshot, snapshot_id)
+
+        with mock.patch.object(
+            instance._run_storage,  # pylint: disable=protected-access
+            "get_pipeline_snapshot",
+            wraps=instance._run_storage.get_pipeline_snapshot,  # pylint: disable=protected-access
+        ) as get_pipeline_snapshot:
+            assert instance.get_pipeline_snapshot(snapshot_id) == snapshot
+            assert instance.get_pipeline_snapshot(snapshot_id) == snapshot
+            assert instance.get_historical_pipeline(snapshot_id).pipeline_snapshot == snapshot
+            assert get_pipeline_snapshot.call_count == 1
+
+            instance.wipe()
+            assert instance.get_pipeline_snapshot(snapshot_id) is None
+            assert get_pipeline_snapshot.call_count == 2
+
+
+def test_snapshot_cache_settings():
+    with instance_for_test() as instance:
+        assert instance.snapshot_cache_max_bytes == DEFAULT_SNAPSHOT_CACHE_MAX_BYTES
+
+    with instance_for_test(overrides={"snapshots": {"cache_max_bytes": 0}}) as instance:
+        assert instance.snapshot_cache_max_bytes == 0
+
+        snapshot = noop_job.get_pipeline_snapshot()
+        snapshot_id = create_pipeline_snapshot_id(snapshot)
+        instance.add_snapshot(snapshot, snapshot_id)
+
+        with mock.patch.object(
+            instance._run_storage,  # pylint: disable=protected-access
+            "get_pipeline_snapshot",
+            wraps=instance._run_storage.get_pipeline_snapshot,  # pylint: disable=protected-access
+        ) as get_pipeline_snapshot:
+            # nothing fits in a cache of 0 bytes
+            assert instance.get_pipeline_snapshot(snapshot_id) == snapshot
+            assert instance.get_pipeline_snapshot(snapshot_id) == snapshot
+            assert get_pipeline_snapshot.call_count == 2
+
+
 def test_submit_run():
     with instance_for_test(
         overrides={
@@ -192,6 +243,67 @@ def test_submit_run():
             assert instance.run_coordinator.queue()[0].run_id == "foo-bar"
 
 
+def test_create_and_submit_runs_bulk():
+    with instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster._core.test_utils",
+                "class": "MockedRunCoordinator",
+            }
+        }
+    ) as instance:
+        with get_bar_workspace(instance) as workspace:
+            external_pipeline = (
+                workspace.get_repository_location("bar_repo_location")
+                .get_repository("bar_repo")
+                .get_full_external_job("foo")
+            )
+
+            create_run_args = [
+                dict(
+                    pipeline_name=external_pipeline.name,
+                    run_id=f"foo-bar-{i}",
+                    run_config=None,
+                    mode="default",
+                    solids_to_execute=None,
+                    step_keys_to_execute=None,
+                    status=PipelineRunStatus.NOT_STARTED,
+                    tags={"partition": str(i)},
+                    root_run_id=None,
+                    parent_run_id=None,
+                    pipeline_snapshot=external_pipeline.pipeline_snapshot,
+                    execution_plan_snapshot=None,
+                    parent_pipeline_snapshot=None,
+                    external_pipeline_origin=external_pipeline.get_external_origin(),
+                    pipeline_code_origin=external_pipeline.get_python_origin(),
+                )
+                for i in range(3)
+            ]
+
+            with mock.patch.object(
+                instance,
+                "_ensure_persisted_pipeline_snapshot",
+                wraps=instance._ensure_persisted_pipeline_snapshot,  # pylint: disable=protected-access
+            ) as ensure_persisted_pipeline_snapshot:
+                runs = instance.create_runs_bulk(create_run_args)
+                # the snapshot shared by the runs is only persisted once
+                assert ensure_persisted_pipeline_snapshot.call_count == 1
+
+            assert [run.run_id for run in runs] == ["foo-bar-0", "foo-bar-1", "foo-bar-2"]
+            assert instance.get_runs_count() == 3
+            assert instance.get_run_by_id("foo-bar-1").tags == {"partition": "1"}
+
+            submitted_runs = instance.submit_runs_bulk(
+                ["foo-bar-2", "foo-bar-0", "foo-bar-1"], workspace
+            )
+            assert [run.run_id for run in submitted_runs] == ["foo-bar-2", "foo-bar-0", "foo-bar-1"]
+            assert [run.run_id for run in instance.run_coordinator.queue()] == [
+                "foo-bar-2",
+                "foo-bar-0",
+                "foo-bar-1",
+            ]
+
+
 def test_get_required_daemon_types():
     from dagster._daemon.daemon import (
         BackfillDaemon,
@@ -330,6 +442,95 @@ def test_cancellation_thread():
         assert instance.cancellation_thread_poll_interval_seconds == 10
 
 
+def test_event_log_batching():
+    @op
+    def log_op(context):
+        for i in range(10):
+            context.log.info(f"message {i}")
+
+    @job
+    def log_job():
+        log_op()
+
+    with instance_for_test() as instance:
+        assert not instance.event_log_batching_enabled
+        unbatched_result = log_job.execute_in_process(instance=instance)
+        unbatched_logs = instance.all_logs(unbatched_result.run_id)
+
+    with instance_for_test(
+        overrides={"event_log_batching": {"enabled": True, "max_batch_size": 5}}
+    ) as instance:
+        assert instance.event_log_batching_enabled
+        result = log_job.execute_in_process(instance=instance)
+        assert result.success
+        logs = instance.all_logs(result.run_id)
+        assert [log.dagster_event_type for log in logs] == [
+            log.dagster_event_type for log in unbatched_logs
+        ]
+        assert [log.user_message for log in logs if not log.is_dagster_event] == [
+            f"message {i}" for i in range(10)
+        ]
+
+    with instance_for_test(
+        overrides={"event_log_batching": {"enabled": True, "max_batch_interval_seconds": 300}}
+    ) as instance:
+        run = create_run_for_test(instance, pipeline_name="foo")
+        instance.report_engine_event("held back", run)
+        # engine events are not step boundaries, so they sit in the buffer until a flush
+        assert not instance.event_log_storage.get_logs_for_run(run.run_id)
+        assert len(instance.all_logs(run.run_id)) == 1
+
+    with instance_for_test(
+        overrides={"event_log_batching": {"enabled": True, "max_batch_interval_seconds": 0.5}}
+    ) as instance:
+        run = create_run_for_test(instance, pipeline_name="foo")
+        instance.report_engine_event("held back", run)
+        assert not instance.event_log_storage.get_logs_for_run(run.run_id)
+
+        # written once the interval elapses, without waiting for another event or a read
+        start_time = time.time()
+        while not instance.event_log_storage.get_logs_for_run(run.run_id):
+            assert time.time() - start_time < 10
+            time.sleep(0.1)
+
+
+def test_binary_snapshot_encoding():
+    snapshot = noop_job.get_pipeline_snapshot()
+    snapshot_id = create_pipeline_snapshot_id(snapshot)
+
+    with instance_for_test() as instance:
+        assert not instance.binary_snapshot_encoding_enabled
+        with mock.patch(
+            "dagster._core.storage.runs.sql_run_storage.serialize_value_to_bytes",
+            wraps=serialize_value_to_bytes,
+        ) as serialize:
+            instance.add_snapshot(snapshot, snapshot_id)
+            assert serialize.call_count == 0
+
+    with instance_for_test(overrides={"snapshots": {"binary_encoding": True}}) as instance:
+        assert instance.binary_snapshot_encoding_enabled
+        with mock.patch(
+            "dagster._core.storage.runs.sql_run_storage.serialize_value_to_bytes",
+            wraps=serialize_value_to_bytes,
+        ) as serialize:
+            instance.add_snapshot(snapshot, snapshot_id)
+            assert serialize.call_count == 1
+        assert instance.get_pipeline_snapshot(snapshot_id) == snapshot
+
+
+def test_execution_plan_cache_settings():
+    with instance_for_test() as instance:
+        assert instance.execution_plan_cache_max_size == DEFAULT_EXECUTION_PLAN_CACHE_SIZE
+        assert get_execution_plan_cache_max_size(instance.get_ref().settings) == (
+            DEFAULT_EXECUTION_PLAN_CACHE_SIZE
+        )
+
+    with instance_for_test(overrides={"execution_plan_cache": {"max_size": 4}}) as instance:
+        assert instance.execution_plan_cache_max_size == 4
+        # code servers only have the ref of the instance that they are planning for
+        assert get_execution_plan_cache_max_size(instance.get_ref().settings) == 4
+
+
 def test_dagster_home_not_set():
     with environ({"DAGSTER_HOME": ""}):
         with pytest.raises(
@@ -0,0 +1,69 @@
+from dagster._core.instance.snapshot_cache import (
+    EXECUTION_PLAN_SNAPSHOT_KIND,
+    PIPELINE_SNAPSHOT_KIND,
+    SnapshotCache,
+    approximate_size,
+    snapshot_cache_key,
+)
+
+
+def test_approximate_size():
+    shared = ["a" * 1000]
+    assert approximate_size((shared, shared)) < 2 * approximate_size(shared)
+    assert approximate_size({"key": shared}) > approximate_size(shared)
+
+
+def test_evicts_least_recently_used():
+    value_size = approximate_size(("x" * 100,))
+    cache = SnapshotCache(max_bytes=value_size * 2)
+
+    cache.put("a", ("a" * 100,))
+    cache.put("b", ("b" * 100,))
+    assert cache.get("a") == ("a" * 100,)
+
+    cache.put("c", ("c" * 100,))
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.size_bytes == value_size * 2
+
+
+def test_does_not_cache_oversized_values():
+    cache = SnapshotCache(max_bytes=100)
+    cache.put("big", ("x" * 1000,))
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_get_or_load():
+    loaded = []
+
+    def _load(snapshot_id):
+        loaded.append(snapshot_id)
+        return None if snapshot_id == "missing" else (snapshot_id,)
+
+    cache = SnapshotCache(max_bytes=1024 * 1024)
+    assert cache.get_or_load(PIPELINE_SNAPSHOT_KIND, "a", _load) == ("a",)
+    assert cache.get_or_load(PIPELINE_SNAPSHOT_KIND, "a", _load) == ("a",)
+    assert cache.get_or_load(PIPELINE_SNAPSHOT_KIND, "missing", _load) is None
+    assert cache.get_or_load(PIPELINE_SNAPSHOT_KIND, "missing", _load) is None
+    assert loaded == ["a", "missing", "missing"]
+
+    cache.clear()
+    assert cache.get_or_load(PIPELINE_SNAPSHOT_KIND, "a", _load) == ("a",)
+    assert loaded == ["a", "missing", "missing", "a"]
+
+
+def test_keyed_by_snapshot_kind():
+    cache = SnapshotCache(max_bytes=1024 * 1024)
+    assert cache.get_or_load(PIPELINE_SNAPSHOT_KIND, "a", lambda _: ("pipeline",)) == ("pipeline",)
+    assert cache.get_or_load(EXECUTION_PLAN_SNAPSHOT_KIND, "a", lambda _: ("plan",)) == ("plan",)
+    assert cache.get_or_load(PIPELINE_SNAPSHOT_KIND, "a", lambda _: None) == ("pipeline",)
+    assert snapshot_cache_key(PIPELINE_SNAPSHOT_KIND, "a") in cache
+    assert "a" not in cache
+
+
+def test_disabled():
+    cache = SnapshotCache(max_bytes=0)
+    cache.put("a", ("a",))
+    assert cache.get("a") is None
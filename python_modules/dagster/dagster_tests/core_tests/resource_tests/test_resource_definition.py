@@ -16,6 +16,7 @@
     ResourceDefinition,
     String,
     build_op_context,
+    build_resources,
     configured,
     execute_job,
     fs_io_manager,
@@ -30,6 +31,7 @@
 from dagster._core.errors import DagsterConfigMappingFunctionError, DagsterInvalidDefinitionError
 from dagster._core.events.log import EventLogEntry, construct_event_logger
 from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.resources_init import reusable_resource_scope
 from dagster._core.instance import DagsterInstance
 from dagster._core.test_utils import instance_for_test
 from dagster._core.utils import coerce_valid_log_level
@@ -1184,3 +1186,72 @@ def call_basic():
 
     assert call_basic.execute_in_process(resources={"cm": cm_resource}).success
     assert event_list == ["foo", "compute", "finally"]
+
+
+def test_reusable_resource_scope():
+    called = []
+
+    @resource(reusable=True)
+    def pool():
+        called.append("init pool")
+        yield "pool"
+        called.append("teardown pool")
+
+    @resource(required_resource_keys={"pool"}, reusable=True)
+    def client(init_context):
+        called.append("init client")
+        yield f"client of {init_context.resources.pool}"
+        called.append("teardown client")
+
+    @resource(required_resource_keys={"client"}, reusable=True)
+    def session(init_context):
+        called.append("init session")
+        return f"session of {init_context.resources.client}"
+
+    assert pool.reusable
+    assert pool.configured({}).reusable
+
+    resource_defs = {"pool": pool, "client": client, "session": session}
+    with reusable_resource_scope():
+        for _ in range(2):
+            with build_resources(resource_defs) as resources:
+                assert resources.session == "session of client of pool"
+        assert called == ["init pool", "init client", "init session"]
+
+    # torn down in the reverse order of initialization once the scope exits
+    assert called == [
+        "init pool",
+        "init client",
+        "init session",
+        "teardown client",
+        "teardown pool",
+    ]
+
+    # outside of the scope, reusable resources are initialized every time
+    called.clear()
+    for _ in range(2):
+        with build_resources({"pool": pool}):
+            pass
+    assert called == ["init pool", "teardown pool"] * 2
+
+
+def test_reusable_resource_with_per_use_dependency():
+    called = []
+
+    @resource
+    def per_use():
+        called.append("init per_use")
+        return "per_use"
+
+    @resource(required_resource_keys={"per_use"}, reusable=True)
+    def depends_on_per_use(init_context):
+        called.append("init depends_on_per_use")
+        return init_context.resources.per_use
+
+    with reusable_resource_scope():
+        for _ in range(2):
+            with build_resources({"per_use": per_use, "dependent": depends_on_per_use}):
+                pass
+
+    # a reusable resource that depends on a resource that is not reusable is not reused
+    assert called == ["init per_use", "init depends_on_per_use"] * 2
@@ -147,6 +147,36 @@ def test_submit_run(
         stored_run = instance.get_run_by_id("foo-1")
         assert stored_run.status == PipelineRunStatus.QUEUED
 
+    def test_submit_runs(
+        self, instance, coordinator, workspace, external_pipeline
+    ):  # pylint: disable=redefined-outer-name
+        runs = [
+            self.create_run(
+                instance, external_pipeline, run_id="foo-1", status=PipelineRunStatus.NOT_STARTED
+            ),
+            self.create_run(
+                instance, external_pipeline, run_id="foo-2", status=PipelineRunStatus.NOT_STARTED
+            ),
+            self.create_run(
+                instance, external_pipeline, run_id="foo-3", status=PipelineRunStatus.QUEUED
+            ),
+        ]
+        returned_runs = coordinator.submit_runs([SubmitRunContext(run, workspace) for run in runs])
+        assert [run.run_id for run in returned_runs] == ["foo-1", "foo-2", "foo-3"]
+        assert all(run.status == PipelineRunStatus.QUEUED for run in returned_runs)
+
+        assert len(instance.run_launcher.queue()) == 0
+        for run_id, num_enqueued_events in [("foo-1", 1), ("foo-2", 1), ("foo-3", 0)]:
+            assert instance.get_run_by_id(run_id).status == PipelineRunStatus.QUEUED
+            assert (
+                len(
+                    instance.get_records_for_run(
+                        run_id, of_type=DagsterEventType.PIPELINE_ENQUEUED
+                    ).records
+                )
+                == num_enqueued_events
+            )
+
     def test_submit_run_checks_status(
         self, instance, coordinator, workspace, external_pipeline
     ):  # pylint: disable=redefined-outer-name
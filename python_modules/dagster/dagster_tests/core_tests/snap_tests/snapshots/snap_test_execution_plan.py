@@ -21,7 +21,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "2c112622b04a96d4234e28c68255845947d4c047",
+  "pipeline_snapshot_id": "7d2c11a475826186dfb9496da8a98f12bf389d7c",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "op_one",
@@ -155,7 +155,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "26031b75270b933a1e23b3ba1d51a2f656ecfb06",
+  "pipeline_snapshot_id": "8bc66a71547cd6e6a7f61e8854c1c90b4ee132dd",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -218,7 +218,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "27b36f3f2ee86db47a1d775af6623978f08057ae",
+  "pipeline_snapshot_id": "0736751be2d5129ce41270644c3b798b587277d6",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -295,7 +295,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "f0f5868a704d2383fb5c1b87f636dec04664d7b1",
+  "pipeline_snapshot_id": "985e6a4610e92140c0a52c235ca7cbcab553ea62",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
@@ -4,7 +4,8 @@
 
 from dagster._core.storage.runs.sql_run_storage import defensively_unpack_pipeline_snapshot_query
 from dagster._legacy import pipeline, solid
-from dagster._serdes import serialize_dagster_namedtuple
+from dagster._serdes import serialize_dagster_namedtuple, serialize_value_to_bytes
+from dagster._serdes.serdes import MSGPACK_V1_HEADER
 
 
 def test_defensive_pipeline_not_a_string():
@@ -96,3 +97,39 @@ def noop_pipeline():
     )
 
     assert mock_logger.warning.call_count == 0
+
+
+def test_correctly_fetch_decompress_parse_binary_snapshot():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    noop_pipeline_snapshot = noop_pipeline.get_pipeline_snapshot()
+
+    mock_logger = mock.MagicMock()
+    assert (
+        defensively_unpack_pipeline_snapshot_query(
+            mock_logger, [zlib.compress(serialize_value_to_bytes(noop_pipeline_snapshot))]
+        )
+        == noop_pipeline_snapshot
+    )
+    assert mock_logger.warning.call_count == 0
+
+
+def test_defensive_pipelines_cannot_parse_binary():
+    mock_logger = mock.MagicMock()
+
+    assert (
+        defensively_unpack_pipeline_snapshot_query(
+            mock_logger, [zlib.compress(MSGPACK_V1_HEADER + b"\xc1")]
+        )
+        is None
+    )
+    assert mock_logger.warning.call_count == 1
+    mock_logger.warning.assert_called_with(
+        "get-pipeline-snapshot: Could not parse binary encoded snapshot in snapshot table."
+    )
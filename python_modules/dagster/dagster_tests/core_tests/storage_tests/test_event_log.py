@@ -2,6 +2,7 @@
 import os
 import sys
 import tempfile
+import time
 import traceback
 
 import pytest
@@ -15,9 +16,11 @@
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.sql import create_engine
+from dagster._core.utils import make_new_run_id
 
-from .utils.event_log_storage import TestEventLogStorage
+from .utils.event_log_storage import TestEventLogStorage, create_test_event_log_record
 
 
 class TestInMemoryEventLogStorage(TestEventLogStorage):
@@ -81,6 +84,26 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data(self, storage):
         with pytest.raises(DagsterEventLogInvalidForRun):
             storage.get_logs_for_run("bar")
 
+    def test_watch_offset_cursor(self, storage):
+        run_id = make_new_run_id()
+        watched = []
+
+        for i in range(3):
+            storage.store_event(create_test_event_log_record(str(i), run_id))
+
+        # offset cursors are resolved to the storage id of the last record already seen
+        storage.watch(
+            run_id, str(EventLogCursor.from_offset(2)), lambda event, _: watched.append(event)
+        )
+        storage.store_event(create_test_event_log_record(str(3), run_id))
+
+        attempts = 10
+        while len(watched) < 2 and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        assert [int(evt.user_message) for evt in watched] == [2, 3]
+
     def cmd(self, exceptions, tmpdir_path):
         storage = SqliteEventLogStorage(tmpdir_path)
         try:
@@ -34,7 +34,11 @@
 from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.storage.fs_io_manager import custom_path_fs_io_manager, fs_io_manager
 from dagster._core.storage.io_manager import IOManager, io_manager
-from dagster._core.storage.mem_io_manager import InMemoryIOManager, mem_io_manager
+from dagster._core.storage.mem_io_manager import (
+    InMemoryIOManager,
+    is_mem_io_manager,
+    mem_io_manager,
+)
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.test_utils import instance_for_test
 from dagster._legacy import (
@@ -516,6 +520,144 @@ def test_mem_io_manager_execution():
     assert mem_io_manager_instance.load_input(input_context) == 1
 
 
+def test_mem_io_manager_spills_to_budget():
+    with tempfile.TemporaryDirectory() as spill_dir:
+        manager = InMemoryIOManager(max_bytes=2500, spill_dir=spill_dir)
+        output_contexts = [
+            build_output_context(step_key=f"step_{i}", name="result") for i in range(3)
+        ]
+        for i, output_context in enumerate(output_contexts):
+            manager.handle_output(output_context, bytes([i]) * 1000)
+
+        # the least recently stored value no longer fits the budget
+        assert manager.num_bytes <= 2500
+        assert manager.is_spilled(tuple(output_contexts[0].get_identifier()))
+        assert not manager.is_spilled(tuple(output_contexts[2].get_identifier()))
+        assert len(os.listdir(spill_dir)) == 1
+
+        for i, output_context in enumerate(output_contexts):
+            input_context = build_input_context(upstream_output=output_context)
+            assert manager.load_input(input_context) == bytes([i]) * 1000
+
+        manager.cleanup()
+        assert not os.listdir(spill_dir)
+
+
+def test_mem_io_manager_spills_containers_to_budget():
+    with tempfile.TemporaryDirectory() as spill_dir:
+        manager = InMemoryIOManager(max_bytes=2500, spill_dir=spill_dir)
+        output_contexts = [
+            build_output_context(step_key=f"step_{i}", name="result") for i in range(2)
+        ]
+        for i, output_context in enumerate(output_contexts):
+            # the container itself is small, but the items it holds are counted
+            manager.handle_output(output_context, [bytearray([i]) * 1000, bytearray([i]) * 1000])
+
+        assert manager.num_bytes <= 2500
+        assert manager.is_spilled(tuple(output_contexts[0].get_identifier()))
+        assert not manager.is_spilled(tuple(output_contexts[1].get_identifier()))
+
+        input_context = build_input_context(upstream_output=output_contexts[0])
+        assert manager.load_input(input_context) == [bytearray([0]) * 1000] * 2
+
+        manager.cleanup()
+
+
+def test_mem_io_manager_releases_consumed_outputs():
+    manager = InMemoryIOManager(release_consumed_outputs=True)
+    values_in_memory = {}
+
+    @op
+    def emit():
+        return 1
+
+    @op
+    def add_one(x):
+        values_in_memory["add_one"] = len(manager.values)
+        return x + 1
+
+    @op
+    def add_two(x):
+        values_in_memory["add_two"] = len(manager.values)
+        return x + 2
+
+    @op
+    def total(a, b):
+        values_in_memory["total"] = len(manager.values)
+        return a + b
+
+    @job(resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(manager)})
+    def release_job():
+        x = emit()
+        total(add_one(x), add_two(x))
+
+    result = release_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("total") == 5
+
+    # the output of emit is held until both of the steps that load it have loaded it
+    assert values_in_memory == {"add_one": 1, "add_two": 1, "total": 0}
+    assert not manager.values
+
+
+def test_mem_io_manager_keeps_outputs_with_unresolved_consumers():
+    manager = InMemoryIOManager(release_consumed_outputs=True)
+
+    @op(out=DynamicOut())
+    def fan_out():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(x):
+        return x * 2
+
+    @op
+    def total(xs):
+        return sum(xs)
+
+    @job(resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(manager)})
+    def dynamic_job():
+        total(fan_out().map(double).collect())
+
+    result = dynamic_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("total") == 2
+
+    # the dynamic outputs are consumed by steps that were not yet resolved when they were stored
+    assert {keys[1] for keys in manager.values.keys()} == {"fan_out"}
+
+
+def test_configured_mem_io_manager():
+    @op
+    def emit():
+        return list(range(100))
+
+    @op
+    def total(xs):
+        return sum(xs)
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+
+        @job(
+            resource_defs={
+                "io_manager": mem_io_manager.configured(
+                    {"max_bytes": 0, "spill_dir": spill_dir, "release_consumed_outputs": True}
+                )
+            }
+        )
+        def configured_job():
+            total(emit())
+
+        result = configured_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("total") == sum(range(100))
+        assert not os.listdir(spill_dir)
+
+    # configured versions are still treated as in memory, e.g. when checking which executors apply
+    assert is_mem_io_manager(mem_io_manager.configured({"max_bytes": 0}))
+
+
 def test_io_manager_resources_on_context():
     @resource
     def foo_resource(_):
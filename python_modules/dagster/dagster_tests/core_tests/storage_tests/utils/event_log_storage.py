@@ -43,7 +43,11 @@
 from dagster._core.execution.api import execute_run
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import (
+    StepEventStatus,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.host_representation.origin import (
     ExternalPipelineOrigin,
     ExternalRepositoryOrigin,
@@ -53,6 +57,7 @@
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_STATS_TABLES,
     migrate_asset_key_data,
 )
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
@@ -446,6 +451,62 @@ def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
             for run in runs:
                 instance.delete_run(run)
 
+    def test_store_event_batch(self, storage, instance):
+        asset_key = AssetKey("batched_asset")
+
+        @op
+        def materialize_one(context):
+            context.log.info("before")
+            yield AssetMaterialization(asset_key=asset_key, tags={"dagster/foo": "bar"})
+            context.log.info("after")
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: materialize_one(), run_id)
+            storage.store_event_batch(events)
+
+            logs = storage.get_logs_for_run(run_id)
+            assert [log.dagster_event_type for log in logs] == [
+                event.dagster_event_type for event in events
+            ]
+            assert [log.user_message for log in logs] == [event.user_message for event in events]
+
+            assert asset_key in set(storage.all_asset_keys())
+            records = storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                )
+            )
+            assert len(records) == 1
+            assert storage.get_event_tags_for_asset(asset_key) == [{"dagster/foo": "bar"}]
+
+    def test_store_event_batch_asset_rows_rolled_back(self, storage, instance):
+        asset_key = AssetKey("batched_asset_rolled_back")
+
+        @op
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key, tags={"dagster/foo": "bar"})
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: materialize_one(), run_id)
+            with mock.patch.object(
+                type(storage), "_store_asset_event_tags", side_effect=Exception("tags failed")
+            ):
+                with pytest.raises(Exception, match="tags failed"):
+                    storage.store_event_batch(events)
+
+            # the asset index rows are written in the same transaction as the asset events
+            assert asset_key not in set(storage.all_asset_keys())
+            records = storage.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                )
+            )
+            assert len(records) == 0
+
     def test_event_log_storage_watch(self, test_run_id, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -489,6 +550,38 @@ def test_event_log_storage_watch(self, test_run_id, storage):
 
         assert [int(evt.user_message) for evt in watched] == [2, 3, 4]
 
+    def test_event_log_storage_watch_shared_run(self, test_run_id, storage):
+        if not self.can_watch():
+            pytest.skip("storage cannot watch runs")
+
+        watched_1 = []
+        watched_2 = []
+
+        storage.store_event(create_test_event_log_record(str(1), test_run_id))
+        storage.watch(
+            test_run_id,
+            storage.get_records_for_run(test_run_id).cursor,
+            lambda event, _cursor: watched_1.append(event),
+        )
+
+        storage.store_event(create_test_event_log_record(str(2), test_run_id))
+        storage.store_event(create_test_event_log_record(str(3), test_run_id))
+
+        watch_two = lambda event, _cursor: watched_2.append(event)
+        storage.watch(test_run_id, storage.get_records_for_run(test_run_id).cursor, watch_two)
+
+        storage.store_event(create_test_event_log_record(str(4), test_run_id))
+
+        attempts = 10
+        while (len(watched_1) < 3 or len(watched_2) < 1) and attempts > 0:
+            time.sleep(0.5)
+            attempts -= 1
+
+        assert [int(evt.user_message) for evt in watched_1] == [2, 3, 4]
+        assert [int(evt.user_message) for evt in watched_2] == [4]
+
+        storage.end_watch(test_run_id, watch_two)
+
     def test_event_log_storage_pagination(self, test_run_id, instance, storage):
         with create_and_delete_test_runs(instance, ["other_run"]):
             # two runs events to ensure pagination is not affected by other runs
@@ -1205,6 +1298,106 @@ def _pipeline():
         assert len(step_stats[0].markers) == 1
         assert step_stats[0].markers[0].end_time >= step_stats[0].markers[0].start_time + 0.1
 
+    def test_run_stats_tables(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        assert storage.has_secondary_index(RUN_STATS_TABLES)
+
+        @solid(required_resource_keys={"foo"})
+        def materialize(_):
+            yield AssetMaterialization(asset_key="stats_asset")
+            yield ExpectationResult(success=True, label="stats_expectation")
+            yield Output("a")
+
+        @solid(input_defs=[InputDefinition("_input", str)])
+        def should_retry(_, _input):
+            raise RetryRequested(max_retries=2)
+
+        def _pipeline():
+            should_retry(materialize())
+
+        events, result = _synthesize_events(_pipeline, check_success=False, run_id=test_run_id)
+
+        # store some events individually and the rest as a batch, to exercise both write paths
+        for event in events[:10]:
+            storage.store_event(event)
+        storage.store_event_batch(events[10:])
+
+        expected_run_stats = build_run_stats_from_events(result.run_id, events)
+        expected_step_stats = build_run_step_stats_from_events(result.run_id, events)
+
+        assert storage.get_stats_for_run(result.run_id) == expected_run_stats
+        assert storage.get_step_stats_for_run(result.run_id) == expected_step_stats
+        assert storage.get_step_stats_for_run(result.run_id, step_keys=["should_retry"]) == [
+            step_stats
+            for step_stats in expected_step_stats
+            if step_stats.step_key == "should_retry"
+        ]
+
+        run_stats = storage.get_stats_for_run(result.run_id)
+        assert run_stats.steps_succeeded == 1
+        assert run_stats.steps_failed == 1
+        assert run_stats.materializations == 1
+        assert run_stats.expectations == 1
+
+        # rebuilding the stats from the event log (as the data migration does) is idempotent
+        storage.rebuild_run_stats(result.run_id)
+        assert storage.get_stats_for_run(result.run_id) == expected_run_stats
+        assert storage.get_step_stats_for_run(result.run_id) == expected_step_stats
+
+        storage.delete_events(result.run_id)
+        assert storage.get_stats_for_run(result.run_id).steps_succeeded == 0
+        assert storage.get_step_stats_for_run(result.run_id) == []
+
+    def test_run_stats_written_with_events(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        events, _ = _synthesize_events(return_one_solid_func, run_id=test_run_id)
+        stats_events = [
+            event for event in events if event.dagster_event_type == DagsterEventType.STEP_START
+        ]
+        assert stats_events
+
+        # the stats rows are written in the same transaction as the events, so a failed stats
+        # write leaves neither behind
+        with mock.patch.object(
+            type(storage), "_upsert_stats_row", side_effect=Exception("stats failed")
+        ):
+            with pytest.raises(Exception, match="stats failed"):
+                storage.store_event(stats_events[0])
+            with pytest.raises(Exception, match="stats failed"):
+                storage.store_event_batch(stats_events)
+
+        assert storage.get_logs_for_run(test_run_id) == []
+        assert storage.get_step_stats_for_run(test_run_id) == []
+
+    def test_run_stats_written_before_migration(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        events, result = _synthesize_events(return_one_solid_func, run_id=test_run_id)
+
+        # processes that started before the data migration completed still write the stats rows,
+        # so that the rows are complete once reads switch over to them
+        has_secondary_index = storage.has_secondary_index
+        with mock.patch.object(
+            type(storage),
+            "has_secondary_index",
+            side_effect=lambda name: name != RUN_STATS_TABLES and has_secondary_index(name),
+        ):
+            for event in events[:3]:
+                storage.store_event(event)
+            storage.store_event_batch(events[3:])
+
+        assert storage.get_stats_for_run(result.run_id) == build_run_stats_from_events(
+            result.run_id, events
+        )
+        assert storage.get_step_stats_for_run(result.run_id) == build_run_step_stats_from_events(
+            result.run_id, events
+        )
+
     @pytest.mark.parametrize(
         "cursor_dt", cursor_datetime_args()
     )  # test both tz-aware and naive datetimes
@@ -2349,6 +2542,50 @@ def _ops():
             DagsterEventType.STEP_SUCCESS,
         ]
 
+    def test_iter_logs_for_all_runs_by_log_id(self, storage):
+        if not storage.supports_event_consumer_queries():
+            pytest.skip("storage does not support event consumer queries")
+
+        @op
+        def return_one(_):
+            return 1
+
+        def _ops():
+            return_one()
+
+        for _ in range(3):
+            events, _ = _synthesize_events(_ops)
+            for event in events:
+                storage.store_event(event)
+
+        event_types = {DagsterEventType.STEP_SUCCESS, DagsterEventType.PIPELINE_SUCCESS}
+        all_events = storage.get_logs_for_all_runs_by_log_id(dagster_event_type=event_types)
+        assert len(all_events) == 6
+
+        for batch_size in [1, 4, 6, 100]:
+            streamed = list(
+                storage.iter_logs_for_all_runs_by_log_id(
+                    dagster_event_type=event_types, batch_size=batch_size
+                )
+            )
+            assert streamed == list(all_events.items())
+
+        stream = storage.iter_logs_for_all_runs_by_log_id(
+            dagster_event_type=DagsterEventType.PIPELINE_SUCCESS, batch_size=2
+        )
+        first_storage_id, _ = next(stream)
+        stream.close()
+
+        resumed = storage.iter_logs_for_all_runs_by_log_id(
+            after_cursor=first_storage_id,
+            dagster_event_type=DagsterEventType.PIPELINE_SUCCESS,
+            batch_size=2,
+        )
+        assert _event_types(event for _, event in resumed) == [
+            DagsterEventType.PIPELINE_SUCCESS,
+            DagsterEventType.PIPELINE_SUCCESS,
+        ]
+
     def test_get_maximum_record_id(self, storage):
         if not storage.supports_event_consumer_queries():
             pytest.skip("storage does not support event consumer queries")
@@ -1,9 +1,11 @@
 import sys
 import tempfile
 from datetime import datetime
+from unittest import mock
 
 import pendulum
 import pytest
+import sqlalchemy as db
 
 from dagster import _seven, job, op
 from dagster._core.definitions import PipelineDefinition
@@ -28,24 +30,27 @@
     DagsterRun,
     JobBucket,
     PipelineRunStatus,
+    RunRecord,
     RunsFilter,
     TagBucket,
 )
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
-from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage, run_priority_from_tag
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    parse_run_priority,
 )
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import serialize_pp
+from dagster._serdes import serialize_dagster_namedtuple, serialize_pp
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 win_py36 = _seven.IS_WINDOWS and sys.version_info[0] == 3 and sys.version_info[1] == 6
@@ -750,6 +755,183 @@ def test_fetch_by_status_cursored(self, storage):
         assert len(cursor_four_limit_one) == 1
         assert cursor_four_limit_one[0].run_id == two
 
+    def test_get_run_tag_counts(self, storage):
+        assert storage
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="some_pipeline",
+                tags={"foo": "a", "bar": "x"},
+                status=PipelineRunStatus.STARTED,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="some_pipeline",
+                tags={"foo": "a"},
+                status=PipelineRunStatus.STARTING,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="some_pipeline",
+                tags={"foo": "b"},
+                status=PipelineRunStatus.STARTED,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="some_pipeline",
+                tags={"foo": "a"},
+                status=PipelineRunStatus.SUCCESS,
+            )
+        )
+
+        assert storage.get_run_tag_counts(["foo", "bar"]) == {
+            ("foo", "a"): 3,
+            ("foo", "b"): 1,
+            ("bar", "x"): 1,
+        }
+        assert storage.get_run_tag_counts(
+            ["foo"],
+            filters=RunsFilter(statuses=[PipelineRunStatus.STARTED, PipelineRunStatus.STARTING]),
+        ) == {("foo", "a"): 2, ("foo", "b"): 1}
+        assert storage.get_run_tag_counts(["baz"]) == {}
+        assert storage.get_run_tag_counts([]) == {}
+
+    def test_get_queued_runs(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        four = make_new_run_id()
+        five = make_new_run_id()
+        origin = self.fake_job_origin("some_pipeline")
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name="some_pipeline",
+                status=PipelineRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name="some_pipeline",
+                tags={PRIORITY_TAG: "3"},
+                status=PipelineRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                pipeline_name="some_pipeline",
+                tags={PRIORITY_TAG: "-1"},
+                status=PipelineRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=four,
+                pipeline_name="some_pipeline",
+                tags={PRIORITY_TAG: "foobar"},
+                status=PipelineRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=five,
+                pipeline_name="some_pipeline",
+                tags={PRIORITY_TAG: "3"},
+                status=PipelineRunStatus.STARTED,
+            )
+        )
+
+        def _run_ids(runs):
+            return [run.run_id for run in runs]
+
+        assert _run_ids(storage.get_queued_runs()) == [two, one, four, three]
+        assert _run_ids(storage.get_queued_runs(limit=2)) == [two, one]
+        assert _run_ids(storage.get_queued_runs(cursor=one, limit=1)) == [four]
+        assert _run_ids(storage.get_queued_runs(cursor=three)) == []
+
+        # the cursor run does not need to still be queued
+        storage.handle_run_event(
+            one,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_STARTING.value,
+                pipeline_name="some_pipeline",
+            ),
+        )
+        assert _run_ids(storage.get_queued_runs(cursor=one)) == [four, three]
+        assert _run_ids(storage.get_queued_runs()) == [two, four, three]
+
+    def test_get_queued_runs_out_of_range_priority(self, storage):
+        assert storage
+        high = make_new_run_id()
+        low = make_new_run_id()
+        default = make_new_run_id()
+        origin = self.fake_job_origin("some_pipeline")
+        for run_id, priority in [
+            (low, "-99999999999999999999"),
+            (default, None),
+            (high, "99999999999999999999"),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    tags={PRIORITY_TAG: priority} if priority else None,
+                    status=PipelineRunStatus.QUEUED,
+                    external_pipeline_origin=origin,
+                )
+            )
+
+        assert [run.run_id for run in storage.get_queued_runs()] == [high, default, low]
+        assert storage.get_run_by_id(high).tags[PRIORITY_TAG] == "99999999999999999999"
+
+    def test_run_priority_from_tag(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("This test is for SQL-backed run storage behavior")
+
+        # the priority parsed in SQL, used until the priority column is built, must agree with the
+        # priority stored in the column
+        tag_values = [
+            None,
+            "",
+            "3",
+            "-1",
+            "+4",
+            " 2 ",
+            "\t5\n",
+            "1.5",
+            "2abc",
+            "foobar",
+            "- 1",
+            "1_0",
+            # clamped to the range of the priority column
+            "2147483647",
+            "2147483648",
+            "-2147483648",
+            "-2147483649",
+            "3000000000",
+            "99999999999999999999",
+            "-99999999999999999999",
+            "00000000000000000000005",
+        ]
+        query = db.select(
+            [run_priority_from_tag(db.literal(value, db.String)) for value in tag_values]
+        )
+        assert list(storage.fetchone(query)) == [parse_run_priority(value) for value in tag_values]
+
     def test_delete(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete runs")
@@ -823,6 +1005,29 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
 
+    def test_add_get_binary_snapshot(self, storage):
+        json_snapshot = PipelineDefinition(
+            name="json_pipeline", solid_defs=[]
+        ).get_pipeline_snapshot()
+        binary_snapshot = PipelineDefinition(
+            name="binary_pipeline", solid_defs=[]
+        ).get_pipeline_snapshot()
+
+        json_snapshot_id = storage.add_pipeline_snapshot(json_snapshot)
+        # set by the `snapshots` instance settings
+        with mock.patch.object(
+            SqlRunStorage,
+            "_binary_snapshot_encoding",
+            new_callable=mock.PropertyMock,
+            return_value=True,
+        ):
+            binary_snapshot_id = storage.add_pipeline_snapshot(binary_snapshot)
+
+        # the snapshot id is derived from the json encoding regardless of the storage format
+        assert binary_snapshot_id == create_pipeline_snapshot_id(binary_snapshot)
+        assert storage.get_pipeline_snapshot(json_snapshot_id) == json_snapshot
+        assert storage.get_pipeline_snapshot(binary_snapshot_id) == binary_snapshot
+
     def test_single_write_read_with_snapshot(self, storage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
@@ -1279,6 +1484,59 @@ def test_handle_run_event_pipeline_success_test(self, storage):
 
         assert storage.get_run_by_id(run_id).status == PipelineRunStatus.SUCCESS
 
+    def test_add_runs(self, storage):
+        assert storage.add_runs([]) == []
+
+        one, two = make_new_run_id(), make_new_run_id()
+        storage.add_runs(
+            [
+                TestRunStorage.build_run(run_id=one, pipeline_name="foo", tags={"tag": "one"}),
+                TestRunStorage.build_run(run_id=two, pipeline_name="foo", tags={"tag": "two"}),
+            ]
+        )
+
+        assert {run.run_id for run in storage.get_runs()} == {one, two}
+        assert storage.get_run_by_id(one).tags == {"tag": "one"}
+        assert {run.run_id for run in storage.get_runs(RunsFilter(tags={"tag": "two"}))} == {two}
+
+        # a batch that fails to be added leaves none of its runs behind
+        three = make_new_run_id()
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=three, pipeline_name="foo", tags={"tag": "three"}
+                    ),
+                    TestRunStorage.build_run(run_id=one, pipeline_name="foo"),
+                ]
+            )
+        assert not storage.has_run(three)
+        assert storage.get_runs(RunsFilter(tags={"tag": "three"})) == []
+
+    def test_handle_run_events(self, storage):
+        one, two = make_new_run_id(), make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=one, pipeline_name="pipeline_name"))
+        storage.add_run(TestRunStorage.build_run(run_id=two, pipeline_name="pipeline_name"))
+
+        def _event(event_type):
+            return DagsterEvent(
+                message="a message",
+                event_type_value=event_type.value,
+                pipeline_name="pipeline_name",
+            )
+
+        storage.handle_run_events(
+            [
+                (one, _event(DagsterEventType.PIPELINE_START)),
+                (two, _event(DagsterEventType.PIPELINE_STARTING)),
+                (one, _event(DagsterEventType.PIPELINE_SUCCESS)),
+                (make_new_run_id(), _event(DagsterEventType.PIPELINE_FAILURE)),  # unknown run
+            ]
+        )
+
+        assert storage.get_run_by_id(one).status == PipelineRunStatus.SUCCESS
+        assert storage.get_run_by_id(two).status == PipelineRunStatus.STARTING
+
     def test_debug_snapshot_import(self, storage):
         from dagster._core.execution.api import create_execution_plan
         from dagster._core.snap import (
@@ -1456,6 +1714,48 @@ def _add_run(job_name, tags=None):
         assert runs_by_tag.get("2").run_id == two.run_id
         assert runs_by_tag.get("3").run_id == three.run_id
 
+    def test_run_record_fields(self, storage):
+        assert storage
+        run_id = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=run_id,
+                pipeline_name="some_pipeline",
+                tags={"foo": "bar"},
+                status=PipelineRunStatus.NOT_STARTED,
+            )
+        )
+        storage.handle_run_event(
+            run_id,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_START.value,
+                pipeline_name="some_pipeline",
+            ),
+        )
+
+        records = storage.get_run_records(filters=RunsFilter(run_ids=[run_id]))
+        assert len(records) == 1
+        record = records[0]
+        assert record.run_id == run_id
+        assert record.pipeline_name == "some_pipeline"
+        assert record.status == PipelineRunStatus.STARTED
+        assert record.pipeline_run == storage.get_run_by_id(run_id)
+        assert record.pipeline_run.tags == {"foo": "bar"}
+        assert record.pipeline_run.status == PipelineRunStatus.STARTED
+
+        # the pipeline_name column of runs stored by old versions of dagster may be NULL
+        legacy_record = RunRecord.from_run_body(
+            storage_id=record.storage_id,
+            run_id=run_id,
+            pipeline_name=None,
+            status=record.status,
+            run_body=serialize_dagster_namedtuple(record.pipeline_run),
+            create_timestamp=record.create_timestamp,
+            update_timestamp=record.update_timestamp,
+        )
+        assert legacy_record.pipeline_name == "some_pipeline"
+
     def test_run_record_timestamps(self, storage):
         assert storage
 
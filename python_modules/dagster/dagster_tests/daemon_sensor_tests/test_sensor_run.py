@@ -5,7 +5,9 @@
 import time
 import warnings
 from contextlib import ExitStack, contextmanager
+from unittest import mock
 
+import grpc
 import pendulum
 import pytest
 
@@ -41,9 +43,11 @@
 from dagster._core.definitions.run_request import InstigatorType
 from dagster._core.definitions.run_status_sensor_definition import run_status_sensor
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus, RunRequest, SkipReason
+from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import execute_pipeline
 from dagster._core.host_representation import ExternalInstigatorOrigin, ExternalRepositoryOrigin
+from dagster._core.host_representation.repository_location import GrpcServerRepositoryLocation
 from dagster._core.instance import DagsterInstance
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorStatus, TickStatus
 from dagster._core.storage.event_log.base import EventRecordsFilter
@@ -54,7 +58,11 @@
     wait_for_futures,
 )
 from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorTickQueue,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._legacy import pipeline, solid
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
@@ -758,7 +766,7 @@ def get_sensor_executors():
     ]
 
 
-def evaluate_sensors(workspace_context, executor, timeout=75):
+def evaluate_sensors(workspace_context, executor, timeout=75, sensor_tick_queue=None):
     logger = get_default_daemon_logger("SensorDaemon")
     futures = {}
     list(
@@ -767,6 +775,8 @@ def evaluate_sensors(workspace_context, executor, timeout=75):
             logger,
             threadpool_executor=executor,
             sensor_tick_futures=futures,
+            log_verbose_checks=sensor_tick_queue is None,
+            sensor_tick_queue=sensor_tick_queue,
         )
     )
 
@@ -1581,6 +1591,174 @@ def test_sensor_start_stop(executor, instance, workspace_context, external_repo)
         assert len(ticks) == 2
 
 
+@pytest.mark.parametrize("executor", get_sensor_executors())
+def test_sensor_tick_queue(executor, instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    external_sensor = external_repo.get_external_sensor("custom_interval_sensor")
+    external_origin_id = external_sensor.get_external_origin_id()
+    other_sensor = external_repo.get_external_sensor("always_on_sensor")
+
+    # only refreshed from the stored sensor states when the workspace or the running sensors change
+    sensor_tick_queue = SensorTickQueue(refresh_interval=3600)
+
+    with pendulum.test(freeze_datetime):
+        instance.start_sensor(external_sensor)
+        evaluate_sensors(workspace_context, executor, sensor_tick_queue=sensor_tick_queue)
+        assert len(instance.get_ticks(external_origin_id, external_sensor.selector_id)) == 1
+
+        freeze_datetime = freeze_datetime.add(seconds=30)
+
+    with pendulum.test(freeze_datetime):
+        with mock.patch.object(
+            instance, "all_instigator_state", wraps=instance.all_instigator_state
+        ) as all_instigator_state:
+            # the sensor is not due yet, and the queue is not refreshed
+            evaluate_sensors(workspace_context, executor, sensor_tick_queue=sensor_tick_queue)
+            assert len(instance.get_ticks(external_origin_id, external_sensor.selector_id)) == 1
+            assert all_instigator_state.call_count == 0
+
+        # sensors started since the last refresh are picked up on the next iteration
+        instance.start_sensor(other_sensor)
+        evaluate_sensors(workspace_context, executor, sensor_tick_queue=sensor_tick_queue)
+        assert (
+            len(instance.get_ticks(other_sensor.get_external_origin_id(), other_sensor.selector_id))
+            == 1
+        )
+        assert len(instance.get_ticks(external_origin_id, external_sensor.selector_id)) == 1
+
+        freeze_datetime = freeze_datetime.add(seconds=31)
+
+    with pendulum.test(freeze_datetime):
+        evaluate_sensors(workspace_context, executor, sensor_tick_queue=sensor_tick_queue)
+        assert len(instance.get_ticks(external_origin_id, external_sensor.selector_id)) == 2
+
+        # sensors stopped since the last refresh are no longer evaluated
+        instance.stop_sensor(external_origin_id, external_sensor.selector_id, external_sensor)
+        freeze_datetime = freeze_datetime.add(seconds=61)
+
+    with pendulum.test(freeze_datetime):
+        evaluate_sensors(workspace_context, executor, sensor_tick_queue=sensor_tick_queue)
+        assert len(instance.get_ticks(external_origin_id, external_sensor.selector_id)) == 2
+        assert (
+            len(instance.get_ticks(other_sensor.get_external_origin_id(), other_sensor.selector_id))
+            == 3
+        )
+
+
+class _UnimplementedRpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNIMPLEMENTED
+
+
+@pytest.mark.parametrize("executor", get_sensor_executors())
+def test_sensor_batch_evaluation(executor, instance, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    success_sensor = external_repo.get_external_sensor("always_on_sensor")
+    error_sensor = external_repo.get_external_sensor("error_sensor")
+
+    with pendulum.test(freeze_datetime):
+        instance.start_sensor(success_sensor)
+        instance.start_sensor(error_sensor)
+
+        # the due sensors of the repository are evaluated in a single batch
+        with mock.patch.object(
+            GrpcServerRepositoryLocation,
+            "get_external_sensor_execution_data",
+            side_effect=Exception("sensor was not evaluated in a batch"),
+        ):
+            evaluate_sensors(workspace_context, executor)
+
+        ticks = instance.get_ticks(
+            success_sensor.get_external_origin_id(), success_sensor.selector_id
+        )
+        assert len(ticks) == 1
+        assert instance.get_runs_count() == 1
+        validate_tick(
+            ticks[0],
+            success_sensor,
+            freeze_datetime,
+            TickStatus.SUCCESS,
+            [instance.get_runs()[0].run_id],
+        )
+
+        ticks = instance.get_ticks(error_sensor.get_external_origin_id(), error_sensor.selector_id)
+        assert len(ticks) == 1
+        validate_tick(
+            ticks[0],
+            error_sensor,
+            freeze_datetime,
+            TickStatus.FAILURE,
+            expected_error="womp womp",
+        )
+
+        freeze_datetime = freeze_datetime.add(seconds=31)
+
+    with pendulum.test(freeze_datetime):
+        # falls back to evaluating the sensors one at a time if the code server predates batched
+        # sensor evaluation
+        unimplemented_error = DagsterUserCodeUnreachableError("Could not reach user code server")
+        unimplemented_error.__cause__ = _UnimplementedRpcError()
+        with mock.patch.object(
+            GrpcServerRepositoryLocation,
+            "get_external_sensor_execution_data_batch",
+            side_effect=unimplemented_error,
+        ):
+            evaluate_sensors(workspace_context, executor)
+
+        ticks = instance.get_ticks(
+            success_sensor.get_external_origin_id(), success_sensor.selector_id
+        )
+        assert len(ticks) == 2
+        assert instance.get_runs_count() == 2
+        validate_tick(ticks[0], success_sensor, freeze_datetime, TickStatus.SUCCESS)
+
+        ticks = instance.get_ticks(error_sensor.get_external_origin_id(), error_sensor.selector_id)
+        assert len(ticks) == 2
+        validate_tick(
+            ticks[0],
+            error_sensor,
+            freeze_datetime,
+            TickStatus.FAILURE,
+            expected_error="womp womp",
+        )
+
+        freeze_datetime = freeze_datetime.add(seconds=31)
+
+    with pendulum.test(freeze_datetime):
+        # otherwise, the sensors that the batch did not evaluate fail with its error, rather than
+        # being evaluated again while the code server may still be evaluating them
+        with mock.patch.object(
+            GrpcServerRepositoryLocation,
+            "get_external_sensor_execution_data_batch",
+            side_effect=DagsterUserCodeUnreachableError("Could not reach user code server"),
+        ), mock.patch.object(
+            GrpcServerRepositoryLocation,
+            "get_external_sensor_execution_data",
+            side_effect=Exception("sensor was evaluated again"),
+        ):
+            evaluate_sensors(workspace_context, executor)
+
+        assert instance.get_runs_count() == 2
+        for external_sensor in [success_sensor, error_sensor]:
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 3
+            validate_tick(
+                ticks[0],
+                external_sensor,
+                freeze_datetime,
+                TickStatus.FAILURE,
+                expected_error="Could not reach user code server",
+            )
+
+
 @pytest.mark.parametrize("executor", get_sensor_executors())
 def test_large_sensor(executor, instance, workspace_context, external_repo):
     freeze_datetime = to_timezone(
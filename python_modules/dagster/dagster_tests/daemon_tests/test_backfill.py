@@ -3,6 +3,7 @@
 import string
 import sys
 import time
+from unittest import mock
 
 import pendulum
 import pytest
@@ -30,9 +31,16 @@
     ExternalRepositoryOrigin,
     InProcessRepositoryLocationOrigin,
 )
+from dagster._core.instance import DagsterInstance
 from dagster._core.storage.pipeline_run import PipelineRunStatus, RunsFilter
 from dagster._core.storage.tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG, PARTITION_SET_TAG
-from dagster._core.test_utils import step_did_not_run, step_failed, step_succeeded
+from dagster._core.test_utils import (
+    create_test_daemon_workspace_context,
+    instance_for_test,
+    step_did_not_run,
+    step_failed,
+    step_succeeded,
+)
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.backfill import execute_backfill_iteration
@@ -41,6 +49,8 @@
 from dagster._utils import touch_file
 from dagster._utils.error import SerializableErrorInfo
 
+from .conftest import workspace_load_target
+
 default_mode_def = ModeDefinition(resource_defs={"io_manager": fs_io_manager})
 
 
@@ -340,15 +350,17 @@ def test_canceled_backfill(instance, workspace_context, external_repo):
     )
     assert instance.get_runs_count() == 0
 
-    iterator = execute_backfill_iteration(
-        workspace_context, get_default_daemon_logger("BackfillDaemon")
-    )
-    next(iterator)
-    assert instance.get_runs_count() == 1
-    backfill = instance.get_backfills()[0]
-    assert backfill.status == BulkActionStatus.REQUESTED
-    instance.update_backfill(backfill.with_status(BulkActionStatus.CANCELED))
-    list(iterator)
+    # runs are submitted a chunk at a time, so cancel the backfill after its first chunk
+    with mock.patch("dagster._daemon.backfill.CHECKPOINT_COUNT", 1):
+        iterator = execute_backfill_iteration(
+            workspace_context, get_default_daemon_logger("BackfillDaemon")
+        )
+        next(iterator)
+        assert instance.get_runs_count() == 1
+        backfill = instance.get_backfills()[0]
+        assert backfill.status == BulkActionStatus.REQUESTED
+        instance.update_backfill(backfill.with_status(BulkActionStatus.CANCELED))
+        list(iterator)
     backfill = instance.get_backfill(backfill.backfill_id)
     assert backfill.status == BulkActionStatus.CANCELED
     assert instance.get_runs_count() == 1
@@ -564,6 +576,301 @@ def test_large_backfill(instance, workspace_context, external_repo):
     assert instance.get_runs_count() == 3
 
 
+def test_backfill_resumes_from_checkpoint(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="simple",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+            last_submitted_partition_name="one",
+            num_submitted_partitions=1,
+        )
+    )
+
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+
+    assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+    assert {run.tags[PARTITION_NAME_TAG] for run in instance.get_runs()} == {"two", "three"}
+
+
+def test_backfill_checkpoints_submitted_partitions(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="simple",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+
+    with mock.patch("dagster._daemon.backfill.CHECKPOINT_COUNT", 2), mock.patch(
+        "dagster._daemon.backfill.CHECKPOINT_INTERVAL", 0
+    ):
+        iterator = execute_backfill_iteration(
+            workspace_context, get_default_daemon_logger("BackfillDaemon")
+        )
+        backfill = instance.get_backfill("simple")
+        while backfill.get_num_submitted_partitions() == 0:
+            next(iterator)
+            backfill = instance.get_backfill("simple")
+
+        assert backfill.num_submitted_partitions == 2
+        assert backfill.last_submitted_partition_name == "two"
+        assert instance.get_runs_count() == 2
+
+        list(iterator)
+
+    assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+    assert instance.get_runs_count() == 3
+
+
+def test_backfill_skips_partitions_with_existing_runs(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    backfill = PartitionBackfill(
+        backfill_id="simple",
+        partition_set_origin=external_partition_set.get_external_origin(),
+        status=BulkActionStatus.REQUESTED,
+        partition_names=["one", "two", "three"],
+        from_failure=False,
+        reexecution_steps=None,
+        tags=None,
+        backfill_timestamp=pendulum.now().timestamp(),
+    )
+    instance.add_backfill(backfill)
+    with mock.patch("dagster._daemon.backfill.CHECKPOINT_COUNT", 1):
+        iterator = execute_backfill_iteration(
+            workspace_context, get_default_daemon_logger("BackfillDaemon")
+        )
+        next(iterator)
+    assert instance.get_runs_count() == 1
+
+    # the daemon crashes before checkpointing, and the backfill is picked up again
+    instance.update_backfill(backfill)
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+
+    assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+    runs = instance.get_runs()
+    assert len(runs) == 3
+    assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ["one", "three", "two"]
+
+
+def test_canceled_backfill_between_chunks(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    instance.add_backfill(
+        PartitionBackfill(
+            backfill_id="simple",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+    )
+
+    with mock.patch("dagster._daemon.backfill.CHECKPOINT_COUNT", 1), mock.patch(
+        "dagster._daemon.backfill.CHECKPOINT_INTERVAL", 0
+    ):
+        iterator = execute_backfill_iteration(
+            workspace_context, get_default_daemon_logger("BackfillDaemon")
+        )
+        backfill = instance.get_backfill("simple")
+        while backfill.get_num_submitted_partitions() == 0:
+            next(iterator)
+            backfill = instance.get_backfill("simple")
+
+        # the first chunk is checkpointed before the next one is submitted
+        assert backfill.last_submitted_partition_name == "one"
+        assert instance.get_runs_count() == 1
+        instance.update_backfill(backfill.with_status(BulkActionStatus.CANCELED))
+        list(iterator)
+
+    backfill = instance.get_backfill("simple")
+    assert backfill.status == BulkActionStatus.CANCELED
+    assert backfill.get_num_submitted_partitions() == 1
+    assert instance.get_runs_count() == 1
+
+
+def test_backfill_submits_unsubmitted_runs(instance, workspace_context, external_repo):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    backfill = PartitionBackfill(
+        backfill_id="simple",
+        partition_set_origin=external_partition_set.get_external_origin(),
+        status=BulkActionStatus.REQUESTED,
+        partition_names=["one", "two", "three"],
+        from_failure=False,
+        reexecution_steps=None,
+        tags=None,
+        backfill_timestamp=pendulum.now().timestamp(),
+    )
+    instance.add_backfill(backfill)
+
+    # the daemon crashes after creating the runs of the chunk, before submitting them
+    with mock.patch.object(DagsterInstance, "submit_runs_bulk", return_value=[]):
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+    assert instance.get_runs_count() == 3
+    assert all(run.status == PipelineRunStatus.NOT_STARTED for run in instance.get_runs())
+
+    # the backfill is picked up again, and the existing runs are submitted instead of skipped
+    instance.update_backfill(backfill)
+    list(execute_backfill_iteration(workspace_context, get_default_daemon_logger("BackfillDaemon")))
+
+    assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+    runs = instance.get_runs()
+    assert len(runs) == 3
+    assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ["one", "three", "two"]
+    assert all(run.status != PipelineRunStatus.NOT_STARTED for run in runs)
+
+
+def test_legacy_backfill_checkpoint():
+    backfill = PartitionBackfill(
+        backfill_id="simple",
+        partition_set_origin=_unloadable_partition_set_origin(),
+        status=BulkActionStatus.REQUESTED,
+        partition_names=["one", "two", "three"],
+        from_failure=False,
+        reexecution_steps=None,
+        tags=None,
+        backfill_timestamp=pendulum.now().timestamp(),
+    )
+    assert backfill.get_num_submitted_partitions() == 0
+
+    # backfills checkpointed by name only
+    assert (
+        backfill._replace(last_submitted_partition_name="two").get_num_submitted_partitions() == 2
+    )
+    assert (
+        backfill.with_partition_checkpoint("two", 2)
+        .with_status(BulkActionStatus.CANCELED)
+        .get_num_submitted_partitions()
+        == 2
+    )
+
+
+def _simple_backfill(external_repo, backfill_id, partition_names):
+    external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+    return PartitionBackfill(
+        backfill_id=backfill_id,
+        partition_set_origin=external_partition_set.get_external_origin(),
+        status=BulkActionStatus.REQUESTED,
+        partition_names=partition_names,
+        from_failure=False,
+        reexecution_steps=None,
+        tags=None,
+        backfill_timestamp=pendulum.now().timestamp(),
+    )
+
+
+def test_backfills_interleaved(instance, workspace_context, external_repo):
+    instance.add_backfill(_simple_backfill(external_repo, "large", ["one", "two", "three"]))
+    instance.add_backfill(_simple_backfill(external_repo, "small", ["one"]))
+
+    with mock.patch("dagster._daemon.backfill.CHECKPOINT_COUNT", 1), mock.patch(
+        "dagster._daemon.backfill.CHECKPOINT_INTERVAL", 0
+    ):
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+    assert instance.get_backfill("large").status == BulkActionStatus.COMPLETED
+    assert instance.get_backfill("small").status == BulkActionStatus.COMPLETED
+
+    # the small backfill is submitted alongside the first chunk of the large backfill, rather than
+    # after all of its chunks
+    runs = list(reversed(instance.get_runs()))
+    assert len(runs) == 4
+    assert ("small", "one") in [
+        (run.tags[BACKFILL_ID_TAG], run.tags[PARTITION_NAME_TAG]) for run in runs[:2]
+    ]
+    assert [
+        run.tags[PARTITION_NAME_TAG] for run in runs if run.tags[BACKFILL_ID_TAG] == "large"
+    ] == [
+        "one",
+        "two",
+        "three",
+    ]
+
+
+def test_backfill_rate_limit(external_repo):
+    with instance_for_test(
+        overrides={
+            "run_launcher": {
+                "module": "dagster._core.launcher.sync_in_memory_run_launcher",
+                "class": "SyncInMemoryRunLauncher",
+            },
+            "backfills": {"max_runs_per_minute": 2},
+        }
+    ) as instance, create_test_daemon_workspace_context(
+        workspace_load_target=workspace_load_target(), instance=instance
+    ) as workspace_context:
+        instance.add_backfill(_simple_backfill(external_repo, "large", ["one", "two", "three"]))
+        instance.add_backfill(_simple_backfill(external_repo, "small", ["one"]))
+
+        with mock.patch("dagster._daemon.backfill.CHECKPOINT_INTERVAL", 0):
+            iterator = execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+            for _ in range(50):
+                next(iterator)
+
+        # the limit applies to each backfill separately
+        assert instance.get_backfill("small").status == BulkActionStatus.COMPLETED
+        assert instance.get_backfill("large").status == BulkActionStatus.REQUESTED
+        assert instance.get_backfill("large").num_submitted_partitions == 2
+        assert instance.get_runs_count() == 3
+
+
+def test_threaded_backfill(external_repo):
+    with instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster._core.run_coordinator.queued_run_coordinator",
+                "class": "QueuedRunCoordinator",
+            },
+            "backfills": {"use_threads": True, "num_workers": 4},
+        }
+    ) as instance, create_test_daemon_workspace_context(
+        workspace_load_target=workspace_load_target(), instance=instance
+    ) as workspace_context:
+        instance.add_backfill(_simple_backfill(external_repo, "simple", ["one", "two", "three"]))
+
+        list(
+            execute_backfill_iteration(
+                workspace_context, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+        assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+        runs = instance.get_runs()
+        assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ["one", "three", "two"]
+        assert all(run.tags[BACKFILL_ID_TAG] == "simple" for run in runs)
+        assert all(run.status == PipelineRunStatus.QUEUED for run in runs)
+
+
+def test_backfill_settings():
+    settings = {"use_threads": True, "num_workers": 4, "max_runs_per_minute": 100}
+    with instance_for_test(overrides={"backfills": settings}) as instance:
+        assert instance.get_settings("backfills") == settings
+
+
 def test_unloadable_backfill(instance, workspace_context):
     unloadable_origin = _unloadable_partition_set_origin()
     instance.add_backfill(
@@ -259,6 +259,51 @@ def test_tag_limits(workspace_context, pipeline_handle, daemon):
         assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1", "large-1"]
 
 
+def test_tag_limits_paginated(workspace_context, pipeline_handle):
+    daemon = QueuedRunCoordinatorDaemon(interval_seconds=1, max_queued_runs_page_size=2)
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=2,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(
+            instance,
+            pipeline_handle,
+            run_id="tiny-in-progress",
+            status=PipelineRunStatus.STARTED,
+            tags={"database": "tiny"},
+        )
+        for i in range(5):
+            create_run(
+                instance,
+                pipeline_handle,
+                run_id=f"tiny-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"database": "tiny"},
+            )
+        create_run(
+            instance,
+            pipeline_handle,
+            run_id="large-1",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "large"},
+        )
+        create_run(
+            instance,
+            pipeline_handle,
+            run_id="large-2",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "large"},
+        )
+
+        list(daemon.run_iteration(bounded_ctx))
+
+        # the first page only contains blocked runs, so later pages are fetched until the limit is
+        # reached
+        assert get_run_ids(instance.run_launcher.queue()) == ["large-1"]
+
+
 def test_tag_limits_just_key(workspace_context, pipeline_handle, daemon):
     with instance_for_queued_run_coordinator(
         max_concurrent_runs=10,
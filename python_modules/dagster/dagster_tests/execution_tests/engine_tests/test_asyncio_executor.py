@@ -0,0 +1,253 @@
+import asyncio
+import threading
+import time
+
+from dagster import (
+    AsyncIOManager,
+    DagsterInstance,
+    Failure,
+    In,
+    Output,
+    asyncio_executor,
+    io_manager,
+    job,
+    op,
+    success_hook,
+)
+from dagster._legacy import execute_pipeline
+
+
+def define_fan_out_job(num_ops, sleep_seconds, loops=None, in_flight=None):
+    @op
+    async def fetch():
+        if loops is not None:
+            loops.add(id(asyncio.get_running_loop()))
+        if in_flight is not None:
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        await asyncio.sleep(sleep_seconds)
+        if in_flight is not None:
+            in_flight["current"] -= 1
+        return 1
+
+    @op(ins={f"in_{i}": In() for i in range(num_ops)})
+    def total(**kwargs):
+        return sum(kwargs.values())
+
+    @job(executor_def=asyncio_executor)
+    def fan_out_job():
+        total(**{f"in_{i}": fetch.alias(f"fetch_{i}")() for i in range(num_ops)})
+
+    return fan_out_job
+
+
+def test_async_ops_execute_concurrently():
+    start = time.time()
+    result = execute_pipeline(
+        define_fan_out_job(num_ops=100, sleep_seconds=2),
+        run_config={"execution": {"config": {"max_concurrent": 100}}},
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert result.success
+    assert result.result_for_solid("total").output_value() == 100
+    # sequentially this would take at least 200 seconds
+    assert time.time() - start < 60
+
+
+def test_async_ops_execute_as_tasks():
+    threads = {"peak": 0}
+    # every op body runs on the one loop, so the counts need no lock
+    in_flight = {"current": 0, "peak": 0}
+
+    @op
+    async def fetch():
+        threads["peak"] = max(threads["peak"], threading.active_count())
+        in_flight["current"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        # hold each call until every call is in flight, rather than for a fixed time, so that the
+        # peak doesn't depend on how quickly the steps start
+        deadline = time.time() + 120
+        while in_flight["peak"] < 500 and time.time() < deadline:
+            await asyncio.sleep(0.1)
+        in_flight["current"] -= 1
+        return 1
+
+    @op(ins={f"in_{i}": In() for i in range(500)})
+    def total(**kwargs):
+        return sum(kwargs.values())
+
+    @job(executor_def=asyncio_executor)
+    def wide_fan_out_job():
+        total(**{f"in_{i}": fetch.alias(f"fetch_{i}")() for i in range(500)})
+
+    result = execute_pipeline(wide_fan_out_job, instance=DagsterInstance.ephemeral())
+    assert result.success
+    assert result.result_for_solid("total").output_value() == 500
+    # every call is in flight at once, rather than a batch per thread
+    assert in_flight["peak"] == 500
+    # the steps don't hold a thread each
+    assert threads["peak"] < 50
+
+
+def test_max_concurrent():
+    # every op body runs on the one loop, so the counts need no lock
+    in_flight = {"current": 0, "peak": 0}
+    result = execute_pipeline(
+        define_fan_out_job(num_ops=12, sleep_seconds=0.5, in_flight=in_flight),
+        run_config={"execution": {"config": {"max_concurrent": 4}}},
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert result.success
+    assert 1 < in_flight["peak"] <= 4
+
+
+def test_sync_ops_execute_concurrently():
+    @op
+    def block():
+        time.sleep(1)
+        return 1
+
+    @op(ins={f"in_{i}": In() for i in range(8)})
+    def total(**kwargs):
+        return sum(kwargs.values())
+
+    @job(executor_def=asyncio_executor)
+    def sync_fan_out_job():
+        total(**{f"in_{i}": block.alias(f"block_{i}")() for i in range(8)})
+
+    start = time.time()
+    result = execute_pipeline(sync_fan_out_job, instance=DagsterInstance.ephemeral())
+    assert result.success
+    assert result.result_for_solid("total").output_value() == 8
+    # blocking op bodies run off the event loop
+    assert time.time() - start < 8
+
+
+def test_async_ops_share_event_loop():
+    loops = set()
+    result = execute_pipeline(
+        define_fan_out_job(num_ops=10, sleep_seconds=0.1, loops=loops),
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert result.success
+    assert len(loops) == 1
+
+
+def test_async_generator_op():
+    @op
+    async def emit():
+        await asyncio.sleep(0.01)
+        yield Output(1)
+
+    @job(executor_def=asyncio_executor)
+    def generator_job():
+        emit()
+
+    result = execute_pipeline(generator_job, instance=DagsterInstance.ephemeral())
+    assert result.success
+    assert result.result_for_solid("emit").output_value() == 1
+
+
+def test_async_io_manager():
+    loops = set()
+    storage = {}
+
+    class AsyncDictIOManager(AsyncIOManager):
+        async def handle_output_async(self, context, obj):
+            loops.add(id(asyncio.get_running_loop()))
+            await asyncio.sleep(0.01)
+            storage[tuple(context.get_identifier())] = obj
+
+        async def load_input_async(self, context):
+            loops.add(id(asyncio.get_running_loop()))
+            await asyncio.sleep(0.01)
+            return storage[tuple(context.upstream_output.get_identifier())]
+
+    @io_manager
+    def async_dict_io_manager():
+        return AsyncDictIOManager()
+
+    @op
+    async def produce():
+        loops.add(id(asyncio.get_running_loop()))
+        return 2
+
+    @op
+    def double(x):
+        return x * 2
+
+    @job(executor_def=asyncio_executor, resource_defs={"io_manager": async_dict_io_manager})
+    def io_manager_job():
+        double(produce())
+
+    result = execute_pipeline(io_manager_job, instance=DagsterInstance.ephemeral())
+    assert result.success
+    assert sorted(storage.values()) == [2, 4]
+    assert len(loops) == 1
+
+
+def test_async_io_manager_outside_asyncio_executor():
+    storage = {}
+
+    class AsyncDictIOManager(AsyncIOManager):
+        async def handle_output_async(self, context, obj):
+            storage[tuple(context.get_identifier())] = obj
+
+        async def load_input_async(self, context):
+            return storage[tuple(context.upstream_output.get_identifier())]
+
+    @io_manager
+    def async_dict_io_manager():
+        return AsyncDictIOManager()
+
+    @op
+    def produce():
+        return 2
+
+    @op
+    def double(x):
+        return x * 2
+
+    @job(resource_defs={"io_manager": async_dict_io_manager})
+    def io_manager_job():
+        double(produce())
+
+    result = io_manager_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("double") == 4
+
+
+def test_failure_and_hooks():
+    hooked = []
+
+    @success_hook
+    def record_success(context):
+        hooked.append(context.op.name)
+
+    @op
+    async def fails():
+        await asyncio.sleep(0.01)
+        raise Failure("failed")
+
+    @op
+    async def succeeds():
+        await asyncio.sleep(0.01)
+        return 1
+
+    @op
+    def downstream(_x):
+        pass
+
+    @job(executor_def=asyncio_executor, hooks={record_success})
+    def failure_job():
+        downstream(fails())
+        succeeds()
+
+    result = execute_pipeline(
+        failure_job, instance=DagsterInstance.ephemeral(), raise_on_error=False
+    )
+    assert not result.success
+    assert result.result_for_solid("fails").failure_data
+    assert result.result_for_solid("succeeds").success
+    assert result.result_for_solid("downstream").skipped
+    assert hooked == ["succeeds"]
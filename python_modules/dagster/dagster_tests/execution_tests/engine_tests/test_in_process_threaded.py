@@ -0,0 +1,196 @@
+import threading
+import time
+
+from dagster import (
+    DagsterInstance,
+    DynamicOut,
+    DynamicOutput,
+    Failure,
+    In,
+    RetryRequested,
+    in_process_threaded_executor,
+    job,
+    op,
+    resource,
+    success_hook,
+)
+from dagster._legacy import execute_pipeline
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.thread_ids = set()
+
+    def enter(self):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.thread_ids.add(threading.get_ident())
+
+    def exit(self):
+        with self._lock:
+            self.running -= 1
+
+
+def define_fan_out_job(tracker, num_ops, op_tags=None, executor_config=None):
+    @resource
+    def tracker_resource(_):
+        return tracker
+
+    @op(required_resource_keys={"tracker"}, tags=op_tags)
+    def wait(context):
+        context.resources.tracker.enter()
+        context.log.info("waiting")
+        time.sleep(0.2)
+        context.resources.tracker.exit()
+        return 1
+
+    @op(ins={f"in_{i}": In() for i in range(num_ops)})
+    def total(**kwargs):
+        return sum(kwargs.values())
+
+    @job(
+        executor_def=in_process_threaded_executor.configured(executor_config or {}),
+        resource_defs={"tracker": tracker_resource},
+    )
+    def fan_out_job():
+        total(**{f"in_{i}": wait.alias(f"wait_{i}")() for i in range(num_ops)})
+
+    return fan_out_job
+
+
+def test_threaded_execution():
+    tracker = ConcurrencyTracker()
+    result = execute_pipeline(
+        define_fan_out_job(tracker, 4, executor_config={"max_concurrent": 4}),
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert result.success
+    assert result.result_for_solid("total").output_value() == 4
+    assert tracker.max_running > 1
+    assert threading.get_ident() not in tracker.thread_ids
+
+
+def test_threaded_execution_logs():
+    tracker = ConcurrencyTracker()
+    with DagsterInstance.ephemeral() as instance:
+        result = execute_pipeline(
+            define_fan_out_job(tracker, 8, executor_config={"max_concurrent": 8}),
+            instance=instance,
+        )
+        assert result.success
+
+        log_step_keys = [
+            record.step_key
+            for record in instance.all_logs(result.run_id)
+            if record.user_message == "waiting"
+        ]
+        assert sorted(log_step_keys) == sorted(f"wait_{i}" for i in range(8))
+
+
+def test_max_concurrent():
+    tracker = ConcurrencyTracker()
+    result = execute_pipeline(
+        define_fan_out_job(tracker, 4, executor_config={"max_concurrent": 1}),
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert result.success
+    assert tracker.max_running == 1
+
+
+def test_tag_concurrency_limits():
+    tracker = ConcurrencyTracker()
+    result = execute_pipeline(
+        define_fan_out_job(
+            tracker,
+            4,
+            op_tags={"database": "warehouse"},
+            executor_config={
+                "max_concurrent": 4,
+                "tag_concurrency_limits": [{"key": "database", "value": "warehouse", "limit": 2}],
+            },
+        ),
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert result.success
+    assert tracker.max_running == 2
+
+
+def test_failure_and_hooks():
+    hooked = []
+
+    @success_hook
+    def record_success(context):
+        hooked.append(context.op.name)
+
+    @op
+    def fails():
+        raise Failure("failed")
+
+    @op
+    def succeeds():
+        return 1
+
+    @op
+    def downstream(_x):
+        pass
+
+    @job(executor_def=in_process_threaded_executor, hooks={record_success})
+    def failure_job():
+        downstream(fails())
+        succeeds()
+
+    result = execute_pipeline(
+        failure_job, instance=DagsterInstance.ephemeral(), raise_on_error=False
+    )
+    assert not result.success
+    assert result.result_for_solid("fails").failure_data
+    assert result.result_for_solid("succeeds").success
+    assert result.result_for_solid("downstream").skipped
+    assert hooked == ["succeeds"]
+
+
+def test_retries():
+    attempts = []
+
+    @op
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RetryRequested(max_retries=1)
+        return 1
+
+    @job(executor_def=in_process_threaded_executor)
+    def retry_job():
+        flaky()
+
+    result = execute_pipeline(retry_job, instance=DagsterInstance.ephemeral())
+    assert result.success
+    assert len(attempts) == 2
+
+
+def test_dynamic_outputs():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(10):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(x):
+        time.sleep(0.05)
+        return x * 2
+
+    @op
+    def total(values):
+        return sum(values)
+
+    @job(executor_def=in_process_threaded_executor)
+    def dynamic_job():
+        total(emit().map(double).collect())
+
+    result = execute_pipeline(dynamic_job, instance=DagsterInstance.ephemeral())
+    assert result.success
+    assert result.result_for_solid("total").output_value() == 90
@@ -12,13 +12,18 @@
     Nothing,
     Output,
     String,
+    job,
     multiprocess_executor,
+    op,
     reconstructable,
+    resource,
 )
 from dagster._core.errors import DagsterUnmetExecutorRequirementsError
 from dagster._core.events import DagsterEventType
+from dagster._core.execution.plan.prioritization import CRITICAL_PATH_PRIORITIZATION
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.captured_log_manager import CapturedLogManager
+from dagster._core.storage.tags import FUSIBLE_TAG, STEP_PRIORITIZATION_TAG
 from dagster._core.test_utils import default_mode_def_for_test, instance_for_test
 from dagster._legacy import (
     InputDefinition,
@@ -114,6 +119,152 @@ def test_forkserver_preload():
         assert result.result_for_solid("adder").output_value() == 11
 
 
+def _step_worker_pids(result):
+    return {
+        event.event_specific_data.metadata_entries[0].value.text
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"max_concurrent": 2, "worker_pool": {}}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        # four steps, executed by at most two workers
+        assert len(_step_worker_pids(result)) <= 2
+
+
+def test_worker_pool_max_tasks_per_worker():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_tasks_per_worker": 1},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert len(_step_worker_pids(result)) == 4
+
+
+def _append_line(path, line):
+    with open(path, "a", encoding="utf8") as f:
+        f.write(line + "\n")
+
+
+def _read_lines(path):
+    with open(path, "r", encoding="utf8") as f:
+        return f.read().splitlines()
+
+
+def define_reusable_resource_job():
+    @resource(config_schema={"path": str}, reusable=True)
+    def connection_pool(init_context):
+        path = init_context.resource_config["path"]
+        _append_line(path, f"init connection_pool {os.getpid()}")
+        try:
+            yield path
+        finally:
+            _append_line(path, f"teardown connection_pool {os.getpid()}")
+
+    @resource(required_resource_keys={"connection_pool"})
+    def client(init_context):
+        path = init_context.resources.connection_pool
+        _append_line(path, "init client")
+        yield path
+        _append_line(path, "teardown client")
+
+    @op(required_resource_keys={"client"})
+    def first(context):
+        return 1
+
+    @op(required_resource_keys={"client"})
+    def second(context, x):
+        return x + 1
+
+    @op(required_resource_keys={"client"})
+    def third(context, x):
+        return x + 1
+
+    @job(
+        resource_defs={"connection_pool": connection_pool, "client": client},
+        executor_def=multiprocess_executor,
+    )
+    def reusable_resource_job():
+        third(second(first()))
+
+    return reusable_resource_job
+
+
+def test_worker_pool_reusable_resources():
+    with instance_for_test() as instance, safe_tempfile_path() as path:
+        result = execute_pipeline(
+            reconstructable(define_reusable_resource_job),
+            run_config={
+                "execution": {"config": {"max_concurrent": 1, "worker_pool": {}}},
+                "resources": {"connection_pool": {"config": {"path": path}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        (pid,) = _step_worker_pids(result)
+        # the reusable resource is initialized by the first step and torn down when the worker
+        # shuts down, while the resource that depends on it is initialized for every step
+        assert _read_lines(path) == [
+            f"init connection_pool {pid}",
+            *(["init client", "teardown client"] * 3),
+            f"teardown connection_pool {pid}",
+        ]
+
+        reused = [
+            any(
+                entry.label == "connection_pool:reused"
+                for entry in event.event_specific_data.metadata_entries
+            )
+            for event in result.event_list
+            if event.event_type == DagsterEventType.RESOURCE_INIT_SUCCESS
+        ]
+        assert reused == [False, True, True]
+
+
+def test_reusable_resources_without_worker_pool():
+    with instance_for_test() as instance, safe_tempfile_path() as path:
+        result = execute_pipeline(
+            reconstructable(define_reusable_resource_job),
+            run_config={
+                "execution": {"config": {"max_concurrent": 1}},
+                "resources": {"connection_pool": {"config": {"path": path}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        # each step process initializes and tears down its own resources
+        assert [line.split(" ")[0] for line in _read_lines(path)] == [
+            "init",
+            "init",
+            "teardown",
+            "teardown",
+        ] * 3
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -324,6 +475,124 @@ def test_separate_sub_dags():
         assert order[0:3] == ["noop_1", "noop_2", "noop_3"]
 
 
+def define_critical_path_pipeline():
+    @lambda_solid
+    def a_noop():
+        pass
+
+    @lambda_solid
+    def z_chain_1():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def z_chain_2(num):
+        return num
+
+    @pipeline(mode_defs=[default_mode_def_for_test])
+    def critical_path_pipeline():
+        a_noop()
+        z_chain_2(z_chain_1())
+
+    return critical_path_pipeline
+
+
+@pytest.mark.parametrize("tags", [{}, {STEP_PRIORITIZATION_TAG: CRITICAL_PATH_PRIORITIZATION}])
+def test_critical_path_prioritization(tags):
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_critical_path_pipeline),
+            run_config={"execution": {"multiprocess": {"config": {"max_concurrent": 1}}}},
+            instance=instance,
+            tags=tags,
+        )
+        assert result.success
+
+        order = [str(event.solid_handle) for event in result.step_event_list if event.is_step_start]
+        if tags:
+            assert order == ["z_chain_1", "a_noop", "z_chain_2"]
+        else:
+            assert order[0] == "a_noop"
+
+
+def define_fusible_job():
+    fusible = {FUSIBLE_TAG: "true"}
+
+    @op(tags=fusible)
+    def extract():
+        return 1
+
+    @op(tags=fusible)
+    def transform(x):
+        return x + 1
+
+    @op(tags=fusible, config_schema={"fail": Field(bool, default_value=False)})
+    def load(context, x):
+        if context.op_config["fail"]:
+            raise Failure("load failed")
+        return x * 2
+
+    @op
+    def report(x):
+        return x
+
+    @job(executor_def=multiprocess_executor)
+    def fusible_job():
+        report(load(transform(extract())))
+
+    return fusible_job
+
+
+@pytest.mark.parametrize("executor_config", [{}, {"worker_pool": {}}])
+def test_fused_steps(executor_config):
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_fusible_job),
+            run_config={"execution": {"config": executor_config}},
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("load").output_value() == 4
+        assert result.result_for_solid("report").output_value() == 4
+
+        # the chain of fusible steps is executed in a single process
+        assert [
+            event.step_key
+            for event in result.event_list
+            if event.event_type == DagsterEventType.STEP_WORKER_STARTING
+        ] == ["extract", "report"]
+        assert [event.step_key for event in result.event_list if event.is_step_success] == [
+            "extract",
+            "transform",
+            "load",
+            "report",
+        ]
+
+        # inputs are only loaded by steps that are not fused with their upstream step
+        assert [
+            event.step_key
+            for event in result.event_list
+            if event.event_type == DagsterEventType.LOADED_INPUT
+        ] == ["report"]
+
+
+def test_fused_step_failure():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_fusible_job),
+            run_config={"ops": {"load": {"config": {"fail": True}}}},
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        assert result.result_for_solid("transform").success
+        assert result.result_for_solid("load").failure_data
+        assert not [
+            event
+            for event in result.event_list
+            if event.step_key == "report" and event.is_step_start
+        ]
+
+
 def test_ephemeral_event_log():
     with instance_for_test(
         overrides={
@@ -479,6 +748,23 @@ def test_crash_multiprocessing():
         # )
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_crash_worker_pool():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(sys_exit_pipeline),
+            run_config={
+                "execution": {"multiprocess": {"config": {"worker_pool": {}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not result.success
+        failure_data = result.result_for_solid("sys_exit").failure_data
+        assert failure_data
+        assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @solid
 def segfault_solid(context):
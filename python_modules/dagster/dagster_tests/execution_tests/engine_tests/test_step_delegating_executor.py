@@ -258,6 +258,25 @@ def test_max_concurrent():
             active_step = None
 
 
+def test_wakes_up_on_step_events():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        start = time.time()
+        result = execute_pipeline(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={"execution": {"config": {"sleep_seconds": 60.0}}},
+        )
+        elapsed = time.time() - start
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
+    # baz_op is launched as soon as the event log shows that bar_op succeeded, rather than after
+    # sleeping between reads of the event log
+    assert elapsed < 60
+
+
 @executor(
     name="test_step_delegating_executor_verify_step",
     requirements=multiple_process_executor_requirements(),
@@ -1,18 +1,34 @@
+from unittest import mock
+
 import pytest
 
-from dagster import DagsterInstance, Int, Output
+from dagster import DagsterInstance, DynamicOut, DynamicOutput, Int, Output
 from dagster import _check as check
+from dagster import job, op
 from dagster._core.definitions.pipeline_base import InMemoryPipeline
 from dagster._core.errors import (
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
     DagsterUnknownStepStateError,
 )
-from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.api import (
+    create_execution_plan,
+    create_execution_plan_for_steps,
+    execute_plan,
+)
+from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.plan import should_skip_step
+from dagster._core.execution.plan.plan_cache import (
+    ExecutionPlanCache,
+    get_execution_plan_cache,
+    get_execution_plan_cache_key,
+)
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
+from dagster._core.snap import snapshot_from_execution_plan
 from dagster._core.storage.pipeline_run import PipelineRun
+from dagster._core.test_utils import instance_for_test
 from dagster._core.utils import make_new_run_id
 from dagster._legacy import (
     OutputDefinition,
@@ -562,3 +578,125 @@ def my_pipeline():
         instance,
         pipeline_run.run_id,
     )
+
+
+def define_dynamic_job():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(3):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(x):
+        return x * 2
+
+    @op
+    def total(values):
+        return sum(values)
+
+    @job
+    def dynamic_job():
+        total(emit().map(double).collect())
+
+    return dynamic_job
+
+
+@pytest.mark.parametrize(
+    "step_keys_to_execute,known_state",
+    [
+        (["emit"], None),
+        (
+            ["double[1]"],
+            KnownExecutionState(dynamic_mappings={"emit": {"result": ["0", "1", "2"]}}),
+        ),
+        (
+            ["total"],
+            KnownExecutionState(dynamic_mappings={"emit": {"result": ["0", "1", "2"]}}),
+        ),
+    ],
+)
+def test_create_execution_plan_for_steps(step_keys_to_execute, known_state):
+    dynamic_job = define_dynamic_job()
+    pipeline_snapshot_id = dynamic_job.get_pipeline_snapshot_id()
+    with instance_for_test() as instance:
+        pipeline_run = instance.create_run_for_pipeline(dynamic_job)
+
+        planned = create_execution_plan(
+            dynamic_job,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+        )
+        # the second plan is derived from the cached plan for the run
+        for _ in range(2):
+            derived = create_execution_plan_for_steps(
+                InMemoryPipeline(dynamic_job),
+                pipeline_run,
+                step_keys_to_execute=step_keys_to_execute,
+                known_state=known_state,
+            )
+            assert derived.step_keys_to_execute == step_keys_to_execute
+            assert snapshot_from_execution_plan(
+                derived, pipeline_snapshot_id
+            ) == snapshot_from_execution_plan(planned, pipeline_snapshot_id)
+
+
+def test_create_execution_plan_for_steps_does_not_modify_cached_plan():
+    dynamic_job = define_dynamic_job()
+    with instance_for_test() as instance:
+        pipeline_run = instance.create_run_for_pipeline(dynamic_job)
+        known_state = KnownExecutionState(dynamic_mappings={"emit": {"result": ["0", "1"]}})
+
+        for step_key in ["double[0]", "double[1]"]:
+            execution_plan = create_execution_plan_for_steps(
+                InMemoryPipeline(dynamic_job),
+                pipeline_run,
+                step_keys_to_execute=[step_key],
+                known_state=known_state,
+            )
+            assert execution_plan.step_keys_to_execute == [step_key]
+
+        run_plan = get_execution_plan_cache().get(
+            get_execution_plan_cache_key(
+                pipeline_run.pipeline_snapshot_id, pipeline_run.run_config, "default", None
+            )
+        )
+        assert run_plan
+        assert not run_plan.has_step(StepHandle.parse_from_key("double[0]"))
+        assert run_plan.known_state == KnownExecutionState()
+
+
+def test_execution_plan_cache():
+    cache = ExecutionPlanCache(max_size=2)
+    execution_plan = create_execution_plan(define_dynamic_job())
+
+    key = get_execution_plan_cache_key("12345", {"ops": {}}, "default", None)
+    assert key == get_execution_plan_cache_key("12345", {"ops": {}}, "default", None)
+    assert key != get_execution_plan_cache_key("12345", {"ops": {}}, "default", ["emit"])
+    assert key != get_execution_plan_cache_key("12345", {"ops": {}}, "default", None, ["emit"])
+    assert key != get_execution_plan_cache_key("54321", {"ops": {}}, "default", None)
+    assert get_execution_plan_cache_key("12345", {"ops": {"x": object()}}, "default", None) is None
+
+    other_keys = [
+        get_execution_plan_cache_key("12345", {}, "default", [step_key]) for step_key in ["a", "b"]
+    ]
+
+    cache.set(key, execution_plan)
+    assert cache.get(key) is execution_plan
+
+    cache.set(other_keys[0], execution_plan)
+    cache.get(key)
+    cache.set(other_keys[1], execution_plan)
+    # the least recently used plan is evicted
+    assert cache.get(other_keys[0]) is None
+    assert cache.get(key) is execution_plan
+    assert cache.get(other_keys[1]) is execution_plan
+
+
+def test_execution_plan_cache_sized_once_per_process():
+    with mock.patch("dagster._core.execution.plan.plan_cache._execution_plan_cache", None):
+        cache = get_execution_plan_cache(4)
+        assert cache.max_size == 4
+
+        # an instance with different settings in the same process shares the existing cache
+        assert get_execution_plan_cache(0) is cache
+        assert cache.max_size == 4
@@ -100,7 +100,8 @@ def write_a_file_pipeline():
 
 
 @pytest.mark.skipif(_seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
-def test_interrupt_multiproc():
+@pytest.mark.parametrize("use_worker_pool", [False, True])
+def test_interrupt_multiproc(use_worker_pool):
     with tempfile.TemporaryDirectory() as tempdir:
         with instance_for_test(temp_dir=tempdir) as instance:
 
@@ -126,7 +127,14 @@ def test_interrupt_multiproc():
                         "write_3": {"config": {"tempfile": file_3}},
                         "write_4": {"config": {"tempfile": file_4}},
                     },
-                    "execution": {"multiprocess": {"config": {"max_concurrent": 4}}},
+                    "execution": {
+                        "multiprocess": {
+                            "config": {
+                                "max_concurrent": 4,
+                                **({"worker_pool": {}} if use_worker_pool else {}),
+                            }
+                        }
+                    },
                 },
                 instance=instance,
             ):
@@ -22,11 +22,12 @@
 from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorTick
-from dagster._core.storage.event_log.migration import migrate_event_log_data
+from dagster._core.storage.event_log.migration import RUN_STATS_TABLES, migrate_event_log_data
 from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.utils import upgrading_instance
 from dagster._core.storage.pipeline_run import DagsterRun, DagsterRunStatus, RunsFilter
-from dagster._core.storage.tags import REPOSITORY_LABEL_TAG
+from dagster._core.storage.runs.migration import RUN_PRIORITY
+from dagster._core.storage.tags import PRIORITY_TAG, REPOSITORY_LABEL_TAG
 from dagster._legacy import execute_pipeline, pipeline, solid
 from dagster._serdes import DefaultNamedTupleSerializer, create_snapshot_id
 from dagster._serdes.serdes import (
@@ -1039,3 +1040,107 @@ def test_add_asset_event_tags_table():
 
             assert not "asset_event_tags" in get_sqlite3_tables(db_path)
             assert get_sqlite3_indexes(db_path, "asset_event_tags") == []
+
+
+def test_add_run_stats_tables():
+    src_dir = file_relative_path(__file__, "snapshot_1_0_12_pre_add_asset_event_tags_table/sqlite")
+    run_id = "25bdc1c2-676d-4981-82c8-fbf3fdb4df75"
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs", f"{run_id}.db")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            assert not "run_stats" in get_sqlite3_tables(db_path)
+            assert not "run_step_stats" in get_sqlite3_tables(db_path)
+
+            run_stats = instance.get_run_stats(run_id)
+            step_stats = instance.get_run_step_stats(run_id)
+
+            instance.upgrade()
+
+            assert "run_stats" in get_sqlite3_tables(db_path)
+            assert "run_step_stats" in get_sqlite3_tables(db_path)
+            assert get_sqlite3_indexes(db_path, "run_step_stats") == ["idx_run_step_stats"]
+
+            # stats are read from the event log until the stats tables have been backfilled
+            assert not instance.event_log_storage.has_secondary_index(RUN_STATS_TABLES)
+            assert instance.get_run_stats(run_id) == run_stats
+
+            instance.reindex()
+
+            assert instance.event_log_storage.has_secondary_index(RUN_STATS_TABLES)
+
+            # the event log timestamp column only has microsecond precision
+            backfilled_run_stats = instance.get_run_stats(run_id)
+            for field, value in run_stats._asdict().items():
+                assert getattr(backfilled_run_stats, field) == pytest.approx(value)
+            assert instance.get_run_step_stats(run_id) == step_stats
+
+
+def test_add_run_priority_column():
+    from dagster._core.host_representation.origin import (
+        ExternalRepositoryOrigin,
+        GrpcServerRepositoryLocationOrigin,
+    )
+
+    src_dir = file_relative_path(__file__, "snapshot_1_0_12_pre_add_asset_event_tags_table/sqlite")
+    origin = ExternalRepositoryOrigin(
+        repository_location_origin=GrpcServerRepositoryLocationOrigin(port=1234, host="localhost"),
+        repository_name="fake_repository",
+    ).get_pipeline_origin("fake_job")
+
+    def _add_queued_run(instance, run_id, tags=None):
+        instance.add_run(
+            DagsterRun(
+                pipeline_name="fake_job",
+                run_id=run_id,
+                run_config=None,
+                tags=tags,
+                status=DagsterRunStatus.QUEUED,
+                external_pipeline_origin=origin,
+            )
+        )
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+        assert "priority" not in get_sqlite3_columns(db_path, "runs")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            _add_queued_run(instance, "default-pri-run")
+            _add_queued_run(instance, "hi-pri-run", tags={PRIORITY_TAG: "3"})
+            _add_queued_run(instance, "low-pri-run", tags={PRIORITY_TAG: "-1"})
+
+            # the queue is ordered by the priority tags until the priority column is built
+            assert not instance.run_storage.has_built_index(RUN_PRIORITY)
+            assert [run.run_id for run in instance.get_queued_runs()] == [
+                "hi-pri-run",
+                "default-pri-run",
+                "low-pri-run",
+            ]
+            assert [
+                run.run_id for run in instance.get_queued_runs(cursor="hi-pri-run", limit=1)
+            ] == ["default-pri-run"]
+
+            instance.upgrade()
+
+            assert "priority" in get_sqlite3_columns(db_path, "runs")
+            assert "idx_run_priority" in get_sqlite3_indexes(db_path, "runs")
+            assert instance.run_storage.has_built_index(RUN_PRIORITY)
+            with sqlite3.connect(db_path) as conn:
+                assert conn.execute(
+                    "SELECT COUNT(*) FROM runs WHERE priority IS NULL"
+                ).fetchone() == (0,)
+
+            _add_queued_run(instance, "new-hi-pri-run", tags={PRIORITY_TAG: "3"})
+            instance.add_run_tags("default-pri-run", {PRIORITY_TAG: "5"})
+
+            assert [run.run_id for run in instance.get_queued_runs()] == [
+                "default-pri-run",
+                "hi-pri-run",
+                "new-hi-pri-run",
+                "low-pri-run",
+            ]
+            assert [run.run_id for run in instance.get_queued_runs(cursor="hi-pri-run")] == [
+                "new-hi-pri-run",
+                "low-pri-run",
+            ]
@@ -31,7 +31,12 @@
     open_server_process,
     wait_for_grpc_server,
 )
-from dagster._grpc.types import ListRepositoriesResponse, SensorExecutionArgs
+from dagster._grpc.types import (
+    ListRepositoriesResponse,
+    SensorBatchExecutionArgs,
+    SensorEvaluationArgs,
+    SensorExecutionArgs,
+)
 from dagster._serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster._seven import get_system_temp_directory
 from dagster._utils import file_relative_path, find_free_port
@@ -785,6 +790,57 @@ def test_sensor_timeout():
         process.wait()
 
 
+def test_sensor_evaluation_max_workers():
+    port = find_free_port()
+    python_file = file_relative_path(__file__, "grpc_repo.py")
+
+    subprocess_args = [
+        "dagster",
+        "api",
+        "grpc",
+        "--port",
+        str(port),
+        "--python-file",
+        python_file,
+        "--sensor-evaluation-max-workers",
+        "1",
+    ]
+
+    process = subprocess.Popen(
+        subprocess_args,
+        stdout=subprocess.PIPE,
+    )
+
+    try:
+        wait_for_grpc_server(
+            process, DagsterGrpcClient(port=port, host="localhost"), subprocess_args
+        )
+        client = DagsterGrpcClient(port=port)
+
+        with instance_for_test() as instance:
+            repo_origin = ExternalRepositoryOrigin(
+                repository_location_origin=GrpcServerRepositoryLocationOrigin(
+                    port=port, host="localhost"
+                ),
+                repository_name="bar_repo",
+            )
+            results = list(
+                client.external_sensor_batch_execution(
+                    sensor_batch_execution_args=SensorBatchExecutionArgs(
+                        repository_origin=repo_origin,
+                        instance_ref=instance.get_ref(),
+                        sensor_evaluation_args=[
+                            SensorEvaluationArgs("slow_sensor", None, None, None)
+                        ],
+                    ),
+                )
+            )
+            assert [sensor_name for sensor_name, _ in results] == ["slow_sensor"]
+    finally:
+        process.terminate()
+        process.wait()
+
+
 def test_load_with_container_context(capfd):
     port = find_free_port()
     python_file = file_relative_path(__file__, "grpc_repo.py")
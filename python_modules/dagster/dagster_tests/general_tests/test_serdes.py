@@ -1,12 +1,13 @@
+import math
 import re
 import string
 from collections import namedtuple
 from enum import Enum
-from typing import NamedTuple, Set
+from typing import NamedTuple, Optional, Set
 
 import pytest
 
-from dagster import _seven
+from dagster import AssetKey, _seven
 from dagster._check import ParameterCheckError, inst_param, set_param
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
@@ -19,11 +20,15 @@
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
+    deserialize_value_from_bytes,
     pack_inner_value,
+    pack_value,
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_inner_value,
+    unpack_value,
 )
 from dagster._serdes.utils import hash_str
 
@@ -708,6 +713,35 @@ class Thing(NamedTuple):
     assert _deserialize_json(thing_serialized, wmap) == thing
 
 
+def test_pack_plans_invalidated_on_registration():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Thing(NamedTuple):
+        name: str
+
+    thing = Thing("foo")
+    assert _seven.json.loads(_serialize_dagster_namedtuple(thing, wmap))["__class__"] == "Thing"
+
+    wmap.register_serialized_name("Thing", "SerializedThing")
+    thing_serialized = _serialize_dagster_namedtuple(thing, wmap)
+    assert _seven.json.loads(thing_serialized)["__class__"] == "SerializedThing"
+
+
+def test_unpack_value_leaves_input_intact():
+    packed = pack_value(AssetKey(["a", "b"]))
+    assert unpack_value(packed) == AssetKey(["a", "b"])
+    assert unpack_value(packed) == AssetKey(["a", "b"])
+
+
+def test_deserialize_non_strict_json():
+    # documents that the optional orjson parser either rejects or loads lossily
+    assert deserialize_value('{"a": "line\nbreak"}') == {"a": "line\nbreak"}
+    assert deserialize_value('{"a": [98765432109876543210]}') == {"a": [98765432109876543210]}
+    nan = deserialize_value(serialize_value({"a": float("nan")}))["a"]
+    assert math.isnan(nan)
+
+
 def test_whitelist_storage_name():
 
     wmap = WhitelistMap.create()
@@ -718,3 +752,86 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_binary_roundtrip():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Color(Enum):
+        RED = 1
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Leaf(NamedTuple):
+        num: int
+
+    class BranchSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def skip_when_empty(cls):
+            return {"extra"}
+
+        @classmethod
+        def value_from_storage_dict(
+            cls, storage_dict, klass, args_for_class, whitelist_map, descent_path
+        ):
+            # inspects the packed form of its fields, like many back-compat serializers
+            assert storage_dict["leaves"][0]["__class__"] == "Leaf"
+            return super().value_from_storage_dict(
+                storage_dict, klass, args_for_class, whitelist_map, descent_path
+            )
+
+    @_whitelist_for_serdes(whitelist_map=test_map, serializer=BranchSerializer)
+    class Branch(NamedTuple):
+        leaves: list
+        extra: Optional[dict] = None
+
+    @_whitelist_for_serdes(whitelist_map=test_map, storage_name="OldTree")
+    class Tree(NamedTuple):
+        branches: list
+        colors: frozenset
+        leaf_set: set
+        by_key: dict
+        big: int
+
+    tree = Tree(
+        branches=[Branch([Leaf(1), Leaf(2)]), Branch([Leaf(3)], {"a": Leaf(4)})],
+        colors=frozenset([Color.RED]),
+        leaf_set={Leaf(5)},
+        by_key={1: [None, True, 1.5, "s"], 2: "int key"},
+        big=98765432109876543210,
+    )
+
+    as_bytes = serialize_value_to_bytes(tree, test_map)
+    as_json = serialize_value(tree, test_map)
+    assert deserialize_value_from_bytes(as_bytes, test_map) == deserialize_value(as_json, test_map)
+    assert deserialize_value_from_bytes(as_json.encode("utf-8"), test_map) == deserialize_value(
+        as_json, test_map
+    )
+
+
+def test_binary_descent_path():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Leaf(NamedTuple):
+        num: int
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Holder(NamedTuple):
+        leaves: list
+
+    as_bytes = serialize_value_to_bytes(Holder([Leaf(1), Leaf(2)]), test_map)
+
+    other_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=other_map)
+    class Holder(NamedTuple):  # pylint: disable=function-redefined
+        leaves: list
+
+    with pytest.raises(DeserializationError, match=re.escape("Descent path: .leaves[0]")):
+        deserialize_value_from_bytes(as_bytes, other_map)
+
+    with pytest.raises(
+        SerializationError, match=re.escape("Descent path: <root:Holder>.leaves[1]")
+    ):
+        serialize_value_to_bytes(Holder([1, Leaf(2)]), other_map)
@@ -65,6 +65,7 @@ def get_version() -> str:
         # pin around issues in specific versions of alembic that broke our migrations
         "alembic>=1.2.1,!=1.6.3,!=1.7.0",
         "croniter>=0.3.34",
+        "msgpack>=1.0",
         # grpcio 1.48.1 has hanging/crashing issues: https://github.com/grpc/grpc/issues/30843
         # ensure version we require is >= that with which we generated the grpc code (set in dev-requirements)
         "grpcio>=1.32.0,<1.48.1",
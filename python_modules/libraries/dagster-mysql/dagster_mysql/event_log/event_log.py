@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 import sqlalchemy as db
 
 import dagster._check as check
@@ -59,6 +61,8 @@ def __init__(self, mysql_url, inst_data=None):
             poolclass=db.pool.NullPool,
         )
         self._secondary_index_cache = {}
+        # only cached once found, since the tables may be added by a migration while in use
+        self._run_stats_tables_exist = False
 
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
 
@@ -120,32 +124,42 @@ def create_clean_storage(conn_string):
         MySQLEventLogStorage.wipe_storage(conn_string)
         return MySQLEventLogStorage(conn_string)
 
-    def store_asset_event(self, event):
+    def _store_asset_event(self, conn, event, has_asset_key_index_cols):
         # last_materialization_timestamp is updated upon observation, materialization, materialization_planned
-        # See SqlEventLogStorage.store_asset_event method for more details
-
-        values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
-        with self.index_connection() as conn:
-            if values:
+        # See SqlEventLogStorage._store_asset_event method for more details
+
+        values = self._get_asset_entry_values(event, has_asset_key_index_cols)
+        if values:
+            conn.execute(
+                db.dialects.mysql.insert(AssetKeyTable)
+                .values(
+                    asset_key=event.dagster_event.asset_key.to_string(),
+                    **values,
+                )
+                .on_duplicate_key_update(
+                    **values,
+                )
+            )
+        else:
+            try:
                 conn.execute(
-                    db.dialects.mysql.insert(AssetKeyTable)
-                    .values(
+                    db.dialects.mysql.insert(AssetKeyTable).values(
                         asset_key=event.dagster_event.asset_key.to_string(),
-                        **values,
-                    )
-                    .on_duplicate_key_update(
-                        **values,
                     )
                 )
-            else:
-                try:
-                    conn.execute(
-                        db.dialects.mysql.insert(AssetKeyTable).values(
-                            asset_key=event.dagster_event.asset_key.to_string(),
-                        )
-                    )
-                except db.exc.IntegrityError:
-                    pass
+            except db.exc.IntegrityError:
+                pass
+
+    @contextmanager
+    def _write_transaction(self, conn):
+        # the engine autocommits every statement, so opt this connection out of it for the
+        # duration of the transaction
+        conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with conn.begin():
+            yield conn
+
+    def _asset_key_index_cols_enabled(self) -> bool:
+        return self.has_secondary_index(ASSET_KEY_INDEX_COLS)
 
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
@@ -168,6 +182,13 @@ def enable_secondary_index(self, name):
         if name in self._secondary_index_cache:
             del self._secondary_index_cache[name]
 
+    def _has_run_stats_tables(self, conn):
+        if not self._run_stats_tables_exist:
+            self._run_stats_tables_exist = super(MySQLEventLogStorage, self)._has_run_stats_tables(
+                conn
+            )
+        return self._run_stats_tables_exist
+
     def watch(self, run_id, cursor, callback):
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
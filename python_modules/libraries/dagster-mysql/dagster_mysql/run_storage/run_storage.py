@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Mapping
 
 import sqlalchemy as db
@@ -62,6 +63,7 @@ def __init__(self, mysql_url, inst_data=None):
         )
 
         self._index_migration_cache = {}
+        self._run_priority_col_cache = None
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -129,10 +131,19 @@ def create_clean_storage(mysql_url):
     def connect(self, run_id=None):  # pylint: disable=arguments-differ, unused-argument
         return create_mysql_connection(self._engine, __file__, "run")
 
+    @contextmanager
+    def _write_transaction(self, conn):
+        # the engine autocommits every statement, so opt this connection out of it for the
+        # duration of the transaction
+        conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with conn.begin():
+            yield conn
+
     def upgrade(self):
         alembic_config = mysql_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._run_priority_col_cache = None
 
     def has_built_index(self, migration_name):
         if migration_name not in self._index_migration_cache:
@@ -146,6 +157,11 @@ def mark_index_built(self, migration_name):
         if migration_name in self._index_migration_cache:
             del self._index_migration_cache[migration_name]
 
+    def has_run_priority_col(self):
+        if self._run_priority_col_cache is None:
+            self._run_priority_col_cache = super(MySQLRunStorage, self).has_run_priority_col()
+        return self._run_priority_col_cache
+
     @property
     def supports_bucket_queries(self):
         if not super().supports_bucket_queries:
@@ -1,10 +1,12 @@
-from typing import Optional
+from contextlib import contextmanager
+from itertools import groupby
+from typing import Iterator, Optional, Set, Tuple, Union
 
 import sqlalchemy as db
 
 import dagster._check as check
 from dagster._core.errors import DagsterInvariantViolationError
-from dagster._core.events import ASSET_EVENTS
+from dagster._core.events import ASSET_EVENTS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -13,7 +15,7 @@
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.base import DEFAULT_EVENT_LOG_STREAM_BATCH_SIZE, EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.sql import (
     check_alembic_revision,
@@ -83,6 +85,8 @@ def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
         self._event_watcher: Optional[PostgresEventWatcher] = None
 
         self._secondary_index_cache = {}
+        # only cached once found, since the tables may be added by a migration while in use
+        self._run_stats_tables_exist = False
 
         table_names = retry_pg_connection_fn(lambda: db.inspect(self._engine).get_table_names())
 
@@ -152,17 +156,22 @@ def store_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
         with self._connect() as conn:
-            result = conn.execute(
-                insert_event_statement.returning(
-                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+            with self._write_transaction(conn) as conn:
+                result = conn.execute(
+                    insert_event_statement.returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
+                )
+                res = result.fetchone()
+                result.close()
+
+                if self._should_write_run_stats(conn, [event]):
+                    self._write_run_stats(conn, event.run_id, [event])
+
+                conn.execute(
+                    """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
+                    (res[0] + "_" + str(res[1]),),
                 )
-            )
-            res = result.fetchone()
-            result.close()
-            conn.execute(
-                """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
-                (res[0] + "_" + str(res[1]),),
-            )
 
         if (
             event.is_dagster_event
@@ -178,11 +187,84 @@ def store_event(self, event):
 
             self.store_asset_event_tags(event, res[1])
 
-    def store_asset_event(self, event: EventLogEntry):
-        check.inst_param(event, "event", EventLogEntry)
-        if not (event.dagster_event and event.dagster_event.asset_key):
+    def store_event_batch(self, events):
+        """Store a batch of events in a single multi-row insert, notifying event watchers of every
+        inserted row in one round trip.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
             return
 
+        insert_event_statement = (
+            SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+            .values([self._get_event_insert_values(event) for event in events])
+            .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+        )
+        has_asset_key_index_cols = self._asset_key_index_cols_enabled()
+        with self._connect() as conn:
+            with self._write_transaction(conn) as conn:
+                result = conn.execute(insert_event_statement)
+                rows = result.fetchall()
+                result.close()
+
+                # ids are assigned from the serial column in the order of the VALUES list, so
+                # sorting the returned ids lines them back up with the submitted events
+                event_ids = sorted(event_id for _, event_id in rows)
+                for event, event_id in zip(events, event_ids):
+                    if (
+                        event.is_dagster_event
+                        and event.dagster_event_type in ASSET_EVENTS
+                        and event.dagster_event.asset_key
+                    ):
+                        self._store_asset_index_rows(
+                            conn, event, event_id, has_asset_key_index_cols
+                        )
+
+                if self._should_write_run_stats(conn, events):
+                    for run_id, run_events in groupby(events, key=lambda event: event.run_id):
+                        self._write_run_stats(conn, run_id, list(run_events))
+
+                # notifications are delivered when the transaction commits
+                conn.execute(
+                    "".join("NOTIFY {channel}, %s; ".format(channel=CHANNEL_NAME) for _ in rows),
+                    tuple(run_id + "_" + str(event_id) for run_id, event_id in rows),
+                )
+
+    @contextmanager
+    def _write_transaction(self, conn):
+        # the engine autocommits every statement, so opt this connection out of it for the
+        # duration of the transaction
+        conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with conn.begin():
+            yield conn
+
+    def _asset_key_index_cols_enabled(self) -> bool:
+        return self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+
+    def _upsert_stats_row(self, conn, table, key_values, values, increments):
+        # an integrity error would abort the enclosing transaction, so resolve conflicting inserts
+        # with an upsert instead
+        query = db.dialects.postgresql.insert(table).values(**key_values, **values, **increments)
+        update_values = {
+            **values,
+            **{
+                column: db.func.coalesce(table.c[column], 0) + increment
+                for column, increment in increments.items()
+            },
+        }
+        if update_values:
+            query = query.on_conflict_do_update(
+                index_elements=[table.c[column] for column in key_values],
+                set_=update_values,
+            )
+        else:
+            query = query.on_conflict_do_nothing()
+        conn.execute(query)
+
+    def _store_asset_event(self, conn, event: EventLogEntry, has_asset_key_index_cols: bool):
         # We switched to storing the entire event record of the last materialization instead of just
         # the AssetMaterialization object, so that we have access to metadata like timestamp,
         # pipeline, run_id, etc.
@@ -213,20 +295,19 @@ def store_asset_event(self, event: EventLogEntry):
         # run id for a set of assets in one roundtrip call to event log storage.
         # https://github.com/dagster-io/dagster/pull/7319
 
-        values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
-        with self.index_connection() as conn:
-            query = db.dialects.postgresql.insert(AssetKeyTable).values(
-                asset_key=event.dagster_event.asset_key.to_string(),
-                **values,
+        values = self._get_asset_entry_values(event, has_asset_key_index_cols)
+        query = db.dialects.postgresql.insert(AssetKeyTable).values(
+            asset_key=event.dagster_event.asset_key.to_string(),
+            **values,
+        )
+        if values:
+            query = query.on_conflict_do_update(
+                index_elements=[AssetKeyTable.c.asset_key],
+                set_=dict(**values),
             )
-            if values:
-                query = query.on_conflict_do_update(
-                    index_elements=[AssetKeyTable.c.asset_key],
-                    set_=dict(**values),
-                )
-            else:
-                query = query.on_conflict_do_nothing()
-            conn.execute(query)
+        else:
+            query = query.on_conflict_do_nothing()
+        conn.execute(query)
 
     def _connect(self):
         return create_pg_connection(self._engine)
@@ -237,6 +318,34 @@ def run_connection(self, run_id=None):
     def index_connection(self):
         return self._connect()
 
+    def iter_logs_for_all_runs_by_log_id(
+        self,
+        after_cursor: int = -1,
+        dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        batch_size: int = DEFAULT_EVENT_LOG_STREAM_BATCH_SIZE,
+    ) -> Iterator[Tuple[int, EventLogEntry]]:
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        query = self._all_runs_events_query(after_cursor, dagster_event_type)
+        with self._connect() as conn:
+            # Stream the rows through a server-side cursor instead of paging. Server-side cursors
+            # only exist within a transaction, so opt this connection out of the engine's
+            # autocommit isolation level.
+            conn = conn.execution_options(
+                isolation_level="READ COMMITTED",
+                stream_results=True,
+                max_row_buffer=batch_size,
+            )
+            with conn.begin():
+                result = conn.execute(query)
+                # Result.partitions() is only available in SQLAlchemy 1.4 and later
+                while True:
+                    rows = result.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from self._iter_event_log_rows(rows)
+
     def has_secondary_index(self, name):
         if name not in self._secondary_index_cache:
             self._secondary_index_cache[name] = super(
@@ -249,6 +358,13 @@ def enable_secondary_index(self, name):
         if name in self._secondary_index_cache:
             del self._secondary_index_cache[name]
 
+    def _has_run_stats_tables(self, conn):
+        if not self._run_stats_tables_exist:
+            self._run_stats_tables_exist = super(
+                PostgresEventLogStorage, self
+            )._has_run_stats_tables(conn)
+        return self._run_stats_tables_exist
+
     def watch(self, run_id, cursor, callback):
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Mapping
 
 import sqlalchemy as db
@@ -73,6 +74,7 @@ def __init__(self, postgres_url, should_autocreate_tables=True, inst_data=None):
         )
 
         self._index_migration_cache = {}
+        self._run_priority_col_cache = None
         table_names = retry_pg_connection_fn(lambda: db.inspect(self._engine).get_table_names())
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -134,9 +136,18 @@ def create_clean_storage(postgres_url, should_autocreate_tables=True):
     def connect(self):
         return create_pg_connection(self._engine)
 
+    @contextmanager
+    def _write_transaction(self, conn):
+        # the engine autocommits every statement, so opt this connection out of it for the
+        # duration of the transaction
+        conn = conn.execution_options(isolation_level="READ COMMITTED")
+        with conn.begin():
+            yield conn
+
     def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)
+        self._run_priority_col_cache = None
 
     def has_built_index(self, migration_name):
         if migration_name not in self._index_migration_cache:
@@ -150,6 +161,11 @@ def mark_index_built(self, migration_name):
         if migration_name in self._index_migration_cache:
             del self._index_migration_cache[migration_name]
 
+    def has_run_priority_col(self):
+        if self._run_priority_col_cache is None:
+            self._run_priority_col_cache = super(PostgresRunStorage, self).has_run_priority_col()
+        return self._run_priority_col_cache
+
     def add_daemon_heartbeat(self, daemon_heartbeat):
         with self.connect() as conn:
 
@@ -0,0 +1,95 @@
+# pylint: disable=print-call
+"""Benchmarks serdes over the snapshot test fixtures.
+
+Usage: python scripts/benchmark_serdes.py [--number N]
+
+To compare against another version of dagster, run the script again with that version installed
+(or with its python_modules/dagster directory at the front of PYTHONPATH).
+"""
+import argparse
+import glob
+import importlib.util
+import json
+import os
+import timeit
+import zlib
+
+from dagster._serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+
+try:
+    from dagster._serdes import deserialize_value_from_bytes, serialize_value_to_bytes
+except ImportError:
+    # versions of dagster without the binary encoding
+    serialize_value_to_bytes = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SNAPSHOT_FIXTURES_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "python_modules",
+    "dagster",
+    "dagster_tests",
+    "core_tests",
+    "snap_tests",
+    "snapshots",
+)
+
+
+def load_fixtures():
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(SNAPSHOT_FIXTURES_DIR, "snap_*.py"))):
+        spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name, value in module.snapshots.items():
+            # only the fixtures that are serialized namedtuples, e.g. pipeline snapshots
+            if isinstance(value, str) and '"__class__"' in value[:64]:
+                fixtures[name] = value
+    return fixtures
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    values = [deserialize_json_to_dagster_namedtuple(s) for s in load_fixtures().values()]
+    # the fixtures are pretty printed, time the compact form that storage actually contains
+    json_strs = [serialize_dagster_namedtuple(value) for value in values]
+    total_kb = sum(len(json_str) for json_str in json_strs) / 1024
+    print(
+        f"{len(json_strs)} snapshot fixtures, {total_kb:.0f} KiB of json, {args.number} iterations, "
+        f"orjson {'installed' if orjson is not None else 'not installed'}"
+    )
+
+    cases = [
+        ("json.loads", lambda: [json.loads(json_str, strict=False) for json_str in json_strs]),
+        ("deserialize", lambda: [deserialize_json_to_dagster_namedtuple(s) for s in json_strs]),
+        ("serialize", lambda: [serialize_dagster_namedtuple(value) for value in values]),
+    ]
+    if orjson is not None:
+        cases.insert(1, ("orjson.loads", lambda: [orjson.loads(s) for s in json_strs]))
+    if serialize_value_to_bytes is not None:
+        binary_docs = [serialize_value_to_bytes(value) for value in values]
+        cases += [
+            ("deserialize bin", lambda: [deserialize_value_from_bytes(d) for d in binary_docs]),
+            ("serialize bin", lambda: [serialize_value_to_bytes(value) for value in values]),
+        ]
+        json_docs = [json_str.encode("utf-8") for json_str in json_strs]
+        for label, docs in [("json", json_docs), ("binary", binary_docs)]:
+            print(
+                f"{label:>14}: {sum(len(d) for d in docs) / 1024:6.0f} KiB, "
+                f"{sum(len(zlib.compress(d)) for d in docs) / 1024:6.0f} KiB compressed"
+            )
+
+    for label, fn in cases:
+        seconds = min(timeit.repeat(fn, number=args.number, repeat=3))
+        print(f"{label:>14}: {seconds * 1000 / args.number:8.2f}ms per pass")
+
+
+if __name__ == "__main__":
+    main()